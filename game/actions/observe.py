@@ -21,7 +21,7 @@ class LookAction(Action):
             return ActionResult.success_result(ctx.ai_reply)
 
         # Build description from room and items
-        base_description = room.get_description(ctx.player, ctx.world_state)
+        base_description = ctx.map.describe_room(room, ctx.player)
         items_description = room.get_items_description(ctx.world_state)
 
         # Combine all descriptions
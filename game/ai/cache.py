@@ -1,12 +1,25 @@
-"""Runtime-sized LRU storage for interpreted commands."""
+"""Runtime-sized LRU storage for interpreted commands.
+
+Two tiers: a process-local LRU that is always on, and an optional SQLite tier
+(``game.ai.disk_cache``) that outlives the process and is shared by every
+worker on the machine. A read falls through memory to disk and promotes a disk
+hit; a write goes to both. A caller on an event loop reads through
+``cache_get_async``, which makes the disk read in a worker thread; disk writes
+are queued and never block (see ``game.ai.disk_cache``).
+"""
 
 from __future__ import annotations
 
+import asyncio
 from collections import OrderedDict
 import hashlib
 import json
+from pathlib import Path
 from typing import Any, Callable, Dict, Optional, Tuple
 
+from game.ai.cache_keys import cache_key_fields
+from game.ai.disk_cache import DiskResponseCache
+from game.ai.prompt import prompt_template_version
 from game.ai.types import Intent
 
 
@@ -21,28 +34,20 @@ ResponseTuple = Tuple[
 
 response_cache: OrderedDict[str, ResponseTuple] = OrderedDict()
 DEFAULT_RESPONSE_CACHE_SIZE = 50
+DEFAULT_RESPONSE_CACHE_DISK_SIZE = 5000
+DEFAULT_RESPONSE_CACHE_TTL_SECONDS = 7 * 86400.0
+
+# Memory-tier counters. The disk tier keeps its own on the store.
+_memory_stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+_disk_tier: Optional[DiskResponseCache] = None
 
 
 def make_cache_key(user_text: str, context: Dict[str, Any]) -> str:
-    """Create a cache key from every prompt-affecting runtime input."""
-    key_data = json.dumps(
-        {
-            "user_text": user_text.strip().lower(),
-            "room_name": context.get("room_name", ""),
-            "exits": sorted(context.get("exits", [])),
-            "room_items": sorted(context.get("room_items", [])),
-            "inventory": sorted(context.get("inventory", [])),
-            "world_flags": context.get("world_flags", {}),
-            "fear": context.get("fear", 0),
-            "health": context.get("health", 100),
-            "rooms_visited": context.get("rooms_visited", 1),
-            "been_here_before": context.get("been_here_before", False),
-            "active_quest": context.get("active_quest"),
-            "can_advance_to_dawn": context.get("can_advance_to_dawn", False),
-            "is_dawn_offer_active": context.get("is_dawn_offer_active", False),
-        },
-        sort_keys=True,
-    )
+    """Create a cache key from the context that can change this input's intent.
+
+    See ``game.ai.cache_keys`` for what that is per class of input.
+    """
+    key_data = json.dumps(cache_key_fields(user_text, context), sort_keys=True)
     return hashlib.md5(key_data.encode()).hexdigest()
 
 
@@ -61,29 +66,150 @@ def response_cache_capacity() -> int:
         return DEFAULT_RESPONSE_CACHE_SIZE
 
 
-def cache_get(
+def _disk_tier_settings() -> Optional[Tuple[Path, int, float, str]]:
+    from game.config import get_config
+
+    config = get_config()
+    raw_path = getattr(config, "response_cache_path", "")
+    if not raw_path:
+        return None
+    try:
+        capacity = int(
+            getattr(config, "response_cache_disk_size", DEFAULT_RESPONSE_CACHE_DISK_SIZE)
+        )
+        ttl = float(
+            getattr(config, "response_cache_ttl_seconds", DEFAULT_RESPONSE_CACHE_TTL_SECONDS)
+        )
+    except (TypeError, ValueError):
+        capacity, ttl = DEFAULT_RESPONSE_CACHE_DISK_SIZE, DEFAULT_RESPONSE_CACHE_TTL_SECONDS
+    if capacity <= 0 or ttl <= 0:
+        return None
+    # A cached intent is only as good as the prompt and the model behind it.
+    version = f"{prompt_template_version()}:{getattr(config, 'openai_model', '')}"
+    return Path(raw_path), capacity, ttl, version
+
+
+def disk_tier() -> Optional[DiskResponseCache]:
+    """Return the persistent tier for the live configuration, if enabled.
+
+    Rebuilt whenever the path, limits or version stamp change, mirroring how
+    the memory tier follows ``response_cache_size``.
+    """
+    global _disk_tier
+    settings = _disk_tier_settings()
+    if settings is None:
+        if _disk_tier is not None:
+            _disk_tier.close()
+            _disk_tier = None
+        return None
+    path, capacity, ttl, version = settings
+    current = _disk_tier
+    if current is None or (current.path, current.capacity, current.ttl_seconds, current.version) != settings:
+        if current is not None:
+            current.close()
+        _disk_tier = DiskResponseCache(
+            path, capacity=capacity, ttl_seconds=ttl, version=version
+        )
+    return _disk_tier
+
+
+def _intent_tuple(intent: Intent) -> ResponseTuple:
+    return (
+        intent.action,
+        intent.args,
+        intent.confidence,
+        intent.reply,
+        intent.effects,
+        intent.rationale,
+    )
+
+
+def _remember(key: str, response: ResponseTuple, capacity: int) -> None:
+    response_cache.pop(key, None)
+    while len(response_cache) >= capacity:
+        response_cache.popitem(last=False)
+        _memory_stats["evictions"] += 1
+    response_cache[key] = response
+
+
+def _memory_get(
     key: str,
-    *,
-    debug: Callable[[str], None] | None = None,
+    capacity: int,
+    debug: Callable[[str], None] | None,
 ) -> Optional[Intent]:
-    """Read a cached intent while enforcing live configuration changes."""
-    capacity = response_cache_capacity()
+    """The memory tier's half of a read, enforcing live configuration."""
     if capacity == 0:
         response_cache.clear()
         return None
 
     while len(response_cache) > capacity:
         response_cache.popitem(last=False)
+        _memory_stats["evictions"] += 1
 
     if key in response_cache:
         response_cache.move_to_end(key)
+        _memory_stats["hits"] += 1
         action, args, confidence, reply, effects, rationale = response_cache[key]
         if debug is not None:
             debug(f"Cache hit for key {key[:8]}...")
         return Intent(action, args, confidence, reply, effects, rationale)
+    _memory_stats["misses"] += 1
     return None
 
 
+def _promote(
+    key: str,
+    stored: Any,
+    capacity: int,
+    debug: Callable[[str], None] | None,
+) -> Optional[Intent]:
+    """Turn a disk-tier row into an intent, keeping it in memory too."""
+    if stored is None:
+        return None
+    try:
+        action, args, confidence, reply, effects, rationale = stored
+    except (TypeError, ValueError):
+        return None
+    _remember(key, (action, args, confidence, reply, effects, rationale), capacity)
+    if debug is not None:
+        debug(f"Disk cache hit for key {key[:8]}...")
+    return Intent(action, args, confidence, reply, effects, rationale)
+
+
+def cache_get(
+    key: str,
+    *,
+    debug: Callable[[str], None] | None = None,
+) -> Optional[Intent]:
+    """Read a cached intent while enforcing live configuration changes."""
+    capacity = response_cache_capacity()
+    cached = _memory_get(key, capacity, debug)
+    if cached is not None or capacity == 0:
+        return cached
+    disk = disk_tier()
+    stored = disk.get(key) if disk is not None else None
+    return _promote(key, stored, capacity, debug)
+
+
+async def cache_get_async(
+    key: str,
+    *,
+    debug: Callable[[str], None] | None = None,
+) -> Optional[Intent]:
+    """``cache_get`` for a caller on an event loop.
+
+    The memory tier is read inline; a miss goes to the disk tier in a worker
+    thread, so a busy SQLite file never holds up the loop.
+    """
+    capacity = response_cache_capacity()
+    cached = _memory_get(key, capacity, debug)
+    if cached is not None or capacity == 0:
+        return cached
+    disk = disk_tier()
+    stored = await asyncio.to_thread(disk.get, key) if disk is not None else None
+    return _promote(key, stored, capacity, debug)
+
+
 def cache_put(key: str, intent: Intent) -> None:
     """Store an intent, evicting the least recently used entry if needed."""
     capacity = response_cache_capacity()
@@ -91,19 +217,30 @@ def cache_put(key: str, intent: Intent) -> None:
         response_cache.clear()
         return
 
-    response_cache.pop(key, None)
-    while len(response_cache) >= capacity:
-        response_cache.popitem(last=False)
-
-    response_cache[key] = (
-        intent.action,
-        intent.args,
-        intent.confidence,
-        intent.reply,
-        intent.effects,
-        intent.rationale,
-    )
+    response = _intent_tuple(intent)
+    _remember(key, response, capacity)
+    disk = disk_tier()
+    if disk is not None:
+        disk.put(key, response)
 
 
 def clear_response_cache() -> None:
     response_cache.clear()
+    for counter in _memory_stats:
+        _memory_stats[counter] = 0
+    disk = disk_tier()
+    if disk is not None:
+        disk.clear()
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Hit, miss and eviction counters for each tier."""
+    disk = disk_tier()
+    return {
+        "memory": {
+            **_memory_stats,
+            "size": len(response_cache),
+            "capacity": response_cache_capacity(),
+        },
+        "disk": disk.stats() if disk is not None else {"enabled": False},
+    }
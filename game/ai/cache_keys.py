@@ -0,0 +1,70 @@
+"""Cache-key derivation for interpreted commands.
+
+Hashing the whole context verbatim made a key unique to one player's exact fear
+and health, which drift by a point or two every few turns, so two people typing
+"look around" in the same place rarely shared an entry.
+
+A key now holds exactly what the interpreter prompt renders
+(``build_user_message_content`` in ``game.ai.prompt``): the exits, room items
+and inventory, every world flag, rooms explored, whether the room is known,
+the active quest and the Act V offer. Anything the model can read can change
+its reply and its effects as well as its action, so none of it is left out.
+The one normalisation is fear and health, which go in as the bands the system
+prompt writes its tone rules against rather than as numbers: a player a few
+points away from another in the same band shares their entries.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Tuple
+
+from game.ai.rules import act_v_offer_active
+
+
+# Upper bounds of each band. The named ones are the system prompt's (fear
+# 0-20 / 40-60 / 70+, health below 40 / 40-70 / 80+); the stretches between
+# them are their own bands because the prompt leaves the model to blend there.
+FEAR_BANDS: Tuple[int, ...] = (20, 39, 60, 69)
+HEALTH_BANDS: Tuple[int, ...] = (39, 70, 79)
+
+# Context fields the prompt renders, keyed verbatim. Lists are sorted, so the
+# order a room happens to list its items in does not split entries. The
+# carryable items are not rendered but decide what a take may pick up.
+PROMPT_FIELDS: Tuple[Tuple[str, Any], ...] = (
+    ("exits", []),
+    ("room_items", []),
+    ("carryable_room_items", []),
+    ("inventory", []),
+    ("world_flags", {}),
+    ("rooms_visited", 1),
+    ("been_here_before", False),
+    ("active_quest", None),
+    ("can_advance_to_dawn", False),
+)
+
+
+def band(value: Any, bounds: Tuple[int, ...]) -> int:
+    """Return the index of the band *value* falls in."""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        number = 0.0
+    for index, upper in enumerate(bounds):
+        if number <= upper:
+            return index
+    return len(bounds)
+
+
+def cache_key_fields(user_text: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the normalised context a cache key is made from."""
+    fields: Dict[str, Any] = {
+        "user_text": " ".join(user_text.strip().lower().split()),
+        "room_id": context.get("room_id") or context.get("room_name", ""),
+        "fear_band": band(context.get("fear", 0), FEAR_BANDS),
+        "health_band": band(context.get("health", 100), HEALTH_BANDS),
+        "act_v_offer_active": act_v_offer_active(context),
+    }
+    for name, default in PROMPT_FIELDS:
+        value = context.get(name, default)
+        fields[name] = sorted(value) if isinstance(value, (list, tuple, set)) else value
+    return fields
@@ -0,0 +1,236 @@
+"""Persistent second tier for the interpreter response cache.
+
+The in-memory LRU in ``game.ai.cache`` is lost on every deploy and restart,
+and each uvicorn worker keeps its own. This tier keeps interpretations in a
+local SQLite file instead, so hot ones survive restarts and are shared by
+every worker on the machine.
+
+Rows carry a version stamp. An entry written under a different prompt
+template (or model) is never served, and is purged the next time the file is
+opened, because an intent is only as good as the prompt that produced it.
+
+A cache must never cost a turn: every SQLite failure reads as a miss or a
+skipped write, logged at debug level. Nor may it stall the event loop: a write
+is queued and committed by the store's own thread, a read made from a
+coroutine runs in a worker thread (``cache_get_async`` in ``game.ai.cache``),
+and ``stats`` reads a running row count rather than counting the table. Every
+read commits whatever this store still has queued first, so it sees its own
+writes.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+
+logger = logging.getLogger("the-cabin")
+
+# Writers from other workers hold the file briefly; wait rather than miss.
+SQLITE_BUSY_TIMEOUT_SECONDS = 0.5
+
+
+class DiskResponseCache:
+    """Size-bounded SQLite store with LRU and TTL eviction."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        capacity: int,
+        ttl_seconds: float,
+        version: str,
+    ) -> None:
+        self.path = path
+        self.capacity = capacity
+        self.ttl_seconds = ttl_seconds
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Rows in the file as of this store's last count, kept up to date by
+        # its own writes and evictions. Other workers' writes show up when
+        # the file is next opened.
+        self._size = 0
+        # Held for every use of the connection.
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        # Writes not yet committed, keyed so a second put of a key replaces
+        # the first: key -> (payload, time of the put).
+        self._queue: Dict[str, Tuple[str, float]] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                str(self.path),
+                timeout=SQLITE_BUSY_TIMEOUT_SECONDS,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            # WAL lets readers in other workers proceed during a write.
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " version TEXT NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " used_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at)"
+            )
+            purged = connection.execute(
+                "DELETE FROM responses WHERE version != ?", (self.version,)
+            ).rowcount
+            self.evictions += max(0, purged)
+            self._size = connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            self._connection = connection
+        return self._connection
+
+    def get(self, key: str) -> Optional[Sequence[Any]]:
+        """Return the stored response tuple for *key*, or None."""
+        now = time.time()
+        with self._lock:
+            self._drain()
+            try:
+                connection = self._connect()
+                row = connection.execute(
+                    "SELECT payload, created_at FROM responses"
+                    " WHERE key = ? AND version = ?",
+                    (key, self.version),
+                ).fetchone()
+                if row is not None and now - row[1] > self.ttl_seconds:
+                    connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self.evictions += 1
+                    self._size = max(0, self._size - 1)
+                    row = None
+                if row is None:
+                    self.misses += 1
+                    return None
+                connection.execute(
+                    "UPDATE responses SET used_at = ? WHERE key = ?", (now, key)
+                )
+                self.hits += 1
+                return json.loads(row[0])
+            except (sqlite3.Error, OSError, ValueError):
+                logger.debug("Response cache read failed: %s", self.path, exc_info=True)
+                self.misses += 1
+                return None
+
+    def put(self, key: str, response: Sequence[Any]) -> None:
+        """Queue *response* under *key* for the store's thread to commit."""
+        try:
+            payload = json.dumps(list(response))
+        except (TypeError, ValueError):
+            logger.debug("Response cache write failed: %s", self.path, exc_info=True)
+            return
+        with self._condition:
+            self._queue.pop(key, None)
+            self._queue[key] = (payload, time.time())
+            self._closed = False
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="response-cache-writer", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self) -> None:
+        """Commit everything queued so far."""
+        with self._lock:
+            self._drain()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if not self._queue:
+                    self._thread = None
+                    return
+            with self._lock:
+                self._drain()
+
+    def _drain(self) -> None:
+        """Commit the queued writes. The caller holds ``_lock``."""
+        with self._condition:
+            batch = list(self._queue.items())
+            self._queue.clear()
+        for key, (payload, now) in batch:
+            self._write(key, payload, now)
+
+    def _write(self, key: str, payload: str, now: float) -> None:
+        """Store one row, evicting expired and least recently used rows."""
+        try:
+            connection = self._connect()
+            existed = connection.execute(
+                "SELECT 1 FROM responses WHERE key = ?", (key,)
+            ).fetchone() is not None
+            connection.execute(
+                "INSERT OR REPLACE INTO responses"
+                " (key, version, payload, created_at, used_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, self.version, payload, now, now),
+            )
+            expired = connection.execute(
+                "DELETE FROM responses WHERE created_at < ?",
+                (now - self.ttl_seconds,),
+            ).rowcount
+            overflow = connection.execute(
+                "DELETE FROM responses WHERE key IN ("
+                " SELECT key FROM responses ORDER BY used_at DESC"
+                " LIMIT -1 OFFSET ?)",
+                (self.capacity,),
+            ).rowcount
+            evicted = max(0, expired) + max(0, overflow)
+            self.evictions += evicted
+            self._size = max(0, self._size + (not existed) - evicted)
+        except (sqlite3.Error, OSError):
+            logger.debug("Response cache write failed: %s", self.path, exc_info=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            with self._condition:
+                self._queue.clear()
+            try:
+                self._connect().execute("DELETE FROM responses")
+            except (sqlite3.Error, OSError):
+                logger.debug("Response cache clear failed: %s", self.path, exc_info=True)
+            self.hits = self.misses = self.evictions = 0
+            self._size = 0
+
+    def size(self) -> int:
+        """Rows in the file, from the running count; no query is made."""
+        return self._size
+
+    def close(self) -> None:
+        """Commit what is queued, stop the store's thread and close the file."""
+        with self._lock:
+            self._drain()
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": True,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": self.size(),
+            "capacity": self.capacity,
+        }
@@ -0,0 +1,154 @@
+"""Deterministic fast path for commands that need no model judgement.
+
+Online, ``rule_based`` only answers obvious fixture uses; everything else,
+down to a bare "look", went to the model and waited on it. This matcher
+settles the commands whose meaning is fixed by the words and the context
+alone: looking, the inventory, waiting, moving through a listed exit, and
+taking or dropping an item named exactly.
+
+It is table-driven. Whole-input phrases sit in one index; verb phrases sit in
+a token trie, so "pick up" and "set down" are found by walking the input once
+rather than by trying each verb in turn. The object must then match the
+context exactly: a listed exit (or an alias for one), a carryable room item,
+an item in hand. Typos, unknown targets and anything else ambiguous return
+None and are left to the model, which is still the judge of everything this
+does not recognise.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Tuple
+
+from game.ai.rules import (
+    DIRECTION_ALIASES,
+    INVENTORY_SYNONYMS,
+    LOOK_SYNONYMS,
+    WAIT_SYNONYMS,
+    act_v_offer_active,
+    normalise_interaction_target,
+)
+from game.ai.types import Intent
+
+
+FAST_PATH_CONFIDENCE = 0.95
+
+LOOK_PHRASES = LOOK_SYNONYMS | {
+    "look around",
+    "look about",
+    "have a look",
+    "have a look around",
+    "take a look",
+    "take a look around",
+}
+
+PHRASE_INDEX: Dict[str, str] = {
+    **{phrase: "look" for phrase in LOOK_PHRASES},
+    **{phrase: "inventory" for phrase in INVENTORY_SYNONYMS},
+    **{phrase: "wait" for phrase in WAIT_SYNONYMS},
+}
+
+VERB_PHRASES: Dict[str, Tuple[str, ...]] = {
+    "move": ("go", "head", "walk", "enter", "move", "step", "run", "crawl", "climb"),
+    "take": ("take", "grab", "get", "collect", "snatch", "acquire", "pick up"),
+    "drop": ("drop", "discard", "set down", "put down"),
+}
+
+# Words between a movement verb and its exit: "go to the north".
+TOWARD_WORDS = frozenset(
+    {"to", "towards", "toward", "into", "inside", "in", "through", "across"}
+)
+
+# Where each action looks for its object.
+OBJECT_SOURCES: Dict[str, Tuple[str, ...]] = {
+    "take": ("carryable_room_items",),
+    "drop": ("inventory",),
+}
+
+_LEAF = ""
+
+
+def _compile_trie(verbs: Dict[str, Tuple[str, ...]]) -> Dict[str, Any]:
+    trie: Dict[str, Any] = {}
+    for action, phrases in verbs.items():
+        for phrase in phrases:
+            node = trie
+            for token in phrase.split():
+                node = node.setdefault(token, {})
+            node[_LEAF] = action
+    return trie
+
+
+VERB_TRIE = _compile_trie(VERB_PHRASES)
+
+
+def _longest_verb(tokens: list[str]) -> Tuple[Optional[str], int]:
+    """Return the action of the longest verb phrase *tokens* start with."""
+    node = VERB_TRIE
+    action: Optional[str] = None
+    length = 0
+    for index, token in enumerate(tokens):
+        node = node.get(token)
+        if node is None:
+            break
+        if _LEAF in node:
+            action, length = node[_LEAF], index + 1
+    return action, length
+
+
+def _exact_exit(target: str, context: Dict[str, Any]) -> Optional[str]:
+    exits = {str(name).lower(): str(name) for name in context.get("exits", [])}
+    normalised = normalise_interaction_target(target)
+    if normalised in exits:
+        return exits[normalised]
+    alias = DIRECTION_ALIASES.get(normalised)
+    return exits.get(alias) if alias else None
+
+
+def _exact_item(target: str, context: Dict[str, Any], sources: Tuple[str, ...]) -> Optional[str]:
+    normalised = normalise_interaction_target(target)
+    for source in sources:
+        for item in context.get(source, []):
+            if str(item).lower() == normalised:
+                return str(item)
+    return None
+
+
+def _intent(action: str, args: Dict[str, Any]) -> Intent:
+    return Intent(
+        action,
+        args,
+        FAST_PATH_CONFIDENCE,
+        reply=None,
+        effects=None,
+        rationale=f"fast path {action}",
+    )
+
+
+def fast_path(user_text: str, context: Optional[Dict[str, Any]]) -> Optional[Intent]:
+    """Return the intent for an unambiguous command, or None."""
+    if not context or act_v_offer_active(context):
+        # During the dawn offer "take the mug" and "stay" are the story's
+        # choice, not an item or a wait; rule_based owns those words there.
+        return None
+    text = " ".join(user_text.strip().lower().rstrip(".!").split())
+    if not text:
+        return None
+
+    action = PHRASE_INDEX.get(text)
+    if action:
+        return _intent(action, {})
+
+    tokens = text.split()
+    action, length = _longest_verb(tokens)
+    rest = tokens[length:]
+    if action == "move":
+        if len(rest) >= 2 and rest[0] in TOWARD_WORDS:
+            rest = rest[1:]
+        direction = _exact_exit(" ".join(rest), context) if rest else None
+        return _intent("move", {"direction": direction}) if direction else None
+    if action in OBJECT_SOURCES:
+        item = _exact_item(" ".join(rest), context, OBJECT_SOURCES[action]) if rest else None
+        return _intent(action, {"item": item}) if item else None
+
+    direction = _exact_exit(text, context)
+    return _intent("move", {"direction": direction}) if direction else None
@@ -0,0 +1,318 @@
+"""Process-wide pooled HTTP clients shared by every model request.
+
+Building a client per call (or per API key) means a fresh TCP and TLS
+handshake on top of model latency whenever the previous connection has gone.
+One blocking and one async client live here instead, with bounded pools and
+keep-alive, and every session's model traffic goes through them.
+
+Settings are read from the environment when a client is first built rather
+than at import, for the same reason ``game.env`` exists: a value frozen at
+module scope would ignore a ``.env`` loaded after the import.
+
+This module sits below ``game.ai.transport``, which sends its requests through
+it, so it imports nothing from the game.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
+
+try:
+    import httpx as _httpx  # type: ignore
+except Exception:  # pragma: no cover
+    _httpx = None
+
+
+logger = logging.getLogger("the-cabin")
+
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 30.0
+# Every model request also passes its own remaining deadline; this is only
+# the clients' default.
+DEFAULT_TIMEOUT_SECONDS = 20.0
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Connection-pool limits for the shared clients."""
+
+    max_connections: int
+    max_keepalive_connections: int
+    keepalive_expiry: float
+    http2: bool
+    timeout: float = DEFAULT_TIMEOUT_SECONDS
+
+
+def positive_float_env(name: str, default: float) -> float:
+    """Parse a positive finite float without making import fragile."""
+    try:
+        value = float(os.getenv(name, ""))
+    except (TypeError, ValueError):
+        return default
+    return value if math.isfinite(value) and value > 0 else default
+
+
+def _positive_int_env(name: str, default: int) -> int:
+    try:
+        value = int(os.getenv(name, ""))
+    except (TypeError, ValueError):
+        return default
+    return value if value > 0 else default
+
+
+def _http2_supported() -> bool:
+    """HTTP/2 needs the optional ``h2`` package alongside httpx."""
+    try:
+        import h2  # type: ignore  # noqa: F401
+    except Exception:
+        return False
+    return True
+
+
+def pool_settings() -> PoolSettings:
+    """Read pool limits from the environment, falling back to the defaults.
+
+    ``CABIN_HTTP2=1`` asks for HTTP/2. Without ``h2`` installed the request is
+    logged and ignored, so a missing extra costs multiplexing, not the turn.
+    """
+    max_connections = _positive_int_env(
+        "CABIN_HTTP_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS
+    )
+    keepalive = min(
+        max_connections,
+        _positive_int_env(
+            "CABIN_HTTP_MAX_KEEPALIVE", DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+        ),
+    )
+    http2 = os.getenv("CABIN_HTTP2", "").lower() in ("1", "true", "yes")
+    if http2 and not _http2_supported():
+        logger.warning("CABIN_HTTP2 is set but h2 is not installed; using HTTP/1.1")
+        http2 = False
+    return PoolSettings(
+        max_connections=max_connections,
+        max_keepalive_connections=keepalive,
+        keepalive_expiry=positive_float_env(
+            "CABIN_HTTP_KEEPALIVE_SECONDS", DEFAULT_KEEPALIVE_EXPIRY_SECONDS
+        ),
+        http2=http2,
+        timeout=positive_float_env("OPENAI_TIMEOUT_SECONDS", DEFAULT_TIMEOUT_SECONDS),
+    )
+
+
+class _Gauge:
+    """Requests one client has out: holding a connection or queued for one."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self._lock = threading.Lock()
+
+    def enter(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+
+    def leave(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+
+# The shared clients count their own requests, through httpx's public client
+# and byte-stream classes: httpx has no public view of its pool. A request is
+# counted from send until its response is closed, streamed body included.
+_Client = _httpx.Client if _httpx is not None else object
+_AsyncClient = _httpx.AsyncClient if _httpx is not None else object
+_SyncByteStream = _httpx.SyncByteStream if _httpx is not None else object
+_AsyncByteStream = _httpx.AsyncByteStream if _httpx is not None else object
+
+
+class _CountedStream(_SyncByteStream):  # type: ignore[misc, valid-type]
+    def __init__(self, stream: Any, gauge: _Gauge) -> None:
+        self._stream = stream
+        self._gauge: Optional[_Gauge] = gauge
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._stream:
+            yield chunk
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            gauge, self._gauge = self._gauge, None
+            if gauge is not None:
+                gauge.leave()
+
+
+class _CountedAsyncStream(_AsyncByteStream):  # type: ignore[misc, valid-type]
+    def __init__(self, stream: Any, gauge: _Gauge) -> None:
+        self._stream = stream
+        self._gauge: Optional[_Gauge] = gauge
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            gauge, self._gauge = self._gauge, None
+            if gauge is not None:
+                gauge.leave()
+
+
+class _CountedClient(_Client):  # type: ignore[misc, valid-type]
+    def __init__(self, **options: Any) -> None:
+        super().__init__(**options)
+        self.gauge = _Gauge()
+
+    def send(self, request: Any, **kwargs: Any) -> Any:
+        self.gauge.enter()
+        try:
+            response = super().send(request, **kwargs)
+        except BaseException:
+            self.gauge.leave()
+            raise
+        if response.is_closed:
+            self.gauge.leave()
+        else:
+            response.stream = _CountedStream(response.stream, self.gauge)
+        return response
+
+
+class _CountedAsyncClient(_AsyncClient):  # type: ignore[misc, valid-type]
+    def __init__(self, **options: Any) -> None:
+        super().__init__(**options)
+        self.gauge = _Gauge()
+
+    async def send(self, request: Any, **kwargs: Any) -> Any:
+        self.gauge.enter()
+        try:
+            response = await super().send(request, **kwargs)
+        except BaseException:
+            self.gauge.leave()
+            raise
+        if response.is_closed:
+            self.gauge.leave()
+        else:
+            response.stream = _CountedAsyncStream(response.stream, self.gauge)
+        return response
+
+
+_settings: Optional[PoolSettings] = None
+_http_client: Optional[Any] = None
+# One async client per event loop: pooled connections belong to the loop that
+# opened them.
+_async_http_clients: Dict[asyncio.AbstractEventLoop, Any] = {}
+
+
+def _client_options() -> Dict[str, Any]:
+    global _settings
+    if _settings is None:
+        _settings = pool_settings()
+    return {
+        "limits": _httpx.Limits(
+            max_connections=_settings.max_connections,
+            max_keepalive_connections=_settings.max_keepalive_connections,
+            keepalive_expiry=_settings.keepalive_expiry,
+        ),
+        "http2": _settings.http2,
+        "timeout": _settings.timeout,
+    }
+
+
+def get_http_client() -> Any:
+    """Return the shared blocking client, building it on first use."""
+    global _http_client
+    if _httpx is None:
+        raise RuntimeError("httpx transport is unavailable")
+    if _http_client is None:
+        _http_client = _CountedClient(**_client_options())
+    return _http_client
+
+
+def get_async_http_client() -> Any:
+    """Return the shared async client for the running event loop.
+
+    A server has one loop for its whole life, so this is built once. Each
+    other loop (a test harness calling ``asyncio.run`` repeatedly) gets a
+    client of its own rather than sockets from another loop, and keeps it
+    while it runs. A client whose loop has closed is dropped on the way past:
+    its loop can no longer close it, and its sockets go when it is collected.
+    """
+    if _httpx is None:
+        raise RuntimeError("httpx transport is unavailable")
+    loop = asyncio.get_running_loop()
+    client = _async_http_clients.get(loop)
+    if client is None:
+        _drop_closed_loops()
+        client = _async_http_clients[loop] = _CountedAsyncClient(**_client_options())
+    return client
+
+
+def _drop_closed_loops() -> None:
+    for loop in [loop for loop in _async_http_clients if loop.is_closed()]:
+        del _async_http_clients[loop]
+
+
+def _in_use_and_waiting(client: Any, settings: PoolSettings) -> Tuple[int, int]:
+    in_flight = client.gauge.in_flight
+    if settings.http2:
+        # Multiplexed: requests share connections rather than queue for them.
+        return in_flight, 0
+    return min(in_flight, settings.max_connections), max(
+        0, in_flight - settings.max_connections
+    )
+
+
+def pool_stats() -> Dict[str, Any]:
+    """Requests in flight through the shared clients, and how many wait.
+
+    ``in_use`` is requests holding a connection, streamed bodies included.
+    ``waiting`` is requests queued for one because a client's pool is at
+    ``max_connections``; a number that stays above zero means the limit is
+    too low for the traffic.
+    """
+    settings = _settings or pool_settings()
+    in_use = waiting = 0
+    for client in (_http_client, *_async_http_clients.values()):
+        if client is None:
+            continue
+        using, queued = _in_use_and_waiting(client, settings)
+        in_use += using
+        waiting += queued
+    return {
+        "in_use": in_use,
+        "waiting": waiting,
+        "clients": int(_http_client is not None) + len(_async_http_clients),
+        "max_connections": settings.max_connections,
+        "http2": settings.http2,
+    }
+
+
+async def aclose_http_clients() -> None:
+    """Close the shared clients. Safe to call when none was built.
+
+    The running loop's async client is closed here. One still running on
+    another loop is closed on that loop; one whose loop has gone is dropped
+    (see :func:`get_async_http_client`).
+    """
+    global _http_client, _settings
+    running = asyncio.get_running_loop()
+    clients = list(_async_http_clients.items())
+    _async_http_clients.clear()
+    sync_client, _http_client = _http_client, None
+    _settings = None
+    for loop, client in clients:
+        if loop is running:
+            await client.aclose()
+        elif loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+    if sync_client is not None:
+        sync_client.close()
@@ -0,0 +1,179 @@
+"""Opt-in model warm-up while a web session shows an overlay.
+
+A cutscene or quest screen holds the player for seconds, and the server does
+nothing with them. With ``CABIN_MODEL_PREFETCH=1`` the session asks for a
+warm-up when an overlay opens: one short completion carrying the static
+system prompt, sent through the shared async pool. That leaves a keep-alive
+connection open and the provider's prefix cache holding the system block, so
+the first real command after dismissal skips the handshake and most of the
+prompt processing.
+
+It is a bet, so it is counted. A warm-up is a hit when a real model request
+follows while it is still fresh, and waste when it goes stale unused (the
+player's next commands were answered by the fast path or the cache, or they
+left). No warm-up is sent while the prefix is already fresh from real
+traffic, which on a busy server is nearly always: those count as skipped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from time import monotonic
+from typing import Any, Callable, Dict, Optional, Set
+
+from game.ai import http_pool
+from game.ai.prompt import build_interpreter_messages
+from game.ai.transport import (
+    OPENAI_CHAT_COMPLETIONS_URL,
+    OPENAI_TIMEOUT_SECONDS,
+    build_openai_chat_params,
+    record_usage,
+)
+from game.config import get_config
+
+logger = logging.getLogger("the-cabin")
+
+# Providers keep a cached prefix for five to ten minutes of disuse; count a
+# warm-up fresh for the short end of that.
+PREFETCH_FRESH_SECONDS = 300.0
+
+# Output budget for a warm-up. Only the prompt matters, but a budget of one
+# token is refused or cut off mid-reasoning by some models; this is still a
+# rounding error beside a real reply's.
+WARM_UP_MAX_TOKENS = 16
+
+_counters: Dict[str, int] = {
+    "issued": 0,
+    "hits": 0,
+    "wasted": 0,
+    "skipped": 0,
+    "failed": 0,
+}
+_warm_until = 0.0
+_warm_used = True
+_last_request_at: Optional[float] = None
+_inflight: Optional[asyncio.Task] = None
+# Strong references, so a scheduled warm-up is not collected mid-flight.
+_tasks: Set[asyncio.Task] = set()
+
+
+def prefetch_enabled() -> bool:
+    return os.getenv("CABIN_MODEL_PREFETCH", "").lower() in ("1", "true", "yes")
+
+
+def _settle(now: float) -> None:
+    """Count a warm-up that went stale without a request as waste."""
+    global _warm_until, _warm_used
+    if _warm_until and now >= _warm_until:
+        if not _warm_used:
+            _counters["wasted"] += 1
+        _warm_until = 0.0
+        _warm_used = True
+
+
+def note_model_request() -> None:
+    """Record that a real model request is being made."""
+    global _last_request_at, _warm_used
+    now = monotonic()
+    _settle(now)
+    if now < _warm_until and not _warm_used:
+        _counters["hits"] += 1
+        _warm_used = True
+    _last_request_at = now
+
+
+def _prefix_is_fresh(now: float) -> bool:
+    if now < _warm_until:
+        return True
+    return _last_request_at is not None and now - _last_request_at < PREFETCH_FRESH_SECONDS
+
+
+def _warm_up_params() -> Dict[str, Any]:
+    config = get_config()
+    model = config.openai_model
+    reasoning_effort = (
+        getattr(config, "openai_reasoning_effort", "none")
+        if model.startswith("gpt-5")
+        else None
+    )
+    params = build_openai_chat_params(
+        model,
+        build_interpreter_messages("wait", {}),
+        stream=False,
+        reasoning_effort=reasoning_effort,
+    )
+    for limit in ("max_completion_tokens", "max_tokens"):
+        if limit in params:
+            params[limit] = WARM_UP_MAX_TOKENS
+    # JSON mode refuses a reply cut off by the budget, and the warm-up's reply
+    # is never read. The cached prefix is the messages, which are unchanged.
+    params.pop("response_format", None)
+    return params
+
+
+async def warm_up(api_key: str, debug: Callable[[str], None]) -> bool:
+    """Send one warm-up completion through the shared pool."""
+    global _warm_until, _warm_used
+    try:
+        response = await http_pool.get_async_http_client().post(
+            OPENAI_CHAT_COMPLETIONS_URL,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            },
+            json=_warm_up_params(),
+            timeout=OPENAI_TIMEOUT_SECONDS,
+        )
+        response.raise_for_status()
+        record_usage(response.json().get("usage"), debug)
+    except Exception as error:
+        _counters["failed"] += 1
+        debug(f"Model warm-up failed: {type(error).__name__}")
+        return False
+    _warm_until = monotonic() + PREFETCH_FRESH_SECONDS
+    _warm_used = False
+    return True
+
+
+def schedule_warm_up(debug: Callable[[str], None] = lambda _: None) -> Optional[asyncio.Task]:
+    """Start a warm-up on the running loop if one would help, and return it."""
+    global _inflight
+    if not prefetch_enabled():
+        return None
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        return None
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+    now = monotonic()
+    _settle(now)
+    if _prefix_is_fresh(now) or (_inflight is not None and not _inflight.done()):
+        _counters["skipped"] += 1
+        return None
+
+    _counters["issued"] += 1
+    task = loop.create_task(warm_up(api_key, debug))
+    _inflight = task
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return task
+
+
+def prefetch_stats() -> Dict[str, Any]:
+    _settle(monotonic())
+    return {"enabled": prefetch_enabled(), **_counters}
+
+
+def reset_prefetch() -> None:
+    global _warm_until, _warm_used, _last_request_at, _inflight
+    for key in _counters:
+        _counters[key] = 0
+    _warm_until = 0.0
+    _warm_used = True
+    _last_request_at = None
+    _inflight = None
@@ -2,25 +2,31 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from game.ai.rules import act_v_offer_active
 
 
-SYSTEM_PROMPT_TEMPLATE = (
+# The system block is the same bytes for every player, room and turn, so the
+# provider can cache it as a prefix. Everything that varies (exits, items,
+# inventory, fear and health, quest, the false-cabin rules) travels in the
+# user message after it; the wording here refers to those fields by name.
+SYSTEM_PROMPT = (
     "You are a command interpreter for a text adventure set in a cold, eerie Finnish wilderness.\n"
     "Output ONLY a single JSON object, no prose, code fences, or commentary.\n\n"
     "Tone & style:\n"
     "- Diegetic, second person (you), terse, moody, atmospheric, no meta.\n"
     "- No breaking the fourth wall, no 'as an AI'.\n"
-    "- Modulate tone based on the player's state:\n"
+    "- Modulate tone based on the player's state (fear and health in the turn context):\n"
     "  - Fear 0-20: calm, observational. Fear 40-60: uneasy, senses sharpened. Fear 70+: panicked, paranoid, seeing threats in shadows.\n"
     "  - Health 80-100: sturdy. Health 40-70: pain colours actions, body protests. Health below 40: desperate, every movement costs.\n"
     "  - When both fear and health are critical, the prose should feel frayed, breathless.\n"
-    "- If the player has been here before, don't repeat discovery language. They know this place.\n"
-    "- If a quest is active, the player's purpose should subtly colour the narration.\n"
-    "{wrong_layer_rules}\n"
+    "- If been_here_before is true, don't repeat discovery language. They know this place.\n"
+    "- If active_quest is set, the player's purpose should subtly colour the narration.\n"
+    "- If the turn context carries layer_rules, they bind every reply; follow them exactly.\n\n"
     "CRITICAL - Handling unusual/creative player input:\n"
     "- If the player types something that is NOT a standard game command (move, look, take, etc.), use action: 'none'.\n"
     "- For action: 'none', you MUST provide a diegetic 'reply' that narrates what happens.\n"
@@ -48,29 +54,27 @@ SYSTEM_PROMPT_TEMPLATE = (
     "- Use 'turn_on_lights' for attempting to turn on lights or use light switches.\n"
     "- Use 'use_circuit_breaker' for flipping the circuit breaker to restore power.\n"
     "- Use 'wait' when the player waits, sits down, stays still, keeps watch, or lets time pass.\n"
-    "- Use 'accept' ONLY for accepting the offered coffee, whether by taking/drinking it or by explicit assent (yes, accept, stay), and ONLY if Act V offer active is true.\n"
-    "- Use 'refuse' ONLY for declining the offered coffee (no thank you, refuse the coffee, put the mug down, decline), and ONLY if Act V offer active is true.\n"
-    "- If Act V offer active is true, a bare 'no' or 'no thank you' is the refusal; a bare 'yes' with the mug in play is acceptance.\n"
-    "- If Act V offer active is false, abstract assent/refusal like 'yes', 'no', 'accept', 'refuse', or 'stay' must use 'none' unless another standard action clearly applies.\n"
-    "- If Act V offer active is false, 'accept' and 'refuse' are never valid — even a decline aimed at the mug or coffee is 'none', narrated in the scene.\n"
+    "- Use 'accept' ONLY for accepting the offered coffee, whether by taking/drinking it or by explicit assent (yes, accept, stay), and ONLY if act_v_offer_active is true.\n"
+    "- Use 'refuse' ONLY for declining the offered coffee (no thank you, refuse the coffee, put the mug down, decline), and ONLY if act_v_offer_active is true.\n"
+    "- If act_v_offer_active is true, a bare 'no' or 'no thank you' is the refusal; a bare 'yes' with the mug in play is acceptance.\n"
+    "- If act_v_offer_active is false, abstract assent/refusal like 'yes', 'no', 'accept', 'refuse', or 'stay' must use 'none' unless another standard action clearly applies.\n"
+    "- If act_v_offer_active is false, 'accept' and 'refuse' are never valid — even a decline aimed at the mug or coffee is 'none', narrated in the scene.\n"
     "- Use 'none' for ALL other input — creative, impossible, ambiguous, or roleplay actions.\n"
-    "- You MAY suggest movement ONLY if the direction/exit is in this list: {exits}.\n"
+    "- You MAY suggest movement ONLY if the direction/exit is in exits.\n"
     "- Exit names like 'konttori', 'cabin', 'lakeside' are valid movement targets.\n"
-    "- NEVER invent rooms, exits, or items. You MAY reference only the provided items.\n"
-    "- Available room items: {room_items}\n"
-    "- Player inventory: {inventory}\n"
-    "- Player fear: {fear}/100 | Player health: {health}/100\n"
-    "- Rooms explored: {rooms_visited} | Returning to this room: {been_here_before}\n"
-    "- Active quest: {active_quest}\n"
-    "- Act V offer active: {act_v_offer_active}\n"
+    "- NEVER invent rooms, exits, or items. You MAY reference only the items in room_items and inventory.\n"
+    "- fear and health are out of 100. rooms_visited counts rooms explored so far.\n"
     "- You MAY suggest small effects: fear and health deltas in [-2, +2]; optionally inventory_add / inventory_remove using only known items.\n"
     "- Keep reply ≤ 200 chars. Aim for 1-3 terse sentences.\n\n"
     "Schema:\n"
-    '{{"action": "...", "args": {{...}}, "confidence": 0.0, "reply": "...", '
-    '"effects": {{"fear": 0, "health": 0, "inventory_add": [], "inventory_remove": []}}, '
-    '"rationale": "..."}}'
+    '{"action": "...", "args": {...}, "confidence": 0.0, "reply": "...", '
+    '"effects": {"fear": 0, "health": 0, "inventory_add": [], "inventory_remove": []}, '
+    '"rationale": "..."}'
 )
 
+# Older name, kept for the evaluation harness and the facade.
+SYSTEM_PROMPT_TEMPLATE = SYSTEM_PROMPT
+
 
 def wrong_layer_rules(context: Optional[Dict[str, Any]]) -> str:
     """Return false-cabin constraints for model flavour."""
@@ -112,39 +116,30 @@ def wrong_layer_rules(context: Optional[Dict[str, Any]]) -> str:
     )
 
 
-def build_system_prompt(context: Dict[str, Any]) -> str:
-    return SYSTEM_PROMPT_TEMPLATE.format(
-        exits=list(context.get("exits", [])),
-        room_items=list(context.get("room_items", [])),
-        inventory=list(context.get("inventory", [])),
-        fear=context.get("fear", 0),
-        health=context.get("health", 100),
-        rooms_visited=context.get("rooms_visited", 1),
-        been_here_before=context.get("been_here_before", False),
-        active_quest=context.get("active_quest") or "none",
-        act_v_offer_active=act_v_offer_active(context),
-        wrong_layer_rules=wrong_layer_rules(context),
-    )
+def build_system_prompt(context: Optional[Dict[str, Any]] = None) -> str:
+    """Return the system block. It no longer depends on *context*."""
+    return SYSTEM_PROMPT
 
 
 def build_user_message_content(user_text: str, context: Dict[str, Any]) -> str:
-    return json.dumps(
-        {
-            "instructions": "Return only the JSON object with the specified schema.",
-            "exits": list(context.get("exits", [])),
-            "room_items": list(context.get("room_items", [])),
-            "inventory": list(context.get("inventory", [])),
-            "world_flags": context.get("world_flags", {}),
-            "fear": context.get("fear", 0),
-            "health": context.get("health", 100),
-            "rooms_visited": context.get("rooms_visited", 1),
-            "been_here_before": context.get("been_here_before", False),
-            "active_quest": context.get("active_quest"),
-            "act_v_offer_active": act_v_offer_active(context),
-            "user": user_text,
-        },
-        ensure_ascii=False,
-    )
+    payload: Dict[str, Any] = {
+        "instructions": "Return only the JSON object with the specified schema.",
+        "exits": list(context.get("exits", [])),
+        "room_items": list(context.get("room_items", [])),
+        "inventory": list(context.get("inventory", [])),
+        "world_flags": context.get("world_flags", {}),
+        "fear": context.get("fear", 0),
+        "health": context.get("health", 100),
+        "rooms_visited": context.get("rooms_visited", 1),
+        "been_here_before": context.get("been_here_before", False),
+        "active_quest": context.get("active_quest"),
+        "act_v_offer_active": act_v_offer_active(context),
+    }
+    layer_rules = wrong_layer_rules(context).strip()
+    if layer_rules:
+        payload["layer_rules"] = layer_rules
+    payload["user"] = user_text
+    return json.dumps(payload, ensure_ascii=False)
 
 
 def build_interpreter_messages(
@@ -156,3 +151,28 @@ def build_interpreter_messages(
         {"role": "system", "content": build_system_prompt(context)},
         {"role": "user", "content": build_user_message_content(user_text, context)},
     ]
+
+
+# Contexts that between them reach every fixed string the prompt can render:
+# the real cabin, the false cabin, and the false cabin once it stops pretending.
+_VERSION_PROBE_CONTEXTS = (
+    {},
+    {"world_flags": {"world_layer": "wrong"}},
+    {"world_flags": {"world_layer": "wrong", "ending": "escaped"}},
+)
+
+
+@lru_cache(maxsize=None)
+def prompt_template_version() -> str:
+    """Fingerprint of the fixed prompt text, for stamping cached intents.
+
+    Rendering the probe contexts rather than hashing the template constant
+    alone means an edit to the wrong-layer rules or the user-message shape
+    also retires what was cached under the old wording.
+    """
+    digest = hashlib.sha256()
+    for context in _VERSION_PROBE_CONTEXTS:
+        for message in build_interpreter_messages("", context):
+            digest.update(message["role"].encode("utf-8"))
+            digest.update(message["content"].encode("utf-8"))
+    return digest.hexdigest()[:16]
@@ -0,0 +1,136 @@
+"""Read the ``reply`` field out of a model response while it streams.
+
+The model answers with one JSON object, and the narration is its ``reply``
+string. Waiting for the closing brace before showing any of it makes the
+player wait for the whole completion; this reader is fed the raw chunks as
+they arrive and hands back the reply's decoded text as soon as each piece is
+known, so the first words can be on screen at time-to-first-token.
+
+It only tracks enough of JSON to find a top-level string value by key:
+nesting depth, strings and their escapes. It never validates. Whatever it
+emits is provisional; the committed frame is built from the validated intent
+once the full object has been parsed.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+
+_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+
+class ReplyStreamReader:
+    """Incremental extractor for one top-level string field."""
+
+    __slots__ = (
+        "field",
+        "done",
+        "_depth",
+        "_in_string",
+        "_escape",
+        "_unicode",
+        "_high_surrogate",
+        "_in_key",
+        "_key",
+        "_last_key",
+        "_in_value",
+        "_capturing",
+    )
+
+    def __init__(self, field: str = "reply") -> None:
+        self.field = field
+        self.done = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._unicode: Optional[str] = None
+        self._high_surrogate: Optional[int] = None
+        self._in_key = False
+        self._key: List[str] = []
+        self._last_key: Optional[str] = None
+        # Between a top-level ":" and the "," that ends its value.
+        self._in_value = False
+        self._capturing = False
+
+    def feed(self, chunk: str) -> str:
+        """Consume *chunk* and return the reply text it completed."""
+        out: List[str] = []
+        for char in chunk:
+            if self._in_string:
+                self._string_char(char, out)
+            elif char == '"':
+                self._in_string = True
+                self._in_key = self._depth == 1 and not self._in_value
+                if self._in_key:
+                    self._key = []
+                self._capturing = (
+                    not self.done
+                    and self._depth == 1
+                    and self._in_value
+                    and self._last_key == self.field
+                )
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+            elif self._depth == 1 and char == ":":
+                self._in_value = True
+            elif self._depth == 1 and char == ",":
+                self._in_value = False
+        return "".join(out)
+
+    def _string_char(self, char: str, out: List[str]) -> None:
+        if self._unicode is not None:
+            self._unicode += char
+            if len(self._unicode) == 4:
+                digits, self._unicode = self._unicode, None
+                try:
+                    self._code_point(int(digits, 16), out)
+                except ValueError:
+                    pass
+            return
+        if self._escape:
+            self._escape = False
+            if char == "u":
+                self._unicode = ""
+            else:
+                self._emit(_ESCAPES.get(char, char), out)
+            return
+        if char == "\\":
+            self._escape = True
+        elif char == '"':
+            self._in_string = False
+            if self._in_key:
+                self._last_key = "".join(self._key)
+                self._in_key = False
+            elif self._capturing:
+                self._capturing = False
+                self.done = True
+        else:
+            self._emit(char, out)
+
+    def _code_point(self, code: int, out: List[str]) -> None:
+        # Characters outside the BMP arrive as a \\uD8xx\\uDCxx pair.
+        if 0xD800 <= code < 0xDC00:
+            self._high_surrogate = code
+            return
+        if 0xDC00 <= code < 0xE000 and self._high_surrogate is not None:
+            code = 0x10000 + ((self._high_surrogate - 0xD800) << 10) + (code - 0xDC00)
+        self._high_surrogate = None
+        self._emit(chr(code), out)
+
+    def _emit(self, text: str, out: List[str]) -> None:
+        if self._in_key:
+            self._key.append(text)
+        elif self._capturing:
+            out.append(text)
@@ -25,6 +25,41 @@ DIRECTION_ALIASES = {
     "office": "north",
 }
 
+# Whole-input phrases with one meaning wherever they are typed. Shared with
+# the online fast path in ``game.ai.fast_path``.
+INVENTORY_SYNONYMS = frozenset(
+    {
+        "inv",
+        "inventory",
+        "bag",
+        "what am i carrying",
+        "what things have i got",
+        "what do i have",
+        "check inventory",
+        "show inventory",
+        "what's in my bag",
+        "what am i holding",
+        "what do i own",
+        "my stuff",
+        "my things",
+    }
+)
+LOOK_SYNONYMS = frozenset({"look", "l", "examine", "inspect", "check", "see", "observe"})
+WAIT_SYNONYMS = frozenset(
+    {
+        "wait",
+        "sit",
+        "sit down",
+        "stay still",
+        "keep still",
+        "stay put",
+        "sit and wait",
+        "sit and listen",
+        "do nothing",
+        "hold still",
+    }
+)
+
 
 def offline_none_reply(user_text: str, context: Dict[str, Any]) -> str:
     """Give common free-form attempts a grounded offline consequence."""
@@ -171,22 +206,7 @@ def rule_based(
     if not t:
         return Intent("none", {}, 0.0, "empty")
 
-    inventory_synonyms = {
-        "inv",
-        "inventory",
-        "bag",
-        "what am i carrying",
-        "what things have i got",
-        "what do i have",
-        "check inventory",
-        "show inventory",
-        "what's in my bag",
-        "what am i holding",
-        "what do i own",
-        "my stuff",
-        "my things",
-    }
-    if t in inventory_synonyms:
+    if t in INVENTORY_SYNONYMS:
         return Intent(
             "inventory",
             {},
@@ -196,8 +216,7 @@ def rule_based(
             rationale="inventory synonym",
         )
 
-    look_synonyms = {"look", "l", "examine", "inspect", "check", "see", "observe"}
-    if t in look_synonyms:
+    if t in LOOK_SYNONYMS:
         return Intent("look", {}, 0.9, reply=None, effects=None, rationale="look synonym")
 
     listen_synonyms = {"listen", "hear", "sound", "noise", "quiet"}
@@ -248,19 +267,7 @@ def rule_based(
                     rationale="obvious fixture use",
                 )
 
-    wait_synonyms = {
-        "wait",
-        "sit",
-        "sit down",
-        "stay still",
-        "keep still",
-        "stay put",
-        "sit and wait",
-        "sit and listen",
-        "do nothing",
-        "hold still",
-    }
-    if t in wait_synonyms:
+    if t in WAIT_SYNONYMS:
         return Intent("wait", {}, 0.95, reply=None, effects=None, rationale="wait synonym")
 
     if act_v_offer_active(context):
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import os
 import sys
-from typing import Any, Callable, Dict, Optional
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Generator, List, Optional
 
-from game.ai.types import Intent
+from game.ai import prefetch
+from game.ai.types import Intent, NarrationListenerError
 
 
 def _intent_log_payload(intent: Intent, *, include_effects: bool = False) -> Dict[str, Any]:
@@ -22,27 +24,46 @@ def _intent_log_payload(intent: Intent, *, include_effects: bool = False) -> Dic
     return payload
 
 
-def interpret(
+@dataclass(frozen=True)
+class ModelCall:
+    """The one model request a turn needs, as decided by the interpreter.
+
+    Produced by ``_interpret_steps`` and performed by whichever driver is
+    running it, so the blocking and awaitable paths share every decision
+    around the call and differ only in how the request itself is made.
+    """
+
+    api_key: str
+    model: str
+    messages: List[Dict[str, str]]
+    reasoning_effort: Optional[str]
+    direct_httpx: bool
+
+
+def _interpret_steps(
     user_text: str,
     context: Dict[str, Any],
     *,
     openai_available: Any,
-    get_openai_client: Callable[[str], Any],
     log_ai_call: Callable[..., Any],
     debug: Callable[[str], None],
     make_cache_key: Callable[[str, Dict[str, Any]], str],
     cache_get: Callable[[str], Optional[Intent]],
     cache_put: Callable[[str, Intent], None],
     rule_based: Callable[[str, Optional[Dict[str, Any]]], Optional[Intent]],
+    fast_path: Callable[[str, Optional[Dict[str, Any]]], Optional[Intent]],
     offline_none_reply: Callable[[str, Dict[str, Any]], str],
     build_messages: Callable[[str, Dict[str, Any]], Any],
-    request_model_json: Callable[..., Any],
-    request_model_json_httpx: Callable[..., Any],
     validate_model_response: Callable[[Any, Dict[str, Any]], Intent],
     openai_version: str,
     httpx_version: str,
-) -> Intent:
-    """Convert player input into an intent without owning subsystem details."""
+) -> Generator[ModelCall, Any, Intent]:
+    """Interpretation with the model request left to the caller.
+
+    Yields at most one ``ModelCall``. The driver sends back the decoded JSON,
+    or throws the request's exception in, and the generator returns the
+    final intent either way.
+    """
     cache_key = make_cache_key(user_text, context)
     cached = cache_get(cache_key)
     if cached:
@@ -99,6 +120,19 @@ def interpret(
         )
         return fallback_intent
 
+    # Commands the words and context settle on their own never wait on the
+    # model. Offline this changes nothing: rule_based above already answers
+    # every one of them.
+    quick = fast_path(user_text, context)
+    if quick:
+        log_ai_call(
+            user_text,
+            context,
+            _intent_log_payload(quick),
+            "deterministic fast path",
+        )
+        return quick
+
     debug(f"Using Python: {sys.version.split()[0]} at {sys.executable}")
     debug(f"openai={openai_version} httpx={httpx_version}")
     messages = build_messages(user_text, context)
@@ -116,22 +150,13 @@ def interpret(
         )
         if use_direct_httpx:
             debug(f"Calling {model} via direct httpx chat.completions")
-            data = request_model_json_httpx(
-                api_key,
-                model,
-                messages,
-                reasoning_effort=reasoning_effort,
-                debug=debug,
-            )
-        else:
-            client = get_openai_client(api_key)
-            data = request_model_json(
-                client,
-                model,
-                messages,
-                reasoning_effort=reasoning_effort,
-                debug=debug,
-            )
+        data = yield ModelCall(
+            api_key=api_key,
+            model=model,
+            messages=messages,
+            reasoning_effort=reasoning_effort,
+            direct_httpx=use_direct_httpx,
+        )
     except Exception as error:
         debug(f"Model call failed: {error!r}; using rule-based fallback")
         ruled = rule_based(user_text, context)
@@ -176,3 +201,174 @@ def interpret(
 
     cache_put(cache_key, intent)
     return intent
+
+
+def _finish(
+    steps: Generator[ModelCall, Any, Intent],
+    data: Any = None,
+    error: Optional[Exception] = None,
+) -> Intent:
+    """Hand the model outcome back to the steps and return their intent."""
+    try:
+        if error is not None:
+            steps.throw(error)
+        else:
+            steps.send(data)
+    except StopIteration as done:
+        return done.value
+    raise RuntimeError("interpreter yielded more than one model call")
+
+
+def interpret(
+    user_text: str,
+    context: Dict[str, Any],
+    *,
+    openai_available: Any,
+    get_openai_client: Callable[[str], Any],
+    log_ai_call: Callable[..., Any],
+    debug: Callable[[str], None],
+    make_cache_key: Callable[[str, Dict[str, Any]], str],
+    cache_get: Callable[[str], Optional[Intent]],
+    cache_put: Callable[[str, Intent], None],
+    rule_based: Callable[[str, Optional[Dict[str, Any]]], Optional[Intent]],
+    fast_path: Callable[[str, Optional[Dict[str, Any]]], Optional[Intent]],
+    offline_none_reply: Callable[[str, Dict[str, Any]], str],
+    build_messages: Callable[[str, Dict[str, Any]], Any],
+    request_model_json: Callable[..., Any],
+    request_model_json_httpx: Callable[..., Any],
+    validate_model_response: Callable[[Any, Dict[str, Any]], Intent],
+    openai_version: str,
+    httpx_version: str,
+) -> Intent:
+    """Convert player input into an intent without owning subsystem details."""
+    steps = _interpret_steps(
+        user_text,
+        context,
+        openai_available=openai_available,
+        log_ai_call=log_ai_call,
+        debug=debug,
+        make_cache_key=make_cache_key,
+        cache_get=cache_get,
+        cache_put=cache_put,
+        rule_based=rule_based,
+        fast_path=fast_path,
+        offline_none_reply=offline_none_reply,
+        build_messages=build_messages,
+        validate_model_response=validate_model_response,
+        openai_version=openai_version,
+        httpx_version=httpx_version,
+    )
+    try:
+        call = next(steps)
+    except StopIteration as done:
+        return done.value
+    prefetch.note_model_request()
+
+    try:
+        if call.direct_httpx:
+            data = request_model_json_httpx(
+                call.api_key,
+                call.model,
+                call.messages,
+                reasoning_effort=call.reasoning_effort,
+                debug=debug,
+            )
+        else:
+            client = get_openai_client(call.api_key)
+            data = request_model_json(
+                client,
+                call.model,
+                call.messages,
+                reasoning_effort=call.reasoning_effort,
+                debug=debug,
+            )
+    except Exception as error:
+        return _finish(steps, error=error)
+    return _finish(steps, data)
+
+
+async def interpret_async(
+    user_text: str,
+    context: Dict[str, Any],
+    *,
+    openai_available: Any,
+    get_openai_client: Callable[[str], Any],
+    log_ai_call: Callable[..., Any],
+    debug: Callable[[str], None],
+    make_cache_key: Callable[[str, Dict[str, Any]], str],
+    cache_get: Callable[[str], Awaitable[Optional[Intent]]],
+    cache_put: Callable[[str, Intent], None],
+    rule_based: Callable[[str, Optional[Dict[str, Any]]], Optional[Intent]],
+    fast_path: Callable[[str, Optional[Dict[str, Any]]], Optional[Intent]],
+    offline_none_reply: Callable[[str, Dict[str, Any]], str],
+    build_messages: Callable[[str, Dict[str, Any]], Any],
+    request_model_json: Callable[..., Awaitable[Any]],
+    request_model_json_httpx: Callable[..., Awaitable[Any]],
+    validate_model_response: Callable[[Any, Dict[str, Any]], Intent],
+    openai_version: str,
+    httpx_version: str,
+    on_narration: Optional[Callable[[Optional[str]], Awaitable[None]]] = None,
+) -> Intent:
+    """Awaitable ``interpret``: the same steps, with the model call awaited.
+
+    ``get_openai_client`` must return an async client, and ``cache_get`` and
+    both request callables must be coroutine functions. ``on_narration``, if given, is
+    awaited with the reply's text as a streamed completion delivers it, and
+    with None when a retry takes back what was streamed. If it raises, the
+    turn ends with its error rather than the fallback.
+    """
+    # The cache is read here, so its disk tier is read off the loop; the
+    # steps then go straight past it.
+    cache_key = make_cache_key(user_text, context)
+    cached = await cache_get(cache_key)
+    if cached:
+        return cached
+    steps = _interpret_steps(
+        user_text,
+        context,
+        openai_available=openai_available,
+        log_ai_call=log_ai_call,
+        debug=debug,
+        make_cache_key=lambda *_: cache_key,
+        cache_get=lambda _key: None,
+        cache_put=cache_put,
+        rule_based=rule_based,
+        fast_path=fast_path,
+        offline_none_reply=offline_none_reply,
+        build_messages=build_messages,
+        validate_model_response=validate_model_response,
+        openai_version=openai_version,
+        httpx_version=httpx_version,
+    )
+    try:
+        call = next(steps)
+    except StopIteration as done:
+        return done.value
+    prefetch.note_model_request()
+
+    try:
+        if call.direct_httpx:
+            data = await request_model_json_httpx(
+                call.api_key,
+                call.model,
+                call.messages,
+                reasoning_effort=call.reasoning_effort,
+                debug=debug,
+            )
+        else:
+            client = get_openai_client(call.api_key)
+            streaming = {} if on_narration is None else {"on_reply": on_narration}
+            data = await request_model_json(
+                client,
+                call.model,
+                call.messages,
+                reasoning_effort=call.reasoning_effort,
+                debug=debug,
+                **streaming,
+            )
+    except NarrationListenerError as error:
+        steps.close()
+        raise error.__cause__ from None
+    except Exception as error:
+        return _finish(steps, error=error)
+    return _finish(steps, data)
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import inspect
 import json
-import math
+import logging
 import os
+import threading
 from time import monotonic, sleep
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from game.ai import http_pool
+from game.ai.http_pool import DEFAULT_TIMEOUT_SECONDS, positive_float_env
+from game.ai.reply_stream import ReplyStreamReader
+from game.ai.types import NarrationListenerError
 
 
 try:
@@ -31,19 +38,84 @@ try:
 except Exception:  # pragma: no cover - optional dependency during dev
     OpenAI = None  # type: ignore
 
+try:
+    from openai import AsyncOpenAI  # type: ignore
+except Exception:  # pragma: no cover - optional dependency during dev
+    AsyncOpenAI = None  # type: ignore
+
+
+OPENAI_TIMEOUT_SECONDS = positive_float_env(
+    "OPENAI_TIMEOUT_SECONDS", DEFAULT_TIMEOUT_SECONDS
+)
+# The SDK reads OPENAI_BASE_URL itself; the direct httpx calls and the
+# prefetch warm-up read it here, so every call goes to the same host.
+OPENAI_BASE_URL = (
+    os.getenv("OPENAI_BASE_URL") or "https://api.openai.com/v1"
+).rstrip("/")
+OPENAI_CHAT_COMPLETIONS_URL = f"{OPENAI_BASE_URL}/chat/completions"
+MODEL_RETRY_DELAY_SECONDS = 0.25
+MODEL_MAX_ATTEMPTS = 2
 
-def positive_float_env(name: str, default: float) -> float:
-    """Parse a positive finite float without making import fragile."""
-    try:
-        value = float(os.getenv(name, ""))
-    except (TypeError, ValueError):
-        return default
-    return value if math.isfinite(value) and value > 0 else default
+logger = logging.getLogger("the-cabin")
+
+# Token counts summed over every completed model call in this process. The
+# cached share is the evidence that the static system prompt is actually
+# being served from the provider's prefix cache; it is reported, not assumed.
+_usage_lock = threading.Lock()
+_usage_totals: Dict[str, int] = {
+    "calls": 0,
+    "prompt_tokens": 0,
+    "cached_prompt_tokens": 0,
+    "completion_tokens": 0,
+}
+
+
+def _usage_field(usage: Any, name: str) -> Any:
+    if isinstance(usage, dict):
+        return usage.get(name)
+    return getattr(usage, name, None)
+
+
+def cached_prompt_tokens(usage: Any) -> int:
+    """Return the prompt tokens a usage report says came from the cache."""
+    details = _usage_field(usage, "prompt_tokens_details")
+    cached = _usage_field(details, "cached_tokens") if details is not None else None
+    return cached if isinstance(cached, int) else 0
+
+
+def record_usage(usage: Any, debug: Callable[[str], None]) -> None:
+    """Log one call's token usage and add it to the process totals."""
+    if not usage:
+        return
+    prompt = _usage_field(usage, "prompt_tokens")
+    completion = _usage_field(usage, "completion_tokens")
+    prompt = prompt if isinstance(prompt, int) else 0
+    completion = completion if isinstance(completion, int) else 0
+    cached = cached_prompt_tokens(usage)
+    with _usage_lock:
+        _usage_totals["calls"] += 1
+        _usage_totals["prompt_tokens"] += prompt
+        _usage_totals["cached_prompt_tokens"] += cached
+        _usage_totals["completion_tokens"] += completion
+    logger.info(
+        "Model usage: prompt=%d cached=%d completion=%d", prompt, cached, completion
+    )
+    debug(f"Model usage: prompt={prompt} cached={cached} completion={completion}")
 
 
-OPENAI_TIMEOUT_SECONDS = positive_float_env("OPENAI_TIMEOUT_SECONDS", 20.0)
-MODEL_RETRY_DELAY_SECONDS = 0.25
-MODEL_MAX_ATTEMPTS = 2
+def usage_stats() -> Dict[str, Any]:
+    """Return process-wide token totals and the cached share of prompt tokens."""
+    with _usage_lock:
+        stats: Dict[str, Any] = dict(_usage_totals)
+    prompt = stats["prompt_tokens"]
+    stats["cached_ratio"] = round(stats["cached_prompt_tokens"] / prompt, 4) if prompt else 0.0
+    return stats
+
+
+def reset_usage_stats() -> None:
+    with _usage_lock:
+        for key in _usage_totals:
+            _usage_totals[key] = 0
 
 
 def _exception_status_code(error: Exception) -> Optional[int]:
@@ -105,7 +177,7 @@ def make_openai_params_compatible(
         return compatible
 
     passthrough: Dict[str, Any] = {}
-    for key in ("max_completion_tokens", "reasoning_effort"):
+    for key in ("max_completion_tokens", "reasoning_effort", "stream_options"):
         if key in compatible and key not in supported_params:
             passthrough[key] = compatible.pop(key)
 
@@ -162,6 +234,8 @@ def request_model_json(
         stream=True,
         reasoning_effort=reasoning_effort,
     )
+    # The final chunk then carries usage, including cached prompt tokens.
+    params["stream_options"] = {"include_usage": True}
     params = make_openai_params_compatible(client.chat.completions.create, params)
 
     for attempt in range(1, MODEL_MAX_ATTEMPTS + 1):
@@ -177,10 +251,16 @@ def request_model_json(
                 timeout=remaining,
             )
             chunks = []
+            usage = None
             for chunk in stream:
+                if getattr(chunk, "usage", None):
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
                 delta = chunk.choices[0].delta
                 if delta.content:
                     chunks.append(delta.content)
+            record_usage(usage, debug)
             content = "".join(chunks).strip()
             debug(f"Model raw output: {content[:120]}")
             return json.loads(content)
@@ -230,8 +310,8 @@ def request_model_json_httpx(
                 raise retry_error
             raise TimeoutError("model-call deadline exhausted before request")
         try:
-            response = _httpx.post(
-                "https://api.openai.com/v1/chat/completions",
+            response = http_pool.get_http_client().post(
+                OPENAI_CHAT_COMPLETIONS_URL,
                 headers={
                     "Authorization": f"Bearer {api_key}",
                     "Content-Type": "application/json",
@@ -241,6 +321,7 @@ def request_model_json_httpx(
             )
             response.raise_for_status()
             body = response.json()
+            record_usage(body.get("usage"), debug)
             content = body["choices"][0]["message"]["content"]
             if not isinstance(content, str):
                 raise ValueError("model response content is not text")
@@ -256,3 +337,155 @@ def request_model_json_httpx(
             retry_error = error
             debug(f"Transient model failure: {type(error).__name__}; retrying once")
             sleep(MODEL_RETRY_DELAY_SECONDS)
+
+
+async def request_model_json_async(
+    client: Any,
+    model: str,
+    messages: List[Dict[str, str]],
+    *,
+    reasoning_effort: Optional[str],
+    debug: Callable[[str], None],
+    on_reply: Optional[Callable[[Optional[str]], Awaitable[None]]] = None,
+) -> Any:
+    """Awaitable twin of :func:`request_model_json` for an ``AsyncOpenAI`` client.
+
+    The server awaits this on its event loop, so a slow completion parks a
+    coroutine rather than holding an executor thread. Deadline, retry and
+    decoding rules are identical to the blocking path.
+
+    ``on_reply`` is awaited with each new piece of the ``reply`` field as the
+    stream delivers it. Before a retry streams its reply again from the start,
+    an attempt that had streamed any of its own is taken back with
+    ``on_reply(None)``. An error raised by ``on_reply`` is the caller's, not
+    the model's: it is raised at once as :class:`NarrationListenerError`.
+    """
+    deadline = monotonic() + OPENAI_TIMEOUT_SECONDS
+    retry_error: Optional[Exception] = None
+    params = build_openai_chat_params(
+        model,
+        messages,
+        stream=True,
+        reasoning_effort=reasoning_effort,
+    )
+    # The final chunk then carries usage, including cached prompt tokens.
+    params["stream_options"] = {"include_usage": True}
+    params = make_openai_params_compatible(client.chat.completions.create, params)
+
+    for attempt in range(1, MODEL_MAX_ATTEMPTS + 1):
+        remaining = deadline - monotonic()
+        if remaining <= 0:
+            if retry_error is not None:
+                raise retry_error
+            raise TimeoutError("model-call deadline exhausted before request")
+
+        streamed = False
+        try:
+            stream = await client.chat.completions.create(
+                **params,
+                timeout=remaining,
+            )
+            chunks = []
+            usage = None
+            reader = ReplyStreamReader() if on_reply is not None else None
+            async for chunk in stream:
+                if getattr(chunk, "usage", None):
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                if delta.content:
+                    chunks.append(delta.content)
+                    if reader is not None:
+                        piece = reader.feed(delta.content)
+                        if piece:
+                            streamed = True
+                            await _narrate(on_reply, piece)
+            record_usage(usage, debug)
+            content = "".join(chunks).strip()
+            debug(f"Model raw output: {content[:120]}")
+            return json.loads(content)
+        except NarrationListenerError:
+            raise
+        except Exception as error:
+            if attempt == MODEL_MAX_ATTEMPTS or not _is_retryable_model_error(error):
+                raise
+
+            remaining = deadline - monotonic()
+            if remaining <= MODEL_RETRY_DELAY_SECONDS:
+                raise
+            retry_error = error
+            debug(f"Transient model failure: {error!r}; retrying once")
+            if streamed:
+                await _narrate(on_reply, None)
+            await asyncio.sleep(MODEL_RETRY_DELAY_SECONDS)
+
+
+async def _narrate(
+    on_reply: Callable[[Optional[str]], Awaitable[None]], piece: Optional[str]
+) -> None:
+    try:
+        await on_reply(piece)
+    except Exception as error:
+        raise NarrationListenerError() from error
+
+
+async def request_model_json_httpx_async(
+    api_key: str,
+    model: str,
+    messages: List[Dict[str, str]],
+    *,
+    reasoning_effort: Optional[str],
+    debug: Callable[[str], None],
+) -> Any:
+    """Awaitable twin of :func:`request_model_json_httpx`.
+
+    Only reached when ``CABIN_MODEL_TRANSPORT=direct-httpx`` is set on a
+    server, which keeps that switch meaning the same thing on every surface.
+    """
+    if _httpx is None:
+        raise RuntimeError("httpx transport is unavailable")
+
+    deadline = monotonic() + OPENAI_TIMEOUT_SECONDS
+    retry_error: Optional[Exception] = None
+    params = build_openai_chat_params(
+        model,
+        messages,
+        stream=False,
+        reasoning_effort=reasoning_effort,
+    )
+
+    for attempt in range(1, MODEL_MAX_ATTEMPTS + 1):
+        remaining = deadline - monotonic()
+        if remaining <= 0:
+            if retry_error is not None:
+                raise retry_error
+            raise TimeoutError("model-call deadline exhausted before request")
+        try:
+            response = await http_pool.get_async_http_client().post(
+                OPENAI_CHAT_COMPLETIONS_URL,
+                headers={
+                    "Authorization": f"Bearer {api_key}",
+                    "Content-Type": "application/json",
+                },
+                json=params,
+                timeout=remaining,
+            )
+            response.raise_for_status()
+            body = response.json()
+            record_usage(body.get("usage"), debug)
+            content = body["choices"][0]["message"]["content"]
+            if not isinstance(content, str):
+                raise ValueError("model response content is not text")
+            content = content.strip()
+            debug(f"Model raw output: {content[:120]}")
+            return json.loads(content)
+        except Exception as error:
+            if attempt == MODEL_MAX_ATTEMPTS or not _is_retryable_model_error(error):
+                raise
+            remaining = deadline - monotonic()
+            if remaining <= MODEL_RETRY_DELAY_SECONDS:
+                raise
+            retry_error = error
+            debug(f"Transient model failure: {type(error).__name__}; retrying once")
+            await asyncio.sleep(MODEL_RETRY_DELAY_SECONDS)
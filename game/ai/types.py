@@ -69,3 +69,13 @@ class Intent:
     reply: Optional[str] = None
     effects: Optional[Dict[str, Any]] = None
     rationale: Optional[str] = None
+
+
+class NarrationListenerError(Exception):
+    """The caller's narration listener raised; its error is ``__cause__``.
+
+    Not a model failure: a listener fails when the client it writes to has
+    gone. The transport does not retry it and the interpreter does not answer
+    it with the fallback, which would play a turn nobody is waiting for; the
+    listener's own error is re-raised to the caller instead.
+    """
@@ -9,9 +9,11 @@ from __future__ import annotations
 
 import os
 import sys
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 from game.ai import cache as _cache
+from game.ai import fast_path as _fast_path_mod
+from game.ai import http_pool as _http_pool
 from game.ai import prompt as _prompt
 from game.ai import rules as _rules
 from game.ai import runtime as _runtime
@@ -30,6 +32,7 @@ from game.logger import log_ai_call
 
 # Importing this facade must not load .env. Entry points own that boundary.
 OpenAI = _transport.OpenAI
+AsyncOpenAI = _transport.AsyncOpenAI
 OPENAI_TIMEOUT_SECONDS = _transport.OPENAI_TIMEOUT_SECONDS
 _OPENAI_VERSION = _transport.OPENAI_VERSION
 _HTTPX_VERSION = _transport.HTTPX_VERSION
@@ -38,6 +41,10 @@ _openai_mod = _transport._openai_mod
 
 _openai_client: Optional[Any] = None
 _openai_client_key: Optional[str] = None
+_openai_http_client: Optional[Any] = None
+_async_openai_client: Optional[Any] = None
+_async_openai_client_key: Optional[str] = None
+_async_openai_http_client: Optional[Any] = None
 
 # These aliases preserve the evaluation and test harness surface.
 _SYSTEM_PROMPT_TEMPLATE = _prompt.SYSTEM_PROMPT_TEMPLATE
@@ -67,24 +74,58 @@ _unique_single_edit_match = _rules.unique_single_edit_match
 _match_known_interaction_target = _rules.match_known_interaction_target
 _match_known_exit = _rules.match_known_exit
 _rule_based = _rules.rule_based
+_fast_path = _fast_path_mod.fast_path
 
 # Keep historical type identity for introspection and pickle compatibility.
 Intent.__module__ = __name__
 
 
 def _get_openai_client(api_key: str) -> Any:
-    """Preserve the facade-level client factory seam."""
-    global _openai_client, _openai_client_key
-    if _openai_client is None or _openai_client_key != api_key:
+    """Preserve the facade-level client factory seam.
+
+    The SDK client is cheap; its connections come from the process-wide pool
+    in ``game.ai.http_pool``, so a new key does not mean a new handshake.
+    """
+    global _openai_client, _openai_client_key, _openai_http_client
+    http_client = _http_pool.get_http_client()
+    if (
+        _openai_client is None
+        or _openai_client_key != api_key
+        or _openai_http_client is not http_client
+    ):
         _openai_client = OpenAI(
             api_key=api_key,
             timeout=OPENAI_TIMEOUT_SECONDS,
             max_retries=0,
+            http_client=http_client,
         )
         _openai_client_key = api_key
+        _openai_http_client = http_client
     return _openai_client
 
 
+def _get_async_openai_client(api_key: str) -> Any:
+    """Async counterpart of ``_get_openai_client`` for the server's event loop."""
+    global _async_openai_client, _async_openai_client_key, _async_openai_http_client
+    http_client = _http_pool.get_async_http_client()
+    if (
+        _async_openai_client is None
+        or _async_openai_client_key != api_key
+        or _async_openai_http_client is not http_client
+    ):
+        if AsyncOpenAI is None:
+            raise RuntimeError("AsyncOpenAI is unavailable")
+        _async_openai_client = AsyncOpenAI(
+            api_key=api_key,
+            timeout=OPENAI_TIMEOUT_SECONDS,
+            max_retries=0,
+            http_client=http_client,
+        )
+        _async_openai_client_key = api_key
+        _async_openai_http_client = http_client
+    return _async_openai_client
+
+
 def _debug(message: str) -> None:
     if os.getenv("CABIN_DEBUG") == "1":
         print(f"[AI DEBUG] {message}", file=sys.stderr)
@@ -100,6 +141,10 @@ def _cache_get(key: str) -> Optional[Intent]:
     return _cache.cache_get(key, debug=_debug)
 
 
+async def _cache_get_async(key: str) -> Optional[Intent]:
+    return await _cache.cache_get_async(key, debug=_debug)
+
+
 def _cache_put(key: str, intent: Intent) -> None:
     _cache.cache_put(key, intent)
 
@@ -121,6 +166,7 @@ def interpret(user_text: str, context: Dict[str, Any]) -> Intent:
         cache_get=_cache_get,
         cache_put=_cache_put,
         rule_based=_rule_based,
+        fast_path=_fast_path,
         offline_none_reply=_offline_none_reply,
         build_messages=build_interpreter_messages,
         request_model_json=_transport.request_model_json,
@@ -129,3 +175,39 @@ def interpret(user_text: str, context: Dict[str, Any]) -> Intent:
         openai_version=_OPENAI_VERSION,
         httpx_version=_HTTPX_VERSION,
     )
+
+
+async def interpret_async(
+    user_text: str,
+    context: Dict[str, Any],
+    *,
+    on_narration: Optional[Callable[[Optional[str]], Awaitable[None]]] = None,
+) -> Intent:
+    """Awaitable ``interpret`` for callers already running an event loop.
+
+    Decisions are shared with ``interpret``; only the model request differs,
+    going through the async SDK client so no thread is held while it waits.
+    ``on_narration`` receives the model's reply as it streams in, and None
+    when a retried request takes back what had streamed.
+    """
+    return await _runtime.interpret_async(
+        user_text,
+        context,
+        openai_available=OpenAI,
+        get_openai_client=_get_async_openai_client,
+        log_ai_call=log_ai_call,
+        debug=_debug,
+        make_cache_key=_make_cache_key,
+        cache_get=_cache_get_async,
+        cache_put=_cache_put,
+        rule_based=_rule_based,
+        fast_path=_fast_path,
+        offline_none_reply=_offline_none_reply,
+        build_messages=build_interpreter_messages,
+        request_model_json=_transport.request_model_json_async,
+        request_model_json_httpx=_transport.request_model_json_httpx_async,
+        validate_model_response=_validation.validate_model_response,
+        openai_version=_OPENAI_VERSION,
+        httpx_version=_HTTPX_VERSION,
+        on_narration=on_narration,
+    )
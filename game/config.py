@@ -35,6 +35,10 @@ class Config:
     # Limits
     max_log_files: int = 10
     response_cache_size: int = 50
+    # Optional persistent tier for the response cache (empty disables it).
+    response_cache_path: str = ""
+    response_cache_disk_size: int = 5000
+    response_cache_ttl_seconds: float = 7 * 86400.0
     
     @classmethod
     def load(cls, config_path: Optional[Path] = None) -> "Config":
@@ -71,6 +75,20 @@ class Config:
         config.save_directory = os.getenv("CABIN_SAVE_DIR", config.save_directory)
         config.log_directory = os.getenv("CABIN_LOG_DIR", config.log_directory)
         
+        config.response_cache_path = os.getenv(
+            "CABIN_RESPONSE_CACHE_PATH", config.response_cache_path
+        )
+        if os.getenv("CABIN_RESPONSE_CACHE_DISK_SIZE"):
+            try:
+                config.response_cache_disk_size = int(os.getenv("CABIN_RESPONSE_CACHE_DISK_SIZE"))
+            except ValueError:
+                pass
+        if os.getenv("CABIN_RESPONSE_CACHE_TTL_SECONDS"):
+            try:
+                config.response_cache_ttl_seconds = float(os.getenv("CABIN_RESPONSE_CACHE_TTL_SECONDS"))
+            except ValueError:
+                pass
+
         if os.getenv("CABIN_MAX_LOGS"):
             try:
                 config.max_log_files = int(os.getenv("CABIN_MAX_LOGS"))
@@ -92,6 +110,9 @@ class Config:
             log_directory=data.get("log_directory", "logs"),
             max_log_files=data.get("max_log_files", 10),
             response_cache_size=data.get("response_cache_size", 50),
+            response_cache_path=data.get("response_cache_path", ""),
+            response_cache_disk_size=data.get("response_cache_disk_size", 5000),
+            response_cache_ttl_seconds=data.get("response_cache_ttl_seconds", 7 * 86400.0),
         )
     
     def to_dict(self) -> dict:
@@ -105,6 +126,9 @@ class Config:
             "log_directory": self.log_directory,
             "max_log_files": self.max_log_files,
             "response_cache_size": self.response_cache_size,
+            "response_cache_path": self.response_cache_path,
+            "response_cache_disk_size": self.response_cache_disk_size,
+            "response_cache_ttl_seconds": self.response_cache_ttl_seconds,
         }
 
 
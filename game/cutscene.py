@@ -2,6 +2,7 @@ import os
 import sys
 import tty
 import termios
+from functools import lru_cache
 from typing import Iterable, List, Optional, Callable
 from pathlib import Path
 
@@ -11,6 +12,31 @@ CUTSCENE_DIRECTORY = Path(__file__).parent / "story" / "cutscenes"
 AUTHORED_CUTSCENE_RULE = "─" * 79
 
 
+def authored_cutscene_text(filename: str) -> str:
+    """Return the validated text of an authored cut-scene file.
+
+    Every session builds its own `CutsceneManager`, but the files do not
+    change while the process runs, so each path is read and checked once.
+    """
+    return _read_authored_cutscene(CUTSCENE_DIRECTORY, filename)
+
+
+@lru_cache(maxsize=None)
+def _read_authored_cutscene(directory: Path, filename: str) -> str:
+    cutscene_path = directory / f"{filename}.txt"
+    cutscene_text = cutscene_path.read_text(encoding="utf-8")
+
+    prefix = f"{AUTHORED_CUTSCENE_RULE}\n\n"
+    suffix = f"\n\n{AUTHORED_CUTSCENE_RULE}\n"
+    if not cutscene_text.startswith(prefix) or not cutscene_text.endswith(suffix):
+        raise ValueError(
+            f"Authored cut-scene {filename!r} is missing its required framing"
+        )
+    if not cutscene_text[len(prefix):-len(suffix)].strip():
+        raise ValueError(f"Authored cut-scene {filename!r} has no story text")
+    return cutscene_text
+
+
 class Cutscene:
     """Represents a single cut-scene with text and optional effects."""
 
@@ -80,7 +106,9 @@ class Cutscene:
 
 class CutsceneManager:
     """Manages all cut-scenes in the game."""
-    
+
+    __slots__ = ("cutscenes",)
+
     def __init__(self):
         self.cutscenes: List[Cutscene] = []
         self._setup_cutscenes()
@@ -94,23 +122,11 @@ class CutsceneManager:
     
     def _load_cutscene_from_file(self, filename: str, trigger_condition: Optional[Callable] = None):
         """Load an authored cut-scene from the runtime data directory."""
-        cutscene_path = CUTSCENE_DIRECTORY / f"{filename}.txt"
-        cutscene_text = cutscene_path.read_text(encoding="utf-8")
-
-        prefix = f"{AUTHORED_CUTSCENE_RULE}\n\n"
-        suffix = f"\n\n{AUTHORED_CUTSCENE_RULE}\n"
-        if not cutscene_text.startswith(prefix) or not cutscene_text.endswith(suffix):
-            raise ValueError(
-                f"Authored cut-scene {filename!r} is missing its required framing"
-            )
-        if not cutscene_text[len(prefix):-len(suffix)].strip():
-            raise ValueError(f"Authored cut-scene {filename!r} has no story text")
-
         # Key by filename so save identity survives edits to the prose.
         self.add_cutscene(
-            Cutscene(cutscene_text, trigger_condition, cutscene_id=filename)
+            Cutscene(authored_cutscene_text(filename), trigger_condition, cutscene_id=filename)
         )
-    
+
     def _cabin_entry_trigger(self, from_room_id: str, to_room_id: str, **kwargs) -> bool:
         """Trigger when moving from the clearing to the cabin interior."""
         return from_room_id == "cabin_clearing" and to_room_id == "cabin_main"
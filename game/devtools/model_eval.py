@@ -44,6 +44,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from game.ai.transport import cached_prompt_tokens
 from game.ai_context import build_ai_context
 from game.env import load_game_dotenv
 from game.ai_interpreter import (
@@ -749,26 +750,21 @@ def _anthropic_client():
 
 
 def split_system_for_cache(system_text: str) -> List[Dict[str, Any]]:
-    """Split the system prompt into a static prefix + dynamic tail.
-
-    Everything before the Constraints block is identical across scenarios and
-    turns, so the prefix is tagged with Anthropic's `cache_control` (type
-    `ephemeral` is the API's name for its ~5-minute prompt cache, not a signal
-    that the block is disposable). Whether the cache actually engages (minimum
-    token thresholds apply) is reported via usage cache_read_input_tokens, not
-    assumed.
+    """Tag the system prompt as one cacheable block.
+
+    The system prompt is static (per-turn context travels in the user
+    message), so all of it is identical across scenarios and turns and is
+    tagged with Anthropic's `cache_control` (type `ephemeral` is the API's
+    name for its ~5-minute prompt cache, not a signal that the block is
+    disposable). Whether the cache actually engages (minimum token thresholds
+    apply) is reported via usage cache_read_input_tokens, not assumed.
     """
-    marker = "Constraints:"
-    index = system_text.find(marker)
-    if index <= 0:
-        return [{"type": "text", "text": system_text}]
     return [
         {
             "type": "text",
-            "text": system_text[:index],
+            "text": system_text,
             "cache_control": {"type": "ephemeral"},
-        },
-        {"type": "text", "text": system_text[index:]},
+        }
     ]
 
 
@@ -806,6 +802,7 @@ def call_openai(spec: ModelSpec, messages: List[Dict[str, str]], timeout: float)
             usage = {
                 "input_tokens": chunk.usage.prompt_tokens,
                 "output_tokens": chunk.usage.completion_tokens,
+                "cache_read_input_tokens": cached_prompt_tokens(chunk.usage),
             }
         if not chunk.choices:
             continue
@@ -390,7 +390,7 @@ class GameEngine:
             self.clear_terminal()
             self._last_room_id = room.id
             self._is_first_render = False
-            description = room.get_description(self.player, self.map.world_state)
+            description = self.map.describe_room(room, self.player)
             # Header + room description on room change only
             print(f"{room.name}\n" + ("-" * len(room.name)))
             print(description)
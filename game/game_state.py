@@ -61,7 +61,8 @@ class GameState:
             },
             "map": {
                 "current_room_id": self.map.current_room.id,
-                "visited_rooms": list(self.map.visited_rooms),
+                # Sorted so the same run always serialises the same way.
+                "visited_rooms": sorted(self.map.visited_rooms),
                 "current_room_been_here_before": self.map.current_room_been_here_before,
                 # Per-room item placement, so taken/dropped items survive a load
                 # instead of snapping back to the fresh Map's defaults.
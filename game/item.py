@@ -3,7 +3,7 @@ from typing import Set, Optional, Dict, Any
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     """An item that can be found in rooms or carried by the player."""
     
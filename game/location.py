@@ -13,6 +13,8 @@ class Location:
     entirely (use sparingly).
     """
 
+    __slots__ = ("id", "name", "overview_description", "rooms", "exits", "exit_criteria")
+
     def __init__(
         self,
         location_id: str,
@@ -31,6 +33,14 @@ class Location:
     def add_room(self, room: "Room") -> None:
         self.rooms[room.id] = room
 
+    def session_copy(self) -> "Location":
+        """Return this location with per-session copies of its rooms."""
+        location = object.__new__(type(self))
+        for name in Location.__slots__:
+            setattr(location, name, getattr(self, name))
+        location.rooms = {room_id: room.session_copy() for room_id, room in self.rooms.items()}
+        return location
+
     def get_overview_text(self, world_state: dict) -> str:
         if callable(self.overview_description):
             return self.overview_description(world_state)
@@ -1,12 +1,21 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 from game.location import Location
 from game.room import Room
 from game.requirements import WorldFlagTrue
-from game.item import create_items
+from game.item import Item, create_items
+from game.render_cache import (
+    MISSING,
+    RenderCache,
+    player_key,
+    render_cache_enabled,
+)
 from game.world_state import WorldState
 from game.story import AnomalyID, fear, log_tell, observe_night_seam
 from game.story.evening import observe_remaining_evening_tells
@@ -15,6 +24,10 @@ from game.story.evening import observe_remaining_evening_tells
 # The tree, taken full on. Health only; the fear half is `fear.CLIMAX_FLIGHT`.
 CLIMAX_INJURY_HEALTH = 20
 
+# The map screen depends only on which rooms have been visited, so its renders
+# are shared by every session in the process.
+_MAP_RENDERS = RenderCache("map", maxsize=128)
+
 
 class MoveOutcome(tuple):
     """A movement decision plus whether its narration is a story beat.
@@ -58,339 +71,27 @@ class Map:
         # Global world state flags - now using typed WorldState
         self.world_state: WorldState = WorldState()
         
+        # Prose derived from the world state, kept until the state moves on
+        # (see game.render_cache).
+        self._descriptions = RenderCache("description")
+        self._observations = RenderCache("observation")
+
         # Track visited rooms
         self.visited_rooms: set = {"wilderness_start"}
         self.current_room_been_here_before: bool = False
         
-        # Create items for the game
-        self.items = create_items()
-
-        # Build locations and rooms
-        wilderness = Location(
-            location_id="wilderness",
-            name="The Wilderness",
-            overview_description=(
-                "The gravel drive narrows between pine and birch. The road is already out of sight."
-            ),
-        )
-
-        cabin_grounds = Location(
-            location_id="cabin_grounds",
-            name="The Cabin Grounds",
-            overview_description=(
-                "The clearing opens around the cabin, snow worn thin on the old paths."
-            ),
-        )
-
-        cabin_interior = Location(
-            location_id="cabin_interior",
-            name="The Cabin",
-            overview_description=(
-                "Inside, dry pine boards and the old smoke caught in them."
-            ),
-        )
-
-        # Rooms
-        start_room = Room(
-            name="Wilderness",
-            description=(
-                "The gravel drive leaves the road and narrows between the trees. Behind you, the rented car clicks as it cools. "
-                "Four hours north, straight through Korpikylä. Ahead, pine and birch close over the track. "
-                "The cabin stands somewhere beyond the bend, yours on paper and nowhere else. Seven days ago the northern camera caught three seconds of grey at the treeline and went dark. "
-                "The other feeds kept showing frost and stillness. Your phone hunts for reception in your pocket."
-            ),
-            room_id="wilderness_start",
-            items=[self.items["stick"], self.items["stone"]],  # Add some items to wilderness
-        )
-
-        clearing = Room(
-            name="The Clearing",
-            description=(
-                "The forest gives up the cabin late: a low roof and dark walls against the trees. "
-                "One small window holds what is left of the light. The key is under the north log, "
-                "wrapped in its square of black plastic. Your fingers know where to reach."
-            ),
-            room_id="cabin_clearing",
-            items=[self.items["rope"]],  # Add rope to clearing
-            wrong_description=(
-                "The clearing, wrong. No driveway. No car. The trees are too old and dark, "
-                "grown too close, their branches interlocked overhead. The ground is a deep "
-                "matt black, as if burnt. The sky is a flat "
-                "ceiling that gives the impression, without any feature you could point to, of "
-                "not being far away.\n\n"
-                "Nothing out here is looking at you. That is new, and it is worse."
-            ),
-            wrong_exits={
-                # The wrong clearing is only crossed on the walk out, after
-                # the refusal. South is the compass. The cabin stays behind.
-                "cabin": ("cabin_interior", "cabin_main"),
-                "south": ("cabin_grounds", "wood_track"),
-            },
-        )
-
-        cabin = Room(
-            name="The Cabin",
-            description=(
-                "The square table stands in the middle of the room. The enamel sink catches a little light; its hairline crack is still there. "
-                "By the stove, the hook for the blue mug is empty. The porch cupboard is just inside the outer door, the snow shovel propped against it.\n\n"
-                "The konttori is through the north door. The bedroom opens off the main room, and the cabin grounds lie outside."
-            ),
-            room_id="cabin_main",
-            items=[
-                self.items["matches"],
-                self.items["circuit_breaker"],
-                self.items["light switch"],
-                self.items["fireplace"],
-                self.items["phone"],
-                self.items["window"],
-                self.items["mug"],
-                self.items["nika"],
-                self.items["mattress"],
-                self.items["tins"],
-            ],
-            is_indoors=True,
-            description_fn=self._cabin_description,
-            wrong_description=(
-                "The door swings shut behind you. The fire is burning, low and steady, tended. "
-                "The cabin is warm. The square table, the enamel sink, the small window. "
-                "Every detail correct. A towel warms by the stove. A mug waits on the table, "
-                "made exactly how you take it. The fire keeps the room ready for you.\n\n"
-                "Nika is there. Sitting at the table, leafing through the old paperback from the shelf. "
-                "She looks up and takes you in, bloody nose and torn jacket and wild face. "
-                "The place is not merely familiar. Someone has prepared it for you, down to the coffee "
-                "cooling in the mug."
-            ),
-            wrong_description_fn=self._wrong_cabin_description,
-            wrong_exits={
-                # No konttori, no bedroom in the wrong layer. Only "out"; that exit
-                # leads into the wrong clearing, not the real one.
-                "out": ("cabin_grounds", "cabin_clearing"),
-            },
-            # "out" has its own denial (the patient door, Nika's hand). Every
-            # other direction lands here, so the room has to hold on its own:
-            # the enclosure is the whole point of the scene.
-            wrong_denial_text=(
-                "You turn that way and stop. The room does not continue. "
-                "Fire, table, door. It does not need more than that to keep you."
-            ),
-        )
-
-        konttori = Room(
-            name="Konttori",
-            description=(
-                "The konttori is scarcely a room: a desk under the low ceiling, invoices and camera manuals in uneven stacks.\n"
-                "On the desk, three camera feeds hold their grey pictures. The northern one is black."
-            ),
-            room_id="konttori",
-            items=[self.items["camera feed"]],
-            is_indoors=True,
-        )
-
-        bedroom = Room(
-            name="Bedroom",
-            description=(
-                "A low ceiling, one small window, the old bed made up under heavy covers. "
-                "The room smells of dry wood and the cold shut in here all year."
-            ),
-            room_id="bedroom",
-            items=[self.items["bed"]],
-            is_indoors=True,
-        )
-
-        cabin_grounds_room = Room(
-            name="Cabin Grounds",
-            description=(
-                "Snow lies thin around the cabin, worn through where the old paths run.\n"
-                "The woodshed door stands ajar. Beyond it, the sauna sits among the trees above the lake."
-            ),
-            room_id="cabin_grounds_main",
-            items=[self.items["firewood"]],  # Move firewood to cabin grounds
-            description_fn=self._grounds_description,
-        )
-
-        sauna = Room(
-            name="Sauna",
-            description=(
-                "The sauna is low and dark. Through the small window the lake shows between the trunks, "
-                "a black plate under dusk. Stones are piled on the iron stove in the corner."
-            ),
-            room_id="sauna",
-            items=[self.items["sauna stove"]],
-            is_indoors=True,
-        )
-
-        lakeside = Room(
-            name="Lakeside",
-            description=(
-                "The childhood path reaches the lake between scrub willow and frost-stiff grass. "
-                "The water has frozen early: smooth black ice without snow, crack, or pressure line.\n"
-                "The bank bends east. North, reeds close around a narrow inlet."
-            ),
-            room_id="lakeside",
-            items=[],  # Remove firewood from lakeside
-        )
-
-        frozen_inlet = Room(
-            name="Frozen Inlet",
-            description=(
-                "The inlet pinches shut between reeds, every stem frozen at the same angle in the black ice. "
-                "After a few paces there is no bank left to follow. Your own marks lead back south."
-            ),
-            room_id="frozen_inlet",
-            items=[],
-        )
-
-        shoreline_bend = Room(
-            name="Shoreline Bend",
-            description=(
-                "The path follows the bank east, then leaves the water at a break in the young spruce. "
-                "The cabin is out of sight behind the bend. Ahead, frost holds each needle exact, and nothing moves."
-            ),
-            room_id="shoreline_bend",
-            items=[],
-        )
-
-        wood_track = Room(
-            name="Wood Track",
-            description=(
-                "The track narrows to the width of one boot between young birch. North, a break in the brush "
-                "closes again almost at once. West, older pines shut over the ground."
-            ),
-            room_id="wood_track",
-            items=[],
-            description_fn=self._wood_track_description,
-            wrong_description=(
-                "Your head torch finds one trunk and then the next. Beyond each is more "
-                "black ground, more bark. The compass on your jacket holds south."
-            ),
-            wrong_exits={
-                # The walk out continues south. Back is the black clearing.
-                "south": ("cabin_grounds", "cabin_grounds_main"),
-                "back": ("cabin_grounds", "cabin_clearing"),
-            },
-        )
-
-        deer_path = Room(
-            name="Birch Thicket",
-            description=(
-                "You push into the break in the birch. It closes inside twenty paces. "
-                "Old stems cross at chest height, rooted where a path would have to be."
-            ),
-            room_id="deer_path",
-            items=[],
-        )
-
-        old_woods = Room(
-            name="Old Woods",
-            description=(
-                "The canopy has knitted shut. The trunks are spruce and pine, but grown so old they no longer "
-                "look like either. Moss and rot lie heavy in the air; beneath them, split stone and old smoke."
-            ),
-            room_id="old_woods",
-            items=[],
-            description_fn=self._old_woods_description,
-        )
-
-        # Optional example: gate leaving the cabin interior unless power restored (diegetic placeholder)
-        # Not applied globally here; instead, we add a requirement on a specific exit if desired.
-
-        # Register rooms to locations
-        wilderness.add_room(start_room)
-        cabin_grounds.add_room(clearing)
-        cabin_grounds.add_room(cabin_grounds_room)
-        cabin_grounds.add_room(sauna)
-        cabin_grounds.add_room(lakeside)
-        cabin_grounds.add_room(frozen_inlet)
-        cabin_grounds.add_room(shoreline_bend)
-        cabin_grounds.add_room(wood_track)
-        cabin_grounds.add_room(deer_path)
-        cabin_grounds.add_room(old_woods)
-        cabin_interior.add_room(cabin)
-        cabin_interior.add_room(konttori)
-        cabin_interior.add_room(bedroom)
-
-        # Room-level exits: direction -> (target_location_id, target_room_id)
-        # The real Act II forest bends after the lake and includes dead ends;
-        # the wrong layer remains tighter and more pointed.
-        start_room.exits = {"north": ("cabin_grounds", "cabin_clearing")}
-        clearing.exits = {
-            "south": ("wilderness", "wilderness_start"),
-            "north": ("cabin_interior", "cabin_main"),
-            "cabin": ("cabin_interior", "cabin_main"),
-        }
-        cabin.exits = {
-            "out": ("cabin_grounds", "cabin_clearing"),
-            "north": ("cabin_interior", "konttori"),
-            "bedroom": ("cabin_interior", "bedroom"),
-            "grounds": ("cabin_grounds", "cabin_grounds_main"),
-        }
-        konttori.exits = {
-            "south": ("cabin_interior", "cabin_main"),
-            "north": ("cabin_grounds", "cabin_grounds_main"),
-        }
-        bedroom.exits = {
-            "out": ("cabin_interior", "cabin_main"),
-            "cabin": ("cabin_interior", "cabin_main"),
-        }
-        cabin_grounds_room.exits = {
-            "south": ("cabin_interior", "cabin_main"),
-            "north": ("cabin_grounds", "lakeside"),
-            "sauna": ("cabin_grounds", "sauna"),
-            "clearing": ("cabin_grounds", "cabin_clearing"),
-        }
-        sauna.exits = {
-            "out": ("cabin_grounds", "cabin_grounds_main"),
-            "grounds": ("cabin_grounds", "cabin_grounds_main"),
-        }
-        lakeside.exits = {
-            "south": ("cabin_grounds", "cabin_grounds_main"),
-            "grounds": ("cabin_grounds", "cabin_grounds_main"),
-            "north": ("cabin_grounds", "frozen_inlet"),
-            "inlet": ("cabin_grounds", "frozen_inlet"),
-            "east": ("cabin_grounds", "shoreline_bend"),
-            "shore": ("cabin_grounds", "shoreline_bend"),
-        }
-        frozen_inlet.exits = {
-            "south": ("cabin_grounds", "lakeside"),
-            "back": ("cabin_grounds", "lakeside"),
-            "lake": ("cabin_grounds", "lakeside"),
-        }
-        shoreline_bend.exits = {
-            "west": ("cabin_grounds", "lakeside"),
-            "back": ("cabin_grounds", "lakeside"),
-            "north": ("cabin_grounds", "wood_track"),
-            "track": ("cabin_grounds", "wood_track"),
-        }
-        wood_track.exits = {
-            "south": ("cabin_grounds", "shoreline_bend"),
-            "shore": ("cabin_grounds", "shoreline_bend"),
-            "north": ("cabin_grounds", "deer_path"),
-            "birch": ("cabin_grounds", "deer_path"),
-            "deer": ("cabin_grounds", "deer_path"),
-            "west": ("cabin_grounds", "old_woods"),
-            "deeper": ("cabin_grounds", "old_woods"),
-        }
-        deer_path.exits = {
-            "south": ("cabin_grounds", "wood_track"),
-            "back": ("cabin_grounds", "wood_track"),
-            "track": ("cabin_grounds", "wood_track"),
-        }
-        old_woods.exits = {
-            "east": ("cabin_grounds", "wood_track"),
-            "track": ("cabin_grounds", "wood_track"),
-            "back": ("cabin_grounds", "wood_track"),
-        }
-
-        # Map registries
+        # Static rooms, exits and items come from the shared template; the
+        # session gets its own room shells so item placement stays private.
+        template = world_template()
+        self.items: Dict[str, Item] = dict(template.items)
         self.locations: Dict[str, Location] = {
-            wilderness.id: wilderness,
-            cabin_grounds.id: cabin_grounds,
-            cabin_interior.id: cabin_interior,
+            location_id: location.session_copy()
+            for location_id, location in template.locations.items()
         }
 
         # Starting position
-        self.current_location_id = wilderness.id
-        self.current_room_id = start_room.id
+        self.current_location_id = template.start_location_id
+        self.current_room_id = template.start_room_id
 
     @property
     def current_location(self) -> Location:
@@ -701,9 +402,40 @@ class Map:
             "You stop where the deer path should be."
         )
 
+    def describe_room(self, room: Room, player=None) -> str:
+        """`room.get_description` against this map's world state, memoised."""
+        ws = self.world_state
+        if not render_cache_enabled():
+            return room.get_description(player, ws)
+        key = (room.id, ws.world_layer, ws.state_version, player_key(player))
+        description = self._descriptions.get(key)
+        if description is MISSING:
+            description = room.get_description(player, ws)
+            self._descriptions.put(key, description)
+        return description
+
     def observe_current_room(self, mode: str, player=None) -> str:
         """Return authored attention prose for the current room, if any.
 
+        Memoised like `describe_room`. An observation that logs a tell moves
+        the state it was keyed on and is not kept; what the next look says
+        is then decided afresh.
+        """
+        ws = self.world_state
+        if not render_cache_enabled():
+            return self._observe_current_room(mode, player)
+        version = ws.state_version
+        key = (self.current_room_id, mode, ws.world_layer, version, player_key(player))
+        text = self._observations.get(key)
+        if text is MISSING:
+            text = self._observe_current_room(mode, player)
+            if self.world_state is ws and ws.state_version == version:
+                self._observations.put(key, text)
+        return text
+
+    def _observe_current_room(self, mode: str, player=None) -> str:
+        """Compose the attention prose for `observe_current_room`.
+
         Covers the Act II forest tells, the Act IV night seams in the false
         cabin, and the coda's scraping. Each observation logs its tell once;
         re-observing narrates without double-counting.
@@ -933,6 +665,17 @@ class Map:
         Returns:
             ASCII map string
         """
+        if not render_cache_enabled():
+            return self._draw_map(visited_rooms)
+        key = frozenset(visited_rooms)
+        drawn = _MAP_RENDERS.get(key)
+        if drawn is MISSING:
+            drawn = self._draw_map(key)
+            _MAP_RENDERS.put(key, drawn)
+        return drawn
+
+    @staticmethod
+    def _draw_map(visited_rooms: frozenset | set) -> str:
         width = 60
 
         def visited(room_id: str) -> bool:
@@ -1053,3 +796,354 @@ class Map:
                 self.current_room_been_here_before = been_here_before
                 return True
         return False
+
+
+@dataclass(frozen=True)
+class WorldTemplate:
+    """The authored world as every new session first sees it.
+
+    Rooms, exits, overlays, requirements and items are built once per process
+    and never handed to a session directly: `Map` takes a `session_copy` of
+    each location, which shares all of this static data and owns only the
+    per-room item lists. Nothing here may be mutated after it is built.
+    """
+
+    items: Mapping[str, Item]
+    locations: Mapping[str, Location]
+    start_location_id: str
+    start_room_id: str
+
+
+@lru_cache(maxsize=None)
+def world_template() -> WorldTemplate:
+    """Return the shared world template, building it on first use."""
+    items = create_items()
+
+    # Build locations and rooms
+    wilderness = Location(
+        location_id="wilderness",
+        name="The Wilderness",
+        overview_description=(
+            "The gravel drive narrows between pine and birch. The road is already out of sight."
+        ),
+    )
+
+    cabin_grounds = Location(
+        location_id="cabin_grounds",
+        name="The Cabin Grounds",
+        overview_description=(
+            "The clearing opens around the cabin, snow worn thin on the old paths."
+        ),
+    )
+
+    cabin_interior = Location(
+        location_id="cabin_interior",
+        name="The Cabin",
+        overview_description=(
+            "Inside, dry pine boards and the old smoke caught in them."
+        ),
+    )
+
+    # Rooms
+    start_room = Room(
+        name="Wilderness",
+        description=(
+            "The gravel drive leaves the road and narrows between the trees. Behind you, the rented car clicks as it cools. "
+            "Four hours north, straight through Korpikylä. Ahead, pine and birch close over the track. "
+            "The cabin stands somewhere beyond the bend, yours on paper and nowhere else. Seven days ago the northern camera caught three seconds of grey at the treeline and went dark. "
+            "The other feeds kept showing frost and stillness. Your phone hunts for reception in your pocket."
+        ),
+        room_id="wilderness_start",
+        items=[items["stick"], items["stone"]],  # Add some items to wilderness
+    )
+
+    clearing = Room(
+        name="The Clearing",
+        description=(
+            "The forest gives up the cabin late: a low roof and dark walls against the trees. "
+            "One small window holds what is left of the light. The key is under the north log, "
+            "wrapped in its square of black plastic. Your fingers know where to reach."
+        ),
+        room_id="cabin_clearing",
+        items=[items["rope"]],  # Add rope to clearing
+        wrong_description=(
+            "The clearing, wrong. No driveway. No car. The trees are too old and dark, "
+            "grown too close, their branches interlocked overhead. The ground is a deep "
+            "matt black, as if burnt. The sky is a flat "
+            "ceiling that gives the impression, without any feature you could point to, of "
+            "not being far away.\n\n"
+            "Nothing out here is looking at you. That is new, and it is worse."
+        ),
+        wrong_exits={
+            # The wrong clearing is only crossed on the walk out, after
+            # the refusal. South is the compass. The cabin stays behind.
+            "cabin": ("cabin_interior", "cabin_main"),
+            "south": ("cabin_grounds", "wood_track"),
+        },
+    )
+
+    cabin = Room(
+        name="The Cabin",
+        description=(
+            "The square table stands in the middle of the room. The enamel sink catches a little light; its hairline crack is still there. "
+            "By the stove, the hook for the blue mug is empty. The porch cupboard is just inside the outer door, the snow shovel propped against it.\n\n"
+            "The konttori is through the north door. The bedroom opens off the main room, and the cabin grounds lie outside."
+        ),
+        room_id="cabin_main",
+        items=[
+            items["matches"],
+            items["circuit_breaker"],
+            items["light switch"],
+            items["fireplace"],
+            items["phone"],
+            items["window"],
+            items["mug"],
+            items["nika"],
+            items["mattress"],
+            items["tins"],
+        ],
+        is_indoors=True,
+        description_fn=Map._cabin_description,
+        wrong_description=(
+            "The door swings shut behind you. The fire is burning, low and steady, tended. "
+            "The cabin is warm. The square table, the enamel sink, the small window. "
+            "Every detail correct. A towel warms by the stove. A mug waits on the table, "
+            "made exactly how you take it. The fire keeps the room ready for you.\n\n"
+            "Nika is there. Sitting at the table, leafing through the old paperback from the shelf. "
+            "She looks up and takes you in, bloody nose and torn jacket and wild face. "
+            "The place is not merely familiar. Someone has prepared it for you, down to the coffee "
+            "cooling in the mug."
+        ),
+        wrong_description_fn=Map._wrong_cabin_description,
+        wrong_exits={
+            # No konttori, no bedroom in the wrong layer. Only "out"; that exit
+            # leads into the wrong clearing, not the real one.
+            "out": ("cabin_grounds", "cabin_clearing"),
+        },
+        # "out" has its own denial (the patient door, Nika's hand). Every
+        # other direction lands here, so the room has to hold on its own:
+        # the enclosure is the whole point of the scene.
+        wrong_denial_text=(
+            "You turn that way and stop. The room does not continue. "
+            "Fire, table, door. It does not need more than that to keep you."
+        ),
+    )
+
+    konttori = Room(
+        name="Konttori",
+        description=(
+            "The konttori is scarcely a room: a desk under the low ceiling, invoices and camera manuals in uneven stacks.\n"
+            "On the desk, three camera feeds hold their grey pictures. The northern one is black."
+        ),
+        room_id="konttori",
+        items=[items["camera feed"]],
+        is_indoors=True,
+    )
+
+    bedroom = Room(
+        name="Bedroom",
+        description=(
+            "A low ceiling, one small window, the old bed made up under heavy covers. "
+            "The room smells of dry wood and the cold shut in here all year."
+        ),
+        room_id="bedroom",
+        items=[items["bed"]],
+        is_indoors=True,
+    )
+
+    cabin_grounds_room = Room(
+        name="Cabin Grounds",
+        description=(
+            "Snow lies thin around the cabin, worn through where the old paths run.\n"
+            "The woodshed door stands ajar. Beyond it, the sauna sits among the trees above the lake."
+        ),
+        room_id="cabin_grounds_main",
+        items=[items["firewood"]],  # Move firewood to cabin grounds
+        description_fn=Map._grounds_description,
+    )
+
+    sauna = Room(
+        name="Sauna",
+        description=(
+            "The sauna is low and dark. Through the small window the lake shows between the trunks, "
+            "a black plate under dusk. Stones are piled on the iron stove in the corner."
+        ),
+        room_id="sauna",
+        items=[items["sauna stove"]],
+        is_indoors=True,
+    )
+
+    lakeside = Room(
+        name="Lakeside",
+        description=(
+            "The childhood path reaches the lake between scrub willow and frost-stiff grass. "
+            "The water has frozen early: smooth black ice without snow, crack, or pressure line.\n"
+            "The bank bends east. North, reeds close around a narrow inlet."
+        ),
+        room_id="lakeside",
+        items=[],  # Remove firewood from lakeside
+    )
+
+    frozen_inlet = Room(
+        name="Frozen Inlet",
+        description=(
+            "The inlet pinches shut between reeds, every stem frozen at the same angle in the black ice. "
+            "After a few paces there is no bank left to follow. Your own marks lead back south."
+        ),
+        room_id="frozen_inlet",
+        items=[],
+    )
+
+    shoreline_bend = Room(
+        name="Shoreline Bend",
+        description=(
+            "The path follows the bank east, then leaves the water at a break in the young spruce. "
+            "The cabin is out of sight behind the bend. Ahead, frost holds each needle exact, and nothing moves."
+        ),
+        room_id="shoreline_bend",
+        items=[],
+    )
+
+    wood_track = Room(
+        name="Wood Track",
+        description=(
+            "The track narrows to the width of one boot between young birch. North, a break in the brush "
+            "closes again almost at once. West, older pines shut over the ground."
+        ),
+        room_id="wood_track",
+        items=[],
+        description_fn=Map._wood_track_description,
+        wrong_description=(
+            "Your head torch finds one trunk and then the next. Beyond each is more "
+            "black ground, more bark. The compass on your jacket holds south."
+        ),
+        wrong_exits={
+            # The walk out continues south. Back is the black clearing.
+            "south": ("cabin_grounds", "cabin_grounds_main"),
+            "back": ("cabin_grounds", "cabin_clearing"),
+        },
+    )
+
+    deer_path = Room(
+        name="Birch Thicket",
+        description=(
+            "You push into the break in the birch. It closes inside twenty paces. "
+            "Old stems cross at chest height, rooted where a path would have to be."
+        ),
+        room_id="deer_path",
+        items=[],
+    )
+
+    old_woods = Room(
+        name="Old Woods",
+        description=(
+            "The canopy has knitted shut. The trunks are spruce and pine, but grown so old they no longer "
+            "look like either. Moss and rot lie heavy in the air; beneath them, split stone and old smoke."
+        ),
+        room_id="old_woods",
+        items=[],
+        description_fn=Map._old_woods_description,
+    )
+
+    # Optional example: gate leaving the cabin interior unless power restored (diegetic placeholder)
+    # Not applied globally here; instead, we add a requirement on a specific exit if desired.
+
+    # Register rooms to locations
+    wilderness.add_room(start_room)
+    cabin_grounds.add_room(clearing)
+    cabin_grounds.add_room(cabin_grounds_room)
+    cabin_grounds.add_room(sauna)
+    cabin_grounds.add_room(lakeside)
+    cabin_grounds.add_room(frozen_inlet)
+    cabin_grounds.add_room(shoreline_bend)
+    cabin_grounds.add_room(wood_track)
+    cabin_grounds.add_room(deer_path)
+    cabin_grounds.add_room(old_woods)
+    cabin_interior.add_room(cabin)
+    cabin_interior.add_room(konttori)
+    cabin_interior.add_room(bedroom)
+
+    # Room-level exits: direction -> (target_location_id, target_room_id)
+    # The real Act II forest bends after the lake and includes dead ends;
+    # the wrong layer remains tighter and more pointed.
+    start_room.exits = {"north": ("cabin_grounds", "cabin_clearing")}
+    clearing.exits = {
+        "south": ("wilderness", "wilderness_start"),
+        "north": ("cabin_interior", "cabin_main"),
+        "cabin": ("cabin_interior", "cabin_main"),
+    }
+    cabin.exits = {
+        "out": ("cabin_grounds", "cabin_clearing"),
+        "north": ("cabin_interior", "konttori"),
+        "bedroom": ("cabin_interior", "bedroom"),
+        "grounds": ("cabin_grounds", "cabin_grounds_main"),
+    }
+    konttori.exits = {
+        "south": ("cabin_interior", "cabin_main"),
+        "north": ("cabin_grounds", "cabin_grounds_main"),
+    }
+    bedroom.exits = {
+        "out": ("cabin_interior", "cabin_main"),
+        "cabin": ("cabin_interior", "cabin_main"),
+    }
+    cabin_grounds_room.exits = {
+        "south": ("cabin_interior", "cabin_main"),
+        "north": ("cabin_grounds", "lakeside"),
+        "sauna": ("cabin_grounds", "sauna"),
+        "clearing": ("cabin_grounds", "cabin_clearing"),
+    }
+    sauna.exits = {
+        "out": ("cabin_grounds", "cabin_grounds_main"),
+        "grounds": ("cabin_grounds", "cabin_grounds_main"),
+    }
+    lakeside.exits = {
+        "south": ("cabin_grounds", "cabin_grounds_main"),
+        "grounds": ("cabin_grounds", "cabin_grounds_main"),
+        "north": ("cabin_grounds", "frozen_inlet"),
+        "inlet": ("cabin_grounds", "frozen_inlet"),
+        "east": ("cabin_grounds", "shoreline_bend"),
+        "shore": ("cabin_grounds", "shoreline_bend"),
+    }
+    frozen_inlet.exits = {
+        "south": ("cabin_grounds", "lakeside"),
+        "back": ("cabin_grounds", "lakeside"),
+        "lake": ("cabin_grounds", "lakeside"),
+    }
+    shoreline_bend.exits = {
+        "west": ("cabin_grounds", "lakeside"),
+        "back": ("cabin_grounds", "lakeside"),
+        "north": ("cabin_grounds", "wood_track"),
+        "track": ("cabin_grounds", "wood_track"),
+    }
+    wood_track.exits = {
+        "south": ("cabin_grounds", "shoreline_bend"),
+        "shore": ("cabin_grounds", "shoreline_bend"),
+        "north": ("cabin_grounds", "deer_path"),
+        "birch": ("cabin_grounds", "deer_path"),
+        "deer": ("cabin_grounds", "deer_path"),
+        "west": ("cabin_grounds", "old_woods"),
+        "deeper": ("cabin_grounds", "old_woods"),
+    }
+    deer_path.exits = {
+        "south": ("cabin_grounds", "wood_track"),
+        "back": ("cabin_grounds", "wood_track"),
+        "track": ("cabin_grounds", "wood_track"),
+    }
+    old_woods.exits = {
+        "east": ("cabin_grounds", "wood_track"),
+        "track": ("cabin_grounds", "wood_track"),
+        "back": ("cabin_grounds", "wood_track"),
+    }
+
+    locations: Dict[str, Location] = {
+        wilderness.id: wilderness,
+        cabin_grounds.id: cabin_grounds,
+        cabin_interior.id: cabin_interior,
+    }
+
+    return WorldTemplate(
+        items=MappingProxyType(items),
+        locations=MappingProxyType(locations),
+        start_location_id=wilderness.id,
+        start_room_id=start_room.id,
+    )
@@ -0,0 +1,118 @@
+"""On-disk encoding of a save slot.
+
+A version 2 save stores the game state as a diff against the pristine world:
+``map.room_items`` keeps only the rooms whose items differ from the world
+template's placement, and ``world_state`` only the fields that differ from a
+fresh ``WorldState``. Most rooms are never touched in a run, so this is most
+of a version 1 save. The diff is expanded on load, so callers always see the
+full ``GameState.to_dict()`` shape.
+
+The JSON is compact. With ``CABIN_SAVE_COMPRESS=1`` it is also zlib
+compressed; the slot keeps its ``.json`` name and is recognised by its first
+byte, since JSON text can never start with a zlib header. Either encoding
+loads regardless of the setting it was written with.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import zlib
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping
+
+
+# zlib's header byte for the default 32 KiB window, at every compression level.
+_ZLIB_HEADER = 0x78
+
+
+def compression_enabled() -> bool:
+    return os.getenv("CABIN_SAVE_COMPRESS", "").lower() in ("1", "true", "yes")
+
+
+@lru_cache(maxsize=None)
+def pristine_room_items() -> Mapping[str, List[str]]:
+    """Item names in every room of the world template, by room ID."""
+    from game.map import world_template
+
+    return {
+        room.id: [item.name for item in room.items]
+        for location in world_template().locations.values()
+        for room in location.rooms.values()
+    }
+
+
+def pristine_world_state() -> Dict[str, Any]:
+    from game.world_state import WorldState
+
+    return WorldState().to_dict()
+
+
+def diff_game_state(game_state: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop everything from *game_state* that matches a fresh game."""
+    diffed = dict(game_state)
+    map_state = game_state.get("map")
+    if isinstance(map_state, dict) and isinstance(map_state.get("room_items"), dict):
+        defaults = pristine_room_items()
+        diffed["map"] = {
+            **map_state,
+            "room_items": {
+                room_id: items
+                for room_id, items in map_state["room_items"].items()
+                if defaults.get(room_id) != items
+            },
+        }
+    world_state = game_state.get("world_state")
+    if isinstance(world_state, dict):
+        defaults = pristine_world_state()
+        diffed["world_state"] = {
+            key: value
+            for key, value in world_state.items()
+            if key not in defaults or defaults[key] != value
+        }
+    return diffed
+
+
+def expand_game_state(game_state: Dict[str, Any]) -> Dict[str, Any]:
+    """Undo `diff_game_state`. Sections the save does not carry stay absent."""
+    expanded = dict(game_state)
+    map_state = game_state.get("map")
+    if isinstance(map_state, dict) and isinstance(map_state.get("room_items"), dict):
+        expanded["map"] = {
+            **map_state,
+            "room_items": {
+                **{room_id: list(items) for room_id, items in pristine_room_items().items()},
+                **map_state["room_items"],
+            },
+        }
+    world_state = game_state.get("world_state")
+    if isinstance(world_state, dict):
+        expanded["world_state"] = {**pristine_world_state(), **world_state}
+    return expanded
+
+
+def state_hash(save_data: Dict[str, Any]) -> str:
+    """Hash of what a save records, leaving out when it was written."""
+    content = {key: value for key, value in save_data.items() if key != "timestamp"}
+    return hashlib.sha256(
+        json.dumps(content, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+
+
+def encode(save_data: Dict[str, Any], *, compress: bool) -> bytes:
+    content = json.dumps(save_data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return zlib.compress(content) if compress else content
+
+
+def decode(content: bytes) -> Any:
+    """Parse a slot written by `encode`, or by a version 1 save manager.
+
+    Raises ValueError for anything that is neither.
+    """
+    if content[:1] == bytes([_ZLIB_HEADER]):
+        try:
+            content = zlib.decompress(content)
+        except zlib.error as error:
+            raise ValueError(f"corrupt compressed save: {error}") from error
+    return json.loads(content)
@@ -1,18 +1,79 @@
-"""Save/load functionality for The Cabin."""
+"""Save/load functionality for The Cabin.
+
+Each save directory keeps a manifest beside its slots: per slot, the summary
+``list_saves`` shows plus the file's mtime, size and content hash. Every
+``save_game`` and ``delete_save`` rewrites it atomically, so listing is one
+small read and a directory scan rather than parsing every save. A slot whose
+mtime or size no longer matches its entry (written by something else, or
+left by a crash between the two writes) is re-read and the manifest
+rewritten; nothing else is.
+
+The manifest also keeps a hash of each slot's recorded state, so saving a
+state the slot already holds writes nothing. The slot encoding itself lives
+in `game.persistence.save_format`.
+
+A manager may be given a ``writer`` that takes the encoded slot and commits
+it later (the server's group-commit writer). The state is still encoded when
+``save_game`` is called; every read of the directory first waits for the
+manager's own queued write, so a load straight after a save sees it. A caller
+on an event loop awaits ``settle`` first, so that wait never blocks the loop.
+The writer thread records each write in the manifest, so every manifest
+update and listing holds the manager's manifest lock.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import os
+import threading
+from concurrent.futures import Future
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional, TYPE_CHECKING
+from typing import Callable, Dict, Any, List, Optional, Protocol, TYPE_CHECKING
+
+from game.persistence import save_format
 
 if TYPE_CHECKING:
     from game.game_state import GameState
 
 
+# Not a ``.json`` name, so it can never be mistaken for, or collide with, a slot.
+MANIFEST_NAME = "slots.manifest"
+MANIFEST_VERSION = 1
+
+
+def _write_atomically(path: Path, data: bytes) -> None:
+    """Replace *path* with *data* so a reader sees the old file or the new."""
+    temp = path.with_name(f".{path.name}.tmp")
+    temp.write_bytes(data)
+    os.replace(temp, path)
+
+
+def _summary(data: Dict[str, Any], save_file: Path) -> Dict[str, Any]:
+    """The fields ``list_saves`` reports, from a parsed save."""
+    game_state = data.get("game_state", {})
+    player = game_state.get("player", {})
+    map_state = game_state.get("map", {})
+    return {
+        "slot_name": data.get("slot_name", save_file.stem),
+        "timestamp": data.get("timestamp", "Unknown"),
+        "room_name": map_state.get("current_room_id", "Unknown"),
+        "player_health": player.get("health", 100),
+        "player_fear": player.get("fear", 0),
+    }
+
+
+class SlotWriter(Protocol):
+    """Commits slot contents on a manager's behalf."""
+
+    def submit(
+        self, path: Path, content: bytes, on_written: Optional[Callable[[], None]] = None
+    ) -> Future: ...
+
+
 @dataclass
 class SaveInfo:
     """Information about a save file."""
@@ -28,19 +89,33 @@ class SaveManager:
     """
     Manages save and load operations.
     
-    Saves are stored as JSON files in the saves directory.
+    Saves are stored as JSON files in the saves directory, optionally
+    compressed.
     """
     
-    SAVE_VERSION = 1
+    SAVE_VERSION = 2
     
-    def __init__(self, save_dir: Optional[Path] = None) -> None:
+    def __init__(self, save_dir: Optional[Path] = None, compress: Optional[bool] = None) -> None:
         """
         Initialize the save manager.
         
         Args:
             save_dir: Directory for save files. Defaults to ./saves/
+            compress: zlib-compress written slots. Defaults to
+                ``CABIN_SAVE_COMPRESS``, read at each save.
         """
         self.save_dir = save_dir or Path("saves")
+        self.compress = compress
+        # Called with the save directory after every successful write, so an
+        # owner can track when a directory was last saved to.
+        self.on_save: Optional[Callable[[Path], None]] = None
+        # With a writer, slots are committed by it rather than inline, and
+        # ``pending_write`` resolves once the last one queued is durable.
+        self.writer: Optional[SlotWriter] = None
+        self.pending_write: Optional[Future] = None
+        # Held for every read-modify-write of the manifest: the writer thread
+        # records its writes while the owner lists and deletes slots.
+        self._manifest_lock = threading.RLock()
 
     def _ensure_save_dir(self) -> None:
         """Create the save directory if it doesn't exist."""
@@ -64,6 +139,10 @@ class SaveManager:
             
         Returns:
             Path to the saved file
+        
+        A slot that already holds the same state is left as it is, with its
+        original timestamp. While a write of this manager's is still queued the
+        disk may be about to change, so nothing is skipped until it lands.
         """
         save_path = self._get_save_path(slot_name)
         # Create the directory lazily, only when a save is actually written.
@@ -73,12 +152,31 @@ class SaveManager:
             "version": self.SAVE_VERSION,
             "timestamp": datetime.now().isoformat(),
             "slot_name": slot_name,
-            "game_state": game_state.to_dict()
+            "game_state": save_format.diff_game_state(game_state.to_dict()),
         }
+        state_hash = save_format.state_hash(save_data)
         
-        with open(save_path, "w", encoding="utf-8") as f:
-            json.dump(save_data, f, indent=2, ensure_ascii=False)
+        pending = self.pending_write
+        settled = pending is None or pending.done()
+        if not (settled and self._holds(save_path, state_hash)):
+            compress = self.compress
+            if compress is None:
+                compress = save_format.compression_enabled()
+            content = save_format.encode(save_data, compress=compress)
+
+            def record() -> None:
+                self._update_manifest(
+                    save_path.stem, self._manifest_entry(save_path, content, save_data)
+                )
+
+            if self.writer is None:
+                _write_atomically(save_path, content)
+                record()
+            else:
+                self.pending_write = self.writer.submit(save_path, content, record)
         
+        if self.on_save is not None:
+            self.on_save(self.save_dir)
         return save_path
     
     def load_game(self, slot_name: str = "autosave") -> Optional[Dict[str, Any]]:
@@ -92,55 +190,183 @@ class SaveManager:
             The saved game state dict, or None if not found
         """
         save_path = self._get_save_path(slot_name)
+        self._settle()
         
         if not save_path.exists():
             return None
         
         try:
-            with open(save_path, "r", encoding="utf-8") as f:
-                save_data = json.load(f)
-            
-            # Version check
-            if save_data.get("version", 0) > self.SAVE_VERSION:
-                return None  # Incompatible future version
-            
-            return save_data.get("game_state")
-        except (json.JSONDecodeError, IOError):
+            save_data = save_format.decode(save_path.read_bytes())
+        except (ValueError, IOError):
             return None
+        if not isinstance(save_data, dict):
+            return None
+        
+        # Version check
+        version = save_data.get("version", 0)
+        if version > self.SAVE_VERSION:
+            return None  # Incompatible future version
+        
+        game_state = save_data.get("game_state")
+        if version >= 2 and isinstance(game_state, dict):
+            # Version 2 stores only what differs from a fresh game.
+            return save_format.expand_game_state(game_state)
+        return game_state
     
     def list_saves(self) -> List[SaveInfo]:
         """
         List all available save files.
         
+        Summaries come from the manifest; only slots it is stale for are
+        read, and the manifest is rewritten if any were read or removed.
+        
         Returns:
             List of SaveInfo objects for each save
         """
-        saves = []
-        
-        for save_file in self.save_dir.glob("*.json"):
-            try:
-                with open(save_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                
-                game_state = data.get("game_state", {})
-                player = game_state.get("player", {})
-                map_state = game_state.get("map", {})
-                
-                saves.append(SaveInfo(
-                    slot_name=data.get("slot_name", save_file.stem),
-                    timestamp=data.get("timestamp", "Unknown"),
-                    room_name=map_state.get("current_room_id", "Unknown"),
-                    player_health=player.get("health", 100),
-                    player_fear=player.get("fear", 0),
-                    file_path=save_file
-                ))
-            except (json.JSONDecodeError, IOError):
+        self._settle()
+        return self._list_saves()
+
+    def _list_saves(self) -> List[SaveInfo]:
+        with self._manifest_lock:
+            return self._list_saves_locked()
+
+    def _list_saves_locked(self) -> List[SaveInfo]:
+        try:
+            on_disk = {
+                entry.name[: -len(".json")]: entry.stat()
+                for entry in os.scandir(self.save_dir)
+                if entry.name.endswith(".json") and entry.is_file()
+            }
+        except OSError:
+            return []
+
+        manifest = self._read_manifest()
+        slots: Dict[str, Dict[str, Any]] = {}
+        # Rewrite only to restate slots read below or drop ones gone from
+        # disk; an empty directory keeps its lack of a manifest.
+        changed = bool(set(manifest or {}) - set(on_disk))
+        for stem, stat in on_disk.items():
+            entry = (manifest or {}).get(stem)
+            if (
+                entry is not None
+                and entry.get("mtime_ns") == stat.st_mtime_ns
+                and entry.get("size") == stat.st_size
+            ):
+                slots[stem] = entry
                 continue
+            changed = True
+            slots[stem] = self._read_entry(self.save_dir / f"{stem}.json")
+        if changed:
+            self._write_manifest(slots)
+
+        saves = [
+            SaveInfo(
+                slot_name=entry["slot_name"],
+                timestamp=entry["timestamp"],
+                room_name=entry["room_name"],
+                player_health=entry["player_health"],
+                player_fear=entry["player_fear"],
+                file_path=self.save_dir / f"{stem}.json",
+            )
+            for stem, entry in slots.items()
+            if entry.get("valid")
+        ]
         
         # Sort by timestamp, newest first
         saves.sort(key=lambda s: s.timestamp, reverse=True)
         return saves
     
+    # -- Manifest -------------------------------------------------------------
+
+    def _holds(self, save_file: Path, state_hash: str) -> bool:
+        """Whether *save_file* is, per the manifest, a save of *state_hash*.
+
+        The entry only counts while the file still has the mtime and size it
+        was recorded with; anything else is written as usual.
+        """
+        entry = (self._read_manifest() or {}).get(save_file.stem)
+        if entry is None or entry.get("state_sha256") != state_hash:
+            return False
+        try:
+            stat = save_file.stat()
+        except OSError:
+            return False
+        return entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size
+
+    def _manifest_entry(
+        self, save_file: Path, content: bytes, data: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        stat = save_file.stat()
+        entry: Dict[str, Any] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": hashlib.sha256(content).hexdigest(),
+            "valid": isinstance(data, dict),
+        }
+        if isinstance(data, dict):
+            entry.update(_summary(data, save_file))
+            entry["state_sha256"] = save_format.state_hash(data)
+        return entry
+
+    def _read_entry(self, save_file: Path) -> Dict[str, Any]:
+        """Build a manifest entry by reading the slot itself.
+
+        An unreadable slot gets an entry too, marked invalid, so it is not
+        re-read on every listing until it changes.
+        """
+        try:
+            content = save_file.read_bytes()
+        except OSError:
+            return {"valid": False}
+        try:
+            data = save_format.decode(content)
+        except ValueError:
+            data = None
+        return self._manifest_entry(save_file, content, data)
+
+    def _read_manifest(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """The manifest's slots, or None if it is missing or unreadable."""
+        try:
+            manifest = json.loads((self.save_dir / MANIFEST_NAME).read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+            return None
+        slots = manifest.get("slots")
+        return slots if isinstance(slots, dict) else None
+
+    def _write_manifest(self, slots: Dict[str, Dict[str, Any]]) -> None:
+        # The manifest is a cache of the slots. Failing to write it costs the
+        # next listing some reads, never a save.
+        try:
+            _write_atomically(
+                self.save_dir / MANIFEST_NAME,
+                json.dumps(
+                    {"version": MANIFEST_VERSION, "slots": slots},
+                    separators=(",", ":"),
+                    ensure_ascii=False,
+                ).encode("utf-8"),
+            )
+        except OSError:
+            pass
+
+    def _update_manifest(self, stem: str, entry: Optional[Dict[str, Any]]) -> None:
+        """Set (or with None, drop) one slot's entry.
+
+        A missing manifest is built from every slot instead, once; that
+        listing picks up this slot as it is on disk.
+        """
+        with self._manifest_lock:
+            slots = self._read_manifest()
+            if slots is None:
+                self._list_saves()
+                return
+            if entry is None:
+                slots.pop(stem, None)
+            else:
+                slots[stem] = entry
+            self._write_manifest(slots)
+
     def delete_save(self, slot_name: str) -> bool:
         """
         Delete a save file.
@@ -152,12 +378,39 @@ class SaveManager:
             True if deleted, False if not found
         """
         save_path = self._get_save_path(slot_name)
+        self._settle()
         
-        if save_path.exists():
-            save_path.unlink()
-            return True
+        with self._manifest_lock:
+            if save_path.exists():
+                save_path.unlink()
+                self._update_manifest(save_path.stem, None)
+                return True
         return False
     
     def save_exists(self, slot_name: str) -> bool:
         """Check if a save slot exists."""
+        self._settle()
         return self._get_save_path(slot_name).exists()
+
+    async def settle(self) -> None:
+        """Await this manager's queued write without blocking the event loop.
+
+        Call before a read from a coroutine; the read's own wait then finds
+        the write already landed.
+        """
+        pending = self.pending_write
+        if pending is None or pending.done():
+            return
+        try:
+            # Shielded: a cancelled caller must not cancel the write itself.
+            await asyncio.shield(asyncio.wrap_future(pending))
+        except Exception:
+            # Logged by the writer; the read that follows sees the disk.
+            pass
+
+    def _settle(self) -> None:
+        """Wait for this manager's queued write, if it has one."""
+        pending, self.pending_write = self.pending_write, None
+        if pending is not None:
+            # A failed write has been logged by the writer; reads see the disk.
+            pending.exception()
@@ -3,6 +3,9 @@ from game.item import Item
 
 
 class Player:
+    # One of these lives in every session, so no per-instance __dict__.
+    __slots__ = ("running", "name", "health", "fear", "inventory")
+
     def __init__(self):
         self.running = True
         self.name = "Eli"
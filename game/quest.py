@@ -17,7 +17,7 @@ class QuestStatus(Enum):
     COMPLETED = "completed"
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestUpdate:
     """Represents an update to a quest."""
     event_name: str
@@ -27,7 +27,23 @@ class QuestUpdate:
 
 class Quest:
     """Represents a quest in the game."""
-    
+
+    __slots__ = (
+        "quest_id",
+        "title",
+        "opening_text",
+        "objective",
+        "trigger_conditions",
+        "update_events",
+        "completion_condition",
+        "completion_text",
+        "quest_screen_text",
+        "inactive_text",
+        "status",
+        "updates",
+        "completed_at",
+    )
+
     def __init__(
         self,
         quest_id: str,
@@ -0,0 +1,88 @@
+"""Memoised room prose and map renders.
+
+Room descriptions, attention prose (`Map.observe_current_room`) and the ASCII
+map are rebuilt on every look, every room re-render after an overlay, and
+every map screen, though they only change when the story does. Each is a
+function of the room, the world layer, `WorldState.state_version` and the
+player fields in `DESCRIPTION_PLAYER_FIELDS` (the map: of the visited rooms
+alone), so a render is kept under that key and reused until any of them
+moves. A story flag changing bumps the version, which is what invalidates.
+
+`CABIN_RENDER_CACHE=0` turns the memo off, for comparing against a fresh
+render. Hits and misses are counted process-wide per kind of render.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Tuple
+
+
+# Player attributes a description callback reads, folded into every key. The
+# callbacks in game.map read none today; one that starts reading, say, fear
+# must add the field here or it will be served stale prose.
+DESCRIPTION_PLAYER_FIELDS: Tuple[str, ...] = ()
+
+DEFAULT_MAXSIZE = 64
+
+# What `RenderCache.get` returns for a key it does not hold.
+MISSING = object()
+
+_counters: Dict[str, Dict[str, int]] = {}
+
+
+def render_cache_enabled() -> bool:
+    return os.getenv("CABIN_RENDER_CACHE", "1").lower() not in ("0", "false", "no")
+
+
+def player_key(player: object) -> Tuple[Any, ...]:
+    """The part of a render key that comes from the player."""
+    return tuple(getattr(player, name, None) for name in DESCRIPTION_PLAYER_FIELDS)
+
+
+class RenderCache:
+    """A bounded memo for one kind of render, counted under *kind*."""
+
+    def __init__(self, kind: str, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        self.kind = kind
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        _counters.setdefault(kind, {"hits": 0, "misses": 0})
+
+    def get(self, key: Hashable) -> Any:
+        """The render stored under *key*, or `MISSING`; counts either way."""
+        counters = _counters[self.kind]
+        value = self._entries.get(key, MISSING)
+        if value is MISSING:
+            counters["misses"] += 1
+            return MISSING
+        counters["hits"] += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def render_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Hits, misses and hit rate for each kind of render, since start-up."""
+    stats: Dict[str, Dict[str, Any]] = {}
+    for kind, counters in _counters.items():
+        total = counters["hits"] + counters["misses"]
+        stats[kind] = {
+            **counters,
+            "hit_rate": round(counters["hits"] / total, 3) if total else None,
+        }
+    return stats
+
+
+def reset_render_cache_stats() -> None:
+    for counters in _counters.values():
+        counters["hits"] = counters["misses"] = 0
@@ -25,6 +25,22 @@ class Room:
     - `get_description` can procedurally compose text from player and world state.
     """
 
+    __slots__ = (
+        "id",
+        "name",
+        "static_description",
+        "exits",
+        "exit_criteria",
+        "_description_fn",
+        "items",
+        "is_indoors",
+        "wrong_description",
+        "_wrong_description_fn",
+        "wrong_exits",
+        "denial_text",
+        "wrong_denial_text",
+    )
+
     def __init__(
         self,
         name: str,
@@ -65,6 +81,20 @@ class Room:
         self.denial_text: Optional[str] = denial_text
         self.wrong_denial_text: Optional[str] = wrong_denial_text
 
+    def session_copy(self) -> "Room":
+        """Return a room for one session that shares this room's static data.
+
+        Prose, exits, overlays and requirements are shared with the template;
+        only the item list is the session's own, because that is the one
+        thing play changes. Rebinding an attribute on the copy (as tests do)
+        never reaches the template.
+        """
+        room = object.__new__(type(self))
+        for name in Room.__slots__:
+            setattr(room, name, getattr(self, name))
+        room.items = list(self.items)
+        return room
+
     # Backward-compat convenience
     @property
     def description(self) -> str:  # type: ignore[override]
@@ -17,11 +17,11 @@ a value would let the caller overwrite whatever a listener had just set.
 
 from __future__ import annotations
 
-from typing import Callable
+from typing import Awaitable, Callable, Optional
 
 from game.actions.base import ModelEffectsPolicy
 from game.ai_context import build_ai_context
-from game.ai_interpreter import interpret
+from game.ai_interpreter import interpret, interpret_async
 from game.events.requests import (
     DarknessFearRequest,
     FireplaceUsedRequest,
@@ -184,7 +184,58 @@ def take_turn(
     """
     context = build_ai_context(player, game_map, quest_manager)
     intent = interpret(text, context)
+    resolve_intent(
+        intent,
+        player=player,
+        game_map=game_map,
+        action_registry=action_registry,
+        event_bus=event_bus,
+        set_feedback=set_feedback,
+    )
 
+
+async def take_turn_async(
+    text: str,
+    *,
+    player,
+    game_map,
+    quest_manager,
+    action_registry,
+    event_bus,
+    set_feedback: Callable[[str], None],
+    on_narration: Optional[Callable[[Optional[str]], Awaitable[None]]] = None,
+) -> None:
+    """``take_turn`` with the interpretation awaited rather than blocked on.
+
+    Nothing is mutated until the intent is back, so a turn cancelled while the
+    model call is pending leaves the game exactly as it was. ``on_narration``
+    is handed the model's reply as it streams, ahead of the committed result.
+    """
+    context = build_ai_context(player, game_map, quest_manager)
+    if on_narration is None:
+        intent = await interpret_async(text, context)
+    else:
+        intent = await interpret_async(text, context, on_narration=on_narration)
+    resolve_intent(
+        intent,
+        player=player,
+        game_map=game_map,
+        action_registry=action_registry,
+        event_bus=event_bus,
+        set_feedback=set_feedback,
+    )
+
+
+def resolve_intent(
+    intent,
+    *,
+    player,
+    game_map,
+    action_registry,
+    event_bus,
+    set_feedback: Callable[[str], None],
+) -> None:
+    """Execute an interpreted intent: the half of a turn after interpretation."""
     result = action_registry.execute(intent.action, player, game_map, intent)
 
     if result is None:
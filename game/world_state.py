@@ -6,6 +6,7 @@ that provides type safety, validation, and IDE autocomplete.
 """
 from __future__ import annotations
 
+import itertools
 from dataclasses import dataclass, field, asdict
 from typing import Dict, Any, List, Literal, Optional
 
@@ -97,6 +98,12 @@ _CODA_STAGE_TRANSITIONS: dict[str, frozenset[str]] = {
 }
 
 
+# One counter for every world state and wrongness log in the process, so a
+# version is never reused: not by another state, and not by a state that
+# replaced this one (a load swaps in a fresh WorldState).
+_VERSIONS = itertools.count(1)
+
+
 def _transition_is_permitted(
     current: object,
     target: object,
@@ -112,7 +119,7 @@ def _transition_is_permitted(
     return target in transitions.get(current, frozenset())
 
 
-@dataclass
+@dataclass(slots=True)
 class WrongnessEntry:
     """A single observed anomaly in the world.
 
@@ -130,7 +137,7 @@ class WrongnessEntry:
     seen_at: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class WrongnessLog:
     """Ordered log of anomalies observed in the world.
 
@@ -138,6 +145,10 @@ class WrongnessLog:
     """
 
     entries: List[WrongnessEntry] = field(default_factory=list)
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+
+    def _changed(self) -> None:
+        self._version = next(_VERSIONS)
 
     def add(self, anomaly_id: str, description: str = "") -> bool:
         """Record a new anomaly. Returns True if newly added, False if already present."""
@@ -151,6 +162,7 @@ class WrongnessLog:
                 seen_at=len(self.entries),
             )
         )
+        self._changed()
         return True
 
     def has(self, anomaly_id: str) -> bool:
@@ -161,6 +173,7 @@ class WrongnessLog:
         for entry in self.entries:
             if entry.anomaly_id == anomaly_id:
                 entry.acknowledged = True
+                self._changed()
                 return True
         return False
 
@@ -204,7 +217,7 @@ class WrongnessLog:
         return cls(entries=entries)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldState:
     """
     Centralized game world state with type safety and validation.
@@ -264,7 +277,29 @@ class WorldState:
     # Custom flags for dynamic/quest-specific state
     # Use sparingly - prefer adding explicit fields for common flags
     _custom_flags: Dict[str, Any] = field(default_factory=dict)
-    
+
+    # Bumped on every change, for caches of prose derived from this state.
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "_version":
+            object.__setattr__(self, "_version", next(_VERSIONS))
+
+    def __post_init__(self) -> None:
+        # __init__ leaves the counter at its default of 0; a fresh state gets
+        # a version of its own so it never matches a render of the last one.
+        object.__setattr__(self, "_version", next(_VERSIONS))
+
+    @property
+    def state_version(self) -> int:
+        """A number that grows whenever anything in this state changes.
+
+        Covers assignments, custom flags and the wrongness log. Versions
+        come from one process-wide counter, so two states never share one.
+        """
+        return max(self._version, self.wrongness._version)
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         Dict-style access for backward compatibility.
@@ -291,6 +326,7 @@ class WorldState:
             setattr(self, key, value)
         else:
             self._custom_flags[key] = value
+            self._version = next(_VERSIONS)
     
     def __contains__(self, key: str) -> bool:
         """Support 'in' operator for backward compatibility."""
@@ -301,6 +337,7 @@ class WorldState:
     def set_flag(self, key: str, value: Any) -> None:
         """Set a custom flag for dynamic/quest content."""
         self._custom_flags[key] = value
+        self._version = next(_VERSIONS)
     
     def get_flag(self, key: str, default: Any = None) -> Any:
         """Get a custom flag."""
@@ -315,11 +352,10 @@ class WorldState:
         result: Dict[str, Any] = {}
         # Add explicit fields (excluding private ones)
         for key, value in asdict(self).items():
-            if key == '_custom_flags':
+            if key in ('_custom_flags', '_version'):
                 continue
             if key == 'wrongness':
-                # asdict has already flattened to a plain dict; keep it.
-                result[key] = value
+                result[key] = self.wrongness.to_dict()
                 continue
             result[key] = value
         # Add custom flags
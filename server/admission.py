@@ -0,0 +1,246 @@
+"""Admission control for turns and new runs.
+
+The per-IP limits in ``RateLimiter`` stop one client from flooding the
+server, but nothing looked at the whole: in a spike every turn started at
+once, all of them waited on the same model connections, and every player's
+latency collapsed together.
+
+``TurnScheduler`` runs at most ``concurrency`` admitted requests at a time
+and holds the rest in a bounded queue. Turns for runs already under way go
+ahead of new runs (``POST /session``, a new socket), so a spike is absorbed
+by making newcomers wait rather than stalling everyone mid-run. A request
+that would wait past the latency budget, or finds the queue full, is shed:
+the caller answers with a narrated "settle" reply and a ``Retry-After``.
+When the queue is full, a turn displaces the newest waiting new run rather
+than being shed itself.
+
+Nothing is touched before admission, so a shed request is safe to repeat
+with the same turn id.
+
+Only turns that can reach the model need a slot. Keypress acknowledgments,
+screens and save commands are local transitions that finish in one pass on
+the loop; they go through ``inline``, which only counts them, so paging
+through a cutscene never waits behind turns waiting on the model.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
+
+
+# A turn's wait is the model call, and the shared pool holds this many
+# connections by default; more concurrent turns would only queue there.
+DEFAULT_TURN_CONCURRENCY = 20
+DEFAULT_TURN_QUEUE_LIMIT = 200
+DEFAULT_TURN_WAIT_BUDGET_SECONDS = 5.0
+
+# Waits kept for the percentiles reported by ``stats``.
+WAIT_SAMPLES = 1024
+
+
+class Priority(IntEnum):
+    """Queue order: lower values are admitted first."""
+
+    RUN = 0
+    NEW = 1
+
+
+class Shed(Exception):
+    """The request was not admitted; ask the client to retry later."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(f"retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+def _positive_env(name: str, default: float) -> float:
+    try:
+        value = float(os.getenv(name, ""))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class _Waiter:
+    __slots__ = ("future", "priority")
+
+    def __init__(self, future: asyncio.Future, priority: Priority) -> None:
+        self.future = future
+        self.priority = priority
+
+
+class TurnScheduler:
+    """Bounded, prioritised admission for work on the event loop.
+
+    Limits left as None are read from the environment on each admission:
+    ``CABIN_TURN_CONCURRENCY``, ``CABIN_TURN_QUEUE_LIMIT`` and
+    ``CABIN_TURN_WAIT_BUDGET_SECONDS``.
+    """
+
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        queue_limit: Optional[int] = None,
+        wait_budget: Optional[float] = None,
+    ) -> None:
+        self._concurrency = concurrency
+        self._queue_limit = queue_limit
+        self._wait_budget = wait_budget
+        self.running = 0
+        self._queues: Dict[Priority, Deque[_Waiter]] = {
+            priority: deque() for priority in Priority
+        }
+        self._waits: Deque[float] = deque(maxlen=WAIT_SAMPLES)
+        self._counters: Dict[str, int] = {
+            "admitted": 0,
+            "inline": 0,
+            "shed_full": 0,
+            "shed_budget": 0,
+            "shed_new": 0,
+            "peak_depth": 0,
+        }
+
+    @property
+    def concurrency(self) -> int:
+        if self._concurrency is not None:
+            return self._concurrency
+        return int(_positive_env("CABIN_TURN_CONCURRENCY", DEFAULT_TURN_CONCURRENCY))
+
+    @property
+    def queue_limit(self) -> int:
+        if self._queue_limit is not None:
+            return self._queue_limit
+        return int(_positive_env("CABIN_TURN_QUEUE_LIMIT", DEFAULT_TURN_QUEUE_LIMIT))
+
+    @property
+    def wait_budget(self) -> float:
+        if self._wait_budget is not None:
+            return self._wait_budget
+        return _positive_env(
+            "CABIN_TURN_WAIT_BUDGET_SECONDS", DEFAULT_TURN_WAIT_BUDGET_SECONDS
+        )
+
+    @property
+    def depth(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    @property
+    def retry_after(self) -> int:
+        """Whole seconds a shed client should wait: one budget."""
+        return max(1, math.ceil(self.wait_budget))
+
+    @asynccontextmanager
+    async def admit(self, priority: Priority) -> AsyncIterator[None]:
+        """Hold one of the concurrency slots for the body, or raise `Shed`."""
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def inline(self) -> AsyncIterator[None]:
+        """Run the body at once, without a slot: for turns that stay local."""
+        self._counters["inline"] += 1
+        yield
+
+    async def _acquire(self, priority: Priority) -> None:
+        now = time.monotonic()
+        if self.running < self.concurrency and not self._ahead_of(priority):
+            self.running += 1
+            self._admitted(0.0)
+            return
+
+        if self.depth >= self.queue_limit and not self._displace_new(priority):
+            self._counters["shed_full"] += 1
+            raise Shed(self.retry_after)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        waiter = _Waiter(future, priority)
+        self._queues[priority].append(waiter)
+        self._counters["peak_depth"] = max(self._counters["peak_depth"], self.depth)
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.wait_budget)
+        except asyncio.TimeoutError:
+            self._forget(waiter)
+            if future.done() and future.exception() is None:
+                # Handed a slot in the same instant the budget ran out.
+                self._release()
+            self._counters["shed_budget"] += 1
+            raise Shed(self.retry_after) from None
+        except asyncio.CancelledError:
+            self._forget(waiter)
+            if future.done() and not future.cancelled() and future.exception() is None:
+                self._release()
+            raise
+        # A displaced waiter's Shed was raised by the wait above; reaching
+        # here means a slot was handed over, already counted as running.
+        self._admitted(time.monotonic() - now)
+
+    def _ahead_of(self, priority: Priority) -> bool:
+        """Whether anyone queued would be admitted before *priority*."""
+        return any(self._queues[p] for p in Priority if p <= priority)
+
+    def _displace_new(self, priority: Priority) -> bool:
+        """Shed the newest waiting new run to make room for a turn."""
+        if priority is not Priority.RUN or not self._queues[Priority.NEW]:
+            return False
+        waiter = self._queues[Priority.NEW].pop()
+        self._counters["shed_new"] += 1
+        waiter.future.set_exception(Shed(self.retry_after))
+        return True
+
+    def _forget(self, waiter: _Waiter) -> None:
+        try:
+            self._queues[waiter.priority].remove(waiter)
+        except ValueError:
+            pass
+
+    def _admitted(self, waited: float) -> None:
+        self._counters["admitted"] += 1
+        self._waits.append(waited)
+
+    def _release(self) -> None:
+        # The slot passes straight to the next waiter, turns first, and stays
+        # counted in ``running`` so nothing arriving meanwhile can take it.
+        if self.running <= self.concurrency:
+            for priority in Priority:
+                queue = self._queues[priority]
+                while queue:
+                    waiter = queue.popleft()
+                    if not waiter.future.done():
+                        waiter.future.set_result(None)
+                        return
+        self.running -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        waits = sorted(self._waits)
+        percentiles = (
+            {
+                f"wait_{name}_ms": round(_percentile(waits, fraction) * 1000, 3)
+                for name, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))
+            }
+            if waits
+            else {"wait_p50_ms": None, "wait_p95_ms": None, "wait_p99_ms": None}
+        )
+        return {
+            "running": self.running,
+            "depth": self.depth,
+            "depth_new": len(self._queues[Priority.NEW]),
+            "concurrency": self.concurrency,
+            "queue_limit": self.queue_limit,
+            "wait_budget_seconds": self.wait_budget,
+            **self._counters,
+            **percentiles,
+        }
@@ -8,11 +8,15 @@ import logging
 import os
 import shutil
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Optional
 
 from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
 # Load .env before any other game import. game.env pulls in nothing else from
@@ -21,19 +25,32 @@ from game.env import load_game_dotenv
 
 load_game_dotenv()
 
+from game.ai.cache import cache_stats
+from game.ai.http_pool import aclose_http_clients, pool_stats
+from game.ai.prefetch import prefetch_stats
+from game.ai.transport import usage_stats
+from game.render_cache import render_cache_stats
+from server.admission import Priority, Shed, TurnScheduler
+from server.frame_diff import FrameDiffer, diff_base
 from server.session import WebGameSession
 from server.rate_limiter import RateLimiter
+from server.save_writer import durable_ack_enabled, flush_save_writer, save_writer_stats
 from server.protocol import (
     BROKEN_MESSAGE_TEXT,
     UNKNOWN_MESSAGE_TEXT,
+    PartialFrame,
     decode_turn_message,
+    wants_batched_overlays,
 )
+from server.shared_state import SQLiteRateCounters, SQLiteSessionBackend
 from server.session_store import (
     IdentityBusy,
+    SessionRef,
     SessionStore,
-    StoredSession,
+    hibernate_after_seconds,
     is_valid_client_id,
     prune_expired_saves,
+    prune_orphaned_hibernations,
 )
 
 logger = logging.getLogger("the-cabin")
@@ -46,6 +63,8 @@ UNKNOWN_SESSION_TEXT = "That thread has gone cold. The room remembers nothing of
 UNKNOWN_IDENTITY_TEXT = "The room will not answer to that name."
 IDENTITY_BUSY_TEXT = "The room is still holding your last breath. Wait."
 TURN_FAILED_TEXT = "The thread breaks. The room lets you go."
+DRAINING_TEXT = "The room holds its breath. Try again in a moment."
+SETTLE_TEXT = "Too many voices at once. The room needs a moment to settle."
 
 # Header set by the Fly edge with the real client address. Trusted over the
 # client-controlled X-Forwarded-For, whose left-most value is spoofable.
@@ -61,8 +80,97 @@ DEFAULT_ALLOWED_ORIGINS = (
     "http://127.0.0.1:8000",
 )
 
-app = FastAPI(title="The Cabin", docs_url=None, redoc_url=None)
 
+# How long shutdown waits for running turns before draining regardless. Kept
+# inside the deploy's kill timeout (fly.toml) with room for the write.
+DRAIN_TIMEOUT_SECONDS = 20.0
+
+# Set once shutdown begins; new sessions and turns are refused from then on.
+_draining = False
+
+
+async def _drain_sessions() -> None:
+    """Stop admitting turns, let running ones land, then write the store out."""
+    global _draining
+    _draining = True
+    deadline = time.monotonic() + DRAIN_TIMEOUT_SECONDS
+    while session_store.in_flight_turns() and time.monotonic() < deadline:
+        await asyncio.sleep(0.05)
+    if session_store.in_flight_turns():
+        logger.warning(
+            "Draining with %d turns still running", session_store.in_flight_turns()
+        )
+    try:
+        path = session_store.drain()
+    except Exception:
+        logger.exception("Failed to drain HTTP sessions")
+        return
+    logger.info(
+        "Drained %d HTTP sessions to %s",
+        len(session_store) + await session_store.hibernated_count_async(),
+        path,
+    )
+
+
+# Seconds between background session sweeps. Expiry is also checked on every
+# token lookup, so this bounds only how long an abandoned session holds its
+# slot and memory.
+DEFAULT_SESSION_SWEEP_SECONDS = 15.0
+
+
+def _session_sweep_seconds() -> float:
+    raw = os.getenv("CABIN_SESSION_SWEEP_SECONDS")
+    try:
+        seconds = float(raw) if raw else DEFAULT_SESSION_SWEEP_SECONDS
+    except ValueError:
+        return DEFAULT_SESSION_SWEEP_SECONDS
+    return seconds if seconds > 0 else DEFAULT_SESSION_SWEEP_SECONDS
+
+
+async def _sweep_forever() -> None:
+    """Sweep HTTP sessions and rate counters on a timer, off the request path."""
+    while True:
+        await asyncio.sleep(_session_sweep_seconds())
+        try:
+            await _sweep_sessions()
+            await rate_limiter.sweep_async()
+            await _maybe_prune_saves()
+        except Exception:
+            logger.exception("HTTP session sweep failed")
+
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI):
+    """Process lifetime hooks.
+
+    Startup picks up the sessions the previous process drained and starts the
+    session sweep; shutdown stops it, drains this process's sessions and
+    closes the shared model connections.
+    """
+    global _draining
+    _draining = False
+    restored = session_store.restore()
+    if restored:
+        logger.info("Restored %d drained HTTP sessions", restored)
+    sweeper = asyncio.create_task(_sweep_forever())
+    yield
+    sweeper.cancel()
+    try:
+        await sweeper
+    except asyncio.CancelledError:
+        pass
+    await _drain_sessions()
+    # Saves the drained sessions queued are still owed to the volume.
+    if not await asyncio.to_thread(flush_save_writer, DRAIN_TIMEOUT_SECONDS):
+        logger.warning("Shutting down with saves still queued")
+    await aclose_http_clients()
+
+
+app = FastAPI(title="The Cabin", docs_url=None, redoc_url=None, lifespan=_lifespan)
+
+# Turn responses resend a room's prose; compressed, a frame is a fraction of
+# its size on a slow connection. Streamed turns are flushed line by line.
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=6)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -70,10 +178,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-rate_limiter = RateLimiter()
+def _shared_state_path() -> Path | None:
+    """SQLite file for state shared across workers, or None to keep it in memory.
+
+    Required for more than one worker (``CABIN_WORKERS``): without it each
+    worker would know only its own sessions and enforce its own limits.
+    """
+    raw = os.getenv("CABIN_SHARED_STATE_PATH")
+    return Path(raw) if raw else None
 
 
-def _release_session_slot(stored: StoredSession) -> None:
+_shared_path = _shared_state_path()
+
+rate_limiter = RateLimiter(
+    shared=SQLiteRateCounters(_shared_path) if _shared_path else None
+)
+
+# Global pressure, where the limiter sees one IP at a time: how many turns
+# run at once, who waits, and who is told to come back (server/admission.py).
+turn_scheduler = TurnScheduler()
+
+
+def _release_session_slot(stored: SessionRef) -> None:
     """Give back the connection slot a stored session was holding.
 
     Looked up through the module global so tests that swap in a fresh limiter
@@ -82,33 +208,108 @@ def _release_session_slot(stored: StoredSession) -> None:
     rate_limiter.release_connection(stored.ip)
 
 
+def _resume_session_slot(stored: SessionRef) -> None:
+    """Take a slot back for a session rehydrated from disk."""
+    rate_limiter.resume_session()
+
+
+# A hibernated session is off the heap, so it gives its slot back and the cap
+# counts only resident sessions. Rehydration always proceeds, even at the cap:
+# the run already exists, and the next sweep brings residency back down.
 session_store = SessionStore(
     idle_timeout=rate_limiter.session_timeout,
+    hibernate_after=hibernate_after_seconds(),
+    backend=SQLiteSessionBackend(_shared_path) if _shared_path else None,
     on_release=_release_session_slot,
+    on_hibernate=_release_session_slot,
+    on_rehydrate=_resume_session_slot,
 )
 
-# Durable save pruning walks the filesystem, so it runs on a timer rather than
-# on every session creation.
+# Durable save pruning touches the filesystem, so it runs on a timer rather
+# than on every session creation, and on its own thread rather than the loop.
 SAVE_PRUNE_INTERVAL_SECONDS = 3600.0
 _last_save_prune: float = 0.0
-
-
-def _sweep_sessions() -> None:
-    """Expire idle HTTP sessions, keeping the store's timeout in step."""
+_save_pruner: ThreadPoolExecutor | None = None
+_save_prune_pass: Future | None = None
+_save_prune_stats = {
+    "passes": 0,
+    "failed": 0,
+    "pruned": 0,
+    "last_pruned": 0,
+    "last_pass_ms": None,
+}
+
+
+async def _sweep_sessions() -> None:
+    """Expire idle HTTP sessions and hibernate quiet ones.
+
+    Keeps the store's timeout and hibernation threshold in step with their
+    settings.
+    """
     session_store.idle_timeout = rate_limiter.session_timeout
+    session_store.hibernate_after = hibernate_after_seconds()
     # Tokens are bearer secrets, so nothing identifying goes to the log.
-    for _ in session_store.sweep():
-        logger.info("HTTP session expired (sessions: %d)", rate_limiter.active_sessions)
+    for _ in await session_store.sweep_async():
+        logger.info(
+            "HTTP session expired (sessions: %d)", rate_limiter.last_active_sessions
+        )
+    hibernated = await session_store.hibernate_idle_async()
+    if hibernated:
+        logger.info(
+            "Hibernated %d HTTP sessions (sessions: %d, hibernated: %d)",
+            len(hibernated),
+            rate_limiter.last_active_sessions,
+            await session_store.hibernated_count_async(),
+        )
+
 
+async def _maybe_prune_saves() -> None:
+    """Start a pruning pass on the pruning thread if one is due.
 
-def _maybe_prune_saves() -> None:
-    global _last_save_prune
+    What is live is read through the store, which is not thread-safe, so
+    from the loop; only a shared backend's rows are read in a worker thread.
+    Everything that touches the disk happens on the pruning thread.
+    """
+    global _last_save_prune, _save_pruner, _save_prune_pass
     now = time.monotonic()
     if _last_save_prune and now - _last_save_prune < SAVE_PRUNE_INTERVAL_SECONDS:
         return
+    if _save_prune_pass is not None and not _save_prune_pass.done():
+        return
+    # Claimed before the await, so a second caller meanwhile sees it done.
     _last_save_prune = now
-    for path in prune_expired_saves(session_store.live_save_dirs()):
+    snapshot_at = time.time()
+    hibernation_files = session_store.hibernation_files()
+    live_dirs = await session_store.live_save_dirs_async()
+    if _save_pruner is None:
+        _save_pruner = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save-prune")
+    _save_prune_pass = _save_pruner.submit(
+        _prune_saves, live_dirs, hibernation_files, snapshot_at
+    )
+
+
+def _prune_saves(live_dirs, hibernation_files, snapshot_at: float) -> None:
+    """One pruning pass. Runs on the pruning thread."""
+    started = time.perf_counter()
+    try:
+        dirs = prune_expired_saves(live_dirs)
+        files = prune_orphaned_hibernations(hibernation_files, older_than=snapshot_at)
+    except Exception:
+        _save_prune_stats["failed"] += 1
+        logger.exception("Save pruning pass failed")
+        return
+    for path in dirs:
         logger.info("Pruned stale save dir: %s", path)
+    for path in files:
+        logger.info("Pruned orphaned hibernation file: %s", path)
+    _save_prune_stats["passes"] += 1
+    _save_prune_stats["pruned"] += len(dirs)
+    _save_prune_stats["last_pruned"] = len(dirs)
+    _save_prune_stats["last_pass_ms"] = round((time.perf_counter() - started) * 1000, 3)
+
+
+def save_prune_stats() -> dict:
+    return dict(_save_prune_stats)
 
 
 def _error(status: int, text: str) -> JSONResponse:
@@ -116,6 +317,20 @@ def _error(status: int, text: str) -> JSONResponse:
     return JSONResponse(status_code=status, content={"type": "error", "message": text})
 
 
+def _admit_turn(session: WebGameSession, text: str):
+    """A slot for a turn that can reach the model; anything else runs inline."""
+    if session.needs_interpreter(text):
+        return turn_scheduler.admit(Priority.RUN)
+    return turn_scheduler.inline()
+
+
+def _settle(shed: Shed) -> JSONResponse:
+    """The answer to a request shed under load: narrated, with a retry time."""
+    response = _error(503, SETTLE_TEXT)
+    response.headers["Retry-After"] = str(shed.retry_after)
+    return response
+
+
 def _client_ip(ws: WebSocket | Request) -> str:
     """Best-effort client IP for rate limiting.
 
@@ -179,10 +394,18 @@ def _cleanup_session_saves(session: WebGameSession) -> None:
 
 @app.get("/health")
 async def health():
-    _sweep_sessions()
     return {
         "status": "ok",
-        "active_sessions": rate_limiter.active_sessions,
+        "active_sessions": rate_limiter.last_active_sessions,
+        "hibernated_sessions": session_store.last_hibernated_count,
+        "http_pool": pool_stats(),
+        "response_cache": cache_stats(),
+        "model_usage": usage_stats(),
+        "model_prefetch": prefetch_stats(),
+        "save_pruning": save_prune_stats(),
+        "save_writer": save_writer_stats(),
+        "admission": turn_scheduler.stats(),
+        "render_cache": render_cache_stats(),
     }
 
 
@@ -268,21 +491,21 @@ def _bearer_token(request: Request) -> str | None:
 @app.post("/session")
 async def create_session(request: Request):
     """Start a run and return its token plus the intro frame."""
-    _sweep_sessions()
+    if _draining:
+        return _error(503, DRAINING_TEXT)
 
     if not _origin_allowed(request):
         return _error(403, ORIGIN_REFUSED_TEXT)
 
     ip = _client_ip(request)
 
-    # Reserve the slot in the same breath as the check. Anything awaited
+    # Reserve the slot in the same step as the check. Anything awaited
     # between the two lets concurrent creates all pass a stale check and
     # overshoot the cap. Rollback returns the slot but keeps the attempt's
     # timestamp, so a burst of malformed bodies still counts against the
     # per-minute limit rather than being free.
-    if not rate_limiter.can_connect(ip):
+    if not await rate_limiter.admit_connection_async(ip):
         return _error(429, CONNECTION_REFUSED_TEXT)
-    rate_limiter.register_connection(ip)
 
     stored = None
     try:
@@ -298,7 +521,11 @@ async def create_session(request: Request):
                 return _error(400, UNKNOWN_IDENTITY_TEXT)
 
         try:
-            stored = session_store.create(ip=ip, client_id=client_id)
+            # New runs queue behind turns for runs already under way.
+            async with turn_scheduler.admit(Priority.NEW):
+                stored = await session_store.create_async(ip=ip, client_id=client_id)
+        except Shed as shed:
+            return _settle(shed)
         except IdentityBusy:
             return _error(409, IDENTITY_BUSY_TEXT)
         except Exception:
@@ -309,15 +536,15 @@ async def create_session(request: Request):
         # live. Pruning first would let a player returning right on the
         # retention boundary watch their history deleted a moment before they
         # could load it.
-        _maybe_prune_saves()
+        await _maybe_prune_saves()
     finally:
         # Any path that did not end up with a stored session must hand the
         # slot back; nothing else would, because nothing was stored.
         if stored is None:
-            rate_limiter.release_connection(ip)
+            await rate_limiter.release_connection_async(ip)
 
     logger.info(
-        "HTTP session opened: %s (sessions: %d)", ip, rate_limiter.active_sessions
+        "HTTP session opened: %s (sessions: %d)", ip, rate_limiter.last_active_sessions
     )
 
     return {
@@ -326,10 +553,62 @@ async def create_session(request: Request):
     }
 
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _wants_stream(request: Request) -> bool:
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
 @app.post("/session/turn")
 async def session_turn(request: Request):
-    """Play one turn against an existing session and return the next frame."""
-    _sweep_sessions()
+    """Play one turn against an existing session and return the next frame.
+
+    A client that sends ``Accept: application/x-ndjson`` may get the turn as
+    a chunked stream instead: ``partial`` narration lines while the model
+    replies, then the frame. Only a turn that actually streams narration is
+    answered that way; anything else, errors included, is the plain response.
+    """
+    if not _wants_stream(request):
+        return await _play_turn(request)
+
+    pieces: asyncio.Queue[Optional[str]] = asyncio.Queue()
+
+    async def narrate(piece: Optional[str]) -> None:
+        pieces.put_nowait(piece)
+
+    turn = asyncio.create_task(_play_turn(request, on_narration=narrate))
+    first = asyncio.create_task(pieces.get())
+    await asyncio.wait({turn, first}, return_when=asyncio.FIRST_COMPLETED)
+    if not first.done():
+        first.cancel()
+        return await turn
+
+    async def lines():
+        yield json.dumps(PartialFrame.of(first.result()).to_dict()) + "\n"
+        while not turn.done():
+            piece = asyncio.create_task(pieces.get())
+            await asyncio.wait({turn, piece}, return_when=asyncio.FIRST_COMPLETED)
+            if not piece.done():
+                piece.cancel()
+                break
+            yield json.dumps(PartialFrame.of(piece.result()).to_dict()) + "\n"
+        while not pieces.empty():
+            yield json.dumps(PartialFrame.of(pieces.get_nowait()).to_dict()) + "\n"
+        # The status line has gone; a turn that fails now reports its error
+        # as the final line, in the same shape as an error response body.
+        result = await turn
+        if isinstance(result, JSONResponse):
+            result = json.loads(result.body)
+        yield json.dumps(result) + "\n"
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
+
+
+async def _play_turn(request: Request, on_narration=None):
+    # A turn started now could land after the drain has written its session.
+    if _draining:
+        return _error(503, DRAINING_TEXT)
 
     if not _origin_allowed(request):
         return _error(403, ORIGIN_REFUSED_TEXT)
@@ -338,14 +617,13 @@ async def session_turn(request: Request):
 
     # Rate limit before the token lookup so probing for live tokens costs the
     # same budget as playing, rather than being free.
-    if not rate_limiter.can_send_message(ip):
+    if not await rate_limiter.admit_message_async(ip):
         return _error(429, RATE_LIMIT_TEXT)
-    rate_limiter.register_message(ip)
 
     token = _bearer_token(request)
-    stored = session_store.get(token) if token else None
+    stored = await session_store.get_async(token) if token else None
     if stored is None:
-        terminal = session_store.terminal_replay(token) if token else None
+        terminal = await session_store.terminal_replay_async(token) if token else None
         if terminal is None:
             return _error(404, UNKNOWN_SESSION_TEXT)
 
@@ -370,9 +648,9 @@ async def session_turn(request: Request):
     # Arrival counts as activity, as it does on the WS path. The in-flight
     # count holds off expiry for as long as this request lives, so a sweep
     # cannot release the session, or delete its save directory, mid-turn.
-    stored.touch()
     stored.in_flight += 1
     try:
+        await session_store.touch_async(stored)
         body = await _json_body(request)
         if body is _TOO_LARGE:
             return _error(413, BROKEN_MESSAGE_TEXT)
@@ -395,14 +673,14 @@ async def session_turn(request: Request):
             return _error(400, err)
 
         # One turn at a time per session: a double-tapped send must not run two
-        # turns against the same mutable game state concurrently. The turn
-        # itself runs in a thread for the same reason as the WS path (see
-        # below).
-        async with stored.lock:
+        # turns against the same mutable game state concurrently, whichever
+        # worker it lands on. The turn is awaited on the loop, as on the WS
+        # path (see below).
+        async with session_store.turn_lock(stored):
             # A session retired while this request waited for the lock (a new
             # run from the same identity, say) must not be resurrected by it.
-            if session_store.get(stored.token) is not stored:
-                terminal = session_store.terminal_replay(stored.token)
+            if await session_store.get_async(stored.token) is not stored:
+                terminal = await session_store.terminal_replay_async(stored.token)
                 if (
                     terminal is not None
                     and turn_id == terminal.turn_id
@@ -428,33 +706,57 @@ async def session_turn(request: Request):
             elif turn_id is not None and turn_id != 1:
                 return _error(400, BROKEN_MESSAGE_TEXT)
 
-            loop = asyncio.get_running_loop()
             try:
-                frame = await loop.run_in_executor(
-                    None, stored.session.handle_input, text
-                )
+                async with _admit_turn(stored.session, text):
+                    if on_narration is None:
+                        frame = await stored.session.handle_input_async(text)
+                    else:
+                        frame = await stored.session.handle_input_async(
+                            text, on_narration=on_narration
+                        )
+            except Shed as shed:
+                # Nothing has run, so the client repeats this turn id as is.
+                return _settle(shed)
             except Exception:
                 # The WS path releases the session on a failed turn; do the
                 # same here rather than leaving a wedged one holding a slot.
                 logger.exception("HTTP turn failed for %s", ip)
-                session_store.release(stored.token)
+                await session_store.release_async(stored.token)
                 return _error(500, TURN_FAILED_TEXT)
+            if wants_batched_overlays(body):
+                frame = stored.session.batch_overlays(frame)
+            payload = frame.to_dict()
+            diffing, base = diff_base(body)
+            if diffing:
+                payload = stored.frames.encode(payload, base)
             stored.touch()
             if turn_id is not None:
                 stored.last_turn_id = turn_id
                 stored.last_turn_type = turn_type
                 stored.last_turn_text = text
-                stored.last_turn_frame = frame.to_dict()
+                stored.last_turn_frame = payload
+            # Inside the lock, so the next turn on any worker starts from it.
+            await session_store.commit_async(stored)
     finally:
         stored.in_flight -= 1
 
+    pending = stored.session.save_manager.pending_write
+    if pending is not None and durable_ack_enabled():
+        # The turn answers once its save is on disk, not merely queued. The
+        # frame already stands, so a failed write is logged and not reported.
+        try:
+            # Shielded: a dropped request must not cancel the write itself.
+            await asyncio.shield(asyncio.wrap_future(pending))
+        except OSError:
+            logger.error("HTTP turn answered with its save unwritten for %s", ip)
+
     if frame.game_over:
-        session_store.release(
+        await session_store.release_async(
             stored.token,
             preserve_terminal_replay=turn_id is not None,
         )
 
-    return frame.to_dict()
+    return payload
 
 
 @app.websocket("/ws")
@@ -465,20 +767,39 @@ async def websocket_endpoint(ws: WebSocket):
         await ws.close(code=1008, reason=ORIGIN_REFUSED_TEXT)
         return
 
-    if not rate_limiter.can_connect(ip):
+    if not await rate_limiter.admit_connection_async(ip):
         await ws.close(code=1008, reason=CONNECTION_REFUSED_TEXT)
         return
 
-    await ws.accept()
-    rate_limiter.register_connection(ip)
-    logger.info("WS connected: %s (sessions: %d)", ip, rate_limiter.active_sessions)
+    # A new socket is a new run, so it waits behind turns already under way,
+    # and holds its slot while the run is built, as a create over HTTP does.
+    # Its turns are admitted one by one below.
+    try:
+        async with turn_scheduler.admit(Priority.NEW):
+            session = WebGameSession()
+            intro = session.get_intro_frame()
+    except Shed:
+        await rate_limiter.release_connection_async(ip)
+        # 1013: try again later.
+        await ws.close(code=1013, reason=SETTLE_TEXT)
+        return
 
-    session = WebGameSession()
+    frames = FrameDiffer()
     last_activity = time.monotonic()
 
+    async def send_partial(piece: Optional[str]) -> None:
+        # A failed send means the client has gone. It is raised through the
+        # interpreter as it is, ending the turn unplayed, rather than taken
+        # for a model failure and answered with the fallback.
+        await ws.send_json(PartialFrame.of(piece).to_dict())
+
     try:
+        await ws.accept()
+        logger.info(
+            "WS connected: %s (sessions: %d)", ip, rate_limiter.last_active_sessions
+        )
+
         # Send intro frame
-        intro = session.get_intro_frame()
         await ws.send_json(intro.to_dict())
 
         while True:
@@ -517,13 +838,12 @@ async def websocket_endpoint(ws: WebSocket):
                 continue
 
             # Rate limit messages
-            if not rate_limiter.can_send_message(ip):
+            if not await rate_limiter.admit_message_async(ip):
                 await ws.send_json({
                     "type": "error",
                     "message": RATE_LIMIT_TEXT,
                 })
                 continue
-            rate_limiter.register_message(ip)
 
             # Validate input length
             err = rate_limiter.validate_input(text)
@@ -531,17 +851,40 @@ async def websocket_endpoint(ws: WebSocket):
                 await ws.send_json({"type": "error", "message": err})
                 continue
 
-            # Run the (potentially blocking) game logic in a thread. A single
-            # turn is bounded by the OpenAI client timeout (see ai_interpreter):
-            # on a slow or stuck model call interpret() raises and falls back to
-            # rule-based parsing, so handle_input returns promptly. We deliberately
-            # do not wrap this in an asyncio per-turn deadline, because wait_for()
-            # cannot cancel the worker thread; abandoning it mid-turn would let it
-            # keep mutating session state after the connection has moved on.
-            loop = asyncio.get_running_loop()
-            frame = await loop.run_in_executor(None, session.handle_input, text)
+            # Await the turn on the loop. Its only wait is the model call, made
+            # through the async client, so a slow completion parks this
+            # coroutine instead of holding an executor thread; other players'
+            # turns keep running. A single turn is bounded by the model-call
+            # timeout (see ai_interpreter): on a slow or stuck call the
+            # interpreter falls back to rule-based parsing, so the turn returns
+            # promptly. Nothing is mutated until the intent is back, so a
+            # disconnect that cancels the turn mid-call leaves no half-applied
+            # state behind.
+            #
+            # The model's reply is streamed ahead of the frame as "partial"
+            # messages, so narration starts at time-to-first-token; the frame
+            # that follows is the committed turn and replaces them. A retried
+            # model call sends a reset partial before streaming again.
+            try:
+                async with _admit_turn(session, text):
+                    frame = await session.handle_input_async(
+                        text, on_narration=send_partial
+                    )
+            except Shed as shed:
+                await ws.send_json({
+                    "type": "error",
+                    "message": SETTLE_TEXT,
+                    "retry_after": shed.retry_after,
+                })
+                continue
 
-            await ws.send_json(frame.to_dict())
+            if wants_batched_overlays(msg):
+                frame = session.batch_overlays(frame)
+            payload = frame.to_dict()
+            diffing, base = diff_base(msg)
+            if diffing:
+                payload = frames.encode(payload, base)
+            await ws.send_json(payload)
 
             if frame.game_over:
                 break
@@ -551,9 +894,11 @@ async def websocket_endpoint(ws: WebSocket):
     except Exception:
         logger.exception("WS error for %s", ip)
     finally:
-        rate_limiter.release_connection(ip)
+        await rate_limiter.release_connection_async(ip)
         _cleanup_session_saves(session)
-        logger.info("WS cleanup: %s (sessions: %d)", ip, rate_limiter.active_sessions)
+        logger.info(
+            "WS cleanup: %s (sessions: %d)", ip, rate_limiter.last_active_sessions
+        )
 
 
 def _mount_site(target_app: FastAPI) -> None:
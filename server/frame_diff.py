@@ -0,0 +1,108 @@
+"""Frame-diff mode: send only the lines a frame changes.
+
+Every render frame carries its whole ``lines`` list, so a turn that changes
+one status line resends the room around it. A client opts in by sending
+``"diff_base"`` with a turn: the ``seq`` of the last frame it holds, or null
+when it holds none. Frames sent to it then carry a ``seq`` of their own, and
+a frame that shares lines with the client's base is sent as a diff:
+
+    {"type": "render", "seq": 7, "base": 6, "keep_head": 3, "keep_tail": 1,
+     "lines": [...the lines in between...], ...the frame's usual flags}
+
+The client rebuilds the frame as the base's first ``keep_head`` lines, then
+``lines``, then the base's last ``keep_tail`` lines. A frame without
+``base`` is whole. The server answers with a whole frame whenever the base
+the client names is not one it remembers, which is the resync: after a lost
+response, a restart, or a session picked up by another worker.
+
+Diffs are only ever against a frame the client names. Sequence numbers start
+at a random point for each session's differ, so a base left over from
+another copy of the session never matches by accident.
+"""
+
+from __future__ import annotations
+
+import secrets
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+
+# Recent frames remembered as bases. More than one, so a client whose last
+# response went missing can still name the frame before it.
+BASE_FRAMES = 4
+
+
+def diff_base(payload: object) -> tuple[bool, Optional[int]]:
+    """Whether a turn message opted in to diffs, and the base it names."""
+    if not isinstance(payload, dict) or "diff_base" not in payload:
+        return False, None
+    base = payload["diff_base"]
+    if isinstance(base, bool) or not isinstance(base, int):
+        return True, None
+    return True, base
+
+
+def _shared_ends(base: List[str], lines: List[str]) -> tuple[int, int]:
+    """Lengths of the common head and, after it, the common tail."""
+    limit = min(len(base), len(lines))
+    head = 0
+    while head < limit and base[head] == lines[head]:
+        head += 1
+    tail = 0
+    while tail < limit - head and base[-1 - tail] == lines[-1 - tail]:
+        tail += 1
+    return head, tail
+
+
+class FrameDiffer:
+    """The frames recently sent to one client, and diffs against them."""
+
+    def __init__(self) -> None:
+        self._next_seq = secrets.randbits(40) + 1
+        self._sent: "OrderedDict[int, List[str]]" = OrderedDict()
+
+    def encode(self, payload: Dict[str, Any], base: Optional[int]) -> Dict[str, Any]:
+        """Number *payload* and, where it pays, express it against *base*.
+
+        *payload* is a ``render`` or ``batch`` message as ``to_dict`` builds
+        it; anything else is returned untouched. A batch's frames are always
+        whole, and its last frame, the room, becomes the next base.
+        """
+        kind = payload.get("type")
+        if kind == "render":
+            lines = payload["lines"]
+        elif kind == "batch":
+            lines = payload["frames"][-1]["lines"]
+        else:
+            return payload
+
+        seq = self._next_seq
+        self._next_seq += 1
+        encoded = {**payload, "seq": seq}
+        base_lines = self._sent.get(base) if base is not None else None
+        if kind == "render" and base_lines is not None:
+            head, tail = _shared_ends(base_lines, lines)
+            if head or tail:
+                encoded.update(
+                    base=base,
+                    keep_head=head,
+                    keep_tail=tail,
+                    lines=lines[head:len(lines) - tail],
+                )
+
+        self._sent[seq] = list(lines)
+        while len(self._sent) > BASE_FRAMES:
+            self._sent.popitem(last=False)
+        return encoded
+
+
+def apply_diff(base_lines: List[str], payload: Dict[str, Any]) -> List[str]:
+    """Rebuild a diffed frame's lines, as a client does."""
+    if "base" not in payload:
+        return list(payload["lines"])
+    tail = payload["keep_tail"]
+    return (
+        base_lines[: payload["keep_head"]]
+        + list(payload["lines"])
+        + (base_lines[len(base_lines) - tail:] if tail else [])
+    )
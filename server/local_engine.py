@@ -3,6 +3,13 @@
 The adapter deliberately speaks only JSON-shaped values.  Native clients own
 rendering and lifecycle; :class:`WebGameSession` remains the single owner of
 story state and turn behaviour.
+
+A run is durable as a full checkpoint plus an append-only journal beside it.
+Each completed turn appends one line to the journal (the turn, its frame and
+the checkpoint sections the turn changed) and fsyncs it once. Every
+``JOURNAL_COMPACT_TURNS`` turns, on ``persist`` and on any journal failure,
+the checkpoint is rewritten in full and the journal removed. Restoring reads
+the checkpoint and replays the journal on top of it.
 """
 
 from __future__ import annotations
@@ -23,6 +30,10 @@ from server.session import WebGameSession
 
 SNAPSHOT_VERSION = 1
 HANDLE_VERSION = 1
+# Journal lines between full checkpoints. Replay cost grows with this; a
+# checkpoint costs two fsyncs and the whole state.
+JOURNAL_COMPACT_TURNS = 64
+JOURNAL_RECORD_KEYS = frozenset({"turn_id", "turn", "frame", "delta"})
 KNOWN_ANOMALY_IDS = frozenset(anomaly.value for anomaly in AnomalyID)
 KNOWN_ANOMALY_DESCRIPTIONS = {
     anomaly.value: description
@@ -216,6 +227,116 @@ def _validate_game_state_snapshot(data: Dict[str, Any]) -> None:
         raise InvalidSnapshot("local checkpoint game state is malformed")
 
 
+SESSION_SNAPSHOT_KEYS = frozenset(
+    {
+        "phase",
+        "last_feedback",
+        "last_room_id",
+        "pending_overlays",
+        "consumed_feedback",
+    }
+)
+
+
+def session_snapshot(session: WebGameSession) -> Dict[str, Any]:
+    """Return the ``game_state`` and ``session`` parts of a checkpoint."""
+    state = GameState(
+        player=session.player,
+        map=session.map,
+        quest_manager=session.quest_manager,
+        cutscene_manager=session.cutscene_manager,
+    )
+    return {
+        "game_state": state.to_dict(),
+        "session": {
+            "phase": session.phase.name,
+            "last_feedback": session._last_feedback,
+            "last_room_id": session._last_room_id,
+            "pending_overlays": [
+                frame.to_dict() for frame in session._pending_overlays
+            ],
+            "consumed_feedback": session._consumed_feedback,
+        },
+    }
+
+
+def restore_session(
+    session: WebGameSession, game_state: object, session_data: object
+) -> None:
+    """Load checkpoint parts written by :func:`session_snapshot` into *session*.
+
+    *session* must be fresh. Everything is validated before the session's own
+    fields are assigned, so on ``InvalidSnapshot`` the caller discards it.
+    """
+    if not _has_exact_keys(session_data, set(SESSION_SNAPSHOT_KEYS)) or not isinstance(
+        game_state, dict
+    ):
+        raise InvalidSnapshot("local checkpoint is malformed")
+    try:
+        _validate_game_state_snapshot(game_state)
+        restored_state = GameState.from_dict(
+            game_state,
+            session.player,
+            session.map,
+            session.quest_manager,
+            session.cutscene_manager,
+        )
+        # ``GameState.from_dict`` intentionally accepts sparse legacy save
+        # files and supplies defaults. A run checkpoint is a different
+        # contract: it was written by this exact schema and must restore
+        # byte-for-byte game meaning. Canonical round-tripping rejects
+        # missing, extra, mistyped, or silently ignored nested state before
+        # the partially populated session can become live.
+        if _canonical_game_state(restored_state.to_dict()) != _canonical_game_state(
+            game_state
+        ):
+            raise InvalidSnapshot("local checkpoint game state is malformed")
+        phase = SessionPhase[session_data["phase"]]
+        last_feedback = session_data["last_feedback"]
+        last_room_id = session_data["last_room_id"]
+        consumed_feedback = session_data["consumed_feedback"]
+        overlays = [
+            _frame_from_dict(frame)
+            for frame in session_data["pending_overlays"]
+        ]
+    except InvalidSnapshot:
+        raise
+    except (
+        AttributeError,
+        IndexError,
+        KeyError,
+        TypeError,
+        ValueError,
+    ) as error:
+        raise InvalidSnapshot("local checkpoint session state is malformed") from error
+    if (
+        not isinstance(last_feedback, str)
+        or (last_room_id is not None and not isinstance(last_room_id, str))
+        or not isinstance(consumed_feedback, str)
+    ):
+        raise InvalidSnapshot("local checkpoint session state is malformed")
+
+    session.phase = phase
+    session._last_feedback = last_feedback
+    session._last_room_id = last_room_id
+    session._pending_overlays = overlays
+    session._consumed_feedback = consumed_feedback
+
+
+def _snapshot_delta(
+    before: Dict[str, Any], after: Dict[str, Any]
+) -> Dict[str, Dict[str, Any]]:
+    """The sections of ``game_state`` and ``session`` that differ in *after*."""
+    return {
+        part: {
+            key: value
+            for key, value in after[part].items()
+            if before[part].get(key) != value
+        }
+        for part in ("game_state", "session")
+    }
+
+
 class LocalEngine:
     """Serially driven, crash-safe wrapper around ``WebGameSession``.
 
@@ -233,6 +354,13 @@ class LocalEngine:
         self.session: Optional[WebGameSession] = None
         self.next_turn_id = 1
         self.last_completed: Optional[Dict[str, Any]] = None
+        # The ``game_state`` and ``session`` parts as of the last durable
+        # write, which the next journal line is a delta against.
+        self._durable_parts: Optional[Dict[str, Any]] = None
+        # Complete lines in the journal, and whether it can take another:
+        # after a failed or torn append only a full checkpoint is safe.
+        self._journal_lines = 0
+        self._journal_clean = True
 
     @property
     def resume_handle(self) -> Optional[str]:
@@ -325,7 +453,7 @@ class LocalEngine:
             "frame": frame.to_dict(),
         }
         self.next_turn_id += 1
-        self._checkpoint()
+        self._record_turn()
         return self._response(frame)
 
     def probe(self) -> Dict[str, Any]:
@@ -404,39 +532,56 @@ class LocalEngine:
     def _snapshot(self) -> Dict[str, Any]:
         if self.session is None or self.run_id is None:
             raise InvalidSnapshot("no local run is open")
-        state = GameState(
-            player=self.session.player,
-            map=self.session.map,
-            quest_manager=self.session.quest_manager,
-            cutscene_manager=self.session.cutscene_manager,
-        )
         return {
             "version": SNAPSHOT_VERSION,
             "run_id": self.run_id,
             "next_turn_id": self.next_turn_id,
-            "game_state": state.to_dict(),
-            "session": {
-                "phase": self.session.phase.name,
-                "last_feedback": self.session._last_feedback,
-                "last_room_id": self.session._last_room_id,
-                "pending_overlays": [
-                    frame.to_dict() for frame in self.session._pending_overlays
-                ],
-                "consumed_feedback": self.session._consumed_feedback,
-            },
+            **session_snapshot(self.session),
             "last_completed": self.last_completed,
         }
 
     def _checkpoint_path(self, run_id: str) -> Path:
         return self.runs_dir / f"{run_id}.json"
 
+    def _journal_path(self, run_id: str) -> Path:
+        return self.runs_dir / f"{run_id}.journal"
+
+    def _record_turn(self) -> None:
+        """Make the turn just completed durable, by journal line if possible."""
+        if not self._journal_clean or self._journal_lines >= JOURNAL_COMPACT_TURNS:
+            self._checkpoint()
+            return
+        assert self.run_id is not None and self.session is not None
+        assert self.last_completed is not None and self._durable_parts is not None
+        parts = session_snapshot(self.session)
+        record = {
+            **self.last_completed,
+            "delta": _snapshot_delta(self._durable_parts, parts),
+        }
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        # Whatever happens below, the journal may now end in a torn line.
+        self._journal_clean = False
+        with self._journal_path(self.run_id).open("a", encoding="utf-8") as stream:
+            stream.write(line)
+            stream.flush()
+            os.fsync(stream.fileno())
+        if self._journal_lines == 0:
+            # The append created the journal; its directory entry has to be
+            # durable too, or the line goes with it.
+            self._fsync_runs_dir()
+        self._journal_clean = True
+        self._journal_lines += 1
+        self._durable_parts = parts
+
     def _checkpoint(self) -> None:
+        """Write the full checkpoint and retire the journal it subsumes."""
         assert self.run_id is not None
         self.runs_dir.mkdir(parents=True, exist_ok=True)
         destination = self._checkpoint_path(self.run_id)
         temporary = destination.with_suffix(f".{uuid4().hex}.tmp")
+        snapshot = self._snapshot()
         payload = json.dumps(
-            self._snapshot(),
+            snapshot,
             ensure_ascii=False,
             separators=(",", ":"),
             sort_keys=True,
@@ -447,32 +592,89 @@ class LocalEngine:
                 stream.flush()
                 os.fsync(stream.fileno())
             os.replace(temporary, destination)
-            try:
-                directory_fd = os.open(self.runs_dir, os.O_RDONLY)
-                try:
-                    os.fsync(directory_fd)
-                finally:
-                    os.close(directory_fd)
-            except OSError:
-                # Some Apple filesystems do not allow directory fsync.  The
-                # atomically replaced file remains the authoritative boundary.
-                pass
+            self._fsync_runs_dir()
         finally:
             try:
                 temporary.unlink()
             except FileNotFoundError:
                 pass
+        # Only once the checkpoint is durable. Should the removal itself not
+        # survive a crash, restore skips every line the checkpoint covers.
+        try:
+            self._journal_path(self.run_id).unlink()
+        except FileNotFoundError:
+            pass
+        self._journal_lines = 0
+        self._journal_clean = True
+        self._durable_parts = {
+            "game_state": snapshot["game_state"],
+            "session": snapshot["session"],
+        }
+
+    def _fsync_runs_dir(self) -> None:
+        try:
+            directory_fd = os.open(self.runs_dir, os.O_RDONLY)
+            try:
+                os.fsync(directory_fd)
+            finally:
+                os.close(directory_fd)
+        except OSError:
+            # Some Apple filesystems do not allow directory fsync.  The
+            # atomically replaced file remains the authoritative boundary.
+            pass
+
+    def _read_journal(
+        self, run_id: str, next_turn_id: int
+    ) -> tuple[list[Dict[str, Any]], bool]:
+        """Journal lines for turns from *next_turn_id* on, and whether it is clean.
+
+        Lines the checkpoint already covers are skipped. A final line without
+        its newline is a torn append whose turn was never acknowledged, so it
+        is dropped; anything else unreadable fails the restore.
+        """
+        try:
+            content = self._journal_path(run_id).read_bytes()
+        except FileNotFoundError:
+            return [], True
+        except OSError as error:
+            raise InvalidSnapshot("local journal is unreadable") from error
+        *lines, tail = content.split(b"\n")
+        records: list[Dict[str, Any]] = []
+        expected = next_turn_id
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError as error:
+                raise InvalidSnapshot("local journal is corrupt") from error
+            if not _has_exact_keys(record, set(JOURNAL_RECORD_KEYS)):
+                raise InvalidSnapshot("local journal is corrupt")
+            turn_id = record["turn_id"]
+            if type(turn_id) is not int:
+                raise InvalidSnapshot("local journal is corrupt")
+            if turn_id < next_turn_id:
+                continue
+            if turn_id != expected:
+                raise InvalidSnapshot("local journal sequence is malformed")
+            delta = record["delta"]
+            if not _has_exact_keys(delta, {"game_state", "session"}) or not all(
+                isinstance(part, dict) for part in delta.values()
+            ):
+                raise InvalidSnapshot("local journal is corrupt")
+            records.append(record)
+            expected += 1
+        return records, not tail
 
     def _prune_other_runs(self) -> None:
         """Best-effort removal of every checkpoint except the current run's."""
         assert self.run_id is not None
         keep = self._checkpoint_path(self.run_id)
+        # open() has just written this run's checkpoint, so it has no journal.
         try:
             entries = list(self.runs_dir.iterdir())
         except OSError:
             return
         for entry in entries:
-            if entry == keep or entry.suffix not in {".json", ".tmp"}:
+            if entry == keep or entry.suffix not in {".json", ".journal", ".tmp"}:
                 continue
             try:
                 entry.unlink()
@@ -506,74 +708,35 @@ class LocalEngine:
         if snapshot.get("run_id") != run_id:
             raise InvalidSnapshot("local checkpoint belongs to another run")
         next_turn_id = snapshot.get("next_turn_id")
-        session_data = snapshot.get("session")
-        game_state = snapshot.get("game_state")
         if (
             not isinstance(next_turn_id, int)
             or isinstance(next_turn_id, bool)
             or next_turn_id < 1
-            or not _has_exact_keys(
-                session_data,
-                {
-                    "phase",
-                    "last_feedback",
-                    "last_room_id",
-                    "pending_overlays",
-                    "consumed_feedback",
-                },
-            )
-            or not isinstance(game_state, dict)
+        ):
+            raise InvalidSnapshot("local checkpoint is malformed")
+        if not isinstance(snapshot["game_state"], dict) or not isinstance(
+            snapshot["session"], dict
         ):
             raise InvalidSnapshot("local checkpoint is malformed")
 
+        records, journal_clean = self._read_journal(run_id, next_turn_id)
+        parts = {"game_state": snapshot["game_state"], "session": snapshot["session"]}
+        for record in records:
+            for part, changed in record["delta"].items():
+                parts[part] = {**parts[part], **changed}
+        if records:
+            last = records[-1]
+            next_turn_id = last["turn_id"] + 1
+            snapshot["last_completed"] = {
+                key: last[key] for key in ("turn_id", "turn", "frame")
+            }
+
         session = self._fresh_session()
-        try:
-            _validate_game_state_snapshot(game_state)
-            restored_state = GameState.from_dict(
-                game_state,
-                session.player,
-                session.map,
-                session.quest_manager,
-                session.cutscene_manager,
+        restore_session(session, parts["game_state"], parts["session"])
+        if (session.phase is SessionPhase.INTRO_KEYPRESS) != (next_turn_id == 1):
+            raise InvalidSnapshot(
+                "local checkpoint phase does not match its turn sequence"
             )
-            # ``GameState.from_dict`` intentionally accepts sparse legacy save
-            # files and supplies defaults. A run checkpoint is a different
-            # contract: it was written by this exact schema and must restore
-            # byte-for-byte game meaning. Canonical round-tripping rejects
-            # missing, extra, mistyped, or silently ignored nested state before
-            # the partially populated session can become live.
-            if _canonical_game_state(restored_state.to_dict()) != _canonical_game_state(
-                game_state
-            ):
-                raise InvalidSnapshot("local checkpoint game state is malformed")
-            phase = SessionPhase[session_data["phase"]]
-            if (phase is SessionPhase.INTRO_KEYPRESS) != (next_turn_id == 1):
-                raise InvalidSnapshot(
-                    "local checkpoint phase does not match its turn sequence"
-                )
-            last_feedback = session_data["last_feedback"]
-            last_room_id = session_data["last_room_id"]
-            consumed_feedback = session_data["consumed_feedback"]
-            overlays = [
-                _frame_from_dict(frame)
-                for frame in session_data["pending_overlays"]
-            ]
-        except InvalidSnapshot:
-            raise
-        except (
-            AttributeError,
-            IndexError,
-            KeyError,
-            TypeError,
-            ValueError,
-        ) as error:
-            raise InvalidSnapshot("local checkpoint session state is malformed") from error
-        if (
-            not isinstance(last_feedback, str)
-            or (last_room_id is not None and not isinstance(last_room_id, str))
-            or not isinstance(consumed_feedback, str)
-        ):
-            raise InvalidSnapshot("local checkpoint session state is malformed")
 
         last_completed = snapshot.get("last_completed")
         if last_completed is not None:
@@ -592,18 +755,19 @@ class LocalEngine:
         elif next_turn_id != 1:
             raise InvalidSnapshot("local checkpoint is missing replay state")
 
-        session.phase = phase
-        session._last_feedback = last_feedback
-        session._last_room_id = last_room_id
-        session._pending_overlays = overlays
-        session._consumed_feedback = consumed_feedback
         self.run_id = run_id
         self.session = session
         self.next_turn_id = next_turn_id
         self.last_completed = last_completed
+        self._durable_parts = parts
+        self._journal_lines = len(records)
+        self._journal_clean = journal_clean
 
     def _clear_loaded_run(self) -> None:
         self.run_id = None
         self.session = None
         self.next_turn_id = 1
         self.last_completed = None
+        self._durable_parts = None
+        self._journal_lines = 0
+        self._journal_clean = True
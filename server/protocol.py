@@ -32,6 +32,11 @@ def decode_turn_message(payload: object) -> Tuple[Optional[str], Optional[str]]:
     return None, UNKNOWN_MESSAGE_TEXT
 
 
+def wants_batched_overlays(payload: object) -> bool:
+    """Whether a turn message opted in to receiving its overlays in one batch."""
+    return isinstance(payload, dict) and payload.get("batch_overlays") is True
+
+
 class SessionPhase(Enum):
     """State machine phases for a web game session."""
     INTRO_KEYPRESS = auto()    # Showing intro text, waiting for any key
@@ -69,3 +74,46 @@ class RenderFrame:
         if self.game_over:
             d["game_over"] = True
         return d
+
+
+@dataclass
+class BatchFrame:
+    """Every frame a turn leads to, for a client that pages through them itself.
+
+    ``frames`` holds the turn's first overlay, each overlay queued behind it,
+    and the room frame that follows the last, in display order. The server
+    has already acknowledged every keypress in between, so the client shows
+    the next frame on each key without a round-trip.
+    """
+    frames: List[RenderFrame]
+
+    @property
+    def game_over(self) -> bool:
+        return self.frames[-1].game_over
+
+    def to_dict(self) -> dict:
+        return {"type": "batch", "frames": [frame.to_dict() for frame in self.frames]}
+
+
+@dataclass
+class PartialFrame:
+    """Narration streamed while a turn is still being interpreted.
+
+    ``text`` continues the partial text already sent for the turn; the client
+    appends it. It is provisional: the turn's ``render`` frame follows and
+    replaces everything streamed, whether or not the reply survived
+    validation. A ``reset`` frame takes back what was streamed so far, when a
+    retried model call is about to stream its reply again.
+    """
+    text: str
+    reset: bool = False
+
+    @classmethod
+    def of(cls, piece: Optional[str]) -> "PartialFrame":
+        """The frame for one ``on_narration`` call: None is the reset."""
+        return cls("", reset=True) if piece is None else cls(piece)
+
+    def to_dict(self) -> dict:
+        if self.reset:
+            return {"type": "partial", "text": self.text, "reset": True}
+        return {"type": "partial", "text": self.text}
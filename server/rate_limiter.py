@@ -2,25 +2,64 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
-from collections import defaultdict
-from dataclasses import dataclass, field
-from typing import Dict
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 
+from server.shared_state import SQLiteRateCounters
 
-def _has_recent(timestamps: list, cutoff: float) -> bool:
-    """True if the most recent timestamp is after *cutoff*.
 
-    Timestamps are appended in monotonic order, so only the last one matters.
+WINDOW_SECONDS = 60
+# One slot per second. The wheel must span more than a window, so that an
+# IP's expiry (last activity plus the window) always lands in a future slot.
+WHEEL_SLOTS = 64
+
+T = TypeVar("T")
+
+
+class _Ring:
+    """The last *limit* timestamps of one kind of event, oldest at ``head``.
+
+    "Fewer than *limit* events since *cutoff*" is exactly "the *limit*-th
+    most recent event is at or before *cutoff*", so a fixed ring answers the
+    sliding-window question with one comparison, and recording overwrites
+    the oldest slot instead of growing a list.
     """
-    return bool(timestamps) and timestamps[-1] > cutoff
+
+    __slots__ = ("stamps", "head")
+
+    def __init__(self) -> None:
+        self.stamps: List[float] = []
+        self.head = 0
+
+    def full_since(self, cutoff: float, limit: int) -> bool:
+        if limit <= 0:
+            return True
+        if len(self.stamps) < limit:
+            return False
+        return self.stamps[self.head] > cutoff
+
+    def add(self, now: float, limit: int) -> None:
+        if limit <= 0:
+            return
+        if len(self.stamps) < limit:
+            self.stamps.append(now)
+            return
+        self.stamps[self.head] = now
+        self.head = (self.head + 1) % limit
 
 
-@dataclass
 class _IPBucket:
-    """Sliding-window counters for a single IP address."""
-    message_timestamps: list = field(default_factory=list)
-    connection_timestamps: list = field(default_factory=list)
+    """Sliding-window rings for a single IP address."""
+
+    __slots__ = ("messages", "connections", "last_seen", "due")
+
+    def __init__(self) -> None:
+        self.messages = _Ring()
+        self.connections = _Ring()
+        self.last_seen = 0.0
+        # The wheel second this bucket is filed under.
+        self.due = 0
 
 
 class RateLimiter:
@@ -32,6 +71,16 @@ class RateLimiter:
       - ``max_sessions`` total concurrent sessions globally (default 50)
       - ``max_input_length`` maximum characters in a single message (default 200)
       - ``session_timeout`` seconds of idle before a session is considered expired (default 3600)
+
+    ``python -m tools.session_memory_benchmark --budget-mb N`` reports what an
+    idle session costs and how many fit in N megabytes, which is the number to
+    size ``max_sessions`` against.
+
+    With *shared* counters every limit, the session cap included, holds across
+    all the workers using the same file rather than per process. Each check
+    is then a file read, so the server uses the ``*_async`` twins, which make
+    it in a worker thread, and reads :attr:`last_active_sessions` rather than
+    :attr:`active_sessions` wherever it only reports the count.
     """
 
     def __init__(
@@ -42,58 +91,143 @@ class RateLimiter:
         max_sessions: int = 50,
         max_input_length: int = 200,
         session_timeout: int = 3600,
+        shared: Optional[SQLiteRateCounters] = None,
     ) -> None:
         self.max_messages_per_min = max_messages_per_min
         self.max_connections_per_min = max_connections_per_min
         self.max_sessions = max_sessions
         self.max_input_length = max_input_length
         self.session_timeout = session_timeout
+        self._shared = shared
 
-        self._buckets: Dict[str, _IPBucket] = defaultdict(_IPBucket)
+        self._buckets: Dict[str, _IPBucket] = {}
         self._active_sessions: int = 0
-        self._last_prune: float = time.monotonic()
+        # The shared session count as of the last call that read or moved it.
+        self._shared_sessions: int = 0
+        self._wheel: List[List[str]] = [[] for _ in range(WHEEL_SLOTS)]
+        self._wheel_tick = int(time.monotonic())
 
     # -- Connection limits ----------------------------------------------------
 
     def can_connect(self, ip: str) -> bool:
         """Check whether a new WebSocket connection from *ip* is allowed."""
-        if self._active_sessions >= self.max_sessions:
+        if self.active_sessions >= self.max_sessions:
             return False
+        if self._shared is not None:
+            recent = self._shared.count(ip, "connection", time.time() - 60)
+            return recent < self.max_connections_per_min
 
         now = time.monotonic()
-        self._prune_idle_buckets(now)
-        bucket = self._buckets[ip]
-        cutoff = now - 60
-        bucket.connection_timestamps = [
-            t for t in bucket.connection_timestamps if t > cutoff
-        ]
-        return len(bucket.connection_timestamps) < self.max_connections_per_min
+        self._expire_idle_buckets(now)
+        bucket = self._buckets.get(ip)
+        if bucket is None:
+            return self.max_connections_per_min > 0
+        return not bucket.connections.full_since(
+            now - WINDOW_SECONDS, self.max_connections_per_min
+        )
 
     def register_connection(self, ip: str) -> None:
         """Record a new connection from *ip*."""
-        self._buckets[ip].connection_timestamps.append(time.monotonic())
+        if self._shared is not None:
+            self._shared.record(ip, "connection", time.time())
+            self._shared_sessions = self._shared.add_sessions(1)
+            return
+        now = time.monotonic()
+        self._bucket(ip, now).connections.add(now, self.max_connections_per_min)
         self._active_sessions += 1
 
+    def admit_connection(self, ip: str) -> bool:
+        """Check a new connection from *ip* and, if allowed, record it.
+
+        With shared counters the check and the record are one transaction,
+        so workers admitting at once cannot overshoot the cap between them.
+        """
+        if self._shared is not None:
+            now = time.time()
+            admitted, self._shared_sessions = self._shared.admit(
+                ip,
+                "connection",
+                now,
+                since=now - WINDOW_SECONDS,
+                limit=self.max_connections_per_min,
+                max_sessions=self.max_sessions,
+            )
+            return admitted
+        if not self.can_connect(ip):
+            return False
+        self.register_connection(ip)
+        return True
+
+    async def admit_connection_async(self, ip: str) -> bool:
+        """:meth:`admit_connection`, with shared counters read off the event loop."""
+        return await self._off_loop(self.admit_connection, ip)
+
     def release_connection(self, ip: str) -> None:
         """Record that a connection from *ip* has closed."""
+        if self._shared is not None:
+            self._shared_sessions = self._shared.add_sessions(-1)
+            return
         self._active_sessions = max(0, self._active_sessions - 1)
 
+    async def release_connection_async(self, ip: str) -> None:
+        """:meth:`release_connection`, with shared counters moved off the event loop."""
+        await self._off_loop(self.release_connection, ip)
+
+    def resume_session(self) -> None:
+        """Take a slot for a session coming back into memory.
+
+        Not a new connection, so it is not counted against any per-minute
+        limit, and not refused at the cap: the run already exists.
+        """
+        if self._shared is not None:
+            self._shared_sessions = self._shared.add_sessions(1)
+            return
+        self._active_sessions += 1
+
     # -- Message limits -------------------------------------------------------
 
     def can_send_message(self, ip: str) -> bool:
         """Check whether *ip* is allowed to send another message."""
+        if self._shared is not None:
+            recent = self._shared.count(ip, "message", time.time() - 60)
+            return recent < self.max_messages_per_min
         now = time.monotonic()
-        self._prune_idle_buckets(now)
-        bucket = self._buckets[ip]
-        cutoff = now - 60
-        bucket.message_timestamps = [
-            t for t in bucket.message_timestamps if t > cutoff
-        ]
-        return len(bucket.message_timestamps) < self.max_messages_per_min
+        self._expire_idle_buckets(now)
+        bucket = self._buckets.get(ip)
+        if bucket is None:
+            return self.max_messages_per_min > 0
+        return not bucket.messages.full_since(
+            now - WINDOW_SECONDS, self.max_messages_per_min
+        )
 
     def register_message(self, ip: str) -> None:
         """Record a message from *ip*."""
-        self._buckets[ip].message_timestamps.append(time.monotonic())
+        if self._shared is not None:
+            self._shared.record(ip, "message", time.time())
+            return
+        now = time.monotonic()
+        self._bucket(ip, now).messages.add(now, self.max_messages_per_min)
+
+    def admit_message(self, ip: str) -> bool:
+        """Check another message from *ip* and, if allowed, record it."""
+        if self._shared is not None:
+            now = time.time()
+            admitted, self._shared_sessions = self._shared.admit(
+                ip,
+                "message",
+                now,
+                since=now - WINDOW_SECONDS,
+                limit=self.max_messages_per_min,
+            )
+            return admitted
+        if not self.can_send_message(ip):
+            return False
+        self.register_message(ip)
+        return True
+
+    async def admit_message_async(self, ip: str) -> bool:
+        """:meth:`admit_message`, with shared counters read off the event loop."""
+        return await self._off_loop(self.admit_message, ip)
 
     # -- Input validation -----------------------------------------------------
 
@@ -105,29 +239,95 @@ class RateLimiter:
 
     # -- Housekeeping ---------------------------------------------------------
 
-    def _prune_idle_buckets(self, now: float) -> None:
+    def sweep(self) -> None:
+        """Drop shared events that have left the window and refresh the count.
+
+        In memory, idle buckets go as requests advance the wheel, so there is
+        nothing to do.
+        """
+        if self._shared is None:
+            return
+        self._shared.prune(time.time() - WINDOW_SECONDS)
+        self._shared_sessions = self._shared.sessions()
+
+    async def sweep_async(self) -> None:
+        """:meth:`sweep`, with shared counters touched off the event loop."""
+        await self._off_loop(self.sweep)
+
+    async def _off_loop(self, function: Callable[..., T], *args: Any) -> T:
+        """Call *function* in a worker thread if it touches shared counters.
+
+        In-memory counters are not thread-safe, and their calls never block,
+        so those stay on the loop.
+        """
+        if self._shared is None:
+            return function(*args)
+        return await asyncio.to_thread(function, *args)
+
+    def _bucket(self, ip: str, now: float) -> _IPBucket:
+        """Return *ip*'s bucket, marking it active at *now*."""
+        bucket = self._buckets.get(ip)
+        if bucket is None:
+            bucket = self._buckets[ip] = _IPBucket()
+            bucket.last_seen = now
+            self._file(ip, bucket)
+        else:
+            bucket.last_seen = now
+        return bucket
+
+    def _file(self, ip: str, bucket: _IPBucket) -> None:
+        bucket.due = int(bucket.last_seen + WINDOW_SECONDS) + 1
+        self._wheel[bucket.due % WHEEL_SLOTS].append(ip)
+
+    def _expire_idle_buckets(self, now: float) -> None:
         """Drop buckets for IPs with no activity inside the sliding window.
 
-        Runs at most once per 60 seconds so the sweep cost stays off the
-        per-message hot path. Without this, one bucket per distinct IP
-        accumulates forever (scanners probing the public endpoint grow the
-        map without bound).
+        Each bucket is filed once in a one-second timing wheel under the
+        second its window runs out, and activity only moves ``last_seen``.
+        Advancing the wheel visits the slots for the seconds that have
+        passed: a bucket found idle there is dropped, one that saw activity
+        since is filed again further on. Every bucket is looked at about
+        once a window however many IPs there are, rather than the whole map
+        being scanned on one unlucky request. Without this, one bucket per
+        distinct IP accumulates forever (scanners probing the public endpoint
+        grow the map without bound).
         """
-        if now - self._last_prune < 60:
+        target = int(now)
+        if target <= self._wheel_tick:
             return
-        self._last_prune = now
-        cutoff = now - 60
-        # Timestamps are only ever appended in monotonic order, so the most
-        # recent activity is the last element — no need to scan the full list.
-        idle = [
-            ip
-            for ip, bucket in self._buckets.items()
-            if not _has_recent(bucket.message_timestamps, cutoff)
-            and not _has_recent(bucket.connection_timestamps, cutoff)
-        ]
-        for ip in idle:
-            del self._buckets[ip]
+        # After a gap of a full turn every slot is due once.
+        first = max(self._wheel_tick + 1, target - WHEEL_SLOTS + 1)
+        self._wheel_tick = target
+        cutoff = now - WINDOW_SECONDS
+        for tick in range(first, target + 1):
+            index = tick % WHEEL_SLOTS
+            slot, self._wheel[index] = self._wheel[index], []
+            for ip in slot:
+                bucket = self._buckets.get(ip)
+                if bucket is None:
+                    continue
+                if bucket.due > tick:
+                    self._wheel[index].append(ip)
+                elif bucket.last_seen <= cutoff:
+                    del self._buckets[ip]
+                else:
+                    self._file(ip, bucket)
 
     @property
     def active_sessions(self) -> int:
+        """Sessions holding a slot. With shared counters, a read of the file."""
+        if self._shared is not None:
+            self._shared_sessions = self._shared.sessions()
+            return self._shared_sessions
+        return self._active_sessions
+
+    @property
+    def last_active_sessions(self) -> int:
+        """:attr:`active_sessions` as of the last call that read or moved it.
+
+        Exact in memory. With shared counters, other workers' changes show
+        from this worker's next admission, release or sweep. Never blocks.
+        """
+        if self._shared is not None:
+            return self._shared_sessions
         return self._active_sessions
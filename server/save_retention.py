@@ -0,0 +1,124 @@
+"""When each durable save directory was last saved to.
+
+Retention used to be decided by walking every client directory under
+``CABIN_SAVE_ROOT`` and stat-ing its files, on the event loop, once an hour:
+every socket stalled for the length of the walk, and the walk grew with every
+player who ever kept a save. This index keeps the answer instead. A durable
+session touches its directory's entry when it starts or resumes, and its
+``SaveManager`` on every save, so a prune asks for the directories untouched
+since the cutoff and looks at only those.
+
+A prune runs on its own thread while sessions keep starting, so deletion is
+claimed first: the entry is removed only if it is still older than the
+cutoff, and a directory whose entry a returning player has just touched is
+left alone.
+
+The index is a SQLite file in the save root, so every worker on the machine
+writes the same one. It starts empty for a root that predates it; the first
+prune seeds it with one walk of the tree, and never walks again.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from server.shared_state import SQLiteFile
+
+
+INDEX_FILENAME = "retention.sqlite3"
+
+_UPSERT = (
+    "INSERT INTO saves (name, touched_at) VALUES (?, ?)"
+    " ON CONFLICT (name) DO UPDATE"
+    " SET touched_at = MAX(touched_at, excluded.touched_at)"
+)
+
+
+class RetentionIndex(SQLiteFile):
+    """Last touch (wall clock) per client directory name."""
+
+    def _schema(self, connection: sqlite3.Connection) -> None:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS saves ("
+            " name TEXT PRIMARY KEY,"
+            " touched_at REAL NOT NULL)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS saves_touched_at ON saves (touched_at)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+        )
+
+    def touch(self, name: str, touched_at: float) -> None:
+        """Note use of *name*. An older time never replaces a newer one."""
+        with self._lock:
+            self._connect().execute(_UPSERT, (name, touched_at))
+
+    def seed(self, entries: Iterable[Tuple[str, float]]) -> None:
+        """Record every entry and mark the index complete for its root."""
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany(_UPSERT, list(entries))
+                connection.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('seeded', '1')"
+                )
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def seeded(self) -> bool:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT value FROM meta WHERE key = 'seeded'"
+            ).fetchone()
+        return row is not None
+
+    def touched_before(self, cutoff: float) -> List[str]:
+        """Directories untouched since *cutoff*, oldest first."""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT name FROM saves WHERE touched_at < ? ORDER BY touched_at",
+                (cutoff,),
+            ).fetchall()
+        return [name for (name,) in rows]
+
+    def claim(self, name: str, cutoff: float) -> bool:
+        """Remove *name*'s entry if it is still older than *cutoff*.
+
+        True means the caller may delete the directory: nothing touched it
+        between the query and now.
+        """
+        with self._lock:
+            cursor = self._connect().execute(
+                "DELETE FROM saves WHERE name = ? AND touched_at < ?", (name, cutoff)
+            )
+        return cursor.rowcount == 1
+
+    def forget(self, name: str) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM saves WHERE name = ?", (name,))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM saves").fetchone()[0]
+
+
+_indexes: Dict[Path, RetentionIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def retention_index(root: Path) -> RetentionIndex:
+    """The index for save root *root*, opened once per process."""
+    path = root / INDEX_FILENAME
+    with _indexes_lock:
+        index = _indexes.get(path)
+        if index is None:
+            index = _indexes[path] = RetentionIndex(path)
+        return index
@@ -0,0 +1,257 @@
+"""Group-commit writer for durable save slots.
+
+A durable session used to write its save inside the turn, on the event loop:
+every ``save`` cost the loop a file write and a rename, and many players
+saving at once meant many small writes contending for the one volume, none
+of them flushed. A durable session's ``SaveManager`` now hands the encoded
+slot to this writer instead and returns once it is queued.
+
+One thread drains the queue. Everything queued while the previous batch was
+being written forms the next batch, and each batch is committed in one pass:
+every temp file written, one sync for their contents, every rename, one sync
+for the renames. A slot saved twice before its batch starts is written once,
+with the later content. Each save gets a ``Future`` that resolves when its
+batch is durable, for a caller that wants to wait for that.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+
+logger = logging.getLogger("the-cabin")
+
+
+@dataclass
+class _Write:
+    path: Path
+    content: bytes
+    on_written: Optional[Callable[[], None]]
+    futures: List[Future] = field(default_factory=list)
+
+
+class SaveWriter:
+    """A queue of slot writes and the thread that commits them in batches."""
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        # Insertion-ordered, keyed by path, so a second write to a slot that
+        # is still queued replaces the first in place.
+        self._queue: Dict[Path, _Write] = {}
+        self._writing = False
+        self._thread: Optional[threading.Thread] = None
+        self._stats: Dict[str, Any] = {
+            "queued": 0,
+            "batches": 0,
+            "writes": 0,
+            "coalesced": 0,
+            "failed": 0,
+            "largest_batch": 0,
+            "last_batch": 0,
+            "last_batch_ms": None,
+        }
+
+    def submit(
+        self,
+        path: Path,
+        content: bytes,
+        on_written: Optional[Callable[[], None]] = None,
+    ) -> Future:
+        """Queue *content* for *path* and return when it is queued.
+
+        *on_written* runs on the writer thread once the slot is in place, in
+        submission order. The returned future resolves (to *path*) once the
+        batch holding the write is durable, or fails with its error.
+        """
+        future: Future = Future()
+        with self._condition:
+            pending = self._queue.pop(path, None)
+            if pending is not None:
+                # The queued content never reaches the disk; its callers are
+                # answered by this write instead.
+                self._stats["coalesced"] += 1
+                futures = pending.futures + [future]
+            else:
+                futures = [future]
+            self._queue[path] = _Write(path, content, on_written, futures)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="save-writer", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything queued so far is committed.
+
+        Returns False if *timeout* ran out first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._queue or self._writing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return {**self._stats, "queued": len(self._queue)}
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue:
+                    self._condition.wait()
+                batch = list(self._queue.values())
+                self._queue.clear()
+                self._writing = True
+            try:
+                self._commit(batch)
+            except Exception as error:
+                # Nothing may stop the thread: later saves would queue forever.
+                logger.exception("Save batch failed")
+                for write in batch:
+                    self._fail(write, error)
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+    def _commit(self, batch: List[_Write]) -> None:
+        started = time.perf_counter()
+        staged: List[tuple[_Write, Path]] = []
+        for write in batch:
+            temp = write.path.with_name(f".{write.path.name}.tmp")
+            try:
+                temp.write_bytes(write.content)
+            except OSError as error:
+                self._fail(write, error)
+                continue
+            staged.append((write, temp))
+
+        try:
+            _sync([temp for _, temp in staged])
+        except OSError as error:
+            for write, temp in staged:
+                temp.unlink(missing_ok=True)
+                self._fail(write, error)
+            return
+        written: List[_Write] = []
+        for write, temp in staged:
+            try:
+                os.replace(temp, write.path)
+            except OSError as error:
+                self._fail(write, error)
+                continue
+            written.append(write)
+        try:
+            _sync_dirs({write.path.parent for write in written})
+        except OSError as error:
+            for write in written:
+                self._fail(write, error)
+            return
+
+        for write in written:
+            if write.on_written is not None:
+                try:
+                    write.on_written()
+                except Exception:
+                    logger.exception("Save bookkeeping failed for %s", write.path)
+            for future in write.futures:
+                future.set_result(write.path)
+
+        with self._condition:
+            self._stats["batches"] += 1
+            self._stats["writes"] += len(written)
+            self._stats["last_batch"] = len(batch)
+            self._stats["largest_batch"] = max(self._stats["largest_batch"], len(batch))
+            self._stats["last_batch_ms"] = round(
+                (time.perf_counter() - started) * 1000, 3
+            )
+
+    def _fail(self, write: _Write, error: Exception) -> None:
+        logger.error("Failed to write save %s: %s", write.path, error)
+        with self._condition:
+            self._stats["failed"] += 1
+        for future in write.futures:
+            if not future.done():
+                future.set_exception(error)
+
+
+def _sync(paths: List[Path]) -> None:
+    """Make the contents of *paths* durable, with one sync where possible."""
+    if not paths:
+        return
+    if hasattr(os, "sync"):
+        os.sync()
+        return
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def _sync_dirs(directories: set[Path]) -> None:
+    """Make renames into *directories* durable."""
+    if not directories:
+        return
+    if hasattr(os, "sync"):
+        os.sync()
+        return
+    for directory in directories:
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.fsync(fd)
+        except OSError:
+            # Not every platform lets a directory be fsynced; the rename is
+            # still atomic, only its durability is left to the filesystem.
+            pass
+        finally:
+            os.close(fd)
+
+
+_writer: Optional[SaveWriter] = None
+_writer_lock = threading.Lock()
+
+
+def save_writer() -> SaveWriter:
+    """The process's save writer, created on first use."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = SaveWriter()
+        return _writer
+
+
+def flush_save_writer(timeout: Optional[float] = None) -> bool:
+    """Wait for queued saves, if anything was ever queued."""
+    with _writer_lock:
+        writer = _writer
+    return True if writer is None else writer.flush(timeout)
+
+
+def save_writer_stats() -> Dict[str, Any]:
+    with _writer_lock:
+        writer = _writer
+    if writer is None:
+        return SaveWriter().stats()
+    return writer.stats()
+
+
+def durable_ack_enabled() -> bool:
+    return os.getenv("CABIN_SAVE_DURABLE_ACK", "").lower() in ("1", "true", "yes")
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
-from typing import List, Optional
+from typing import Awaitable, Callable, List, Optional
 from uuid import uuid4
 
-from server.protocol import RenderFrame, SessionPhase
+from server.protocol import BatchFrame, RenderFrame, SessionPhase
 
 from game.player import Player
 from game.map import Map
@@ -27,9 +28,15 @@ from game.death import death_line_for
 from game.ending import ending_line_for, ending_reached
 from game.input.handler import InputHandler, InputType
 from game.intro import INTRO_LINES
+from game.ai.prefetch import schedule_warm_up
 from game.ai_context import build_ai_context
 from game import save_commands
-from game.turn import apply_effects, handle_action_events, take_turn
+from game.turn import (
+    apply_effects,
+    handle_action_events,
+    take_turn,
+    take_turn_async,
+)
 from game.persistence import SaveManager
 
 
@@ -112,6 +119,27 @@ def _without_dismiss_cue(lines: List[str]) -> List[str]:
     return kept
 
 
+# Input a server answers without waiting for a turn slot: quitting, the
+# screens and save listing. Saving, loading and deleting write to disk, so
+# they queue like any other turn.
+_LOCAL_INPUT_TYPES = frozenset({
+    InputType.QUIT,
+    InputType.QUEST_SCREEN,
+    InputType.MAP_SCREEN,
+    InputType.LIST_SAVES,
+})
+
+# Save commands that read the save directory, so wait for a queued write.
+_SAVE_READ_TYPES = frozenset({
+    InputType.LOAD,
+    InputType.LIST_SAVES,
+    InputType.DELETE_SAVE,
+})
+
+# Save commands touch the disk, so the awaitable path runs them in a thread.
+_SAVE_TYPES = _SAVE_READ_TYPES | {InputType.SAVE}
+
+
 class WebGameSession:
     """A single web game session.
 
@@ -207,6 +235,89 @@ class WebGameSession:
         In INTRO_KEYPRESS / OVERLAY_KEYPRESS phases, ``text`` is ignored
         (any input counts as a keypress acknowledgment).
         """
+        frame = self._handle_keypress_phase()
+        if frame is not None:
+            return frame
+
+        # --- AWAITING_INPUT ---
+        self._consumed_feedback = ""
+        frame = self._process_game_input(text)
+        return self._settle_turn(frame)
+
+    def needs_interpreter(self, text: str) -> bool:
+        """Whether ``handle_input(text)`` should queue for a turn slot now.
+
+        False for keypress acknowledgments, blank input, quitting, screens and
+        save listing: local transitions a server can answer without queueing
+        the turn behind ones waiting on the model. Reads state, changes none.
+        Save, load and delete are True: they never reach the model, but they
+        write to disk and take a turn slot like a turn that does.
+        """
+        if self.phase != SessionPhase.AWAITING_INPUT or not text.strip():
+            return False
+        return self.input_handler.parse(text).input_type not in _LOCAL_INPUT_TYPES
+
+    async def handle_input_async(
+        self,
+        text: str,
+        *,
+        on_narration: Optional[Callable[[Optional[str]], Awaitable[None]]] = None,
+    ) -> RenderFrame:
+        """Awaitable ``handle_input`` for a server running an event loop.
+
+        Identical state machine and frames; the only difference is that a turn
+        reaching the interpreter awaits the model instead of blocking a thread
+        on it. Save commands run in a worker thread, since they read and write
+        the save directory; everything else a turn does is short local work
+        and runs inline.
+
+        ``on_narration`` is awaited with the model's reply text as it streams,
+        for a surface that shows it before the turn's frame is ready, and with
+        None when a retry takes back what was streamed. If it raises, the
+        turn is abandoned with its error and the game is left as it was. The
+        returned frame is still the whole, validated turn.
+        """
+        frame = self._handle_keypress_phase()
+        if frame is None:
+            input_type = self.input_handler.parse(text).input_type
+            if input_type in _SAVE_READ_TYPES:
+                # The read would otherwise wait for this session's queued
+                # save on the loop itself.
+                await self.save_manager.settle()
+            self._consumed_feedback = ""
+            if input_type in _SAVE_TYPES:
+                frame = await asyncio.to_thread(self._process_command, text)
+            else:
+                frame = self._process_command(text)
+            if frame is None:
+                streaming = {} if on_narration is None else {"on_narration": on_narration}
+                await take_turn_async(text, **self._turn_components(), **streaming)
+                frame = self._frame_after_turn()
+            frame = self._settle_turn(frame)
+
+        if self.phase == SessionPhase.OVERLAY_KEYPRESS:
+            # The player is reading; spend the pause warming the model path
+            # for their next command (opt-in, see game.ai.prefetch).
+            schedule_warm_up()
+        return frame
+
+    def batch_overlays(self, frame: RenderFrame) -> RenderFrame | BatchFrame:
+        """Acknowledge every overlay still owed a keypress, all at once.
+
+        *frame* is what the turn returned. If it is an overlay, the result
+        carries it and each frame the following keypresses would have
+        returned, up to the room, and the session is left awaiting input.
+        Any other frame is returned as is.
+        """
+        if self.phase != SessionPhase.OVERLAY_KEYPRESS:
+            return frame
+        frames = [frame]
+        while self.phase == SessionPhase.OVERLAY_KEYPRESS:
+            frames.append(self._handle_keypress_phase())
+        return BatchFrame(frames)
+
+    def _handle_keypress_phase(self) -> Optional[RenderFrame]:
+        """Answer input outside AWAITING_INPUT, or None to run a real turn."""
         if self.phase == SessionPhase.ENDED:
             return RenderFrame(lines=["The cold has had its turn."], game_over=True)
 
@@ -223,10 +334,10 @@ class WebGameSession:
             self.phase = SessionPhase.AWAITING_INPUT
             return self._render_room()
 
-        # --- AWAITING_INPUT ---
-        self._consumed_feedback = ""
-        frame = self._process_game_input(text)
+        return None
 
+    def _settle_turn(self, frame: RenderFrame) -> RenderFrame:
+        """Reconcile a turn's frame with any overlays the turn queued."""
         # A closed run stays closed. An overlay queued in the same turn as a
         # death or an ending must not reopen the session behind the last word —
         # but it must not be thrown away either. The terminal prints cutscenes
@@ -271,6 +382,20 @@ class WebGameSession:
 
     def _process_game_input(self, text: str) -> RenderFrame:
         """Run one turn of the game loop for a text command."""
+        frame = self._process_command(text)
+        if frame is not None:
+            return frame
+
+        # --- Game action: shared turn core, one implementation for both surfaces
+        take_turn(text, **self._turn_components())
+        return self._frame_after_turn()
+
+    def _process_command(self, text: str) -> Optional[RenderFrame]:
+        """Answer input that is not a game action, or None if it is one.
+
+        Blank input, quitting, screens and save commands never reach the
+        interpreter, so the blocking and awaitable paths share this whole.
+        """
         # A blank command is not a turn. Keypress acknowledgments that race
         # in after an overlay has already been dismissed land here as empty
         # text; running them would send empty input to the interpreter and
@@ -349,17 +474,21 @@ class WebGameSession:
             self._delete_save(parsed.slot_name or "autosave")
             return self._render_room()
 
-        # --- Game action: shared turn core, one implementation for both surfaces
-        take_turn(
-            text,
-            player=self.player,
-            game_map=self.map,
-            quest_manager=self.quest_manager,
-            action_registry=self.action_registry,
-            event_bus=self.event_bus,
-            set_feedback=self._set_feedback,
-        )
-
+        return None
+
+    def _turn_components(self) -> dict:
+        """Keyword arguments handing this session's state to the turn core."""
+        return {
+            "player": self.player,
+            "game_map": self.map,
+            "quest_manager": self.quest_manager,
+            "action_registry": self.action_registry,
+            "event_bus": self.event_bus,
+            "set_feedback": self._set_feedback,
+        }
+
+    def _frame_after_turn(self) -> RenderFrame:
+        """Build the frame that follows a game action."""
         # Check if player died — shared precedence and lines with the terminal.
         # Death is checked first so a turn that lands both ends as a death.
         death_frame = self._death_frame_if_dead()
@@ -484,7 +613,7 @@ class WebGameSession:
 
         if room_changed:
             self._last_room_id = room.id
-            description = room.get_description(self.player, self.map.world_state)
+            description = self.map.describe_room(room, self.player)
             lines.append(room.name)
             lines.append("-" * len(room.name))
             lines.append(description)
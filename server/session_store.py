@@ -11,23 +11,78 @@ idle past a grace period (or the game ends). Save directories follow the same
 rule: throwaway dirs are cleaned at expiry rather than at disconnect, and a
 client that supplies a stable identity gets a durable dir that outlives the
 session entirely.
+
+Most of a session's idle life is a locked phone. A session idle past a much
+shorter threshold is hibernated: its state is written to the save volume in
+the local engine's checkpoint shape and dropped from memory, leaving only a
+small record behind. The next request with its token rehydrates it in place,
+so the client never notices, and memory is spent only on sessions in play.
+
+A deploy restarts the process, so on shutdown the store is drained: every
+session, hibernated or not, and every terminal replay goes to the save volume
+in one file, and the next process restores them as hibernated records. The
+file opens with an index of small records and byte offsets, which is all a
+startup reads; a session's state is parsed only when its token comes back.
+Records are keyed by a hash of the token, so no bearer secret is written.
+
+Given a ``SessionBackend`` (``CABIN_SHARED_STATE_PATH``), the store is one
+worker's view of sessions every worker can serve: each turn's state is written
+through to the backend, sessions in memory are a cache checked against the
+backend's version, and a lease there serialises turns across workers. See
+``server.shared_state``.
+
+Backend calls block: SQLite waits up to its busy timeout for another worker's
+write. So does the file work of hibernating, rehydrating and releasing a
+session, on a save volume that may be a network disk. Operations that make
+such calls are written once, as generators that yield each call (``Steps``),
+and driven two ways: the plain methods make every call inline, and their
+``*_async`` twins, which the server awaits, make it in a worker thread. Store state is only read and changed between calls, on the
+caller's side, so the store stays single-threaded.
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
 import hashlib
+import heapq
 import logging
 import os
 import re
 import secrets
 import shutil
+import sqlite3
+import json
 import time
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional
-
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from uuid import uuid4
+
+from server.frame_diff import FrameDiffer
+from server.local_engine import (
+    SNAPSHOT_VERSION,
+    InvalidSnapshot,
+    restore_session,
+    session_snapshot,
+)
+from server.save_retention import retention_index
+from server.save_writer import save_writer
 from server.session import WebGameSession
+from server.shared_state import SessionBackend, SessionRow, SharedReplay
 
 logger = logging.getLogger("the-cabin")
 
@@ -38,11 +93,75 @@ CLIENT_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{16,128}$")
 
 DEFAULT_SAVE_RETENTION_DAYS = 30
 
+DRAIN_VERSION = 1
+
+# A shared-backend turn lease outlives any turn: a turn is one model call,
+# bounded by the model timeout. It only matters when its holder died.
+TURN_LEASE_SECONDS = 120.0
+# Waiting for another worker's lease polls the backend, backing off from the
+# first interval to the last: a short turn is picked up quickly, a long one
+# costs a handful of queries rather than one every few milliseconds.
+TURN_LEASE_POLL_SECONDS = 0.01
+TURN_LEASE_POLL_MAX_SECONDS = 0.25
+# A shared sweep matches expired rows (wall clock) with resident copies idle
+# by the monotonic clock; this much earlier a cutoff keeps the two readings'
+# drift from hiding a copy whose row has expired.
+SHARED_SWEEP_SLACK_SECONDS = 1.0
+
+# Idle seconds before a session's state moves from memory to disk. Short
+# enough that a backgrounded app gives up its memory within minutes, long
+# enough that a player reading the screen is not paying a disk round trip
+# every turn.
+DEFAULT_HIBERNATE_AFTER_SECONDS = 300
+
+
+T = TypeVar("T")
+
+# A blocking call an operation needs made: the function and its arguments.
+Blocking = Tuple[Callable[..., Any], Tuple[Any, ...]]
+Steps = Generator[Blocking, Any, T]
+
+
+def _call(function: Callable[..., Any], *args: Any) -> Blocking:
+    return function, args
+
+
+def _run(steps: Steps[T]) -> T:
+    """Drive *steps*, making each blocking call inline."""
+    result: Any = None
+    error: Optional[Exception] = None
+    while True:
+        try:
+            function, args = steps.throw(error) if error else steps.send(result)
+        except StopIteration as done:
+            return done.value
+        result, error = None, None
+        try:
+            result = function(*args)
+        except Exception as raised:
+            error = raised
+
+
+async def _run_async(steps: Steps[T]) -> T:
+    """Drive *steps*, making each blocking call in a worker thread."""
+    result: Any = None
+    error: Optional[Exception] = None
+    while True:
+        try:
+            function, args = steps.throw(error) if error else steps.send(result)
+        except StopIteration as done:
+            return done.value
+        result, error = None, None
+        try:
+            result = await asyncio.to_thread(function, *args)
+        except Exception as raised:
+            error = raised
+
 
 class IdentityBusy(Exception):
     """Raised when an identity's live session is midway through a turn.
 
-    Retiring a session while its executor is still running would leave two
+    Retiring a session while its turn is still running would leave two
     writers on one save directory. Refusing is the safe answer: the turn is a
     single model call, so the client can simply try again.
     """
@@ -69,6 +188,31 @@ def _retention_seconds() -> float:
     return max(0, days) * 86400.0
 
 
+def hibernate_after_seconds() -> float:
+    """Idle seconds before a session is hibernated; 0 disables hibernation."""
+    raw = os.getenv("CABIN_SESSION_HIBERNATE_SECONDS")
+    seconds = DEFAULT_HIBERNATE_AFTER_SECONDS
+    if raw:
+        try:
+            seconds = int(raw)
+        except ValueError:
+            logger.warning("Ignoring non-integer CABIN_SESSION_HIBERNATE_SECONDS: %r", raw)
+    return float(max(0, seconds))
+
+
+def _hibernation_dir() -> Path:
+    return _save_root() / "hibernated"
+
+
+def _drain_path() -> Path:
+    return _save_root() / "drain.ndjson"
+
+
+def _token_key(token: str) -> str:
+    """Hash a session token for anything kept on disk or keyed beside it."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
 def _identity_of(client_id: str) -> str:
     """Hash a client identity into an opaque, filesystem-safe key.
 
@@ -109,6 +253,11 @@ class StoredSession:
     last_turn_type: Optional[str] = None
     last_turn_text: Optional[str] = None
     last_turn_frame: Optional[Dict[str, Any]] = None
+    # Frames recently sent in diff mode. Not part of any snapshot: a copy
+    # rebuilt elsewhere starts empty, and its first frame is whole.
+    frames: FrameDiffer = field(default_factory=FrameDiffer)
+    # The shared backend's version of the state this copy holds.
+    version: int = 0
 
     @property
     def durable(self) -> bool:
@@ -119,6 +268,42 @@ class StoredSession:
         self.last_activity = time.monotonic() if now is None else now
 
 
+@dataclass(frozen=True)
+class HibernatedSession:
+    """What stays in memory of a session whose state is on disk.
+
+    Enough to expire it, to keep its save directory from being pruned, and to
+    retire it when its identity starts another run, without reading the file.
+    A record restored from a drain has its state at *offset* in the shared
+    drain file rather than in a file of its own.
+    """
+
+    key: str
+    ip: str
+    identity: Optional[str]
+    save_dir: Optional[Path]
+    last_activity: float
+    path: Path
+    offset: Optional[int] = None
+    length: Optional[int] = None
+
+    @property
+    def in_drain_file(self) -> bool:
+        return self.offset is not None
+
+    def read(self) -> Dict[str, Any]:
+        if self.offset is None:
+            data = self.path.read_bytes()
+        else:
+            with self.path.open("rb") as stream:
+                stream.seek(self.offset)
+                data = stream.read(self.length or 0)
+        record = json.loads(data)
+        if not isinstance(record, dict):
+            raise InvalidSnapshot("hibernated session is malformed")
+        return record
+
+
 @dataclass(frozen=True)
 class TerminalReplay:
     """The last idempotent game-over frame after its session is released."""
@@ -130,24 +315,59 @@ class TerminalReplay:
     expires_at: float
 
 
+# What a slot callback is handed: the session, or with a shared backend, the
+# row of one another worker was holding. Either has the ``ip``.
+SessionRef = Union[StoredSession, SessionRow]
+
+
 class SessionStore:
     """In-memory session registry with idle expiry.
 
     Not thread-safe by design: every caller is a coroutine on the same event
-    loop, and the only blocking work (a game turn) happens in an executor while
-    holding the per-session lock.
+    loop, and a game turn is awaited while holding the per-session lock.
+
+    Nothing here scans every session on the request path. Identities map to
+    their token, and resident sessions, hibernated records and terminal
+    replays each sit in a min-heap by the time they go idle or expire, so a
+    sweep pops only what is due. The heaps are lazy: activity moves
+    ``last_activity`` forward without touching the heap, and an entry found
+    out of date when it reaches the top is filed again under the new time.
+    Moving it backwards needs :meth:`touch` with an explicit time.
     """
 
     def __init__(
         self,
         *,
         idle_timeout: float,
-        on_release: Optional[Callable[[StoredSession], None]] = None,
+        hibernate_after: float = 0.0,
+        backend: Optional[SessionBackend] = None,
+        on_release: Optional[Callable[[SessionRef], None]] = None,
+        on_hibernate: Optional[Callable[[SessionRef], None]] = None,
+        on_rehydrate: Optional[Callable[[SessionRef], None]] = None,
     ) -> None:
         self.idle_timeout = idle_timeout
+        self.hibernate_after = hibernate_after
+        self._backend = backend
+        # Names this worker in the backend's owner and lease columns.
+        self._owner = uuid4().hex
         self._on_release = on_release
+        self._on_hibernate = on_hibernate
+        self._on_rehydrate = on_rehydrate
         self._sessions: Dict[str, StoredSession] = {}
+        # Both keyed by token hash: a drain writes them, and restores them,
+        # without the tokens.
+        self._hibernated: Dict[str, HibernatedSession] = {}
         self._terminal_replays: Dict[str, TerminalReplay] = {}
+        # identity -> token, and identity -> token hash once hibernated.
+        self._identities: Dict[str, str] = {}
+        self._hibernated_identities: Dict[str, str] = {}
+        # (last activity, token), with the time each token was last filed at.
+        self._idle: List[Tuple[float, str]] = []
+        self._filed: Dict[str, float] = {}
+        self._hibernated_idle: List[Tuple[float, str]] = []
+        self._replay_expiry: List[Tuple[float, str]] = []
+        # The backend's hibernated count as of the last sweep or count.
+        self._shared_hibernated = 0
 
     # -- Lifecycle ------------------------------------------------------------
 
@@ -169,7 +389,7 @@ class SessionStore:
         same save files at once.
 
         Raises ``IdentityBusy`` if the identity's existing session is midway
-        through a turn. Retiring it there would leave its executor writing the
+        through a turn. Retiring it there would leave that turn writing the
         save directory the new session is about to claim, which is the very
         corruption exclusivity exists to prevent. The caller narrates the
         refusal and the client retries once the turn lands.
@@ -178,24 +398,51 @@ class SessionStore:
         a filesystem path, so the check belongs here rather than resting on
         every call site remembering to make it.
         """
+        return _run(self._create(ip, client_id, session))
+
+    async def create_async(
+        self,
+        *,
+        ip: str,
+        client_id: Optional[str] = None,
+        session: Optional[WebGameSession] = None,
+    ) -> StoredSession:
+        """:meth:`create`, with its backend calls made off the event loop."""
+        return await _run_async(self._create(ip, client_id, session))
+
+    def _create(
+        self,
+        ip: str,
+        client_id: Optional[str],
+        session: Optional[WebGameSession],
+    ) -> Steps[StoredSession]:
         if client_id is not None and not is_valid_client_id(client_id):
             raise ValueError("malformed client_id")
 
         identity = _identity_of(client_id) if client_id is not None else None
         superseded: List[str] = []
+        superseded_rows: List[SessionRow] = []
         if identity is not None:
-            superseded = [
-                t for t, s in self._sessions.items() if s.identity == identity
-            ]
+            if identity in self._identities:
+                superseded.append(self._identities[identity])
+            if self._backend is not None:
+                superseded_rows = yield _call(self._backend.by_identity, identity)
             # Check before building anything, so a refusal costs nothing.
-            if any(self._sessions[t].in_flight for t in superseded):
+            if any(self._sessions[t].in_flight for t in superseded) or any(
+                row.leased(time.time()) for row in superseded_rows
+            ):
                 raise IdentityBusy(identity)
 
         game = session if session is not None else WebGameSession()
         if identity is not None:
-            game.save_manager.save_dir = _client_dir(identity)
+            _use_save_dir(game, _client_dir(identity))
+            yield from _claim_save_dir(_client_dir(identity))
             for token in superseded:
-                self.release(token)
+                yield from self._release(token, False)
+            if identity in self._hibernated_identities:
+                yield from self._drop_hibernated(self._hibernated_identities[identity])
+            for row in superseded_rows:
+                yield from self._release_row(row.key)
 
         stored = StoredSession(
             token=secrets.token_urlsafe(32),
@@ -204,28 +451,77 @@ class SessionStore:
             identity=identity,
             last_activity=time.monotonic(),
         )
-        self._sessions[stored.token] = stored
+        if self._backend is not None:
+            stored.version = yield _call(
+                functools.partial(
+                    self._backend.insert,
+                    _token_key(stored.token),
+                    ip=ip,
+                    identity=identity,
+                    save_dir=_save_dir_of(game),
+                    record=_hibernation_record(stored),
+                    last_activity=time.time(),
+                    owner=self._owner,
+                )
+            )
+        self._add(stored)
         return stored
 
     def get(self, token: str) -> Optional[StoredSession]:
         """Return the live session for *token*, or None if unknown or expired.
 
         Expiry is checked here rather than only in the sweep so a token cannot
-        be revived by arriving between sweeps.
+        be revived by arriving between sweeps. A hibernated session is read
+        back from disk and returned under the same token.
         """
+        return _run(self._get(token))
+
+    async def get_async(self, token: str) -> Optional[StoredSession]:
+        """:meth:`get`, with its backend calls made off the event loop."""
+        return await _run_async(self._get(token))
+
+    def _get(self, token: str) -> Steps[Optional[StoredSession]]:
+        if self._backend is not None:
+            return (yield from self._get_shared(token))
         stored = self._sessions.get(token)
         if stored is None:
-            return None
+            hibernated = self._hibernated.get(_token_key(token))
+            if hibernated is None:
+                return None
+            if time.monotonic() - hibernated.last_activity > self.idle_timeout:
+                yield from self._drop_hibernated(hibernated.key)
+                return None
+            return (yield from self._rehydrate(token, hibernated))
         if self._is_expired(stored, time.monotonic()):
-            self.release(token)
+            yield from self._release(token, False)
             return None
         return stored
 
     def release(
         self, token: str, *, preserve_terminal_replay: bool = False
     ) -> Optional[StoredSession]:
-        """Drop a session, cleaning up its throwaway save dir if it had one."""
-        stored = self._sessions.pop(token, None)
+        """Drop a session, cleaning up its throwaway save dir if it had one.
+
+        A hibernated session is dropped with its file. It gave its slot back
+        when it left memory, so ``on_release`` is not called for it, and it is
+        not returned.
+        """
+        return _run(self._release(token, preserve_terminal_replay))
+
+    async def release_async(
+        self, token: str, *, preserve_terminal_replay: bool = False
+    ) -> Optional[StoredSession]:
+        """:meth:`release`, with its backend calls made off the event loop."""
+        return await _run_async(self._release(token, preserve_terminal_replay))
+
+    def _release(
+        self, token: str, preserve_terminal_replay: bool
+    ) -> Steps[Optional[StoredSession]]:
+        if self._backend is not None:
+            return (yield from self._release_shared(token, preserve_terminal_replay))
+        if (yield from self._drop_hibernated(_token_key(token))):
+            return None
+        stored = self._pop(token)
         if stored is None:
             return None
         if (
@@ -235,68 +531,746 @@ class SessionStore:
             and stored.last_turn_text is not None
             and stored.last_turn_frame is not None
         ):
-            self._terminal_replays[token] = TerminalReplay(
-                turn_id=stored.last_turn_id,
-                turn_type=stored.last_turn_type,
-                text=stored.last_turn_text,
-                frame=stored.last_turn_frame,
-                expires_at=time.monotonic() + max(0, self.idle_timeout),
+            self._put_replay(
+                _token_key(token),
+                TerminalReplay(
+                    turn_id=stored.last_turn_id,
+                    turn_type=stored.last_turn_type,
+                    text=stored.last_turn_text,
+                    frame=stored.last_turn_frame,
+                    expires_at=time.monotonic() + max(0, self.idle_timeout),
+                ),
             )
         if not stored.durable:
-            _remove_dir(_save_dir_of(stored.session))
-        if self._on_release is not None:
-            self._on_release(stored)
+            yield _call(_remove_dir, _save_dir_of(stored.session))
+        yield from self._notify(self._on_release, stored)
         return stored
 
     def sweep(self) -> List[StoredSession]:
         """Release every session idle past the timeout. Returns the released."""
+        return _run(self._sweep())
+
+    async def sweep_async(self) -> List[StoredSession]:
+        """:meth:`sweep`, with its backend calls made off the event loop."""
+        return await _run_async(self._sweep())
+
+    def _sweep(self) -> Steps[List[StoredSession]]:
+        if self._backend is not None:
+            return (yield from self._sweep_shared())
         now = time.monotonic()
-        expired = [
-            token
-            for token, stored in self._sessions.items()
-            if self._is_expired(stored, now)
-        ]
-        released = [self.release(token) for token in expired]
-        self._prune_terminal_replays(time.monotonic())
-        return [s for s in released if s is not None]
+        cutoff = now - self.idle_timeout
+        released: List[StoredSession] = []
+        for stored in self._idle_since(cutoff):
+            if self._is_expired(stored, now):
+                if (yield from self._release(stored.token, False)) is not None:
+                    released.append(stored)
+            else:
+                # Mid-turn. Filed under its old time, so the next sweep looks
+                # again.
+                self._file(stored)
+        while self._hibernated_idle and self._hibernated_idle[0][0] < cutoff:
+            last_activity, key = heapq.heappop(self._hibernated_idle)
+            hibernated = self._hibernated.get(key)
+            if hibernated is not None and hibernated.last_activity == last_activity:
+                yield from self._drop_hibernated(key)
+        self._prune_terminal_replays(now)
+        return released
+
+    # -- Turns ----------------------------------------------------------------
+
+    def touch(self, stored: StoredSession, now: Optional[float] = None) -> None:
+        """Record activity on *stored*, where every worker can see it.
+
+        *now* is a ``time.monotonic()`` reading, defaulting to the present.
+        An earlier one than the session's last activity files it again, so
+        the idle heap sees it go quiet sooner.
+        """
+        _run(self._touch(stored, now))
+
+    async def touch_async(self, stored: StoredSession, now: Optional[float] = None) -> None:
+        """:meth:`touch`, with its backend call made off the event loop."""
+        await _run_async(self._touch(stored, now))
+
+    def _touch(self, stored: StoredSession, now: Optional[float]) -> Steps[None]:
+        previous = stored.last_activity
+        stored.touch(now)
+        if stored.last_activity < previous and stored.token in self._sessions:
+            self._file(stored)
+        if self._backend is not None:
+            wall = time.time() - (time.monotonic() - stored.last_activity)
+            yield _call(self._backend.touch, _token_key(stored.token), wall)
+
+    @asynccontextmanager
+    async def turn_lock(self, stored: StoredSession) -> AsyncIterator[None]:
+        """Hold *stored* for one turn.
+
+        In memory that is the session's lock. With a shared backend it is also
+        the backend's lease on the token, polled for with backoff while
+        another worker holds it; every backend call is made in a worker
+        thread. A session deleted meanwhile stops the wait; the caller's own
+        lookup then finds it gone.
+        """
+        async with stored.lock:
+            if self._backend is None:
+                yield
+                return
+            key = _token_key(stored.token)
+            pause = TURN_LEASE_POLL_SECONDS
+            while True:
+                taken = await asyncio.to_thread(
+                    self._backend.acquire_lease,
+                    key,
+                    self._owner,
+                    time.time(),
+                    TURN_LEASE_SECONDS,
+                )
+                if taken is not False:
+                    break
+                await asyncio.sleep(pause)
+                pause = min(pause * 2, TURN_LEASE_POLL_MAX_SECONDS)
+            try:
+                yield
+            finally:
+                if taken:
+                    await asyncio.to_thread(
+                        self._backend.release_lease, key, self._owner
+                    )
+
+    def commit(self, stored: StoredSession) -> None:
+        """Write a finished turn through to the shared backend, if there is one."""
+        _run(self._commit(stored))
+
+    async def commit_async(self, stored: StoredSession) -> None:
+        """:meth:`commit`, with its backend call made off the event loop."""
+        await _run_async(self._commit(stored))
+
+    def _commit(self, stored: StoredSession) -> Steps[None]:
+        if self._backend is None:
+            return
+        stored.version = yield _call(
+            self._backend.commit,
+            _token_key(stored.token),
+            _hibernation_record(stored),
+            time.time(),
+        )
+
+    # -- Shared backend ---------------------------------------------------------
+
+    def _get_shared(self, token: str) -> Steps[Optional[StoredSession]]:
+        assert self._backend is not None
+        key = _token_key(token)
+        row = yield _call(self._backend.row, key)
+        stored = self._sessions.get(token)
+        if row is None:
+            # Released by another worker, which settled its slot.
+            self._pop(token)
+            return None
+        now = time.time()
+        if (
+            (stored is None or not stored.in_flight)
+            and not row.leased(now)
+            and now - row.last_activity > self.idle_timeout
+        ):
+            yield from self._release_shared(token, False)
+            return None
+        if stored is not None and stored.version == row.version:
+            if row.owner != self._owner or not row.resident:
+                yield from self._claim(stored)
+            return stored
+
+        loaded = yield _call(self._backend.record, key)
+        try:
+            if loaded is None:
+                raise InvalidSnapshot("shared session vanished")
+            version, record = loaded
+            game, last_turn = _session_from_record(record, row.save_dir)
+            yield from _claim_save_dir(row.save_dir)
+        except (ValueError, InvalidSnapshot):
+            logger.warning("Failed to load a shared session", exc_info=True)
+            yield from self._release_shared(token, False)
+            return None
+        # Another lookup may have loaded the session while this one waited on
+        # the backend; keep whichever copy is newer.
+        stored = self._sessions.get(token)
+        if stored is not None and stored.version >= version:
+            return stored
+        if stored is None:
+            stored = StoredSession(
+                token=token,
+                session=game,
+                ip=row.ip,
+                identity=row.identity,
+                last_activity=time.monotonic() - max(0.0, now - row.last_activity),
+            )
+            self._add(stored)
+        else:
+            # Another worker played a turn since this copy was made. Refresh it
+            # in place: a request on this worker may already be holding it.
+            stored.session = game
+        stored.last_turn_id = last_turn.get("turn_id")
+        stored.last_turn_type = last_turn.get("turn_type")
+        stored.last_turn_text = last_turn.get("text")
+        stored.last_turn_frame = last_turn.get("frame")
+        stored.version = version
+        yield from self._claim(stored)
+        return stored
+
+    def _claim(self, stored: StoredSession) -> Steps[None]:
+        assert self._backend is not None
+        if (yield _call(self._backend.claim, _token_key(stored.token), self._owner)):
+            yield from self._notify(self._on_rehydrate, stored)
+
+    def _release_shared(
+        self, token: str, preserve_terminal_replay: bool
+    ) -> Steps[Optional[StoredSession]]:
+        assert self._backend is not None
+        stored = self._pop(token)
+        if (
+            preserve_terminal_replay
+            and stored is not None
+            and stored.last_turn_id is not None
+            and stored.last_turn_type is not None
+            and stored.last_turn_text is not None
+            and stored.last_turn_frame is not None
+        ):
+            yield _call(
+                self._backend.put_replay,
+                _token_key(token),
+                SharedReplay(
+                    turn_id=stored.last_turn_id,
+                    turn_type=stored.last_turn_type,
+                    text=stored.last_turn_text,
+                    frame=stored.last_turn_frame,
+                    expires_at=time.time() + max(0, self.idle_timeout),
+                ),
+            )
+        if (yield from self._release_row(_token_key(token), stored)) is None:
+            return None
+        return stored
+
+    def _release_row(
+        self, key: str, stored: Optional[StoredSession] = None
+    ) -> Steps[Optional[SessionRow]]:
+        """Delete a shared session. Only the worker whose delete lands settles it."""
+        assert self._backend is not None
+        row = yield _call(self._backend.delete, key)
+        if row is None:
+            return None
+        if row.identity is None:
+            yield _call(_remove_dir, row.save_dir)
+        if row.resident:
+            yield from self._notify(self._on_release, stored if stored is not None else row)
+        return row
+
+    def _sweep_shared(self) -> Steps[List[StoredSession]]:
+        assert self._backend is not None
+        now = time.time()
+        released: List[StoredSession] = []
+        expired = yield _call(self._backend.expired, now - self.idle_timeout, now)
+        # An expired row's resident copy went quiet here too, so it is in the
+        # idle heap's due prefix; the slack covers the two clocks' readings.
+        idle = {
+            _token_key(stored.token): stored
+            for stored in self._idle_since(
+                time.monotonic() - self.idle_timeout + SHARED_SWEEP_SLACK_SECONDS
+            )
+        }
+        for row in expired:
+            stored = idle.pop(row.key, None)
+            if stored is not None and stored.in_flight:
+                idle[row.key] = stored
+                continue
+            if stored is not None:
+                self._pop(stored.token)
+            if (
+                (yield from self._release_row(row.key, stored)) is not None
+                and stored is not None
+            ):
+                released.append(stored)
+        # Mid-turn, or kept busy by another worker: filed again, so the next
+        # sweep looks again.
+        for stored in idle.values():
+            if self._sessions.get(stored.token) is stored:
+                self._file(stored)
+        yield _call(self._backend.prune_replays, now)
+        yield from self._hibernated_count()
+        return released
+
+    # -- Hibernation ----------------------------------------------------------
+
+    def hibernate_idle(self) -> List[StoredSession]:
+        """Hibernate every session idle past ``hibernate_after``.
+
+        Returns the sessions moved to disk. A ``hibernate_after`` of 0 keeps
+        everything resident.
+        """
+        return _run(self._hibernate_idle())
+
+    async def hibernate_idle_async(self) -> List[StoredSession]:
+        """:meth:`hibernate_idle`, with its writes made off the event loop."""
+        return await _run_async(self._hibernate_idle())
+
+    def _hibernate_idle(self) -> Steps[List[StoredSession]]:
+        if self.hibernate_after <= 0:
+            return []
+        now = time.monotonic()
+        hibernated: List[StoredSession] = []
+        for stored in self._idle_since(now - self.hibernate_after):
+            if (
+                stored.in_flight == 0
+                and not stored.lock.locked()
+                and now - stored.last_activity > self.hibernate_after
+                and not self._is_expired(stored, now)
+                and (yield from self._hibernate(stored.token))
+            ):
+                hibernated.append(stored)
+            elif stored.token in self._sessions:
+                self._file(stored)
+        return hibernated
+
+    def hibernate(self, token: str) -> bool:
+        """Write a resident session to disk and drop it from memory.
+
+        Returns False, leaving the session resident, if it is mid-turn or the
+        write fails; a full disk costs memory, never a run.
+        """
+        return _run(self._hibernate(token))
+
+    def _hibernate(self, token: str) -> Steps[bool]:
+        stored = self._sessions.get(token)
+        if stored is None or stored.in_flight or stored.lock.locked():
+            return False
+        if self._backend is not None:
+            # The state is already in the backend, written at the last turn.
+            # Drop the copy either way: if another worker holds the session
+            # now, this one is stale.
+            self._pop(token)
+            if (yield _call(self._backend.hibernate, _token_key(token), self._owner)):
+                yield from self._notify(self._on_hibernate, stored)
+                return True
+            return False
+        key = _token_key(token)
+        # A file of its own each time: the rehydration that removes the last
+        # one may still be in flight when the session goes quiet again.
+        path = _hibernation_dir() / f"{key}-{secrets.token_hex(4)}.json"
+        last_activity = stored.last_activity
+        try:
+            record = _hibernation_record(stored)
+            yield _call(_write_atomically, path, record)
+        except (OSError, TypeError, ValueError):
+            logger.warning("Failed to hibernate session; keeping it resident", exc_info=True)
+            return False
+        if (
+            self._sessions.get(token) is not stored
+            or stored.in_flight
+            or stored.lock.locked()
+            or stored.last_activity != last_activity
+        ):
+            # A turn or a release got to the session while the file was
+            # written; the file is already out of date.
+            yield _call(_remove_file, path)
+            return False
+        self._pop(token)
+        self._add_hibernated(
+            HibernatedSession(
+                key=key,
+                ip=stored.ip,
+                identity=stored.identity,
+                save_dir=_save_dir_of(stored.session),
+                last_activity=stored.last_activity,
+                path=path,
+            )
+        )
+        yield from self._notify(self._on_hibernate, stored)
+        return True
+
+    def _rehydrate(
+        self, token: str, hibernated: HibernatedSession
+    ) -> Steps[Optional[StoredSession]]:
+        """Bring a hibernated session back into memory, or drop it if unreadable."""
+        failed = False
+        try:
+            record = yield _call(hibernated.read)
+            game, last_turn = _session_from_record(record, hibernated.save_dir)
+            yield from _claim_save_dir(hibernated.save_dir)
+        except (OSError, ValueError, InvalidSnapshot):
+            failed = True
+            logger.warning("Failed to rehydrate a hibernated session", exc_info=True)
+        if self._hibernated.get(hibernated.key) is not hibernated:
+            # Another request brought it back, or dropped it, during the read.
+            return self._sessions.get(token)
+        if failed:
+            yield from self._drop_hibernated(hibernated.key)
+            return None
+
+        self._forget_hibernated(hibernated.key)
+        stored = StoredSession(
+            token=token,
+            session=game,
+            ip=hibernated.ip,
+            identity=hibernated.identity,
+            last_activity=hibernated.last_activity,
+            last_turn_id=last_turn.get("turn_id"),
+            last_turn_type=last_turn.get("turn_type"),
+            last_turn_text=last_turn.get("text"),
+            last_turn_frame=last_turn.get("frame"),
+        )
+        self._add(stored)
+        yield from self._notify(self._on_rehydrate, stored)
+        if not hibernated.in_drain_file:
+            yield _call(_remove_file, hibernated.path)
+        return stored
+
+    def _drop_hibernated(self, key: str) -> Steps[bool]:
+        """Forget a hibernated session and its files. True if there was one."""
+        hibernated = self._forget_hibernated(key)
+        if hibernated is None:
+            return False
+        # A shared drain file goes once nothing points at it; see
+        # prune_orphaned_hibernations.
+        if not hibernated.in_drain_file:
+            yield _call(_remove_file, hibernated.path)
+        if hibernated.identity is None:
+            yield _call(_remove_dir, hibernated.save_dir)
+        return True
+
+    def prune_orphaned_hibernations(self) -> List[Path]:
+        """Delete hibernation files no record points at.
+
+        That covers a restored drain file once every session in it has been
+        resumed or has expired, and files a crash left behind with no drain
+        to carry their records over.
+        """
+        return prune_orphaned_hibernations(self.hibernation_files())
 
     def terminal_replay(self, token: str) -> Optional[TerminalReplay]:
         """Return a live terminal replay tombstone without retaining the session."""
+        return _run(self._terminal_replay(token))
+
+    async def terminal_replay_async(self, token: str) -> Optional[TerminalReplay]:
+        """:meth:`terminal_replay`, with its backend call made off the event loop."""
+        return await _run_async(self._terminal_replay(token))
+
+    def _terminal_replay(self, token: str) -> Steps[Optional[TerminalReplay]]:
+        if self._backend is not None:
+            wall = time.time()
+            shared = yield _call(self._backend.replay, _token_key(token), wall)
+            if shared is None:
+                return None
+            return TerminalReplay(
+                turn_id=shared.turn_id,
+                turn_type=shared.turn_type,
+                text=shared.text,
+                frame=shared.frame,
+                expires_at=time.monotonic() + shared.expires_at - wall,
+            )
         now = time.monotonic()
         self._prune_terminal_replays(now)
-        return self._terminal_replays.get(token)
+        return self._terminal_replays.get(_token_key(token))
+
+    def _put_replay(self, key: str, replay: TerminalReplay) -> None:
+        self._terminal_replays[key] = replay
+        heapq.heappush(self._replay_expiry, (replay.expires_at, key))
 
     def _prune_terminal_replays(self, now: float) -> None:
-        expired = [
-            token
-            for token, replay in self._terminal_replays.items()
-            if replay.expires_at <= now
-        ]
-        for token in expired:
-            self._terminal_replays.pop(token, None)
+        while self._replay_expiry and self._replay_expiry[0][0] <= now:
+            expires_at, key = heapq.heappop(self._replay_expiry)
+            replay = self._terminal_replays.get(key)
+            if replay is not None and replay.expires_at == expires_at:
+                del self._terminal_replays[key]
 
     def _is_expired(self, stored: StoredSession, now: float) -> bool:
         # A request in flight is activity, whatever the clock says. Without
         # this, a sweep could delete a throwaway save directory out from under
-        # a turn that is still running in the executor.
+        # a turn that is still waiting on the model.
         if stored.in_flight > 0:
             return False
         return now - stored.last_activity > self.idle_timeout
 
+    # -- Drain and restore ----------------------------------------------------
+
+    def in_flight_turns(self) -> int:
+        """Sessions with a turn running or waiting on the session lock."""
+        return sum(
+            1
+            for stored in self._sessions.values()
+            if stored.in_flight or stored.lock.locked()
+        )
+
+    def drain(self) -> Path:
+        """Write every session and terminal replay to the drain file.
+
+        One write, fsynced, for the next process to :meth:`restore`. Resident
+        sessions are snapshotted into the file; hibernated ones already have
+        their state on disk, so only their records go in. The store is not
+        changed: draining is the last thing a process does with it.
+
+        With a shared backend every session's state is already there, so a
+        drain only hands this worker's sessions back (hibernates them) and
+        writes nothing of its own.
+        """
+        if self._backend is not None:
+            for token in list(self._sessions):
+                self.hibernate(token)
+            return self._backend.path
+        now = time.monotonic()
+        sessions: Dict[str, Dict[str, Any]] = {}
+        chunks: List[bytes] = []
+        offset = 0
+        for token, stored in self._sessions.items():
+            chunk = _encode(_hibernation_record(stored)) + b"\n"
+            sessions[_token_key(token)] = {
+                **_drain_entry(
+                    stored.ip,
+                    stored.identity,
+                    _save_dir_of(stored.session),
+                    now - stored.last_activity,
+                ),
+                "file": None,
+                "offset": offset,
+                "length": len(chunk) - 1,
+            }
+            chunks.append(chunk)
+            offset += len(chunk)
+        for key, hibernated in self._hibernated.items():
+            sessions[key] = {
+                **_drain_entry(
+                    hibernated.ip,
+                    hibernated.identity,
+                    hibernated.save_dir,
+                    now - hibernated.last_activity,
+                ),
+                "file": str(hibernated.path),
+                "offset": hibernated.offset,
+                "length": hibernated.length,
+            }
+        self._prune_terminal_replays(now)
+        replays = {
+            key: {
+                "turn_id": replay.turn_id,
+                "turn_type": replay.turn_type,
+                "text": replay.text,
+                "frame": replay.frame,
+                "expires_in": replay.expires_at - now,
+            }
+            for key, replay in self._terminal_replays.items()
+        }
+        index = {
+            "version": DRAIN_VERSION,
+            "sessions": sessions,
+            "terminal_replays": replays,
+        }
+        path = _drain_path()
+        _write_atomically(path, b"".join([_encode(index), b"\n", *chunks]), durable=True)
+        return path
+
+    def restore(self) -> int:
+        """Load a drain left by the previous process. Returns sessions restored.
+
+        Only the index is read. Every session comes back as a hibernated
+        record pointing into the drain file, which moves into the hibernation
+        directory so the next drain cannot overwrite state still unread.
+        A shared backend keeps its sessions across restarts by itself.
+        """
+        if self._backend is not None:
+            return 0
+        source = _drain_path()
+        try:
+            with source.open("rb") as stream:
+                header = stream.readline()
+        except FileNotFoundError:
+            return 0
+        except OSError:
+            logger.warning("Failed to read the session drain", exc_info=True)
+            return 0
+        try:
+            index = json.loads(header)
+            if not isinstance(index, dict) or index.get("version") != DRAIN_VERSION:
+                raise ValueError("unsupported drain version")
+            sessions = index["sessions"]
+            replays = index["terminal_replays"]
+            if not isinstance(sessions, dict) or not isinstance(replays, dict):
+                raise ValueError("malformed drain index")
+        except (KeyError, ValueError):
+            logger.warning("Ignoring an unreadable session drain", exc_info=True)
+            return 0
+
+        bulk = _hibernation_dir() / f"drain-{secrets.token_hex(8)}.ndjson"
+        try:
+            bulk.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(source, bulk)
+        except OSError:
+            logger.warning("Failed to adopt the session drain", exc_info=True)
+            return 0
+
+        now = time.monotonic()
+        restored = 0
+        for key, entry in sessions.items():
+            try:
+                hibernated = _restored_session(key, entry, bulk, len(header), now)
+            except (KeyError, TypeError, ValueError):
+                logger.warning("Skipping a malformed drained session", exc_info=True)
+                continue
+            self._add_hibernated(hibernated)
+            restored += 1
+        for key, entry in replays.items():
+            try:
+                self._put_replay(
+                    key,
+                    TerminalReplay(
+                        turn_id=int(entry["turn_id"]),
+                        turn_type=str(entry["turn_type"]),
+                        text=str(entry["text"]),
+                        frame=dict(entry["frame"]),
+                        expires_at=now + float(entry["expires_in"]),
+                    ),
+                )
+            except (KeyError, TypeError, ValueError):
+                logger.warning("Skipping a malformed drained replay", exc_info=True)
+        return restored
+
+    # -- Indexes --------------------------------------------------------------
+
+    def _add(self, stored: StoredSession) -> None:
+        """Make *stored* resident, indexed by identity and filed by activity."""
+        self._sessions[stored.token] = stored
+        if stored.identity is not None:
+            self._identities[stored.identity] = stored.token
+        # Left alone, out-of-date entries would pile up under sessions that
+        # stay busy; rebuilding once they outnumber the live ones keeps the
+        # heap within a constant factor of the store.
+        if len(self._idle) > 2 * len(self._sessions) + 64:
+            self._idle = [(s.last_activity, t) for t, s in self._sessions.items()]
+            heapq.heapify(self._idle)
+            self._filed = {t: s.last_activity for t, s in self._sessions.items()}
+        else:
+            self._file(stored)
+
+    def _pop(self, token: str) -> Optional[StoredSession]:
+        """Take *token* out of residency and the indexes."""
+        stored = self._sessions.pop(token, None)
+        if stored is None:
+            return None
+        self._filed.pop(token, None)
+        if stored.identity is not None and self._identities.get(stored.identity) == token:
+            del self._identities[stored.identity]
+        return stored
+
+    def _file(self, stored: StoredSession) -> None:
+        self._filed[stored.token] = stored.last_activity
+        heapq.heappush(self._idle, (stored.last_activity, stored.token))
+
+    def _idle_since(self, cutoff: float) -> List[StoredSession]:
+        """Take every resident session last active by *cutoff* off the heap.
+
+        The caller files back whichever it keeps resident. Sessions active
+        since they were filed go back under their new time on the way past.
+        """
+        found: List[StoredSession] = []
+        while self._idle and self._idle[0][0] <= cutoff:
+            filed, token = heapq.heappop(self._idle)
+            stored = self._sessions.get(token)
+            if stored is None or self._filed.get(token) != filed:
+                continue
+            if stored.last_activity > cutoff:
+                self._file(stored)
+            else:
+                del self._filed[token]
+                found.append(stored)
+        return found
+
+    def _add_hibernated(self, hibernated: HibernatedSession) -> None:
+        self._hibernated[hibernated.key] = hibernated
+        if hibernated.identity is not None:
+            self._hibernated_identities[hibernated.identity] = hibernated.key
+        heapq.heappush(
+            self._hibernated_idle, (hibernated.last_activity, hibernated.key)
+        )
+
+    def _forget_hibernated(self, key: str) -> Optional[HibernatedSession]:
+        hibernated = self._hibernated.pop(key, None)
+        if hibernated is None:
+            return None
+        identity = hibernated.identity
+        if identity is not None and self._hibernated_identities.get(identity) == key:
+            del self._hibernated_identities[identity]
+        return hibernated
+
+    def _notify(
+        self, callback: Optional[Callable[[SessionRef], None]], ref: SessionRef
+    ) -> Steps[None]:
+        """Call a slot callback.
+
+        With a shared backend the slot counts are shared too, so the callback
+        is made where backend calls are: in a worker thread on the async paths.
+        """
+        if callback is None:
+            return
+        if self._backend is not None:
+            yield _call(callback, ref)
+        else:
+            callback(ref)
+
     # -- Introspection --------------------------------------------------------
 
     def live_save_dirs(self) -> set[Path]:
-        """Save directories belonging to live sessions, which must not be pruned."""
-        dirs = set()
-        for stored in self._sessions.values():
-            save_dir = _save_dir_of(stored.session)
-            if save_dir is not None:
-                dirs.add(save_dir.resolve() if save_dir.exists() else save_dir)
-        return dirs
+        """Save directories belonging to live sessions, which must not be pruned.
+
+        Hibernated sessions are live: their runs resume on the next request.
+        The paths are as the sessions hold them, with no filesystem call made;
+        :func:`prune_expired_saves` resolves them on its own thread. With a
+        shared backend other workers' sessions are read from it, so the
+        server takes :meth:`live_save_dirs_async` instead.
+        """
+        return _run(self._live_save_dirs())
+
+    async def live_save_dirs_async(self) -> set[Path]:
+        """:meth:`live_save_dirs`, with its backend call made off the event loop."""
+        return await _run_async(self._live_save_dirs())
+
+    def _live_save_dirs(self) -> Steps[set[Path]]:
+        save_dirs = [_save_dir_of(stored.session) for stored in self._sessions.values()]
+        save_dirs.extend(h.save_dir for h in self._hibernated.values())
+        if self._backend is not None:
+            save_dirs.extend((yield _call(self._backend.save_dirs)))
+        return {save_dir for save_dir in save_dirs if save_dir is not None}
+
+    def hibernation_files(self) -> set[Path]:
+        """Hibernation files some record still points at."""
+        return {h.path for h in self._hibernated.values()}
 
     def __len__(self) -> int:
+        """Resident sessions only; hibernated ones hold no memory to count."""
         return len(self._sessions)
 
+    @property
+    def hibernated_count(self) -> int:
+        """Hibernated sessions. With a shared backend, a read of it."""
+        return _run(self._hibernated_count())
+
+    async def hibernated_count_async(self) -> int:
+        """:attr:`hibernated_count`, with its backend call made off the event loop."""
+        return await _run_async(self._hibernated_count())
+
+    @property
+    def last_hibernated_count(self) -> int:
+        """:attr:`hibernated_count` as of the last sweep or count.
+
+        Exact in memory. With a shared backend it is what the sweep last
+        read, so reporting it never blocks.
+        """
+        if self._backend is not None:
+            return self._shared_hibernated
+        return len(self._hibernated)
+
+    def _hibernated_count(self) -> Steps[int]:
+        if self._backend is None:
+            return len(self._hibernated)
+        self._shared_hibernated = yield _call(
+            functools.partial(self._backend.count, resident=False)
+        )
+        return self._shared_hibernated
+
     def tokens(self) -> Iterable[str]:
         return tuple(self._sessions)
 
@@ -306,6 +1280,110 @@ def _save_dir_of(session: WebGameSession) -> Optional[Path]:
     return getattr(save_manager, "save_dir", None)
 
 
+def _hibernation_record(stored: StoredSession) -> Dict[str, Any]:
+    """A session's state in the local engine's checkpoint shape, plus replay."""
+    return {
+        "version": SNAPSHOT_VERSION,
+        **session_snapshot(stored.session),
+        "last_turn": {
+            "turn_id": stored.last_turn_id,
+            "turn_type": stored.last_turn_type,
+            "text": stored.last_turn_text,
+            "frame": stored.last_turn_frame,
+        },
+    }
+
+
+def _session_from_record(
+    record: Dict[str, Any], save_dir: Optional[Path]
+) -> Tuple[WebGameSession, Dict[str, Any]]:
+    """Rebuild a session from :func:`_hibernation_record` output, validated."""
+    if record.get("version") != SNAPSHOT_VERSION:
+        raise InvalidSnapshot("hibernated session has an unsupported version")
+    game = WebGameSession()
+    if save_dir is not None:
+        _use_save_dir(game, save_dir)
+    restore_session(game, record.get("game_state"), record.get("session"))
+    last_turn = record.get("last_turn")
+    if not isinstance(last_turn, dict):
+        raise InvalidSnapshot("hibernated session replay state is malformed")
+    return game, last_turn
+
+
+def _drain_entry(
+    ip: str, identity: Optional[str], save_dir: Optional[Path], idle_for: float
+) -> Dict[str, Any]:
+    # Idle time rather than last_activity: the monotonic clock does not
+    # survive the restart.
+    return {
+        "ip": ip,
+        "identity": identity,
+        "save_dir": None if save_dir is None else str(save_dir),
+        "idle_for": max(0.0, idle_for),
+    }
+
+
+def _restored_session(
+    key: str, entry: Dict[str, Any], bulk: Path, base: int, now: float
+) -> HibernatedSession:
+    """Rebuild a hibernated record from a drain index entry."""
+    identity = entry["identity"]
+    save_dir = entry["save_dir"]
+    if entry["file"] is None:
+        path, offset = bulk, base + int(entry["offset"])
+    else:
+        path = Path(entry["file"])
+        offset = None if entry["offset"] is None else int(entry["offset"])
+        # Only ever a file this store wrote; never follow a path elsewhere.
+        if path.parent != _hibernation_dir():
+            raise ValueError("drained session points outside the hibernation dir")
+    return HibernatedSession(
+        key=str(key),
+        ip=str(entry["ip"]),
+        identity=None if identity is None else str(identity),
+        save_dir=None if save_dir is None else Path(save_dir),
+        last_activity=now - float(entry["idle_for"]),
+        path=path,
+        offset=offset,
+        length=None if entry["length"] is None else int(entry["length"]),
+    )
+
+
+def _encode(data: Dict[str, Any]) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _write_atomically(path: Path, data: Dict[str, Any] | bytes, *, durable: bool = False) -> None:
+    """Write *data* to *path* so a reader never sees half a file.
+
+    A single hibernation skips the fsync: a session lost to a crash is no
+    worse off than the resident one it replaced, which would not have survived
+    it either. A drain is *durable*, because the process is about to go.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(f".{secrets.token_hex(8)}.tmp")
+    payload = data if isinstance(data, bytes) else _encode(data)
+    try:
+        with temporary.open("xb") as stream:
+            stream.write(payload)
+            if durable:
+                stream.flush()
+                os.fsync(stream.fileno())
+        os.replace(temporary, path)
+    finally:
+        _remove_file(temporary)
+
+
+def _remove_file(path: Path) -> None:
+    """Delete *path* if it exists. Runs during cleanup, so it must not raise."""
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+    except OSError:
+        logger.debug("Failed to remove file: %s", path, exc_info=True)
+
+
 def _remove_dir(path: Optional[Path]) -> None:
     """Delete *path* if it exists. Runs during cleanup, so it must not raise."""
     if path is None:
@@ -317,6 +1395,70 @@ def _remove_dir(path: Optional[Path]) -> None:
         logger.debug("Failed to remove save dir: %s", path, exc_info=True)
 
 
+def _use_save_dir(game: WebGameSession, save_dir: Path) -> None:
+    """Point *game*'s saves at *save_dir*; a durable one is indexed on every
+    save and its slots go through the group-commit writer."""
+    game.save_manager.save_dir = save_dir
+    if _is_durable_dir(save_dir):
+        game.save_manager.on_save = _touch_durable_dir
+        game.save_manager.writer = save_writer()
+
+
+def _is_durable_dir(save_dir: Optional[Path]) -> bool:
+    return save_dir is not None and save_dir.parent == _save_root() / "clients"
+
+
+def _claim_save_dir(save_dir: Optional[Path]) -> Steps[None]:
+    """Index a durable *save_dir* as in use, as a step of the caller's operation.
+
+    Made before the session is handed out, so a prune already under way
+    cannot take the directory; a blocking call, so off the loop on the async
+    paths. Later touches come from saves, which the session runs off the
+    loop too.
+    """
+    if _is_durable_dir(save_dir):
+        yield _call(_touch_durable_dir, save_dir)
+
+
+def _touch_durable_dir(save_dir: Path) -> None:
+    # Failing to index must not fail the session or the save. A directory the
+    # index missed is only ever kept too long: a prune re-reads the mtime of
+    # any candidate before deleting it.
+    try:
+        retention_index(_save_root()).touch(save_dir.name, time.time())
+    except (OSError, sqlite3.Error):
+        logger.warning("Failed to index a save directory for retention", exc_info=True)
+
+
+def prune_orphaned_hibernations(
+    known: Iterable[Path], *, older_than: Optional[float] = None
+) -> List[Path]:
+    """Delete files in the hibernation directory that are not in *known*.
+
+    With *older_than* (a wall-clock time), files modified since are kept:
+    *known* was taken then, and a session hibernated after it is not an
+    orphan.
+    """
+    known = set(known)
+    try:
+        entries = list(_hibernation_dir().iterdir())
+    except OSError:
+        return []
+    pruned = []
+    for entry in entries:
+        if entry in known:
+            continue
+        if older_than is not None:
+            try:
+                if entry.stat().st_mtime >= older_than:
+                    continue
+            except OSError:
+                continue
+        _remove_file(entry)
+        pruned.append(entry)
+    return pruned
+
+
 def prune_expired_saves(
     live_dirs: Optional[Iterable[Path]] = None,
     *,
@@ -328,10 +1470,16 @@ def prune_expired_saves(
     are never touched, however old their files look; a run that has not saved
     for a long time must not lose its history mid-session.
 
-    Retention is otherwise measured from the most recently modified save file
-    in the directory, so an active player's saves are never collected out from
-    under them. A retention of 0 days disables pruning rather than deleting
-    everything, so a misconfiguration cannot wipe live saves.
+    Retention is otherwise measured from the most recent save, so an active
+    player's saves are never collected out from under them. The retention
+    index (``server.save_retention``) supplies the candidates; the first
+    prune of a root seeds it from the files' mtimes. Each candidate's mtime is checked again before it is
+    deleted, so a save the index missed keeps its directory. A retention of
+    0 days disables pruning rather than deleting everything, so a
+    misconfiguration cannot wipe live saves.
+
+    Blocking filesystem and SQLite work throughout: call it off the event
+    loop.
     """
     retention = _retention_seconds()
     if retention <= 0:
@@ -341,21 +1489,34 @@ def prune_expired_saves(
     if not clients_dir.is_dir():
         return []
 
-    protected = {Path(p) for p in (live_dirs or ())}
+    index = retention_index(_save_root())
+    if not index.seeded():
+        try:
+            entries = [entry for entry in clients_dir.iterdir() if entry.is_dir()]
+        except OSError:
+            logger.debug("Failed to list durable save root: %s", clients_dir, exc_info=True)
+            return []
+        index.seed([(entry.name, _latest_mtime(entry)) for entry in entries])
+
+    protected = set()
+    for live in live_dirs or ():
+        live = Path(live)
+        protected.add(live)
+        protected.add(live.resolve())
     cutoff = (time.time() if now is None else now) - retention
     pruned: List[Path] = []
-    try:
-        entries = list(clients_dir.iterdir())
-    except OSError:
-        logger.debug("Failed to list durable save root: %s", clients_dir, exc_info=True)
-        return []
-
-    for entry in entries:
+    for name in index.touched_before(cutoff):
+        entry = clients_dir / name
         if not entry.is_dir():
+            index.forget(name)
             continue
         if entry in protected or entry.resolve() in protected:
             continue
-        if _latest_mtime(entry) > cutoff:
+        latest = _latest_mtime(entry)
+        if latest > cutoff:
+            index.touch(name, latest)
+            continue
+        if not index.claim(name, cutoff):
             continue
         _remove_dir(entry)
         pruned.append(entry)
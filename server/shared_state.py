@@ -0,0 +1,533 @@
+"""Session and rate-limit state shared by every worker on a machine.
+
+``SessionStore`` and ``RateLimiter`` keep their state in process memory, which
+is why the server ran one uvicorn worker: a second worker would not know the
+first one's tokens, and each would enforce its own limits. With
+``CABIN_SHARED_STATE_PATH`` set, both keep it in one SQLite file instead, so
+any worker can serve any token and the limits hold across all of them.
+
+A session row holds the session's checkpoint (the shape ``LocalEngine``
+validates), a version that rises with every committed turn, and a lease. The
+lease is what serialises turns across workers, as the per-session
+``asyncio.Lock`` does within one: a worker takes it before running a turn and
+gives it back after committing the new state. A lease that outlives its
+holder (a worker killed mid-turn) simply expires. Each worker keeps the
+sessions it has served in memory and reuses them while the row's version
+still matches, so a player whose turns keep landing on one worker pays one
+read per turn, not a restore.
+
+Times are wall-clock: the monotonic clock is per process. SQLite shares a
+file between processes on one machine, not between machines; the
+``SessionBackend`` protocol is the seam for a networked store.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Protocol, Tuple
+
+
+# Writers in other workers hold the file for one short transaction.
+SQLITE_BUSY_TIMEOUT_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class SessionRow:
+    """Everything about a shared session except its checkpoint."""
+
+    key: str
+    ip: str
+    identity: Optional[str]
+    save_dir: Optional[Path]
+    version: int
+    last_activity: float
+    resident: bool
+    owner: Optional[str]
+    lease_owner: Optional[str]
+    lease_until: float
+
+    def leased(self, now: float) -> bool:
+        return self.lease_owner is not None and self.lease_until > now
+
+
+@dataclass(frozen=True)
+class SharedReplay:
+    turn_id: int
+    turn_type: str
+    text: str
+    frame: Dict[str, Any]
+    expires_at: float
+
+
+class SessionBackend(Protocol):
+    """What ``SessionStore`` needs from a store other workers can see.
+
+    Keys are token hashes; tokens never leave the process that issued them.
+    """
+
+    path: Path
+
+    def insert(
+        self,
+        key: str,
+        *,
+        ip: str,
+        identity: Optional[str],
+        save_dir: Optional[Path],
+        record: Dict[str, Any],
+        last_activity: float,
+        owner: str,
+    ) -> int: ...
+
+    def row(self, key: str) -> Optional[SessionRow]: ...
+
+    def record(self, key: str) -> Optional[Tuple[int, Dict[str, Any]]]: ...
+
+    def commit(self, key: str, record: Dict[str, Any], last_activity: float) -> int: ...
+
+    def touch(self, key: str, last_activity: float) -> None: ...
+
+    def claim(self, key: str, owner: str) -> bool: ...
+
+    def hibernate(self, key: str, owner: str) -> bool: ...
+
+    def delete(self, key: str) -> Optional[SessionRow]: ...
+
+    def by_identity(self, identity: str) -> List[SessionRow]: ...
+
+    def acquire_lease(
+        self, key: str, owner: str, now: float, ttl: float
+    ) -> Optional[bool]: ...
+
+    def release_lease(self, key: str, owner: str) -> None: ...
+
+    def expired(self, cutoff: float, now: float) -> List[SessionRow]: ...
+
+    def save_dirs(self) -> List[Path]: ...
+
+    def count(self, *, resident: bool) -> int: ...
+
+    def put_replay(self, key: str, replay: SharedReplay) -> None: ...
+
+    def replay(self, key: str, now: float) -> Optional[SharedReplay]: ...
+
+    def prune_replays(self, now: float) -> None: ...
+
+
+class SQLiteFile:
+    """One lazily opened connection per process, WAL mode, autocommit.
+
+    The base for every SQLite file the server shares between workers. A
+    subclass creates its tables in :meth:`_schema` and holds ``_lock`` for
+    each use of the connection, which any thread may make.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def _schema(self, connection: sqlite3.Connection) -> None:
+        raise NotImplementedError
+
+    def _connect(self) -> sqlite3.Connection:
+        # Opened on first use, not at import, so a forked worker never
+        # inherits its parent's connection.
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(
+                str(self.path),
+                timeout=SQLITE_BUSY_TIMEOUT_SECONDS,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._schema(connection)
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+_ROW_COLUMNS = (
+    "key, ip, identity, save_dir, version, last_activity, resident, owner,"
+    " lease_owner, lease_until"
+)
+
+
+def _row(values: Any) -> SessionRow:
+    return SessionRow(
+        key=values[0],
+        ip=values[1],
+        identity=values[2],
+        save_dir=None if values[3] is None else Path(values[3]),
+        version=values[4],
+        last_activity=values[5],
+        resident=bool(values[6]),
+        owner=values[7],
+        lease_owner=values[8],
+        lease_until=values[9],
+    )
+
+
+def _encode(data: Dict[str, Any]) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+class SQLiteSessionBackend(SQLiteFile):
+    """``SessionBackend`` over a SQLite file on the machine's volume."""
+
+    def _schema(self, connection: sqlite3.Connection) -> None:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            " key TEXT PRIMARY KEY,"
+            " ip TEXT NOT NULL,"
+            " identity TEXT,"
+            " save_dir TEXT,"
+            " record TEXT NOT NULL,"
+            " version INTEGER NOT NULL,"
+            " last_activity REAL NOT NULL,"
+            " resident INTEGER NOT NULL,"
+            " owner TEXT,"
+            " lease_owner TEXT,"
+            " lease_until REAL NOT NULL DEFAULT 0)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS sessions_identity ON sessions (identity)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS sessions_last_activity"
+            " ON sessions (last_activity)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS replays ("
+            " key TEXT PRIMARY KEY,"
+            " turn_id INTEGER NOT NULL,"
+            " turn_type TEXT NOT NULL,"
+            " text TEXT NOT NULL,"
+            " frame TEXT NOT NULL,"
+            " expires_at REAL NOT NULL)"
+        )
+
+    def insert(
+        self,
+        key: str,
+        *,
+        ip: str,
+        identity: Optional[str],
+        save_dir: Optional[Path],
+        record: Dict[str, Any],
+        last_activity: float,
+        owner: str,
+    ) -> int:
+        with self._lock:
+            self._connect().execute(
+                "INSERT INTO sessions"
+                " (key, ip, identity, save_dir, record, version, last_activity,"
+                "  resident, owner)"
+                " VALUES (?, ?, ?, ?, ?, 1, ?, 1, ?)",
+                (
+                    key,
+                    ip,
+                    identity,
+                    None if save_dir is None else str(save_dir),
+                    _encode(record),
+                    last_activity,
+                    owner,
+                ),
+            )
+        return 1
+
+    def row(self, key: str) -> Optional[SessionRow]:
+        with self._lock:
+            values = self._connect().execute(
+                f"SELECT {_ROW_COLUMNS} FROM sessions WHERE key = ?", (key,)
+            ).fetchone()
+        return None if values is None else _row(values)
+
+    def record(self, key: str) -> Optional[Tuple[int, Dict[str, Any]]]:
+        with self._lock:
+            values = self._connect().execute(
+                "SELECT version, record FROM sessions WHERE key = ?", (key,)
+            ).fetchone()
+        if values is None:
+            return None
+        return values[0], json.loads(values[1])
+
+    def commit(self, key: str, record: Dict[str, Any], last_activity: float) -> int:
+        """Store a turn's state and return the row's new version."""
+        with self._lock:
+            values = self._connect().execute(
+                "UPDATE sessions SET record = ?, version = version + 1,"
+                " last_activity = ? WHERE key = ? RETURNING version",
+                (_encode(record), last_activity, key),
+            ).fetchone()
+        return 0 if values is None else values[0]
+
+    def touch(self, key: str, last_activity: float) -> None:
+        with self._lock:
+            self._connect().execute(
+                "UPDATE sessions SET last_activity = max(last_activity, ?)"
+                " WHERE key = ?",
+                (last_activity, key),
+            )
+
+    def claim(self, key: str, owner: str) -> bool:
+        """Make *owner* the worker holding the session in memory.
+
+        Returns True if the session was hibernated, which is when it takes a
+        session slot again. Moving between workers keeps the one it has.
+        """
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                values = connection.execute(
+                    "SELECT resident FROM sessions WHERE key = ?", (key,)
+                ).fetchone()
+                connection.execute(
+                    "UPDATE sessions SET owner = ?, resident = 1 WHERE key = ?",
+                    (owner, key),
+                )
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        return values is not None and not values[0]
+
+    def hibernate(self, key: str, owner: str) -> bool:
+        """Mark a session out of memory if *owner* still holds it."""
+        with self._lock:
+            changed = self._connect().execute(
+                "UPDATE sessions SET resident = 0, owner = NULL"
+                " WHERE key = ? AND owner = ? AND resident = 1",
+                (key, owner),
+            ).rowcount
+        return changed == 1
+
+    def delete(self, key: str) -> Optional[SessionRow]:
+        """Delete a session, returning it only to the one caller that did."""
+        with self._lock:
+            values = self._connect().execute(
+                f"DELETE FROM sessions WHERE key = ? RETURNING {_ROW_COLUMNS}",
+                (key,),
+            ).fetchone()
+        return None if values is None else _row(values)
+
+    def by_identity(self, identity: str) -> List[SessionRow]:
+        with self._lock:
+            rows = self._connect().execute(
+                f"SELECT {_ROW_COLUMNS} FROM sessions WHERE identity = ?",
+                (identity,),
+            ).fetchall()
+        return [_row(values) for values in rows]
+
+    def acquire_lease(
+        self, key: str, owner: str, now: float, ttl: float
+    ) -> Optional[bool]:
+        """Take the turn lease. None if the session no longer exists."""
+        with self._lock:
+            connection = self._connect()
+            taken = connection.execute(
+                "UPDATE sessions SET lease_owner = ?, lease_until = ?"
+                " WHERE key = ? AND (lease_owner IS NULL OR lease_until <= ?"
+                "  OR lease_owner = ?)",
+                (owner, now + ttl, key, now, owner),
+            ).rowcount
+            if taken:
+                return True
+            exists = connection.execute(
+                "SELECT 1 FROM sessions WHERE key = ?", (key,)
+            ).fetchone()
+        return False if exists else None
+
+    def release_lease(self, key: str, owner: str) -> None:
+        with self._lock:
+            self._connect().execute(
+                "UPDATE sessions SET lease_owner = NULL, lease_until = 0"
+                " WHERE key = ? AND lease_owner = ?",
+                (key, owner),
+            )
+
+    def expired(self, cutoff: float, now: float) -> List[SessionRow]:
+        """Sessions idle since before *cutoff* with no turn running."""
+        with self._lock:
+            rows = self._connect().execute(
+                f"SELECT {_ROW_COLUMNS} FROM sessions WHERE last_activity < ?"
+                " AND (lease_owner IS NULL OR lease_until <= ?)",
+                (cutoff, now),
+            ).fetchall()
+        return [_row(values) for values in rows]
+
+    def save_dirs(self) -> List[Path]:
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT save_dir FROM sessions WHERE save_dir IS NOT NULL"
+            ).fetchall()
+        return [Path(values[0]) for values in rows]
+
+    def count(self, *, resident: bool) -> int:
+        with self._lock:
+            return self._connect().execute(
+                "SELECT COUNT(*) FROM sessions WHERE resident = ?", (int(resident),)
+            ).fetchone()[0]
+
+    def put_replay(self, key: str, replay: SharedReplay) -> None:
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO replays"
+                " (key, turn_id, turn_type, text, frame, expires_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    replay.turn_id,
+                    replay.turn_type,
+                    replay.text,
+                    _encode(replay.frame),
+                    replay.expires_at,
+                ),
+            )
+
+    def replay(self, key: str, now: float) -> Optional[SharedReplay]:
+        with self._lock:
+            values = self._connect().execute(
+                "SELECT turn_id, turn_type, text, frame, expires_at FROM replays"
+                " WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+        if values is None:
+            return None
+        return SharedReplay(
+            turn_id=values[0],
+            turn_type=values[1],
+            text=values[2],
+            frame=json.loads(values[3]),
+            expires_at=values[4],
+        )
+
+    def prune_replays(self, now: float) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM replays WHERE expires_at <= ?", (now,))
+
+
+class SQLiteRateCounters(SQLiteFile):
+    """``RateLimiter``'s counters, shared by every worker on the machine.
+
+    Events are rows in a sliding window, counted with an index range scan;
+    the session slot count is one row updated in place. Rows that have left
+    the window are deleted by :meth:`prune`, which the server's sweep calls,
+    so no rate check pays for the cleanup.
+    """
+
+    def _schema(self, connection: sqlite3.Connection) -> None:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS rate_events ("
+            " ip TEXT NOT NULL, kind TEXT NOT NULL, at REAL NOT NULL)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS rate_events_ip ON rate_events (ip, kind, at)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS counters ("
+            " name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+        )
+
+    def count(self, ip: str, kind: str, since: float) -> int:
+        """Events of *kind* from *ip* after *since*."""
+        with self._lock:
+            return self._connect().execute(
+                "SELECT COUNT(*) FROM rate_events WHERE ip = ? AND kind = ? AND at > ?",
+                (ip, kind, since),
+            ).fetchone()[0]
+
+    def record(self, ip: str, kind: str, at: float) -> None:
+        with self._lock:
+            self._connect().execute(
+                "INSERT INTO rate_events (ip, kind, at) VALUES (?, ?, ?)",
+                (ip, kind, at),
+            )
+
+    def admit(
+        self,
+        ip: str,
+        kind: str,
+        at: float,
+        *,
+        since: float,
+        limit: int,
+        max_sessions: Optional[int] = None,
+    ) -> Tuple[bool, int]:
+        """Record an event of *kind* from *ip* if fewer than *limit* came after *since*.
+
+        With *max_sessions* the event is a new session, refused at the cap
+        and taking a slot when admitted. The check and the writes are one
+        transaction, so workers admitting at once cannot all pass a stale
+        count. Returns whether it was admitted and the session count after.
+        """
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                sessions = self._sessions(connection)
+                admitted = (
+                    max_sessions is None or sessions < max_sessions
+                ) and connection.execute(
+                    "SELECT COUNT(*) FROM rate_events WHERE ip = ? AND kind = ? AND at > ?",
+                    (ip, kind, since),
+                ).fetchone()[0] < limit
+                if admitted:
+                    connection.execute(
+                        "INSERT INTO rate_events (ip, kind, at) VALUES (?, ?, ?)",
+                        (ip, kind, at),
+                    )
+                    if max_sessions is not None:
+                        sessions = self._add_sessions(connection, 1)
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        return admitted, sessions
+
+    def prune(self, before: float) -> int:
+        """Delete events at or before *before*. Returns how many went."""
+        with self._lock:
+            return self._connect().execute(
+                "DELETE FROM rate_events WHERE at <= ?", (before,)
+            ).rowcount
+
+    def add_sessions(self, delta: int) -> int:
+        """Move the shared session count by *delta*, never below zero.
+
+        Returns the count after.
+        """
+        with self._lock:
+            return self._add_sessions(self._connect(), delta)
+
+    def sessions(self) -> int:
+        with self._lock:
+            return self._sessions(self._connect())
+
+    @staticmethod
+    def _add_sessions(connection: sqlite3.Connection, delta: int) -> int:
+        return connection.execute(
+            "INSERT INTO counters (name, value) VALUES ('sessions', max(0, ?))"
+            " ON CONFLICT (name) DO UPDATE SET value = max(0, value + ?)"
+            " RETURNING value",
+            (delta, delta),
+        ).fetchone()[0]
+
+    @staticmethod
+    def _sessions(connection: sqlite3.Connection) -> int:
+        values = connection.execute(
+            "SELECT value FROM counters WHERE name = 'sessions'"
+        ).fetchone()
+        return 0 if values is None else values[0]
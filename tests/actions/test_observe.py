@@ -26,6 +26,9 @@ class TestLookAction:
         room.get_items_description.return_value = ""
         map_mock.current_room = room
         map_mock.observe_current_room.return_value = ""
+        map_mock.describe_room.side_effect = (
+            lambda room, player=None: room.get_description(player, map_mock.world_state)
+        )
         
         return ActionContext(player=player, map=map_mock, intent=intent)
     
@@ -295,24 +295,18 @@ def test_build_ai_context_carries_distinct_runtime_dawn_truth():
     assert dawn_context["is_dawn_offer_active"] is True
 
 
-def test_split_system_for_cache_marks_static_prefix():
+def test_split_system_for_cache_marks_whole_system_prompt():
     messages = build_interpreter_messages("wait", _base_context())
     system_text = messages[0]["content"]
 
     blocks = split_system_for_cache(system_text)
 
-    assert len(blocks) == 2
-    assert blocks[0]["cache_control"] == {"type": "ephemeral"}
-    assert blocks[1]["text"].startswith("Constraints:")
-    # Nothing scenario-specific may sit in the cacheable prefix.
-    assert "stick" not in blocks[0]["text"]
-    assert blocks[0]["text"] + blocks[1]["text"] == system_text
-
-
-def test_split_system_for_cache_handles_missing_marker():
-    blocks = split_system_for_cache("no marker here")
-
-    assert blocks == [{"type": "text", "text": "no marker here"}]
+    assert blocks == [
+        {"type": "text", "text": system_text, "cache_control": {"type": "ephemeral"}}
+    ]
+    # Nothing scenario-specific may sit in the cacheable block.
+    assert "The Cabin" not in system_text
+    assert '"key"' not in system_text
 
 
 def test_challenger_position_is_deterministic_and_swaps():
@@ -168,3 +168,21 @@ def test_use_seed_copies_into_main_saves(tmp_path: Path, monkeypatch: pytest.Mon
     dst = seed_saves.use_seed("act3_arrival")
     assert dst == main_dir / "act3_arrival.json"
     assert dst.exists()
+
+
+def test_system_prompt_is_byte_identical_across_seeds() -> None:
+    """The provider caches the system block as a prefix; nothing per-turn may enter it."""
+    from game.ai_context import build_ai_context
+    from game.ai_interpreter import build_interpreter_messages
+
+    systems = set()
+    users = set()
+    for build in seed_saves.SEEDS.values():
+        state = build()
+        context = build_ai_context(state.player, state.map, state.quest_manager)
+        messages = build_interpreter_messages("look around", context)
+        systems.add(messages[0]["content"].encode("utf-8"))
+        users.add(messages[1]["content"])
+
+    assert len(systems) == 1
+    assert len(users) > 1
@@ -0,0 +1,217 @@
+"""Tests for turn admission control (server.admission)."""
+
+import asyncio
+
+import pytest
+
+from server.admission import Priority, Shed, TurnScheduler
+
+
+async def _hold(scheduler, priority, entered, release, order=None, name=None):
+    async with scheduler.admit(priority):
+        if order is not None:
+            order.append(name)
+        entered.set()
+        await release.wait()
+
+
+def test_admits_up_to_concurrency_without_waiting():
+    async def scenario():
+        scheduler = TurnScheduler(concurrency=2, queue_limit=4, wait_budget=1)
+        async with scheduler.admit(Priority.RUN):
+            async with scheduler.admit(Priority.NEW):
+                assert scheduler.running == 2
+                assert scheduler.depth == 0
+        return scheduler.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["running"] == 0
+    assert stats["admitted"] == 2
+
+
+def test_waiting_turns_go_ahead_of_new_runs():
+    async def scenario():
+        scheduler = TurnScheduler(concurrency=1, queue_limit=4, wait_budget=1)
+        order = []
+        release = asyncio.Event()
+        first = asyncio.Event()
+        holder = asyncio.create_task(
+            _hold(scheduler, Priority.RUN, first, release)
+        )
+        await first.wait()
+
+        waiters = [
+            asyncio.create_task(
+                _hold(scheduler, priority, asyncio.Event(), release, order, name)
+            )
+            for priority, name in (
+                (Priority.NEW, "new"),
+                (Priority.RUN, "run-1"),
+                (Priority.RUN, "run-2"),
+            )
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.depth == 3
+        release.set()
+        await asyncio.gather(holder, *waiters)
+        return order, scheduler
+
+    order, scheduler = asyncio.run(scenario())
+    assert order == ["run-1", "run-2", "new"]
+    assert scheduler.running == 0
+
+
+def test_a_freed_slot_is_handed_over_not_raced_for():
+    async def scenario():
+        scheduler = TurnScheduler(concurrency=1, queue_limit=8, wait_budget=1)
+        peak = 0
+
+        async def turn():
+            nonlocal peak
+            async with scheduler.admit(Priority.RUN):
+                peak = max(peak, scheduler.running)
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(turn() for _ in range(8)))
+        return peak, scheduler
+
+    peak, scheduler = asyncio.run(scenario())
+    assert peak == 1
+    assert scheduler.running == 0
+    assert scheduler.stats()["admitted"] == 8
+
+
+def test_a_wait_past_the_budget_is_shed():
+    async def scenario():
+        scheduler = TurnScheduler(concurrency=1, queue_limit=4, wait_budget=0.01)
+        release = asyncio.Event()
+        entered = asyncio.Event()
+        holder = asyncio.create_task(_hold(scheduler, Priority.RUN, entered, release))
+        await entered.wait()
+        with pytest.raises(Shed) as shed:
+            async with scheduler.admit(Priority.RUN):
+                pass
+        assert scheduler.depth == 0
+        release.set()
+        await holder
+        return shed.value, scheduler.stats()
+
+    shed, stats = asyncio.run(scenario())
+    assert shed.retry_after == 1
+    assert stats["shed_budget"] == 1
+    assert stats["running"] == 0
+
+
+def test_a_full_queue_sheds_at_once():
+    async def scenario():
+        scheduler = TurnScheduler(concurrency=1, queue_limit=0, wait_budget=1)
+        scheduler.running = 1
+        with pytest.raises(Shed):
+            async with scheduler.admit(Priority.RUN):
+                pass
+        return scheduler.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["shed_full"] == 1
+    assert stats["running"] == 1
+
+
+def test_a_turn_displaces_the_newest_waiting_new_run():
+    async def scenario():
+        scheduler = TurnScheduler(concurrency=1, queue_limit=2, wait_budget=1)
+        release = asyncio.Event()
+        entered = asyncio.Event()
+        holder = asyncio.create_task(_hold(scheduler, Priority.RUN, entered, release))
+        await entered.wait()
+
+        order = []
+        older = asyncio.create_task(
+            _hold(scheduler, Priority.NEW, asyncio.Event(), release, order, "older")
+        )
+        newer = asyncio.create_task(
+            _hold(scheduler, Priority.NEW, asyncio.Event(), release, order, "newer")
+        )
+        await asyncio.sleep(0)
+        turn = asyncio.create_task(
+            _hold(scheduler, Priority.RUN, asyncio.Event(), release, order, "turn")
+        )
+        await asyncio.sleep(0)
+        with pytest.raises(Shed):
+            await newer
+
+        release.set()
+        await asyncio.gather(holder, older, turn)
+        return order, scheduler.stats()
+
+    order, stats = asyncio.run(scenario())
+    assert order == ["turn", "older"]
+    assert stats["shed_new"] == 1
+    assert stats["running"] == 0
+
+
+def test_new_runs_are_shed_rather_than_displace_each_other():
+    async def scenario():
+        scheduler = TurnScheduler(concurrency=1, queue_limit=1, wait_budget=1)
+        release = asyncio.Event()
+        entered = asyncio.Event()
+        holder = asyncio.create_task(_hold(scheduler, Priority.RUN, entered, release))
+        await entered.wait()
+        waiting = asyncio.create_task(
+            _hold(scheduler, Priority.NEW, asyncio.Event(), release)
+        )
+        await asyncio.sleep(0)
+        with pytest.raises(Shed):
+            async with scheduler.admit(Priority.NEW):
+                pass
+        release.set()
+        await asyncio.gather(holder, waiting)
+        return scheduler.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["shed_full"] == 1
+    assert stats["shed_new"] == 0
+
+
+def test_a_cancelled_waiter_leaves_the_queue():
+    async def scenario():
+        scheduler = TurnScheduler(concurrency=1, queue_limit=4, wait_budget=1)
+        release = asyncio.Event()
+        entered = asyncio.Event()
+        holder = asyncio.create_task(_hold(scheduler, Priority.RUN, entered, release))
+        await entered.wait()
+        waiting = asyncio.create_task(
+            _hold(scheduler, Priority.RUN, asyncio.Event(), release)
+        )
+        await asyncio.sleep(0)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert scheduler.depth == 0
+        release.set()
+        await holder
+        return scheduler
+
+    assert asyncio.run(asyncio.wait_for(scenario(), 5)).running == 0
+
+
+def test_limits_come_from_the_environment(monkeypatch):
+    monkeypatch.setenv("CABIN_TURN_CONCURRENCY", "3")
+    monkeypatch.setenv("CABIN_TURN_QUEUE_LIMIT", "7")
+    monkeypatch.setenv("CABIN_TURN_WAIT_BUDGET_SECONDS", "0.5")
+    stats = TurnScheduler().stats()
+    assert (stats["concurrency"], stats["queue_limit"]) == (3, 7)
+    assert stats["wait_budget_seconds"] == 0.5
+
+    monkeypatch.setenv("CABIN_TURN_CONCURRENCY", "none")
+    assert TurnScheduler().concurrency == 20
+
+
+def test_stats_report_wait_percentiles():
+    scheduler = TurnScheduler(concurrency=1, queue_limit=1, wait_budget=1)
+    assert scheduler.stats()["wait_p99_ms"] is None
+    for waited in range(100):
+        scheduler._admitted(waited / 1000)
+    stats = scheduler.stats()
+    assert stats["wait_p50_ms"] == 50.0
+    assert stats["wait_p95_ms"] == 95.0
+    assert stats["wait_p99_ms"] == 99.0
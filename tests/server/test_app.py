@@ -19,7 +19,9 @@ from server.app import (
     UNKNOWN_MESSAGE_TEXT,
     RATE_LIMIT_TEXT,
     SESSION_TIMEOUT_TEXT,
+    SETTLE_TEXT,
 )
+from server.admission import TurnScheduler
 from server.rate_limiter import RateLimiter
 from server.session import WebGameSession
 from game.ai_interpreter import clear_response_cache
@@ -38,6 +40,7 @@ def limiter(monkeypatch):
     def install(**kwargs):
         rl = RateLimiter(**kwargs)
         monkeypatch.setattr(app_module, "rate_limiter", rl)
+        monkeypatch.setattr(app_module, "turn_scheduler", TurnScheduler())
         return rl
     return install
 
@@ -61,6 +64,32 @@ class TestHealth:
         assert body["status"] == "ok"
         assert body["active_sessions"] == 0
 
+    def test_health_reports_model_pool(self, client, limiter):
+        limiter()
+        pool = client.get("/health").json()["http_pool"]
+        assert set(pool) == {"in_use", "waiting", "clients", "max_connections", "http2"}
+
+    def test_health_reports_response_cache_tiers(self, client, limiter):
+        limiter()
+        tiers = client.get("/health").json()["response_cache"]
+        assert set(tiers) == {"memory", "disk"}
+        assert {"hits", "misses", "evictions"} <= set(tiers["memory"])
+
+    def test_shutdown_closes_the_shared_model_client(
+        self, limiter, tmp_path, monkeypatch
+    ):
+        from game.ai import http_pool
+
+        limiter()
+        # Shutdown drains the session store; keep it out of the tree and
+        # leave the module admitting turns for the tests after this one.
+        monkeypatch.setenv("CABIN_SAVE_ROOT", str(tmp_path / "saves"))
+        monkeypatch.setattr(app_module, "_draining", False)
+        with TestClient(app) as running:
+            running.get("/health")
+            shared = http_pool.get_http_client()
+        assert shared.is_closed
+
 
 class TestConnection:
     def test_intro_frame_sent_on_connect(self, client, limiter):
@@ -77,6 +106,78 @@ class TestConnection:
             with client.websocket_connect("/ws") as ws:
                 _intro(ws)
 
+    def test_connection_closed_with_try_later_when_saturated(
+        self, client, limiter, monkeypatch
+    ):
+        limiter()
+        full = TurnScheduler(concurrency=1, queue_limit=0)
+        full.running = 1
+        monkeypatch.setattr(app_module, "turn_scheduler", full)
+        with pytest.raises(WebSocketDisconnect) as closed:
+            with client.websocket_connect("/ws") as ws:
+                _intro(ws)
+        assert closed.value.code == 1013
+        assert closed.value.reason == SETTLE_TEXT
+        assert app_module.rate_limiter.active_sessions == 0
+
+    def test_a_new_run_holds_its_slot_while_it_is_built(
+        self, client, limiter, monkeypatch
+    ):
+        limiter()
+        scheduler = TurnScheduler(concurrency=1)
+        monkeypatch.setattr(app_module, "turn_scheduler", scheduler)
+        running = []
+
+        class _Counted(WebGameSession):
+            def __init__(self):
+                running.append(scheduler.running)
+                super().__init__()
+
+        monkeypatch.setattr(app_module, "WebGameSession", _Counted)
+        with client.websocket_connect("/ws") as ws:
+            _intro(ws)
+            assert running == [1]
+            assert scheduler.running == 0
+
+    def test_shed_turn_is_answered_and_the_socket_stays_open(
+        self, client, limiter, monkeypatch
+    ):
+        limiter()
+        with client.websocket_connect("/ws") as ws:
+            _intro(ws)
+            ws.send_json({"type": "keypress"})
+            ws.receive_json()
+            full = TurnScheduler(concurrency=1, queue_limit=0, wait_budget=2.5)
+            full.running = 1
+            monkeypatch.setattr(app_module, "turn_scheduler", full)
+            # A keypress is local and would run anyway; a command is not.
+            ws.send_json({"type": "input", "text": "look around"})
+            assert ws.receive_json() == {
+                "type": "error",
+                "message": SETTLE_TEXT,
+                "retry_after": 3,
+            }
+
+            monkeypatch.setattr(app_module, "turn_scheduler", TurnScheduler())
+            ws.send_json({"type": "input", "text": "look around"})
+            assert ws.receive_json()["type"] == "render"
+
+    def test_local_turns_run_when_saturated(self, client, limiter, monkeypatch):
+        limiter()
+        with client.websocket_connect("/ws") as ws:
+            _intro(ws)
+            full = TurnScheduler(concurrency=1, queue_limit=0)
+            full.running = 1
+            monkeypatch.setattr(app_module, "turn_scheduler", full)
+            ws.send_json({"type": "keypress"})
+            assert ws.receive_json()["type"] == "render"
+            ws.send_json({"type": "input", "text": "map"})
+            assert ws.receive_json()["wait_for_key"] is True
+            ws.send_json({"type": "keypress"})
+            assert ws.receive_json()["type"] == "render"
+        assert full.stats()["inline"] == 3
+        assert full.stats()["shed_full"] == 0
+
     def test_keypress_dismisses_intro_and_renders_room(self, client, limiter):
         limiter()
         with client.websocket_connect("/ws") as ws:
@@ -119,6 +220,89 @@ class TestMessageHandling:
             assert any("Health:" in line for line in frame["lines"])
 
 
+    def test_batched_overlays_arrive_in_one_message(self, client, limiter):
+        limiter()
+        with client.websocket_connect("/ws") as ws:
+            _intro(ws)
+            ws.send_json({"type": "keypress"})
+            ws.receive_json()
+            ws.send_json({"type": "input", "text": "map", "batch_overlays": True})
+            batch = ws.receive_json()
+            assert batch["type"] == "batch"
+            assert batch["frames"][0]["wait_for_key"] is True
+            assert batch["frames"][-1]["prompt"] == "> "
+
+            ws.send_json({"type": "input", "text": "look"})
+            assert ws.receive_json()["type"] == "render"
+
+    def test_diffed_frames_name_their_base(self, client, limiter):
+        limiter()
+        with client.websocket_connect("/ws") as ws:
+            _intro(ws)
+            ws.send_json({"type": "keypress", "diff_base": None})
+            room = ws.receive_json()
+            ws.send_json({"type": "input", "text": "look", "diff_base": room["seq"]})
+            looked = ws.receive_json()
+            assert looked["base"] == room["seq"]
+            assert len(looked["lines"]) < len(room["lines"])
+
+    def test_streamed_narration_arrives_as_partials_before_the_frame(
+        self, client, limiter, monkeypatch
+    ):
+        from server.protocol import RenderFrame
+
+        class _Narrating:
+            def get_intro_frame(self):
+                return RenderFrame(lines=["intro"], wait_for_key=True)
+
+            def needs_interpreter(self, text):
+                return True
+
+            async def handle_input_async(self, text, on_narration=None):
+                await on_narration("The snow ")
+                await on_narration("gives nothing back.")
+                return RenderFrame(lines=["The snow gives nothing back."], prompt="> ")
+
+        limiter()
+        monkeypatch.setattr(app_module, "WebGameSession", _Narrating)
+        with client.websocket_connect("/ws") as ws:
+            _intro(ws)
+            ws.send_json({"type": "input", "text": "listen"})
+            received = [ws.receive_json() for _ in range(3)]
+
+        assert received[:2] == [
+            {"type": "partial", "text": "The snow "},
+            {"type": "partial", "text": "gives nothing back."},
+        ]
+        assert received[2]["type"] == "render"
+
+
+    def test_a_retry_sends_a_reset_partial(self, client, limiter, monkeypatch):
+        from server.protocol import RenderFrame
+
+        class _Retrying:
+            def get_intro_frame(self):
+                return RenderFrame(lines=["intro"], wait_for_key=True)
+
+            def needs_interpreter(self, text):
+                return True
+
+            async def handle_input_async(self, text, on_narration=None):
+                await on_narration("The sn")
+                await on_narration(None)
+                await on_narration("The snow.")
+                return RenderFrame(lines=["The snow."], prompt="> ")
+
+        limiter()
+        monkeypatch.setattr(app_module, "WebGameSession", _Retrying)
+        with client.websocket_connect("/ws") as ws:
+            _intro(ws)
+            ws.send_json({"type": "input", "text": "listen"})
+            received = [ws.receive_json() for _ in range(4)]
+
+        assert received[1] == {"type": "partial", "text": "", "reset": True}
+        assert received[2] == {"type": "partial", "text": "The snow."}
+
 class TestRateLimitingAndValidation:
     def test_per_message_rate_limit_returns_settle_text(self, client, limiter):
         limiter(max_messages_per_min=0)
@@ -167,7 +351,10 @@ class TestSessionCleanup:
                 from server.protocol import RenderFrame
                 return RenderFrame(lines=["intro"], wait_for_key=True)
 
-            def handle_input(self, text):
+            def needs_interpreter(self, text):
+                return True
+
+            async def handle_input_async(self, text, **_):
                 raise RuntimeError("session blew up")
 
         monkeypatch.setattr(app_module, "WebGameSession", _Boom)
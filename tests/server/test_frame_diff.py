@@ -0,0 +1,93 @@
+"""Tests for frame-diff mode (server.frame_diff)."""
+
+from server.frame_diff import BASE_FRAMES, FrameDiffer, apply_diff, diff_base
+from server.protocol import BatchFrame, RenderFrame
+from server.session import WebGameSession
+
+
+SCRIPT = ["", "look", "look", "north", "listen", "cabin", "", "", "look", "map", ""]
+
+
+def _render(lines):
+    return RenderFrame(lines=list(lines), prompt="> ").to_dict()
+
+
+class TestDiffBase:
+    def test_reads_the_opt_in_and_the_base(self):
+        assert diff_base({"type": "keypress"}) == (False, None)
+        assert diff_base({"type": "keypress", "diff_base": None}) == (True, None)
+        assert diff_base({"type": "keypress", "diff_base": 12}) == (True, 12)
+        assert diff_base({"type": "keypress", "diff_base": True}) == (True, None)
+        assert diff_base("diff_base") == (False, None)
+
+
+class TestFrameDiffer:
+    def test_first_frame_is_whole_and_numbered(self):
+        payload = FrameDiffer().encode(_render(["a", "b"]), None)
+        assert payload["lines"] == ["a", "b"]
+        assert isinstance(payload["seq"], int)
+        assert "base" not in payload
+
+    def test_changed_middle_is_sent_against_the_base(self):
+        differ = FrameDiffer()
+        first = differ.encode(_render(["room", "desc", "", "Health: 100"]), None)
+        second = differ.encode(
+            _render(["room", "desc", "", "You listen.", "", "Health: 100"]),
+            first["seq"],
+        )
+        assert second["seq"] == first["seq"] + 1
+        assert second["base"] == first["seq"]
+        assert (second["keep_head"], second["keep_tail"]) == (3, 1)
+        assert second["lines"] == ["You listen.", ""]
+        assert second["prompt"] == "> "
+
+    def test_an_unknown_base_gets_a_whole_frame(self):
+        differ = FrameDiffer()
+        first = differ.encode(_render(["a", "b"]), None)
+        resync = differ.encode(_render(["a", "b", "c"]), first["seq"] + 99)
+        assert "base" not in resync
+        assert resync["lines"] == ["a", "b", "c"]
+
+    def test_nothing_in_common_is_sent_whole(self):
+        differ = FrameDiffer()
+        first = differ.encode(_render(["a"]), None)
+        assert "base" not in differ.encode(_render(["b"]), first["seq"])
+
+    def test_old_bases_are_forgotten(self):
+        differ = FrameDiffer()
+        oldest = differ.encode(_render(["x", "0"]), None)["seq"]
+        for n in range(BASE_FRAMES):
+            differ.encode(_render(["x", str(n + 1)]), None)
+        assert "base" not in differ.encode(_render(["x", "y"]), oldest)
+
+    def test_a_batch_is_whole_and_its_room_becomes_the_base(self):
+        differ = FrameDiffer()
+        batch = differ.encode(
+            BatchFrame([
+                RenderFrame(lines=["scene"], wait_for_key=True),
+                RenderFrame(lines=["room", "Health: 100"], prompt="> "),
+            ]).to_dict(),
+            None,
+        )
+        assert batch["frames"][0]["lines"] == ["scene"]
+        after = differ.encode(_render(["room", "Health: 90"]), batch["seq"])
+        assert after["keep_head"] == 1
+        assert after["lines"] == ["Health: 90"]
+
+    def test_other_messages_pass_through(self):
+        error = {"type": "error", "message": "no"}
+        assert FrameDiffer().encode(error, None) is error
+
+    def test_a_client_rebuilds_every_frame_of_a_run(self):
+        session = WebGameSession()
+        differ = FrameDiffer()
+        held_seq, held_lines = None, []
+        diffed = 0
+        for text in SCRIPT:
+            full = session.handle_input(text).to_dict()
+            payload = differ.encode(dict(full), held_seq)
+            diffed += "base" in payload
+            held_lines = apply_diff(held_lines, payload)
+            held_seq = payload["seq"]
+            assert held_lines == full["lines"], text
+        assert diffed
@@ -5,7 +5,10 @@ WebGameSession falls back to rule-based parsing. Each test installs a fresh
 RateLimiter and SessionStore so limits and expiry can be driven deterministically.
 """
 
+import asyncio
+import threading
 import time
+from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
@@ -15,12 +18,15 @@ from server.app import (
     app,
     BROKEN_MESSAGE_TEXT,
     CONNECTION_REFUSED_TEXT,
+    DRAINING_TEXT,
     ORIGIN_REFUSED_TEXT,
     RATE_LIMIT_TEXT,
+    SETTLE_TEXT,
     TURN_FAILED_TEXT,
     UNKNOWN_IDENTITY_TEXT,
     UNKNOWN_SESSION_TEXT,
 )
+from server.admission import TurnScheduler
 from server.rate_limiter import RateLimiter
 from server.session_store import SessionStore, durable_save_dir
 from game.ai_interpreter import clear_response_cache
@@ -54,9 +60,13 @@ def limiter(monkeypatch):
         store = SessionStore(
             idle_timeout=rl.session_timeout,
             on_release=app_module._release_session_slot,
+            on_hibernate=app_module._release_session_slot,
+            on_rehydrate=app_module._resume_session_slot,
         )
         monkeypatch.setattr(app_module, "session_store", store)
         monkeypatch.setattr(app_module, "_last_save_prune", 0.0)
+        monkeypatch.setattr(app_module, "_save_prune_pass", None)
+        monkeypatch.setattr(app_module, "turn_scheduler", TurnScheduler())
         return rl
     return install
 
@@ -79,6 +89,15 @@ def _turn(client, token, **body):
     )
 
 
+def _awaitable(turn):
+    """Wrap a stub turn so it can stand in for ``handle_input_async``."""
+
+    async def run(text):
+        return turn(text)
+
+    return run
+
+
 def _turn_request(client, token, turn_id: int, text: str):
     return _turn(
         client,
@@ -160,6 +179,65 @@ class TestTurns:
         assert resp.json()["message"] == RATE_LIMIT_TEXT
 
 
+class TestStreamedTurns:
+    def _narrating(self, stored, pieces):
+        from server.protocol import RenderFrame
+
+        async def run(text, on_narration=None):
+            for piece in pieces:
+                await on_narration(piece)
+            return RenderFrame(lines=["".join(pieces) or text], prompt="> ")
+
+        stored.session.handle_input_async = run
+
+    def _stream(self, client, token, **body):
+        return client.post(
+            "/session/turn",
+            json=body,
+            headers={
+                "authorization": f"Bearer {token}",
+                "accept": "application/x-ndjson",
+            },
+        )
+
+    def test_narration_streams_as_ndjson_then_the_frame(self, client, limiter):
+        import json
+
+        limiter()
+        token, _ = _open(client)
+        self._narrating(app_module.session_store.get(token), ["You wait. ", "Nothing."])
+
+        resp = self._stream(client, token, type="input", text="wait a while")
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        assert lines[:2] == [
+            {"type": "partial", "text": "You wait. "},
+            {"type": "partial", "text": "Nothing."},
+        ]
+        assert lines[2]["type"] == "render"
+        assert lines[2]["lines"] == ["You wait. Nothing."]
+
+    def test_a_turn_with_nothing_to_stream_is_a_plain_response(self, client, limiter):
+        limiter()
+        token, _ = _open(client)
+        self._narrating(app_module.session_store.get(token), [])
+
+        resp = self._stream(client, token, type="input", text="look")
+
+        assert resp.headers["content-type"].startswith("application/json")
+        assert resp.json()["lines"] == ["look"]
+
+    def test_errors_keep_their_status_when_streaming_is_asked_for(self, client, limiter):
+        limiter(max_input_length=5)
+        token, _ = _open(client)
+
+        resp = self._stream(client, token, type="input", text="x" * 6)
+
+        assert resp.status_code == 400
+
+
 class TestIdempotentTurns:
     def test_repeat_replays_the_exact_frame_and_advances_once(self, client, limiter):
         from server.protocol import RenderFrame
@@ -173,7 +251,7 @@ class TestIdempotentTurns:
             calls.append(text)
             return RenderFrame(lines=[f"turn {len(calls)}: {text}"], prompt="> ")
 
-        stored.session.handle_input = _turn
+        stored.session.handle_input_async = _awaitable(_turn)
 
         first = _turn_request(client, token, 1, "look")
         repeated = _turn_request(client, token, 1, "look")
@@ -189,8 +267,10 @@ class TestIdempotentTurns:
         token, _ = _open(client)
         stored = app_module.session_store.get(token)
         calls = []
-        stored.session.handle_input = lambda text: (
-            calls.append(text) or RenderFrame(lines=[text], prompt="> ")
+        stored.session.handle_input_async = _awaitable(
+            lambda text: (
+                calls.append(text) or RenderFrame(lines=[text], prompt="> ")
+            )
         )
 
         _turn_request(client, token, 1, "look")
@@ -209,7 +289,7 @@ class TestIdempotentTurns:
         token, _ = _open(client)
         stored = app_module.session_store.get(token)
         calls = []
-        stored.session.handle_input = lambda text: calls.append(text)
+        stored.session.handle_input_async = _awaitable(lambda text: calls.append(text))
 
         resp = _turn(
             client, token, type="input", text="look", turn_id=turn_id
@@ -226,8 +306,10 @@ class TestIdempotentTurns:
         token, _ = _open(client)
         stored = app_module.session_store.get(token)
         calls = []
-        stored.session.handle_input = lambda text: (
-            calls.append(text) or RenderFrame(lines=[text], prompt="> ")
+        stored.session.handle_input_async = _awaitable(
+            lambda text: (
+                calls.append(text) or RenderFrame(lines=[text], prompt="> ")
+            )
         )
 
         assert _turn_request(client, token, 1, "look").status_code == 200
@@ -245,8 +327,10 @@ class TestIdempotentTurns:
         token, _ = _open(client)
         stored = app_module.session_store.get(token)
         calls = []
-        stored.session.handle_input = lambda text: (
-            calls.append(text) or RenderFrame(lines=[text], prompt="> ")
+        stored.session.handle_input_async = _awaitable(
+            lambda text: (
+                calls.append(text) or RenderFrame(lines=[text], prompt="> ")
+            )
         )
 
         assert _turn_request(client, token, 1, "look").status_code == 200
@@ -262,8 +346,10 @@ class TestIdempotentTurns:
         token, _ = _open(client)
         stored = app_module.session_store.get(token)
         calls = []
-        stored.session.handle_input = lambda text: (
-            calls.append(text) or RenderFrame(lines=["moved on"], prompt="> ")
+        stored.session.handle_input_async = _awaitable(
+            lambda text: (
+                calls.append(text) or RenderFrame(lines=["moved on"], prompt="> ")
+            )
         )
 
         first = _turn(client, token, type="keypress", turn_id=1)
@@ -282,8 +368,10 @@ class TestIdempotentTurns:
         token, _ = _open(client)
         stored = app_module.session_store.get(token)
         calls = []
-        stored.session.handle_input = lambda text: (
-            calls.append(text) or RenderFrame(lines=[text], prompt="> ")
+        stored.session.handle_input_async = _awaitable(
+            lambda text: (
+                calls.append(text) or RenderFrame(lines=[text], prompt="> ")
+            )
         )
 
         assert _turn(client, token, type="input", text="look").status_code == 200
@@ -297,8 +385,10 @@ class TestIdempotentTurns:
         token, _ = _open(client)
         stored = app_module.session_store.get(token)
         calls = []
-        stored.session.handle_input = lambda text: (
-            calls.append(text) or RenderFrame(lines=["It is over."], game_over=True)
+        stored.session.handle_input_async = _awaitable(
+            lambda text: (
+                calls.append(text) or RenderFrame(lines=["It is over."], game_over=True)
+            )
         )
 
         first = _turn_request(client, token, 1, "wait")
@@ -317,8 +407,10 @@ class TestIdempotentTurns:
         token, _ = _open(client)
         stored = app_module.session_store.get(token)
         calls = []
-        stored.session.handle_input = lambda text: (
-            calls.append(text) or RenderFrame(lines=["It is over."], game_over=True)
+        stored.session.handle_input_async = _awaitable(
+            lambda text: (
+                calls.append(text) or RenderFrame(lines=["It is over."], game_over=True)
+            )
         )
 
         first = _turn(client, token, type="keypress", turn_id=1)
@@ -349,16 +441,132 @@ class TestUnknownAndExpiredTokens:
         rl = limiter(session_timeout=-1)
         _open(client)
         assert rl.active_sessions == 1
-        client.get("/health")
+        asyncio.run(app_module._sweep_sessions())
         assert rl.active_sessions == 0
 
     def test_expiry_does_not_end_a_live_session(self, client, limiter):
         rl = limiter(session_timeout=3600)
         token, _ = _open(client)
-        client.get("/health")
+        asyncio.run(app_module._sweep_sessions())
         assert rl.active_sessions == 1
         assert _turn(client, token, type="keypress").status_code == 200
 
+    def test_health_probes_do_not_sweep(self, client, limiter):
+        rl = limiter(session_timeout=-1)
+        _open(client)
+        client.get("/health")
+        assert rl.active_sessions == 1
+
+    def test_session_creation_does_not_sweep(self, client, limiter):
+        rl = limiter(session_timeout=-1)
+        _open(client)
+        _open(client)
+        assert rl.active_sessions == 2
+
+    def test_the_app_sweeps_in_the_background(self, limiter, monkeypatch):
+        monkeypatch.setattr(app_module, "_draining", False)
+        monkeypatch.setenv("CABIN_SESSION_SWEEP_SECONDS", "0.01")
+        rl = limiter(session_timeout=-1)
+        with TestClient(app) as running:
+            _open(running)
+            assert rl.active_sessions == 1
+            deadline = time.monotonic() + 5
+            while rl.active_sessions and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert rl.active_sessions == 0
+
+
+class TestHibernation:
+    """Store behaviour is in test_session_store; these cover the wiring."""
+
+    def test_a_hibernated_run_resumes_and_frees_its_slot(
+        self, client, limiter, monkeypatch
+    ):
+        rl = limiter(max_sessions=1)
+        monkeypatch.setenv("CABIN_SESSION_HIBERNATE_SECONDS", "1")
+        token, _ = _open(client)
+        _turn(client, token, type="keypress")
+        before = _turn(client, token, type="input", text="look").json()
+        stored = app_module.session_store.get(token)
+        app_module.session_store.touch(stored, stored.last_activity - 5)
+        asyncio.run(app_module._sweep_sessions())
+
+        health = client.get("/health").json()
+        assert health["active_sessions"] == 0
+        assert health["hibernated_sessions"] == 1
+        # The cap counts resident sessions, so a paused run leaves room.
+        other, _ = _open(client)
+        assert rl.active_sessions == 1
+
+        after = _turn(client, token, type="input", text="look")
+        assert after.status_code == 200
+        assert after.json()["lines"] == before["lines"]
+        assert rl.active_sessions == 2
+        assert app_module.session_store.hibernated_count == 0
+
+
+class TestWorkers:
+    def test_workers_sharing_state_serve_one_token(
+        self, client, limiter, monkeypatch, tmp_path
+    ):
+        """Swapping the module's store and limiter between requests plays the
+        part of a load balancer picking a different worker."""
+        from server.shared_state import SQLiteRateCounters, SQLiteSessionBackend
+
+        path = tmp_path / "state.sqlite3"
+
+        def worker():
+            rl = RateLimiter(shared=SQLiteRateCounters(path))
+            store = SessionStore(
+                idle_timeout=rl.session_timeout,
+                backend=SQLiteSessionBackend(path),
+                on_release=app_module._release_session_slot,
+                on_hibernate=app_module._release_session_slot,
+                on_rehydrate=app_module._resume_session_slot,
+            )
+            return rl, store
+
+        def use(pair):
+            monkeypatch.setattr(app_module, "rate_limiter", pair[0])
+            monkeypatch.setattr(app_module, "session_store", pair[1])
+
+        one, two = worker(), worker()
+        use(one)
+        token, _ = _open(client)
+        use(two)
+        assert _turn(client, token, type="keypress", turn_id=1).status_code == 200
+        use(one)
+        looked = _turn_request(client, token, 2, "look")
+        assert looked.status_code == 200
+        use(two)
+        assert _turn_request(client, token, 2, "look").json() == looked.json()
+        assert two[0].active_sessions == 1
+
+
+class TestRestart:
+    def test_a_run_survives_a_restart(self, limiter, monkeypatch):
+        monkeypatch.setattr(app_module, "_draining", False)
+        limiter()
+        with TestClient(app) as before:
+            token, _ = _open(before)
+            assert _turn(before, token, type="keypress", turn_id=1).status_code == 200
+            looked = _turn_request(before, token, 2, "look").json()
+
+        limiter()  # the next process's empty store
+        with TestClient(app) as after:
+            assert _turn_request(after, token, 2, "look").json() == looked
+            assert _turn_request(after, token, 3, "look").status_code == 200
+            assert app_module.rate_limiter.active_sessions == 1
+
+    def test_turns_are_refused_while_draining(self, client, limiter, monkeypatch):
+        limiter()
+        token, _ = _open(client)
+        monkeypatch.setattr(app_module, "_draining", True)
+        resp = _turn(client, token, type="keypress")
+        assert resp.status_code == 503
+        assert resp.json()["message"] == DRAINING_TEXT
+        assert client.post("/session", json={}).status_code == 503
+
 
 class TestSaveDurability:
     """Release-time cleanup itself is a store behaviour (test_session_store);
@@ -374,7 +582,7 @@ class TestSaveDurability:
 
         app_module.session_store.idle_timeout = -1
         app_module.rate_limiter.session_timeout = -1
-        client.get("/health")  # sweeps
+        asyncio.run(app_module._sweep_sessions())
         assert not save_dir.exists()
 
     def test_client_identity_gets_a_durable_dir(self, client, limiter):
@@ -384,6 +592,30 @@ class TestSaveDurability:
         stored = app_module.session_store.get(token)
         assert stored.session.save_manager.save_dir == durable_save_dir(client_id)
 
+    def test_durable_saves_are_queued_for_the_writer(self, client, limiter):
+        limiter()
+        token, _ = _open(client, client_id="w" * 32)
+        _turn(client, token, type="keypress")
+        assert _turn(client, token, type="input", text="save slot").status_code == 200
+
+        manager = app_module.session_store.get(token).session.save_manager
+        assert manager.pending_write.result(timeout=5) == manager.save_dir / "slot.json"
+        assert manager.load_game("slot") is not None
+        assert client.get("/health").json()["save_writer"]["writes"] >= 1
+
+    def test_a_durable_ack_answers_once_the_save_is_written(
+        self, client, limiter, monkeypatch
+    ):
+        limiter()
+        monkeypatch.setenv("CABIN_SAVE_DURABLE_ACK", "1")
+        token, _ = _open(client, client_id="x" * 32)
+        _turn(client, token, type="keypress")
+        _turn(client, token, type="input", text="save slot")
+
+        manager = app_module.session_store.get(token).session.save_manager
+        assert manager.pending_write.done()
+        assert (manager.save_dir / "slot.json").exists()
+
     def test_a_second_run_retires_the_first_for_one_identity(self, client, limiter):
         """Two live sessions must never write the same save files. The store
         owns the exclusivity rule; this checks the HTTP endpoint wires it up
@@ -429,8 +661,12 @@ class TestGameOver:
 
         monkeypatch.setattr(
             stored.session,
-            "handle_input",
-            lambda text: RenderFrame(lines=["the cold has had its turn"], game_over=True),
+            "handle_input_async",
+            _awaitable(
+                lambda text: RenderFrame(
+                    lines=["the cold has had its turn"], game_over=True
+                )
+            ),
         )
 
         frame = _turn(client, token, type="input", text="wait").json()
@@ -659,7 +895,7 @@ class TestTurnFailure:
         def _boom(text):
             raise RuntimeError("the session blew up")
 
-        stored.session.handle_input = _boom
+        stored.session.handle_input_async = _awaitable(_boom)
 
         resp = _turn(client, token, type="keypress")
         assert resp.status_code == 500
@@ -670,16 +906,178 @@ class TestTurnFailure:
     def test_failed_session_creation_frees_the_slot(self, client, limiter, monkeypatch):
         rl = limiter()
 
-        def _boom(**kwargs):
+        async def _boom(**kwargs):
             raise RuntimeError("no session for you")
 
-        monkeypatch.setattr(app_module.session_store, "create", _boom)
+        monkeypatch.setattr(app_module.session_store, "create_async", _boom)
         resp = client.post("/session", json={})
         assert resp.status_code == 500
         assert resp.json()["message"] == TURN_FAILED_TEXT
         assert rl.active_sessions == 0
 
 
+class TestBatchedOverlays:
+    def test_a_batched_turn_carries_the_overlays_and_the_room(self, client, limiter):
+        limiter()
+        token, _ = _open(client)
+        _turn(client, token, type="keypress")
+
+        resp = _turn(client, token, type="input", text="map", batch_overlays=True)
+        body = resp.json()
+        assert body["type"] == "batch"
+        assert [frame["type"] for frame in body["frames"]] == ["render", "render"]
+        assert body["frames"][0]["wait_for_key"] is True
+        assert body["frames"][-1]["prompt"] == "> "
+
+        # Every keypress was acknowledged with the batch: the next command runs.
+        resp = _turn(client, token, type="input", text="look")
+        assert resp.json()["prompt"] == "> "
+
+    def test_a_batched_turn_replays_as_one_turn_id(self, client, limiter):
+        limiter()
+        token, _ = _open(client)
+        _turn(client, token, type="keypress", turn_id=1)
+
+        body = {"type": "input", "text": "quests", "turn_id": 2, "batch_overlays": True}
+        first = _turn(client, token, **body)
+        repeated = _turn(client, token, **body)
+        assert first.json()["type"] == "batch"
+        assert repeated.json() == first.json()
+
+        resp = _turn(client, token, type="input", text="look", turn_id=3)
+        assert resp.status_code == 200
+        assert "wait_for_key" not in resp.json()
+
+
+class TestFrameDiffs:
+    def test_frames_are_diffed_against_the_named_base(self, client, limiter):
+        limiter()
+        token, _ = _open(client)
+        room = _turn(client, token, type="keypress", diff_base=None).json()
+        assert "base" not in room
+
+        looked = _turn(
+            client, token, type="input", text="look", diff_base=room["seq"]
+        ).json()
+        assert looked["base"] == room["seq"]
+        assert looked["seq"] == room["seq"] + 1
+
+        stale = _turn(
+            client, token, type="input", text="look", diff_base=room["seq"] - 7
+        ).json()
+        assert "base" not in stale
+
+    def test_a_diffed_turn_replays_exactly(self, client, limiter):
+        limiter()
+        token, _ = _open(client)
+        room = _turn(client, token, type="keypress", turn_id=1, diff_base=None).json()
+        body = {"type": "input", "text": "look", "turn_id": 2, "diff_base": room["seq"]}
+        first = _turn(client, token, **body)
+        assert _turn(client, token, **body).json() == first.json()
+
+    def test_turns_without_the_opt_in_are_unchanged(self, client, limiter):
+        limiter()
+        token, _ = _open(client)
+        assert "seq" not in _turn(client, token, type="keypress").json()
+
+    def test_turn_responses_are_gzipped_when_accepted(self, client, limiter):
+        limiter()
+        token, _ = _open(client)
+        resp = client.post(
+            "/session/turn",
+            json={"type": "keypress"},
+            headers={
+                "authorization": f"Bearer {token}",
+                "accept-encoding": "gzip",
+            },
+        )
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.json()["prompt"] == "> "
+
+
+class TestAdmission:
+    """Queueing and shedding are the scheduler's (test_admission); these
+    cover how a shed request is answered over HTTP."""
+
+    @staticmethod
+    def _saturate(monkeypatch):
+        full = TurnScheduler(concurrency=1, queue_limit=0, wait_budget=2.5)
+        full.running = 1
+        monkeypatch.setattr(app_module, "turn_scheduler", full)
+        return full
+
+    def test_shed_turn_is_narrated_with_retry_after(self, client, limiter, monkeypatch):
+        limiter()
+        token, _ = _open(client)
+        _turn(client, token, type="keypress")
+        self._saturate(monkeypatch)
+
+        resp = _turn(client, token, type="input", text="look around")
+        assert resp.status_code == 503
+        assert resp.headers["retry-after"] == "3"
+        assert resp.json() == {"type": "error", "message": SETTLE_TEXT}
+        # A shed turn keeps its session.
+        assert app_module.session_store.get(token) is not None
+
+    def test_shed_turn_id_runs_when_repeated(self, client, limiter, monkeypatch):
+        from server.protocol import RenderFrame
+
+        limiter()
+        token, _ = _open(client)
+        _turn(client, token, type="keypress")
+        calls = []
+        app_module.session_store.get(token).session.handle_input_async = _awaitable(
+            lambda text: calls.append(text) or RenderFrame(lines=[text], prompt="> ")
+        )
+        full = self._saturate(monkeypatch)
+
+        assert _turn_request(client, token, 1, "look").status_code == 503
+        assert calls == []
+        full.running = 0
+        resp = _turn_request(client, token, 1, "look")
+        assert resp.status_code == 200
+        assert resp.json()["lines"] == ["look"]
+        assert calls == ["look"]
+
+    def test_keypress_and_screens_are_not_held_for_a_slot(
+        self, client, limiter, monkeypatch
+    ):
+        limiter()
+        token, _ = _open(client)
+        full = self._saturate(monkeypatch)
+
+        assert _turn(client, token, type="keypress").status_code == 200
+        for text in ("map", "quests", "saves"):
+            resp = _turn(client, token, type="input", text=text)
+            assert resp.status_code == 200, text
+            if resp.json().get("wait_for_key"):
+                assert _turn(client, token, type="keypress").status_code == 200
+        assert full.stats()["admitted"] == 0
+        assert full.stats()["inline"] >= 4
+
+    def test_shed_session_creation_frees_the_slot(self, client, limiter, monkeypatch):
+        rl = limiter()
+        self._saturate(monkeypatch)
+
+        resp = client.post("/session", json={})
+        assert resp.status_code == 503
+        assert resp.headers["retry-after"] == "3"
+        assert resp.json()["message"] == SETTLE_TEXT
+        assert rl.active_sessions == 0
+
+    def test_health_reports_admission(self, client, limiter):
+        limiter()
+        token, _ = _open(client)
+        _turn(client, token, type="keypress")
+        _turn(client, token, type="input", text="look around")
+        report = client.get("/health").json()["admission"]
+        assert report["admitted"] == 2
+        assert report["inline"] == 1
+        assert report["running"] == 0
+        assert report["depth"] == 0
+        assert report["wait_p50_ms"] == 0.0
+
+
 class TestConcurrentTurns:
     def test_turns_for_one_session_do_not_overlap(self, client, limiter):
         """A double-tapped send must not run two turns against one game state."""
@@ -693,14 +1091,12 @@ class TestConcurrentTurns:
         token, _ = _open(client)
         stored = app_module.session_store.get(token)
 
-        import threading
-
         in_flight = 0
         max_in_flight = 0
-        entered = threading.Event()
-        release = threading.Event()
+        entered = asyncio.Event()
+        release = asyncio.Event()
 
-        def _slow_turn(text):
+        async def _slow_turn(text):
             nonlocal in_flight, max_in_flight
             in_flight += 1
             max_in_flight = max(max_in_flight, in_flight)
@@ -708,16 +1104,15 @@ class TestConcurrentTurns:
             # Held open by the test, not by a timing guess: the second request
             # is already issued, so if the lock were missing it would enter
             # here and push max_in_flight to 2.
-            release.wait(timeout=5)
+            await asyncio.wait_for(release.wait(), timeout=5)
             in_flight -= 1
             return RenderFrame(lines=["a turn"])
 
-        stored.session.handle_input = _slow_turn
+        stored.session.handle_input_async = _slow_turn
 
         async def _fire_both():
             transport = httpx.ASGITransport(app=app)
             headers = {"authorization": f"Bearer {token}"}
-            loop = asyncio.get_running_loop()
             async with httpx.AsyncClient(
                 transport=transport, base_url="http://testserver"
             ) as ac:
@@ -735,8 +1130,8 @@ class TestConcurrentTurns:
                 )
                 # Wait until a turn is genuinely executing, then let the event
                 # loop run so the second request reaches the lock.
-                await loop.run_in_executor(None, entered.wait, 5)
-                assert entered.is_set(), "no turn reached the executor"
+                await asyncio.wait_for(entered.wait(), timeout=5)
+                assert entered.is_set(), "no turn started"
                 for _ in range(20):
                     await asyncio.sleep(0)
                 overlapped = max_in_flight
@@ -752,7 +1147,6 @@ class TestConcurrentTurns:
     def test_repeat_waits_for_the_original_then_replays_it(self, client, limiter):
         """A retry arriving mid-turn must not advance state a second time."""
         import asyncio
-        import threading
 
         import httpx
 
@@ -761,18 +1155,18 @@ class TestConcurrentTurns:
         limiter(max_messages_per_min=10)
         token, _ = _open(client)
         stored = app_module.session_store.get(token)
-        entered = threading.Event()
-        release = threading.Event()
+        entered = asyncio.Event()
+        release = asyncio.Event()
         calls = 0
 
-        def _slow_turn(text):
+        async def _slow_turn(text):
             nonlocal calls
             calls += 1
             entered.set()
-            release.wait(timeout=5)
+            await asyncio.wait_for(release.wait(), timeout=5)
             return RenderFrame(lines=["one turn"], prompt="> ")
 
-        stored.session.handle_input = _slow_turn
+        stored.session.handle_input_async = _slow_turn
 
         async def _fire_both():
             transport = httpx.ASGITransport(app=app)
@@ -784,10 +1178,8 @@ class TestConcurrentTurns:
                 first = asyncio.create_task(
                     ac.post("/session/turn", json=body, headers=headers)
                 )
-                await asyncio.get_running_loop().run_in_executor(
-                    None, entered.wait, 5
-                )
-                assert entered.is_set(), "the original never reached the executor"
+                await asyncio.wait_for(entered.wait(), timeout=5)
+                assert entered.is_set(), "the original turn never started"
                 repeated = asyncio.create_task(
                     ac.post("/session/turn", json=body, headers=headers)
                 )
@@ -806,7 +1198,6 @@ class TestConcurrentTurns:
         self, client, limiter
     ):
         import asyncio
-        import threading
 
         import httpx
 
@@ -815,18 +1206,18 @@ class TestConcurrentTurns:
         limiter(max_messages_per_min=10)
         token, _ = _open(client)
         stored = app_module.session_store.get(token)
-        entered = threading.Event()
-        release = threading.Event()
+        entered = asyncio.Event()
+        release = asyncio.Event()
         calls = 0
 
-        def _terminal_turn(text):
+        async def _terminal_turn(text):
             nonlocal calls
             calls += 1
             entered.set()
-            release.wait(timeout=5)
+            await asyncio.wait_for(release.wait(), timeout=5)
             return RenderFrame(lines=["It is over."], game_over=True)
 
-        stored.session.handle_input = _terminal_turn
+        stored.session.handle_input_async = _terminal_turn
 
         async def _fire_both():
             transport = httpx.ASGITransport(app=app)
@@ -838,10 +1229,8 @@ class TestConcurrentTurns:
                 first = asyncio.create_task(
                     ac.post("/session/turn", json=body, headers=headers)
                 )
-                await asyncio.get_running_loop().run_in_executor(
-                    None, entered.wait, 5
-                )
-                assert entered.is_set(), "the terminal turn never reached the executor"
+                await asyncio.wait_for(entered.wait(), timeout=5)
+                assert entered.is_set(), "the terminal turn never started"
                 repeated = asyncio.create_task(
                     ac.post("/session/turn", json=body, headers=headers)
                 )
@@ -868,7 +1257,9 @@ class TestSavePruning:
             lambda live: calls.append(live) or [],
         )
         _open(client)
+        app_module._save_prune_pass.result()
         _open(client)
+        app_module._save_prune_pass.result()
         assert len(calls) == 1
 
     def test_prune_is_told_which_dirs_are_live(self, client, limiter, monkeypatch):
@@ -884,8 +1275,36 @@ class TestSavePruning:
 
         monkeypatch.setattr(app_module, "_last_save_prune", 0.0)
         _open(client)
+        app_module._save_prune_pass.result()
         assert stored.session.save_manager.save_dir in calls[-1]
 
+    def test_the_pass_runs_off_the_event_loop(self, client, limiter, monkeypatch):
+        limiter()
+        threads = []
+        monkeypatch.setattr(
+            app_module,
+            "prune_expired_saves",
+            lambda live: threads.append(threading.current_thread().name) or [],
+        )
+        _open(client)
+        app_module._save_prune_pass.result()
+        assert threads and threads[0].startswith("save-prune")
+
+    def test_health_reports_each_pass(self, client, limiter, monkeypatch):
+        limiter()
+        monkeypatch.setattr(
+            app_module, "_save_prune_stats", dict(app_module._save_prune_stats, passes=0)
+        )
+        monkeypatch.setattr(
+            app_module, "prune_expired_saves", lambda live: [Path("a"), Path("b")]
+        )
+        _open(client)
+        app_module._save_prune_pass.result()
+        report = client.get("/health").json()["save_pruning"]
+        assert report["passes"] == 1
+        assert report["last_pruned"] == 2
+        assert report["last_pass_ms"] >= 0
+
 
 def _anonymous_session(client, monkeypatch):
     _open(client)
@@ -999,20 +1418,18 @@ class TestIdentityBusy:
         stored = app_module.session_store.get(token)
         save_dir = stored.session.save_manager.save_dir
 
-        import threading
-
         # Events rather than sleeps: the create must happen while the turn is
         # genuinely in flight, and a timing guess would make that either flaky
         # or silently trivial on a slow machine.
-        turn_started = threading.Event()
-        may_finish = threading.Event()
+        turn_started = asyncio.Event()
+        may_finish = asyncio.Event()
 
-        def _slow_turn(text):
+        async def _slow_turn(text):
             turn_started.set()
-            may_finish.wait(timeout=5)
+            await asyncio.wait_for(may_finish.wait(), timeout=5)
             return RenderFrame(lines=["a slow turn"])
 
-        stored.session.handle_input = _slow_turn
+        stored.session.handle_input_async = _slow_turn
 
         async def _turn_then_create():
             transport = httpx.ASGITransport(app=app)
@@ -1026,10 +1443,8 @@ class TestIdentityBusy:
                         headers={"authorization": f"Bearer {token}"},
                     )
                 )
-                await asyncio.get_running_loop().run_in_executor(
-                    None, turn_started.wait, 5
-                )
-                assert turn_started.is_set(), "turn never reached the executor"
+                await asyncio.wait_for(turn_started.wait(), timeout=5)
+                assert turn_started.is_set(), "turn never started"
                 create = await ac.post("/session", json={"client_id": client_id})
                 may_finish.set()
                 return await turn, create
@@ -1138,6 +1553,7 @@ class TestPruningDoesNotEatTheSessionItIsOpening:
         _age(save_dir, days=31)
 
         token, _ = _open(client, client_id=client_id)
+        app_module._save_prune_pass.result()
 
         assert save_dir.exists()
         assert stale.exists()
@@ -1155,5 +1571,6 @@ class TestPruningDoesNotEatTheSessionItIsOpening:
 
         # Someone else opens a session; the abandoned dir is not theirs.
         _open(client, client_id="g" * 32)
+        app_module._save_prune_pass.result()
 
         assert not abandoned.exists()
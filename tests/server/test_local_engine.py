@@ -7,6 +7,7 @@ import json
 import pytest
 
 from game.persistence import SaveManager
+from server import local_engine
 from server.local_engine import InvalidSnapshot, LocalEngine, TurnMismatch
 from server.protocol import SessionPhase
 from server.session import WebGameSession
@@ -93,6 +94,7 @@ def test_intro_phase_and_first_turn_sequence_must_coincide(
     _, local = _paired_run(tmp_path)
     if advance_intro:
         local.send(1, _turn("keypress"))
+    local.persist()
     path = local._checkpoint_path(local.run_id)
     snapshot = json.loads(path.read_text(encoding="utf-8"))
     snapshot["session"]["phase"] = replacement_phase.name
@@ -147,14 +149,20 @@ def test_replay_retries_a_checkpoint_that_failed_after_turn_completion(
     original_checkpoint = local._checkpoint
     attempts = 0
 
-    def fail_once():
+    def fail_journal():
+        nonlocal attempts
+        attempts += 1
+        raise OSError("storage temporarily unavailable")
+
+    def checkpoint():
         nonlocal attempts
         attempts += 1
-        if attempts == 1:
-            raise OSError("storage temporarily unavailable")
         original_checkpoint()
 
-    monkeypatch.setattr(local, "_checkpoint", fail_once)
+    # The turn's journal line fails; the replay makes it durable by a full
+    # checkpoint instead.
+    monkeypatch.setattr(local, "_record_turn", fail_journal)
+    monkeypatch.setattr(local, "_checkpoint", checkpoint)
     request = json.dumps(
         {"operation": "send", "turn_id": 1, "turn": _turn("keypress")}
     )
@@ -175,6 +183,107 @@ def test_replay_retries_a_checkpoint_that_failed_after_turn_completion(
     assert restored.last_completed["frame"] == replayed["frame"]
 
 
+def _journal(local):
+    return local._journal_path(local.run_id)
+
+
+def test_a_turn_appends_one_journal_line_with_one_fsync(tmp_path, monkeypatch):
+    _, local = _paired_run(tmp_path)
+    checkpoint = local._checkpoint_path(local.run_id).read_bytes()
+    fsyncs = []
+    monkeypatch.setattr(local_engine.os, "fsync", fsyncs.append)
+
+    local.send(1, _turn("keypress"))
+    local.send(2, _turn("input", "look"))
+
+    assert len(fsyncs) == 3  # one per line, plus the directory on creation
+    assert local._checkpoint_path(local.run_id).read_bytes() == checkpoint
+    records = [json.loads(line) for line in _journal(local).read_text().splitlines()]
+    assert [record["turn_id"] for record in records] == [1, 2]
+    assert records[1]["turn"] == _turn("input", "look")
+    # Only what the turn changed is written.
+    assert "cutscenes" not in records[1]["delta"]["game_state"]
+
+
+def test_restore_replays_the_journal_over_the_checkpoint(tmp_path):
+    direct, local = _paired_run(tmp_path)
+    for turn_id, (payload, text) in enumerate(
+        [(_turn("keypress"), ""), (_turn("input", "north"), "north")], start=1
+    ):
+        assert local.send(turn_id, payload)["frame"] == direct.handle_input(text).to_dict()
+
+    restored = LocalEngine(tmp_path / "local")
+    restored.adopt(local.resume_handle)
+
+    assert restored.next_turn_id == 3
+    assert restored.last_completed == local.last_completed
+    assert restored._snapshot() == local._snapshot()
+    assert restored.send(2, _turn("input", "north")) == local.send(2, _turn("input", "north"))
+    with pytest.raises(TurnMismatch, match="already used"):
+        restored.send(2, _turn("input", "look"))
+
+
+def test_the_journal_is_compacted_into_the_checkpoint(tmp_path, monkeypatch):
+    monkeypatch.setattr(local_engine, "JOURNAL_COMPACT_TURNS", 2)
+    _, local = _paired_run(tmp_path)
+    local.send(1, _turn("keypress"))
+    local.send(2, _turn("input", "look"))
+    assert len(_journal(local).read_text().splitlines()) == 2
+
+    local.send(3, _turn("input", "look"))
+
+    assert not _journal(local).exists()
+    snapshot = json.loads(local._checkpoint_path(local.run_id).read_text())
+    assert snapshot["next_turn_id"] == 4
+    assert snapshot["last_completed"]["turn_id"] == 3
+
+
+def test_lines_the_checkpoint_already_covers_are_skipped(tmp_path):
+    """A crash between the compacting checkpoint and the journal's removal."""
+    _, local = _paired_run(tmp_path)
+    local.send(1, _turn("keypress"))
+    local.send(2, _turn("input", "look"))
+    leftover = _journal(local).read_bytes()
+    local.persist()
+    _journal(local).write_bytes(leftover)
+
+    restored = LocalEngine(tmp_path / "local")
+    restored.adopt(local.resume_handle)
+
+    assert restored._snapshot() == local._snapshot()
+
+
+def test_a_torn_final_line_is_dropped_and_compacted_away(tmp_path):
+    _, local = _paired_run(tmp_path)
+    local.send(1, _turn("keypress"))
+    handle = local.resume_handle
+    with _journal(local).open("a", encoding="utf-8") as stream:
+        stream.write('{"turn_id":2,"tu')
+
+    restored = LocalEngine(tmp_path / "local")
+    restored.adopt(handle)
+    assert restored.next_turn_id == 2
+    restored.send(2, _turn("input", "look"))
+
+    assert not _journal(restored).exists()
+    again = LocalEngine(tmp_path / "local")
+    again.adopt(restored.resume_handle)
+    assert again.next_turn_id == 3
+
+
+def test_a_corrupt_journal_line_is_not_partially_restored(tmp_path):
+    _, local = _paired_run(tmp_path)
+    local.send(1, _turn("keypress"))
+    local.send(2, _turn("input", "look"))
+    lines = _journal(local).read_text().splitlines()
+    _journal(local).write_text("not json\n" + lines[1] + "\n")
+
+    restored = LocalEngine(tmp_path / "local")
+    with pytest.raises(InvalidSnapshot, match="journal is corrupt"):
+        restored.adopt(local.resume_handle)
+    assert restored.session is None
+
+
 def test_reused_turn_id_with_another_body_fails_closed(tmp_path):
     _, local = _paired_run(tmp_path)
     local.send(1, _turn("keypress"))
@@ -209,6 +318,7 @@ def test_sparse_nested_game_state_is_rejected_instead_of_default_filled(tmp_path
     _, local = _paired_run(tmp_path)
     local.send(1, _turn("keypress"))
     local.send(2, _turn("input", "load act4_night"))
+    local.persist()
     path = local._checkpoint_path(local.run_id)
     snapshot = json.loads(path.read_text(encoding="utf-8"))
     snapshot["game_state"] = {}
@@ -258,6 +368,7 @@ def test_impossible_player_stats_in_checkpoint_are_rejected(tmp_path, field, val
     _, local = _paired_run(tmp_path)
     local.send(1, _turn("keypress"))
     local.send(2, _turn("input", "load act4_night"))
+    local.persist()
     path = local._checkpoint_path(local.run_id)
     snapshot = json.loads(path.read_text(encoding="utf-8"))
     snapshot["game_state"]["player"][field] = value
@@ -271,6 +382,7 @@ def test_duplicate_anomaly_ids_in_checkpoint_are_rejected(tmp_path):
     _, local = _paired_run(tmp_path)
     local.send(1, _turn("keypress"))
     local.send(2, _turn("input", "load act4_night"))
+    local.persist()
     path = local._checkpoint_path(local.run_id)
     snapshot = json.loads(path.read_text(encoding="utf-8"))
     entries = snapshot["game_state"]["world_state"]["wrongness"]["entries"]
@@ -294,6 +406,7 @@ def test_noncanonical_wrongness_entries_dispatch_as_lost(tmp_path, field, value)
     _, local = _paired_run(tmp_path)
     local.send(1, _turn("keypress"))
     local.send(2, _turn("input", "load act4_night"))
+    local.persist()
     path = local._checkpoint_path(local.run_id)
     snapshot = json.loads(path.read_text(encoding="utf-8"))
     entries = snapshot["game_state"]["world_state"]["wrongness"]["entries"]
@@ -386,7 +499,7 @@ def test_open_prunes_every_other_checkpoint_from_the_sandbox(tmp_path):
     local.send(1, _turn("keypress"))
     stray = runs_dir / "abandoned.deadbeef.tmp"
     stray.write_text("{}", encoding="utf-8")
-    assert len(list(runs_dir.iterdir())) == 2
+    assert len(list(runs_dir.iterdir())) == 3
 
     reopened = LocalEngine(tmp_path / "local")
     reopened.open()
@@ -1,6 +1,6 @@
 """Tests for protocol types."""
 
-from server.protocol import RenderFrame
+from server.protocol import BatchFrame, RenderFrame, wants_batched_overlays
 
 
 class TestRenderFrame:
@@ -34,3 +34,26 @@ class TestRenderFrame:
             "wait_for_key": True,
             "game_over": True,
         }
+
+
+class TestBatchFrame:
+    def test_to_dict_nests_frames_in_order(self):
+        batch = BatchFrame([
+            RenderFrame(lines=["scene"], wait_for_key=True),
+            RenderFrame(lines=["room"], prompt="> "),
+        ])
+
+        assert batch.to_dict() == {
+            "type": "batch",
+            "frames": [
+                {"type": "render", "lines": ["scene"], "wait_for_key": True},
+                {"type": "render", "lines": ["room"], "prompt": "> "},
+            ],
+        }
+        assert batch.game_over is False
+
+    def test_opt_in_must_be_exactly_true(self):
+        assert wants_batched_overlays({"type": "keypress", "batch_overlays": True})
+        assert not wants_batched_overlays({"type": "keypress", "batch_overlays": 1})
+        assert not wants_batched_overlays({"type": "keypress"})
+        assert not wants_batched_overlays(["batch_overlays"])
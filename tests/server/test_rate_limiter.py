@@ -1,5 +1,7 @@
 """Tests for the rate limiter."""
 
+import asyncio
+import threading
 import time
 from unittest.mock import patch
 
@@ -51,6 +53,14 @@ class TestRateLimiter:
         rl.release_connection("1.1.1.1")
         assert rl.active_sessions == 0
 
+    def test_admission_checks_and_records_in_one_call(self):
+        rl = RateLimiter(max_connections_per_min=5, max_sessions=1, max_messages_per_min=1)
+        assert rl.admit_connection("1.1.1.1") is True
+        assert rl.admit_connection("2.2.2.2") is False
+        assert rl.active_sessions == 1
+        assert rl.admit_message("1.1.1.1") is True
+        assert rl.admit_message("1.1.1.1") is False
+
     def test_release_does_not_go_negative(self):
         rl = RateLimiter()
         rl.release_connection("1.1.1.1")
@@ -91,3 +101,113 @@ class TestBucketEviction:
             clock.return_value = 125.0
             rl.can_connect("9.9.9.9")
             assert rl.can_send_message("1.2.3.4") is False
+
+    def test_window_slides_from_the_oldest_event(self):
+        with patch("server.rate_limiter.time.monotonic") as clock:
+            clock.return_value = 0.0
+            rl = RateLimiter(max_messages_per_min=2)
+            rl.register_message("1.2.3.4")
+            clock.return_value = 30.0
+            rl.register_message("1.2.3.4")
+
+            clock.return_value = 59.0
+            assert rl.can_send_message("1.2.3.4") is False
+            clock.return_value = 60.5
+            assert rl.can_send_message("1.2.3.4") is True
+            rl.register_message("1.2.3.4")
+            assert rl.can_send_message("1.2.3.4") is False
+
+    def test_buckets_expire_a_second_at_a_time(self):
+        with patch("server.rate_limiter.time.monotonic") as clock:
+            clock.return_value = 0.0
+            rl = RateLimiter()
+            for n in range(10):
+                clock.return_value = float(n)
+                rl.register_message(f"10.0.0.{n}")
+
+            clock.return_value = 65.5
+            rl.can_send_message("9.9.9.9")
+            assert sorted(rl._buckets) == [f"10.0.0.{n}" for n in range(5, 10)]
+            assert "9.9.9.9" not in rl._buckets
+
+
+class TestSharedCounters:
+    def test_limits_hold_across_workers(self, tmp_path):
+        from server.shared_state import SQLiteRateCounters
+
+        path = tmp_path / "state.sqlite3"
+        one = RateLimiter(max_messages_per_min=2, shared=SQLiteRateCounters(path))
+        two = RateLimiter(max_messages_per_min=2, shared=SQLiteRateCounters(path))
+        one.register_message("1.2.3.4")
+        two.register_message("1.2.3.4")
+        assert one.can_send_message("1.2.3.4") is False
+        assert two.can_send_message("5.6.7.8") is True
+
+    def test_the_session_cap_is_global(self, tmp_path):
+        from server.shared_state import SQLiteRateCounters
+
+        path = tmp_path / "state.sqlite3"
+        one = RateLimiter(max_sessions=1, shared=SQLiteRateCounters(path))
+        two = RateLimiter(max_sessions=1, shared=SQLiteRateCounters(path))
+        one.register_connection("1.1.1.1")
+        assert two.can_connect("2.2.2.2") is False
+        two.release_connection("1.1.1.1")
+        assert one.active_sessions == 0
+
+    def test_admission_is_one_transaction(self, tmp_path):
+        from server.shared_state import SQLiteRateCounters
+
+        path = tmp_path / "state.sqlite3"
+        workers = [
+            RateLimiter(
+                max_sessions=3,
+                max_connections_per_min=100,
+                shared=SQLiteRateCounters(path),
+            )
+            for _ in range(8)
+        ]
+        admitted = []
+
+        def connect(rl):
+            admitted.append(rl.admit_connection("1.1.1.1"))
+
+        threads = [threading.Thread(target=connect, args=(rl,)) for rl in workers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert admitted.count(True) == 3
+        assert workers[0].active_sessions == 3
+
+    def test_async_admission_reads_the_file_off_the_loop(self, tmp_path):
+        from server.shared_state import SQLiteRateCounters
+
+        counters = SQLiteRateCounters(tmp_path / "state.sqlite3")
+        rl = RateLimiter(shared=counters)
+        on_main = []
+        real = counters.admit
+
+        def spy(*args, **kwargs):
+            on_main.append(threading.current_thread() is threading.main_thread())
+            return real(*args, **kwargs)
+
+        counters.admit = spy
+
+        async def scenario():
+            assert await rl.admit_connection_async("1.1.1.1") is True
+            assert await rl.admit_message_async("1.1.1.1") is True
+
+        asyncio.run(scenario())
+        assert on_main == [False, False]
+        assert rl.last_active_sessions == 1
+
+    def test_the_reported_count_catches_up_at_the_sweep(self, tmp_path):
+        from server.shared_state import SQLiteRateCounters
+
+        path = tmp_path / "state.sqlite3"
+        one = RateLimiter(shared=SQLiteRateCounters(path))
+        two = RateLimiter(shared=SQLiteRateCounters(path))
+        one.admit_connection("1.1.1.1")
+        assert two.last_active_sessions == 0
+        asyncio.run(two.sweep_async())
+        assert two.last_active_sessions == 1
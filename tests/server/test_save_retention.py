@@ -0,0 +1,44 @@
+"""Tests for the durable save retention index (server.save_retention)."""
+
+import pytest
+
+from server.save_retention import RetentionIndex
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = RetentionIndex(tmp_path / "retention.sqlite3")
+    yield index
+    index.close()
+
+
+class TestRetentionIndex:
+    def test_a_touch_never_moves_backwards(self, index):
+        index.touch("a", 200.0)
+        index.touch("a", 100.0)
+        assert index.touched_before(150.0) == []
+        assert index.touched_before(250.0) == ["a"]
+
+    def test_candidates_come_oldest_first(self, index):
+        index.touch("new", 30.0)
+        index.touch("old", 10.0)
+        index.touch("fresh", 100.0)
+        assert index.touched_before(50.0) == ["old", "new"]
+
+    def test_a_claim_loses_to_a_touch_since_the_query(self, index):
+        index.touch("a", 10.0)
+        assert index.touched_before(50.0) == ["a"]
+        index.touch("a", 60.0)
+        assert index.claim("a", 50.0) is False
+        assert len(index) == 1
+
+    def test_a_claim_removes_the_entry(self, index):
+        index.touch("a", 10.0)
+        assert index.claim("a", 50.0) is True
+        assert len(index) == 0
+
+    def test_seeding_marks_the_index_complete(self, index):
+        assert not index.seeded()
+        index.seed([("a", 10.0), ("b", 20.0)])
+        assert index.seeded()
+        assert len(index) == 2
@@ -0,0 +1,177 @@
+"""Tests for the group-commit save writer."""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from game.persistence import SaveManager
+from server import save_writer as save_writer_module
+from server.save_writer import SaveWriter
+
+
+@pytest.fixture
+def held(monkeypatch):
+    """Hold the writer inside its first batch until the event is set."""
+    release = threading.Event()
+    entered = threading.Event()
+    real_sync = save_writer_module._sync
+
+    def sync(paths):
+        entered.set()
+        assert release.wait(5)
+        real_sync(paths)
+
+    monkeypatch.setattr(save_writer_module, "_sync", sync)
+    yield entered, release
+    release.set()
+
+
+def test_a_write_resolves_once_it_is_in_place(tmp_path):
+    writer = SaveWriter()
+    path = tmp_path / "slot.json"
+
+    assert writer.submit(path, b"{}").result(timeout=5) == path
+    assert path.read_bytes() == b"{}"
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_writes_queued_behind_a_batch_commit_together(tmp_path, held):
+    entered, release = held
+    writer = SaveWriter()
+    first = writer.submit(tmp_path / "first.json", b"1")
+    assert entered.wait(5)
+    later = [writer.submit(tmp_path / f"{n}.json", b"2") for n in range(3)]
+    release.set()
+
+    for future in [first, *later]:
+        future.result(timeout=5)
+    stats = writer.stats()
+    assert stats["batches"] == 2
+    assert stats["last_batch"] == 3
+    assert stats["largest_batch"] == 3
+
+
+def test_a_slot_saved_twice_while_queued_is_written_once(tmp_path, held):
+    entered, release = held
+    writer = SaveWriter()
+    writer.submit(tmp_path / "other.json", b"x")
+    assert entered.wait(5)
+    path = tmp_path / "slot.json"
+    older = writer.submit(path, b"old")
+    newer = writer.submit(path, b"new")
+    release.set()
+
+    assert older.result(timeout=5) == newer.result(timeout=5) == path
+    assert path.read_bytes() == b"new"
+    assert writer.stats()["coalesced"] == 1
+
+
+def test_a_failed_write_fails_only_its_own_future(tmp_path):
+    writer = SaveWriter()
+    bad = writer.submit(tmp_path / "missing" / "slot.json", b"{}")
+    good = writer.submit(tmp_path / "slot.json", b"{}")
+
+    with pytest.raises(OSError):
+        bad.result(timeout=5)
+    assert good.result(timeout=5) == tmp_path / "slot.json"
+    assert writer.stats()["failed"] == 1
+
+
+def test_flush_waits_for_everything_queued(tmp_path):
+    writer = SaveWriter()
+    futures = [writer.submit(tmp_path / f"{n}.json", b"{}") for n in range(20)]
+
+    assert writer.flush(timeout=5)
+    assert all(future.done() for future in futures)
+
+
+class TestSaveManagerWithAWriter:
+    @pytest.fixture
+    def manager(self, tmp_path):
+        manager = SaveManager(save_dir=tmp_path / "saves")
+        manager.writer = SaveWriter()
+        return manager
+
+    def _state(self, health=100):
+        state = type("State", (), {})()
+        state.to_dict = lambda: {
+            "player": {"health": health, "fear": 0},
+            "map": {"current_room_id": "cabin"},
+        }
+        return state
+
+    def test_a_load_straight_after_a_save_sees_it(self, manager, held):
+        entered, release = held
+        manager.save_game(self._state(health=40), "slot")
+        assert entered.wait(5)
+        threading.Timer(0.05, release.set).start()
+
+        assert manager.load_game("slot")["player"]["health"] == 40
+
+    def test_the_manifest_is_written_after_the_slot(self, manager):
+        manager.save_game(self._state(), "slot")
+        manager.pending_write.result(timeout=5)
+
+        manifest = json.loads((manager.save_dir / "slots.manifest").read_text())
+        assert manifest["slots"]["slot"]["valid"] is True
+        assert [s.slot_name for s in manager.list_saves()] == ["slot"]
+
+    def test_a_save_is_not_skipped_while_another_is_queued(self, manager, held):
+        entered, release = held
+        release.set()
+        manager.save_game(self._state(health=100), "slot")
+        manager.pending_write.result(timeout=5)
+
+        release.clear()
+        entered.clear()
+        manager.save_game(self._state(health=40), "slot")
+        assert entered.wait(5)
+        # The slot on disk still holds this state, but the queued write is
+        # about to replace it.
+        manager.save_game(self._state(health=100), "slot")
+        release.set()
+
+        assert manager.load_game("slot")["player"]["health"] == 100
+
+    def test_settle_waits_without_blocking_the_loop(self, manager, held):
+        entered, release = held
+        manager.save_game(self._state(health=40), "slot")
+        assert entered.wait(5)
+        backstop = threading.Timer(2, release.set)
+        backstop.start()
+
+        async def scenario():
+            settling = asyncio.create_task(manager.settle())
+            await asyncio.sleep(0.05)
+            assert not settling.done()
+            release.set()
+            await asyncio.wait_for(settling, 5)
+
+        try:
+            asyncio.run(scenario())
+        finally:
+            backstop.cancel()
+        assert manager.pending_write.done()
+
+    def test_a_cancelled_settle_leaves_the_write_queued(self, manager, held):
+        entered, release = held
+        manager.save_game(self._state(health=40), "slot")
+        assert entered.wait(5)
+
+        async def scenario():
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(manager.settle(), 0.01)
+
+        asyncio.run(scenario())
+        release.set()
+        assert manager.pending_write.result(timeout=5) == manager.save_dir / "slot.json"
+
+    def test_the_writer_records_under_the_manifest_lock(self, manager):
+        with manager._manifest_lock:
+            manager.save_game(self._state(), "slot")
+            with pytest.raises(TimeoutError):
+                manager.pending_write.result(timeout=0.1)
+        manager.pending_write.result(timeout=5)
+        assert [s.slot_name for s in manager.list_saves()] == ["slot"]
@@ -1,5 +1,8 @@
 """Tests for WebGameSession — works without OpenAI API key via rule-based fallback."""
 
+import asyncio
+import threading
+
 import pytest
 from unittest.mock import patch
 from server.session import WebGameSession
@@ -109,6 +112,43 @@ class TestSaveLoad:
 
         assert first.save_manager.save_dir != second.save_manager.save_dir
 
+    def test_save_reads_await_the_queued_write_first(self, session, tmp_path):
+        session.save_manager = session.save_manager.__class__(save_dir=tmp_path / "saves")
+        settled = []
+
+        async def settle():
+            settled.append(True)
+
+        session.save_manager.settle = settle
+
+        async def _play(text):
+            await session.handle_input_async(text)
+            return len(settled)
+
+        assert asyncio.run(_play("save slot")) == 0
+        assert asyncio.run(_play("saves")) == 1
+        assert asyncio.run(_play("load slot")) == 2
+        assert asyncio.run(_play("delete save slot")) == 3
+
+
+    def test_save_commands_run_off_the_loop(self, session, tmp_path):
+        session.save_manager = session.save_manager.__class__(save_dir=tmp_path / "saves")
+        threads = []
+        for name in ("save_game", "load_game", "list_saves", "delete_save"):
+            real = getattr(session.save_manager, name)
+
+            def spy(*args, _real=real, **kwargs):
+                threads.append(threading.current_thread() is threading.main_thread())
+                return _real(*args, **kwargs)
+
+            setattr(session.save_manager, name, spy)
+
+        async def _play():
+            for text in ("save slot", "saves", "load slot", "delete save slot"):
+                await session.handle_input_async(text)
+
+        asyncio.run(_play())
+        assert threads and not any(threads)
 
 class TestQuestOverlay:
     @pytest.fixture
@@ -134,6 +174,13 @@ class TestQuestOverlay:
         assert session.phase == SessionPhase.OVERLAY_KEYPRESS
         assert frame.wait_for_key is True
 
+    def test_opening_an_overlay_asks_for_a_model_warm_up(self, session):
+        with patch("server.session.schedule_warm_up") as warm_up:
+            asyncio.run(session.handle_input_async("quest"))
+            assert warm_up.call_count == 1
+            asyncio.run(session.handle_input_async(""))  # dismissed
+            assert warm_up.call_count == 1
+
 
 class TestRoomTransitions:
     @pytest.fixture
@@ -199,6 +246,42 @@ class TestCutsceneIntegration:
         assert session.map.current_room.id == "cabin_main"
 
 
+class TestBatchedOverlays:
+    """A batch is exactly the frames paging key by key would have shown."""
+
+    def test_batch_matches_paging_one_keypress_at_a_time(self):
+        paged = WebGameSession()
+        batched = WebGameSession()
+        for session in (paged, batched):
+            session.handle_input("")
+            session.handle_input("north")
+
+        first = paged.handle_input("cabin")
+        expected = [first]
+        while paged.phase == SessionPhase.OVERLAY_KEYPRESS:
+            expected.append(paged.handle_input(""))
+
+        batch = batched.batch_overlays(batched.handle_input("cabin"))
+        assert [f.to_dict() for f in batch.frames] == [f.to_dict() for f in expected]
+        assert len(batch.frames) == 3
+        assert batch.frames[-1].prompt == "> "
+        assert batched.phase == SessionPhase.AWAITING_INPUT
+        assert batched.handle_input("look").to_dict() == paged.handle_input("look").to_dict()
+
+    def test_a_frame_with_nothing_to_page_is_returned_as_is(self):
+        session = WebGameSession()
+        session.handle_input("")
+        frame = session.handle_input("look")
+        assert session.batch_overlays(frame) is frame
+
+    def test_a_late_keypress_after_a_batch_is_not_a_turn(self):
+        session = WebGameSession()
+        session.handle_input("")
+        session.batch_overlays(session.handle_input("map"))
+        assert session.handle_input("").lines == []
+        assert session.phase == SessionPhase.AWAITING_INPUT
+
+
 class TestOverlaysQueuedOnTheClosingTurn:
     """A run that ends on the same turn as a scripted scene must still show it.
 
@@ -314,3 +397,89 @@ class TestAIContext:
         context = session._build_ai_context()
 
         assert context["exits"] == ["out"]
+
+
+class TestAsyncTurnPath:
+    """``handle_input_async`` is the server's path; it must not drift."""
+
+    SCRIPT = [
+        "",
+        "look",
+        "north",
+        "map",
+        "",
+        "cabin",
+        "",
+        "",
+        "quests",
+        "",
+        "listen",
+        "   ",
+        "sing to the trees",
+    ]
+
+    def test_frames_match_the_blocking_path(self):
+        blocking = WebGameSession()
+        awaited = WebGameSession()
+
+        async def _play():
+            return [await awaited.handle_input_async(text) for text in self.SCRIPT]
+
+        expected = [blocking.handle_input(text) for text in self.SCRIPT]
+        actual = asyncio.run(_play())
+
+        assert [f.to_dict() for f in actual] == [f.to_dict() for f in expected]
+        assert awaited.phase == blocking.phase
+        assert awaited.map.current_room_id == blocking.map.current_room_id
+
+
+class TestNeedsInterpreter:
+    """Servers answer local turns inline; the classification must be exact."""
+
+    SCRIPT = TestAsyncTurnPath.SCRIPT + [
+        "saves", "save slot", "load slot", "delete save slot", "delete the rope",
+    ]
+
+    def test_classification_matches_what_the_turn_does(self, tmp_path):
+        session = WebGameSession()
+        session.save_manager = session.save_manager.__class__(save_dir=tmp_path / "saves")
+        reached = []
+
+        async def _take_turn(text, **kwargs):
+            reached.append(text)
+
+        async def _play():
+            for text in self.SCRIPT:
+                expected = session.needs_interpreter(text)
+                before = len(reached)
+                await session.handle_input_async(text)
+                if not expected:
+                    assert len(reached) == before, text
+
+        with patch("server.session.take_turn_async", _take_turn):
+            asyncio.run(_play())
+        assert reached == [
+            "look", "north", "cabin", "listen", "sing to the trees", "delete the rope",
+        ]
+
+    def test_save_writes_queue_for_a_slot(self, tmp_path):
+        session = WebGameSession()
+        session.save_manager = session.save_manager.__class__(save_dir=tmp_path / "saves")
+        session.handle_input("")
+        assert session.needs_interpreter("saves") is False
+        assert session.needs_interpreter("save slot") is True
+        assert session.needs_interpreter("load slot") is True
+        assert session.needs_interpreter("delete save slot") is True
+
+    def test_keypress_phases_never_need_it(self):
+        session = WebGameSession()
+        assert session.needs_interpreter("look") is False
+        session.phase = SessionPhase.ENDED
+        assert session.needs_interpreter("look") is False
+
+    def test_classifying_changes_nothing(self):
+        session = WebGameSession()
+        session.handle_input("")
+        session.needs_interpreter("map")
+        assert session.phase == SessionPhase.AWAITING_INPUT
+        assert session._pending_overlays == []
@@ -1,15 +1,21 @@
 """Unit tests for the token-keyed session store and save retention."""
 
+import asyncio
 import os
+import threading
 import time
 from pathlib import Path
 
 import pytest
 
 from server import session_store as store_module
+from server.local_engine import session_snapshot
+from server.session import WebGameSession
+from server.shared_state import SQLiteSessionBackend
 from server.session_store import (
     SessionStore,
     durable_save_dir,
+    hibernate_after_seconds,
     is_valid_client_id,
     prune_expired_saves,
 )
@@ -126,7 +132,7 @@ class TestExpiry:
         store = _store(idle_timeout=60)
         stale = store.create(ip="1.2.3.4", session=_StubSession(tmp_path / "one"))
         fresh = store.create(ip="1.2.3.4", session=_StubSession(tmp_path / "two"))
-        stale.last_activity = time.monotonic() - 3600
+        store.touch(stale, time.monotonic() - 3600)
 
         assert store.sweep() == [stale]
         assert store.get(fresh.token) is fresh
@@ -154,6 +160,38 @@ class TestExpiry:
         assert store.get(stored.token) is None
         assert not save_dir.exists()
 
+    def test_a_session_kept_by_a_turn_is_swept_once_it_lands(self, tmp_path):
+        store = _store(idle_timeout=60)
+        stored = store.create(ip="1.2.3.4", session=_StubSession(tmp_path / "one"))
+        store.touch(stored, time.monotonic() - 3600)
+        stored.in_flight = 1
+        assert store.sweep() == []
+
+        stored.in_flight = 0
+        assert store.sweep() == [stored]
+
+    def test_the_idle_heap_stays_near_the_store_size(self, tmp_path):
+        store = _store()
+        stored = store.create(ip="1.2.3.4", session=_StubSession(tmp_path / "one"))
+        for n in range(500):
+            store.touch(stored, stored.last_activity - 1)
+            extra = store.create(ip="1.2.3.4", session=_StubSession(tmp_path / f"s{n}"))
+            store.release(extra.token)
+        assert len(store._idle) <= 2 * len(store) + 65
+
+    def test_expired_terminal_replays_are_dropped(self, tmp_path):
+        store = _store(idle_timeout=0)
+        stored = store.create(ip="1.2.3.4", session=_StubSession(tmp_path / "one"))
+        stored.last_turn_id = 1
+        stored.last_turn_type = "input"
+        stored.last_turn_text = "look"
+        stored.last_turn_frame = {"type": "render"}
+        store.release(stored.token, preserve_terminal_replay=True)
+
+        store.sweep()
+        assert store.terminal_replay(stored.token) is None
+        assert store._terminal_replays == {}
+
 
 class TestIdentityExclusivity:
     def test_a_second_session_retires_the_first(self, tmp_path):
@@ -170,6 +208,18 @@ class TestIdentityExclusivity:
         assert store.get(second.token) is second
         assert len(store) == 1
 
+    def test_a_released_identity_starts_clean(self, tmp_path):
+        released = []
+        store = _store(on_release=released.append)
+        first = store.create(
+            ip="1.2.3.4", client_id="k" * 32, session=_StubSession(tmp_path / "one")
+        )
+        store.release(first.token)
+        store.create(
+            ip="1.2.3.4", client_id="k" * 32, session=_StubSession(tmp_path / "two")
+        )
+        assert released == [first]
+
     def test_different_identities_coexist(self, tmp_path):
         store = _store()
         first = store.create(
@@ -315,6 +365,50 @@ class TestSaveRetention:
         assert prune_expired_saves() == []
         assert stray.exists()
 
+    def test_after_seeding_only_indexed_dirs_are_looked_at(self, monkeypatch):
+        monkeypatch.setenv("CABIN_SAVE_RETENTION_DAYS", "30")
+        self._make_client_dir("s" * 20, age_seconds=1)
+        assert prune_expired_saves() == []
+
+        unindexed = self._make_client_dir("u" * 20, age_seconds=40 * 86400)
+        assert prune_expired_saves() == []
+        assert unindexed.exists()
+
+    def test_a_save_since_indexing_keeps_the_dir(self, monkeypatch):
+        monkeypatch.setenv("CABIN_SAVE_RETENTION_DAYS", "30")
+        path = self._make_client_dir("r" * 20, age_seconds=40 * 86400)
+        store_module.retention_index(Path(os.environ["CABIN_SAVE_ROOT"])).seed(
+            [(path.name, time.time() - 40 * 86400)]
+        )
+        (path / "recent.json").write_text("{}")
+        assert prune_expired_saves() == []
+        assert path.exists()
+
+    def test_sessions_index_their_saves(self, monkeypatch):
+        monkeypatch.setenv("CABIN_SAVE_RETENTION_DAYS", "30")
+        stored = _store().create(ip="1.2.3.4", client_id="w" * 32)
+        index = store_module.retention_index(Path(os.environ["CABIN_SAVE_ROOT"]))
+        name = stored.session.save_manager.save_dir.name
+        assert index.touched_before(time.time() + 1) == [name]
+
+        index.claim(name, time.time() + 1)
+        stored.session.handle_input("")
+        stored.session.handle_input("save")
+        assert index.touched_before(time.time() + 1) == [name]
+
+    def test_async_creation_indexes_off_the_loop(self, monkeypatch):
+        on_main = []
+        real = store_module._touch_durable_dir
+
+        def spy(save_dir):
+            on_main.append(threading.current_thread() is threading.main_thread())
+            real(save_dir)
+
+        monkeypatch.setattr(store_module, "_touch_durable_dir", spy)
+        store = _store()
+        asyncio.run(store.create_async(ip="1.2.3.4", client_id="t" * 32))
+        assert on_main == [False]
+
     def test_latest_mtime_reports_now_when_stat_fails(self, tmp_path):
         """A stat failure must never be mistaken for staleness."""
         missing = tmp_path / "gone"
@@ -341,3 +435,555 @@ class TestCreateValidatesIdentity:
         store = SessionStore(idle_timeout=60)
         stored = store.create(ip="1.2.3.4", client_id="a" * 32)
         assert stored.durable
+
+
+class TestHibernation:
+    """Hibernation needs a real session: the stub has no state to snapshot."""
+
+    def _idle_session(self, store, **kwargs):
+        stored = store.create(ip="1.2.3.4", **kwargs)
+        stored.session.handle_input("")  # past the intro
+        stored.session.handle_input("look")
+        store.touch(stored, time.monotonic() - 120)
+        return stored
+
+    def test_idle_sessions_move_to_disk(self):
+        hibernated = []
+        store = _store(hibernate_after=60, on_hibernate=hibernated.append)
+        stored = self._idle_session(store)
+        busy = store.create(ip="1.2.3.4")
+
+        assert store.hibernate_idle() == [stored]
+        assert hibernated == [stored]
+        assert len(store) == 1
+        assert store.hibernated_count == 1
+        assert list(store_module._hibernation_dir().iterdir())
+        assert store.get(busy.token) is busy
+
+    def test_rehydration_restores_the_run_under_the_same_token(self):
+        rehydrated = []
+        store = _store(hibernate_after=60, on_rehydrate=rehydrated.append)
+        stored = self._idle_session(store)
+        stored.last_turn_id = 2
+        stored.last_turn_type = "input"
+        stored.last_turn_text = "look"
+        stored.last_turn_frame = {"type": "render", "lines": ["x"]}
+        before = session_snapshot(stored.session)
+        save_dir = stored.session.save_manager.save_dir
+        store.hibernate_idle()
+
+        back = store.get(stored.token)
+        assert back is not None and back is not stored
+        assert rehydrated == [back]
+        assert session_snapshot(back.session) == before
+        assert back.session.save_manager.save_dir == save_dir
+        assert (back.last_turn_id, back.last_turn_text) == (2, "look")
+        assert back.last_turn_frame == {"type": "render", "lines": ["x"]}
+        assert len(store) == 1
+        assert store.hibernated_count == 0
+        assert not list(store_module._hibernation_dir().iterdir())
+
+    def test_mid_turn_sessions_stay_resident(self):
+        store = _store(hibernate_after=60)
+        stored = self._idle_session(store)
+        stored.in_flight = 1
+        assert store.hibernate_idle() == []
+        assert store.get(stored.token) is stored
+
+    def test_zero_threshold_keeps_everything_resident(self):
+        store = _store(hibernate_after=0)
+        self._idle_session(store)
+        assert store.hibernate_idle() == []
+        assert len(store) == 1
+
+    def test_hibernated_sessions_still_expire(self):
+        released = []
+        store = _store(idle_timeout=600, hibernate_after=60, on_release=released.append)
+        stored = self._idle_session(store)
+        save_dir = stored.session.save_manager.save_dir
+        stored.session.save_manager._ensure_save_dir()
+        store.hibernate_idle()
+
+        store.idle_timeout = 60
+        store.sweep()
+        assert store.hibernated_count == 0
+        assert store.get(stored.token) is None
+        assert not save_dir.exists()
+        assert not list(store_module._hibernation_dir().iterdir())
+        # The slot went back at hibernation; it is not returned twice.
+        assert released == []
+
+    def test_a_new_run_retires_a_rehydrated_one(self):
+        store = _store(hibernate_after=60)
+        first = self._idle_session(store, client_id="a" * 32)
+        store.hibernate_idle()
+        back = store.get(first.token)
+
+        second = store.create(ip="1.2.3.4", client_id="a" * 32)
+        assert store.get(back.token) is None
+        assert len(store) == 1 and store.get(second.token) is second
+
+    def test_a_new_run_retires_a_hibernated_one(self):
+        store = _store(hibernate_after=60)
+        first = self._idle_session(store, client_id="a" * 32)
+        store.hibernate_idle()
+
+        second = store.create(ip="1.2.3.4", client_id="a" * 32)
+        assert store.hibernated_count == 0
+        assert store.get(first.token) is None
+        assert store.get(second.token) is second
+
+    def test_hibernated_save_dirs_are_live(self):
+        store = _store(hibernate_after=60)
+        self._idle_session(store, client_id="a" * 32)
+        store.hibernate_idle()
+        assert durable_save_dir("a" * 32) in store.live_save_dirs()
+
+    def test_a_corrupt_file_drops_the_session(self):
+        store = _store(hibernate_after=60)
+        stored = self._idle_session(store)
+        store.hibernate_idle()
+        for path in store_module._hibernation_dir().iterdir():
+            path.write_text("{}", encoding="utf-8")
+
+        assert store.get(stored.token) is None
+        assert store.hibernated_count == 0
+
+    def test_orphaned_files_are_pruned(self):
+        store = _store(hibernate_after=60)
+        self._idle_session(store)
+        store.hibernate_idle()
+        orphan = store_module._hibernation_dir() / "orphan.json"
+        orphan.write_text("{}", encoding="utf-8")
+
+        assert store.prune_orphaned_hibernations() == [orphan]
+        assert store.hibernated_count == 1
+        assert len(list(orphan.parent.iterdir())) == 1
+
+    def test_async_hibernation_does_its_file_work_off_the_loop(self, monkeypatch):
+        store = _store(hibernate_after=60)
+        stored = self._idle_session(store)
+        calls = []
+        for name in ("_write_atomically", "_remove_file", "_remove_dir"):
+            real = getattr(store_module, name)
+
+            def spy(*args, _name=name, _real=real, **kwargs):
+                on_loop = threading.current_thread() is threading.main_thread()
+                calls.append((_name, on_loop))
+                return _real(*args, **kwargs)
+
+            monkeypatch.setattr(store_module, name, spy)
+
+        async def cycle():
+            assert await store.hibernate_idle_async() == [stored]
+            back = await store.get_async(stored.token)
+            await store.release_async(back.token)
+
+        asyncio.run(cycle())
+        assert {name for name, _ in calls} == {
+            "_write_atomically",
+            "_remove_file",
+            "_remove_dir",
+        }
+        assert not any(on_loop for _, on_loop in calls)
+
+    def test_a_turn_during_the_write_keeps_the_session_resident(self, monkeypatch):
+        store = _store(hibernate_after=60)
+        stored = self._idle_session(store)
+        real = store_module._write_atomically
+
+        def write_then_play(path, data, **kwargs):
+            real(path, data, **kwargs)
+            store.touch(stored)
+
+        monkeypatch.setattr(store_module, "_write_atomically", write_then_play)
+        assert store.hibernate_idle() == []
+        assert store.get(stored.token) is stored
+        assert store.hibernated_count == 0
+        assert not list(store_module._hibernation_dir().iterdir())
+
+    def test_concurrent_rehydrations_share_one_copy(self):
+        rehydrated = []
+        store = _store(hibernate_after=60, on_rehydrate=rehydrated.append)
+        stored = self._idle_session(store)
+        store.hibernate_idle()
+
+        async def both():
+            return await asyncio.gather(
+                store.get_async(stored.token), store.get_async(stored.token)
+            )
+
+        first, second = asyncio.run(both())
+        assert first is second is not None
+        assert rehydrated == [first]
+        assert len(store) == 1 and store.hibernated_count == 0
+        assert not list(store_module._hibernation_dir().iterdir())
+
+    def test_threshold_setting(self, monkeypatch):
+        monkeypatch.delenv("CABIN_SESSION_HIBERNATE_SECONDS", raising=False)
+        assert hibernate_after_seconds() == store_module.DEFAULT_HIBERNATE_AFTER_SECONDS
+        monkeypatch.setenv("CABIN_SESSION_HIBERNATE_SECONDS", "0")
+        assert hibernate_after_seconds() == 0
+        monkeypatch.setenv("CABIN_SESSION_HIBERNATE_SECONDS", "soon")
+        assert hibernate_after_seconds() == store_module.DEFAULT_HIBERNATE_AFTER_SECONDS
+
+
+class TestDrainAndRestore:
+    def _played(self, store, **kwargs):
+        stored = store.create(ip="1.2.3.4", **kwargs)
+        stored.session.handle_input("")
+        stored.session.handle_input("look")
+        stored.last_turn_id = 2
+        stored.last_turn_type = "input"
+        stored.last_turn_text = "look"
+        stored.last_turn_frame = {"type": "render", "lines": ["x"]}
+        return stored
+
+    def test_sessions_come_back_under_their_tokens(self):
+        old = _store()
+        stored = self._played(old)
+        before = session_snapshot(stored.session)
+        old.drain()
+
+        new = _store()
+        assert new.restore() == 1
+        assert len(new) == 0
+        back = new.get(stored.token)
+        assert session_snapshot(back.session) == before
+        assert back.last_turn_frame == {"type": "render", "lines": ["x"]}
+        assert back.ip == "1.2.3.4"
+
+    def test_restore_reads_no_session_state(self, monkeypatch):
+        old = _store()
+        tokens = [self._played(old).token for _ in range(3)]
+        old.drain()
+
+        restores = []
+        real = store_module.restore_session
+        monkeypatch.setattr(
+            store_module,
+            "restore_session",
+            lambda *args: restores.append(args) or real(*args),
+        )
+        new = _store()
+        assert new.restore() == 3
+        assert restores == []
+        new.get(tokens[1])
+        assert len(restores) == 1
+
+    def test_hibernated_sessions_are_carried_over(self):
+        old = _store(hibernate_after=60)
+        stored = self._played(old)
+        before = session_snapshot(stored.session)
+        old.touch(stored, time.monotonic() - 120)
+        old.hibernate_idle()
+        old.drain()
+
+        new = _store()
+        assert new.restore() == 1
+        assert session_snapshot(new.get(stored.token).session) == before
+
+    def test_terminal_replays_are_carried_over(self):
+        old = _store()
+        stored = self._played(old)
+        old.release(stored.token, preserve_terminal_replay=True)
+        old.drain()
+
+        new = _store()
+        new.restore()
+        replay = new.terminal_replay(stored.token)
+        assert (replay.turn_id, replay.text) == (2, "look")
+
+    def test_idle_time_carries_over(self):
+        old = _store(idle_timeout=60)
+        stored = self._played(old)
+        stored.last_activity = time.monotonic() - 120
+        old.drain()
+
+        new = _store(idle_timeout=60)
+        new.restore()
+        assert new.get(stored.token) is None
+
+    def test_the_drain_file_goes_once_every_session_has(self):
+        old = _store()
+        first = self._played(old)
+        second = self._played(old)
+        old.drain()
+        new = _store()
+        new.restore()
+        assert not store_module._drain_path().exists()
+
+        new.get(first.token)
+        assert new.prune_orphaned_hibernations() == []
+        new.get(second.token)
+        assert len(new.prune_orphaned_hibernations()) == 1
+
+    def test_a_missing_or_unreadable_drain_restores_nothing(self):
+        assert _store().restore() == 0
+        store_module._drain_path().parent.mkdir(parents=True)
+        store_module._drain_path().write_text("not json\n", encoding="utf-8")
+        assert _store().restore() == 0
+
+    def test_no_token_is_written(self):
+        store = _store()
+        stored = self._played(store)
+        store.drain()
+        assert stored.token not in store_module._drain_path().read_text(encoding="utf-8")
+
+
+class TestSharedBackend:
+    """Two stores over one file stand in for two workers."""
+
+    @pytest.fixture
+    def workers(self, tmp_path):
+        def make(**kwargs):
+            kwargs.setdefault("idle_timeout", 3600)
+            return SessionStore(
+                backend=SQLiteSessionBackend(tmp_path / "state.sqlite3"), **kwargs
+            )
+        return make
+
+    def test_any_worker_serves_any_token(self, workers):
+        one, two = workers(), workers()
+        stored = one.create(ip="1.2.3.4")
+        stored.session.handle_input("")
+        one.commit(stored)
+
+        other = two.get(stored.token)
+        assert session_snapshot(other.session) == session_snapshot(stored.session)
+        assert other.ip == "1.2.3.4"
+
+    def test_a_turn_on_one_worker_refreshes_the_other(self, workers):
+        one, two = workers(), workers()
+        stored = one.create(ip="1.2.3.4")
+        assert two.get(stored.token) is not None
+
+        stored.session.handle_input("")
+        stored.last_turn_id = 1
+        one.commit(stored)
+        refreshed = two.get(stored.token)
+        assert session_snapshot(refreshed.session) == session_snapshot(stored.session)
+        assert refreshed.last_turn_id == 1
+
+    def test_an_unchanged_session_is_not_reloaded(self, workers):
+        one = workers()
+        stored = one.create(ip="1.2.3.4")
+        game = stored.session
+        assert one.get(stored.token).session is game
+
+    def test_the_lease_serialises_turns_across_workers(self, workers):
+        one, two = workers(), workers()
+        stored = one.create(ip="1.2.3.4")
+        elsewhere = two.get(stored.token)
+        order = []
+
+        async def turn(store, held, name):
+            async with store.turn_lock(held):
+                order.append(f"{name} in")
+                await asyncio.sleep(0.1)
+                order.append(f"{name} out")
+
+        async def both():
+            first = asyncio.create_task(turn(one, stored, "one"))
+            await asyncio.sleep(0.01)
+            await asyncio.gather(first, turn(two, elsewhere, "two"))
+
+        asyncio.run(both())
+        assert order == ["one in", "one out", "two in", "two out"]
+
+    def test_release_is_settled_once(self, workers):
+        released = []
+        one = workers(on_release=released.append)
+        two = workers(on_release=released.append)
+        stored = one.create(ip="1.2.3.4")
+        two.get(stored.token)
+
+        two.release(stored.token)
+        assert one.get(stored.token) is None
+        assert len(released) == 1
+
+    def test_expiry_reaches_sessions_other_workers_hold(self, workers):
+        released = []
+        one = workers(on_release=released.append)
+        two = workers(idle_timeout=-1, on_release=released.append)
+        one.create(ip="1.2.3.4")
+        two.sweep()
+        assert [ref.ip for ref in released] == ["1.2.3.4"]
+        assert one.hibernated_count == 0
+
+    @staticmethod
+    def _go_quiet(store, stored):
+        """Age a session two minutes, in memory and in its row."""
+        store.touch(stored, time.monotonic() - 120)
+        store._backend._connect().execute(
+            "UPDATE sessions SET last_activity = ? WHERE key = ?",
+            (time.time() - 120, store_module._token_key(stored.token)),
+        )
+
+    def test_the_sweep_takes_resident_copies_from_the_idle_heap(self, workers):
+        one = workers(idle_timeout=60)
+        quiet = one.create(ip="1.2.3.4")
+        busy = one.create(ip="5.6.7.8")
+        self._go_quiet(one, quiet)
+
+        assert one.sweep() == [quiet]
+        assert one.tokens() == (busy.token,)
+        # The busy session was never due, so it is still filed where it was.
+        assert one._filed == {busy.token: busy.last_activity}
+
+    def test_a_mid_turn_copy_survives_the_sweep_and_is_filed_again(self, workers):
+        one = workers(idle_timeout=60)
+        stored = one.create(ip="1.2.3.4")
+        self._go_quiet(one, stored)
+        stored.in_flight = 1
+
+        assert one.sweep() == []
+        stored.in_flight = 0
+        assert one.sweep() == [stored]
+
+    def test_a_new_run_retires_one_on_another_worker(self, workers):
+        one, two = workers(), workers()
+        first = one.create(ip="1.2.3.4", client_id="a" * 32)
+        second = two.create(ip="1.2.3.4", client_id="a" * 32)
+        assert one.get(first.token) is None
+        assert one.get(second.token) is not None
+
+    def test_hibernation_returns_the_slot_and_rehydration_takes_it(self, workers):
+        hibernated, rehydrated = [], []
+        one = workers(hibernate_after=60, on_hibernate=hibernated.append)
+        two = workers(on_rehydrate=rehydrated.append)
+        stored = one.create(ip="1.2.3.4")
+        one.touch(stored, time.monotonic() - 120)
+
+        assert one.hibernate_idle() == [stored]
+        assert len(one) == 0 and one.hibernated_count == 1
+        assert two.get(stored.token) is not None
+        assert len(rehydrated) == 1 and one.hibernated_count == 0
+
+    def test_terminal_replays_are_shared(self, workers):
+        one, two = workers(), workers()
+        stored = one.create(ip="1.2.3.4")
+        stored.last_turn_id = 4
+        stored.last_turn_type = "input"
+        stored.last_turn_text = "wait"
+        stored.last_turn_frame = {"type": "render", "lines": []}
+        one.release(stored.token, preserve_terminal_replay=True)
+        assert two.terminal_replay(stored.token).turn_id == 4
+
+    def test_async_lookups_make_backend_calls_off_the_loop(self, workers):
+        one, two = workers(), workers()
+        stored = one.create(ip="1.2.3.4")
+        backend = two._backend
+        threads = []
+        for name in ("row", "record", "claim", "touch", "commit"):
+            real = getattr(backend, name)
+
+            def spy(*args, _real=real, **kwargs):
+                threads.append(threading.current_thread() is threading.main_thread())
+                return _real(*args, **kwargs)
+
+            setattr(backend, name, spy)
+
+        async def turn():
+            held = await two.get_async(stored.token)
+            await two.touch_async(held)
+            await two.commit_async(held)
+            return held
+
+        held = asyncio.run(turn())
+        assert session_snapshot(held.session) == session_snapshot(stored.session)
+        assert len(threads) == 5 and not any(threads)
+
+    def test_async_paths_settle_slots_off_the_loop(self, workers):
+        on_main = []
+
+        def settle(ref):
+            on_main.append(threading.current_thread() is threading.main_thread())
+
+        one = workers(on_release=settle)
+        two = workers(idle_timeout=-1, on_release=settle)
+
+        async def scenario():
+            stored = await one.create_async(ip="1.2.3.4")
+            await one.release_async(stored.token)
+            await one.create_async(ip="5.6.7.8")
+            await two.sweep_async()
+
+        asyncio.run(scenario())
+        assert on_main == [False, False]
+
+    def test_counts_and_save_dirs_are_read_off_the_loop(self, workers):
+        one = workers(hibernate_after=60)
+        two = workers()
+        stored = one.create(ip="1.2.3.4", client_id="a" * 32)
+        one.touch(stored, time.monotonic() - 120)
+        one.hibernate_idle()
+        backend = two._backend
+        on_main = []
+        for name in ("count", "save_dirs"):
+            real = getattr(backend, name)
+
+            def spy(*args, _real=real, **kwargs):
+                on_main.append(threading.current_thread() is threading.main_thread())
+                return _real(*args, **kwargs)
+
+            setattr(backend, name, spy)
+
+        async def scenario():
+            return (
+                await two.hibernated_count_async(),
+                await two.live_save_dirs_async(),
+            )
+
+        assert two.last_hibernated_count == 0
+        count, live = asyncio.run(scenario())
+        assert count == 1 and two.last_hibernated_count == 1
+        assert durable_save_dir("a" * 32) in live
+        assert on_main == [False, False]
+
+    def test_the_sweep_refreshes_the_reported_count(self, workers):
+        one = workers(hibernate_after=60)
+        two = workers()
+        stored = one.create(ip="1.2.3.4")
+        one.touch(stored, time.monotonic() - 120)
+        one.hibernate_idle()
+
+        assert two.last_hibernated_count == 0
+        asyncio.run(two.sweep_async())
+        assert two.last_hibernated_count == 1
+
+    def test_concurrent_async_lookups_share_one_copy(self, workers):
+        one, two = workers(), workers()
+        stored = one.create(ip="1.2.3.4")
+
+        async def both():
+            return await asyncio.gather(
+                two.get_async(stored.token), two.get_async(stored.token)
+            )
+
+        first, second = asyncio.run(both())
+        assert first is second
+        assert len(two) == 1
+
+    def test_a_held_lease_is_polled_with_backoff(self, workers, monkeypatch):
+        one, two = workers(), workers()
+        stored = one.create(ip="1.2.3.4")
+        elsewhere = two.get(stored.token)
+        pauses = []
+        real_sleep = asyncio.sleep
+
+        async def sleep(seconds):
+            pauses.append(seconds)
+            await real_sleep(0)
+
+        async def scenario():
+            async with one.turn_lock(stored):
+                monkeypatch.setattr(store_module.asyncio, "sleep", sleep)
+                waiting = asyncio.create_task(two.turn_lock(elsewhere).__aenter__())
+                while len(pauses) < 8:
+                    await real_sleep(0.001)
+            await waiting
+
+        asyncio.run(scenario())
+        assert pauses[:3] == [0.01, 0.02, 0.04]
+        assert max(pauses) == store_module.TURN_LEASE_POLL_MAX_SECONDS
@@ -0,0 +1,131 @@
+"""Tests for the SQLite state shared by workers (server.shared_state)."""
+
+from pathlib import Path
+
+import pytest
+
+from server.shared_state import SQLiteRateCounters, SQLiteSessionBackend, SharedReplay
+
+
+@pytest.fixture
+def backend(tmp_path):
+    backend = SQLiteSessionBackend(tmp_path / "state.sqlite3")
+    yield backend
+    backend.close()
+
+
+def _insert(backend, key="k", **kwargs):
+    kwargs.setdefault("ip", "1.2.3.4")
+    kwargs.setdefault("identity", None)
+    kwargs.setdefault("save_dir", Path("saves/web/x"))
+    kwargs.setdefault("record", {"n": 1})
+    kwargs.setdefault("last_activity", 100.0)
+    kwargs.setdefault("owner", "a")
+    return backend.insert(key, **kwargs)
+
+
+class TestSessionRows:
+    def test_commit_advances_the_version(self, backend):
+        assert _insert(backend) == 1
+        assert backend.commit("k", {"n": 2}, 200.0) == 2
+        assert backend.record("k") == (2, {"n": 2})
+        assert backend.row("k").last_activity == 200.0
+
+    def test_a_delete_settles_once(self, backend):
+        _insert(backend)
+        assert backend.delete("k").key == "k"
+        assert backend.delete("k") is None
+        assert backend.row("k") is None
+
+    def test_claim_reports_a_return_from_hibernation(self, backend):
+        _insert(backend)
+        assert backend.claim("k", "b") is False  # moved, still resident
+        assert backend.hibernate("k", "a") is False  # no longer a's
+        assert backend.hibernate("k", "b") is True
+        assert backend.count(resident=False) == 1
+        assert backend.claim("k", "a") is True
+
+    def test_identity_lookup(self, backend):
+        _insert(backend, "k1", identity="id")
+        _insert(backend, "k2", identity="other")
+        assert [row.key for row in backend.by_identity("id")] == ["k1"]
+
+
+class TestLeases:
+    def test_one_holder_at_a_time(self, backend):
+        _insert(backend)
+        assert backend.acquire_lease("k", "a", 0.0, 10.0) is True
+        assert backend.acquire_lease("k", "b", 1.0, 10.0) is False
+        backend.release_lease("k", "a")
+        assert backend.acquire_lease("k", "b", 2.0, 10.0) is True
+
+    def test_an_abandoned_lease_expires(self, backend):
+        _insert(backend)
+        backend.acquire_lease("k", "a", 0.0, 10.0)
+        assert backend.acquire_lease("k", "b", 11.0, 10.0) is True
+
+    def test_a_missing_session_has_no_lease_to_wait_for(self, backend):
+        assert backend.acquire_lease("gone", "a", 0.0, 10.0) is None
+
+    def test_leased_sessions_do_not_expire(self, backend):
+        _insert(backend, last_activity=0.0)
+        backend.acquire_lease("k", "a", 50.0, 10.0)
+        assert backend.expired(cutoff=40.0, now=50.0) == []
+        assert [row.key for row in backend.expired(cutoff=40.0, now=70.0)] == ["k"]
+
+
+class TestReplays:
+    def test_replays_expire(self, backend):
+        replay = SharedReplay(1, "input", "look", {"type": "render"}, expires_at=10.0)
+        backend.put_replay("k", replay)
+        assert backend.replay("k", 5.0) == replay
+        assert backend.replay("k", 10.0) is None
+        backend.prune_replays(10.0)
+        assert backend.replay("k", 0.0) is None
+
+
+class TestRateCounters:
+    def test_counts_are_shared_between_connections(self, tmp_path):
+        one = SQLiteRateCounters(tmp_path / "state.sqlite3")
+        two = SQLiteRateCounters(tmp_path / "state.sqlite3")
+        one.record("1.2.3.4", "message", 100.0)
+        two.record("1.2.3.4", "message", 101.0)
+        assert one.count("1.2.3.4", "message", 50.0) == 2
+        assert two.count("1.2.3.4", "message", 100.5) == 1
+        assert one.count("1.2.3.4", "connection", 50.0) == 0
+
+    def test_session_count_never_goes_negative(self, tmp_path):
+        counters = SQLiteRateCounters(tmp_path / "state.sqlite3")
+        counters.add_sessions(-1)
+        assert counters.sessions() == 0
+        counters.add_sessions(1)
+        counters.add_sessions(1)
+        counters.add_sessions(-1)
+        assert counters.sessions() == 1
+
+    def test_counting_never_deletes(self, tmp_path):
+        counters = SQLiteRateCounters(tmp_path / "state.sqlite3")
+        counters.record("1.2.3.4", "message", 100.0)
+        assert counters.count("1.2.3.4", "message", 500.0) == 0
+        assert counters.count("1.2.3.4", "message", 50.0) == 1
+
+    def test_prune_drops_events_outside_the_window(self, tmp_path):
+        counters = SQLiteRateCounters(tmp_path / "state.sqlite3")
+        counters.record("1.2.3.4", "message", 100.0)
+        counters.record("1.2.3.4", "message", 200.0)
+        assert counters.prune(150.0) == 1
+        assert counters.count("1.2.3.4", "message", 0.0) == 1
+
+    def test_admit_holds_the_limit_and_the_cap(self, tmp_path):
+        counters = SQLiteRateCounters(tmp_path / "state.sqlite3")
+
+        def connect(ip, at):
+            return counters.admit(
+                ip, "connection", at, since=0.0, limit=1, max_sessions=2
+            )
+
+        assert connect("a", 1.0) == (True, 1)
+        assert connect("a", 2.0) == (False, 1)
+        assert connect("b", 3.0) == (True, 2)
+        assert connect("c", 4.0) == (False, 2)
+        assert counters.admit("c", "message", 5.0, since=0.0, limit=1) == (True, 2)
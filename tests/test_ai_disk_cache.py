@@ -0,0 +1,175 @@
+"""Persistent tier of the interpreter response cache."""
+
+import asyncio
+import threading
+
+import pytest
+
+from game.ai import cache, disk_cache
+from game.ai.disk_cache import DiskResponseCache
+from game.ai.types import Intent
+from game.config import Config
+
+
+def _intent(name: str) -> Intent:
+    return Intent(action="none", args={}, confidence=1.0, reply=name, rationale=name)
+
+
+@pytest.fixture
+def persistent(monkeypatch, tmp_path):
+    """Enable the disk tier on a throwaway file, and tear it down after."""
+    path = tmp_path / "cache" / "responses.sqlite"
+    monkeypatch.setattr(
+        "game.config._config", Config(response_cache_size=2, response_cache_path=str(path))
+    )
+    cache.clear_response_cache()
+    yield path
+    monkeypatch.setattr("game.config._config", Config())
+    cache.disk_tier()
+    cache.clear_response_cache()
+
+
+def test_entries_survive_losing_the_memory_tier(persistent):
+    cache.cache_put("look", _intent("kept"))
+    cache.response_cache.clear()  # what a restart does
+
+    assert cache.cache_get("look").reply == "kept"
+    stats = cache.cache_stats()
+    assert stats["memory"]["misses"] == 1
+    assert stats["disk"]["hits"] == 1
+    # Promoted, so the next read never reaches the disk.
+    assert cache.cache_get("look").reply == "kept"
+    assert cache.cache_stats()["memory"]["hits"] == 1
+
+
+def test_workers_on_one_machine_share_entries(tmp_path):
+    path = tmp_path / "shared.sqlite"
+    first = DiskResponseCache(path, capacity=10, ttl_seconds=60, version="v1")
+    second = DiskResponseCache(path, capacity=10, ttl_seconds=60, version="v1")
+
+    first.put("listen", ("none", {}, 1.0, "quiet", None, None))
+    first.flush()
+
+    assert second.get("listen") == ["none", {}, 1.0, "quiet", None, None]
+    first.close()
+    second.close()
+
+
+def test_a_new_prompt_version_retires_old_entries(tmp_path):
+    path = tmp_path / "versions.sqlite"
+    old = DiskResponseCache(path, capacity=10, ttl_seconds=60, version="old-prompt")
+    old.put("listen", ("none", {}, 1.0, "quiet", None, None))
+    old.close()
+
+    new = DiskResponseCache(path, capacity=10, ttl_seconds=60, version="new-prompt")
+
+    assert new.get("listen") is None
+    assert new.stats()["size"] == 0
+    assert new.evictions == 1
+    new.close()
+
+
+def test_least_recently_used_rows_go_past_capacity(tmp_path, monkeypatch):
+    clock = iter(float(t) for t in range(100, 200))
+    monkeypatch.setattr(disk_cache.time, "time", lambda: next(clock))
+    store = DiskResponseCache(tmp_path / "lru.sqlite", capacity=2, ttl_seconds=1e6, version="v")
+
+    store.put("a", ("none", {}, 1.0, "a", None, None))
+    store.put("b", ("none", {}, 1.0, "b", None, None))
+    store.get("a")
+    store.put("c", ("none", {}, 1.0, "c", None, None))
+
+    assert store.get("b") is None
+    assert store.get("a") is not None
+    assert store.get("c") is not None
+    assert store.evictions == 1
+    store.close()
+
+
+def test_expired_rows_are_dropped_on_read(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(disk_cache.time, "time", lambda: now[0])
+    store = DiskResponseCache(tmp_path / "ttl.sqlite", capacity=10, ttl_seconds=30, version="v")
+    store.put("a", ("none", {}, 1.0, "a", None, None))
+
+    now[0] += 31
+
+    assert store.get("a") is None
+    assert (store.misses, store.evictions) == (1, 1)
+    store.close()
+
+
+def test_an_unusable_file_reads_as_a_miss(tmp_path):
+    path = tmp_path / "not-a-database.sqlite"
+    path.write_bytes(b"this is not sqlite" * 100)
+    store = DiskResponseCache(path, capacity=10, ttl_seconds=60, version="v")
+
+    store.put("a", ("none", {}, 1.0, "a", None, None))
+
+    assert store.get("a") is None
+    store.close()
+
+
+def test_disk_tier_is_off_by_default(monkeypatch):
+    monkeypatch.setattr("game.config._config", Config())
+
+    assert cache.disk_tier() is None
+    assert cache.cache_stats()["disk"] == {"enabled": False}
+
+
+def test_writes_are_committed_by_the_stores_own_thread(tmp_path):
+    store = DiskResponseCache(tmp_path / "queued.sqlite", capacity=10, ttl_seconds=60, version="v")
+    committed_on = []
+    committed = threading.Event()
+    real_write = store._write
+
+    def write(key, payload, now):
+        committed_on.append(threading.current_thread().name)
+        real_write(key, payload, now)
+        committed.set()
+
+    store._write = write
+    store.put("a", ("none", {}, 1.0, "a", None, None))
+
+    assert committed.wait(5)
+    assert committed_on == ["response-cache-writer"]
+    assert store.get("a") is not None
+    store.close()
+
+
+def test_size_is_a_running_count(tmp_path):
+    path = tmp_path / "count.sqlite"
+    store = DiskResponseCache(path, capacity=2, ttl_seconds=60, version="v")
+    for key in ("a", "b", "a", "c"):
+        store.put(key, ("none", {}, 1.0, key, None, None))
+    store.flush()
+    assert store.size() == 2
+    store.clear()
+    assert store.stats()["size"] == 0
+    store.put("d", ("none", {}, 1.0, "d", None, None))
+    store.close()
+
+    reopened = DiskResponseCache(path, capacity=2, ttl_seconds=60, version="v")
+    assert reopened.get("d") is not None
+    assert reopened.size() == 1
+    reopened.close()
+
+
+def test_an_async_read_reaches_the_disk_in_a_worker_thread(persistent, monkeypatch):
+    cache.cache_put("look", _intent("kept"))
+    cache.response_cache.clear()
+    disk = cache.disk_tier()
+    read_on = []
+    real_get = disk.get
+
+    def get(key):
+        read_on.append(threading.current_thread() is threading.main_thread())
+        return real_get(key)
+
+    monkeypatch.setattr(disk, "get", get)
+
+    assert asyncio.run(cache.cache_get_async("look")).reply == "kept"
+    assert read_on == [False]
+    # Promoted, so the next read never reaches the disk.
+    assert asyncio.run(cache.cache_get_async("look")).reply == "kept"
+    assert read_on == [False]
@@ -0,0 +1,85 @@
+"""Deterministic fast path: the commands that never wait on the model."""
+
+import pytest
+
+import game.ai_interpreter as ai_interpreter
+from game.ai.fast_path import VERB_TRIE, fast_path
+
+
+def _context(**overrides):
+    context = {
+        "room_id": "wilderness_start",
+        "exits": ["north", "cabin"],
+        "room_items": ["stone", "stick", "signpost"],
+        "carryable_room_items": ["stone", "stick"],
+        "inventory": ["rope"],
+        "world_flags": {},
+        "is_dawn_offer_active": False,
+    }
+    context.update(overrides)
+    return context
+
+
+@pytest.mark.parametrize(
+    ("text", "action", "args"),
+    [
+        ("look", "look", {}),
+        ("have a look around", "look", {}),
+        ("what's in my bag", "inventory", {}),
+        ("Wait.", "wait", {}),
+        ("north", "move", {"direction": "north"}),
+        ("go to the cabin", "move", {"direction": "cabin"}),
+        ("pick up the stone", "take", {"item": "stone"}),
+        ("take a look", "look", {}),
+        ("set down the rope", "drop", {"item": "rope"}),
+    ],
+)
+def test_unambiguous_commands_resolve(text, action, args):
+    intent = fast_path(text, _context())
+
+    assert (intent.action, intent.args) == (action, args)
+    assert intent.reply is None and intent.effects is None
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "go nort",  # typo: the model or the offline rules decide
+        "go east",  # not an exit here
+        "take the signpost",  # in the room, not carryable
+        "take the rope",  # already held
+        "drop the stone",  # not held
+        "pick up my courage",
+        "sing to the trees",
+    ],
+)
+def test_anything_inexact_is_left_to_the_model(text):
+    assert fast_path(text, _context()) is None
+
+
+def test_dawn_offer_keeps_its_own_vocabulary():
+    context = _context(carryable_room_items=["mug"], is_dawn_offer_active=True)
+
+    assert fast_path("take the mug", context) is None
+    assert fast_path("look", context) is None
+
+
+def test_verb_phrases_share_a_trie():
+    assert VERB_TRIE["pick"]["up"][""] == "take"
+    assert "" not in VERB_TRIE["pick"]
+
+
+def test_online_fast_path_never_calls_the_model(monkeypatch):
+    def _no_client(_):
+        raise AssertionError("the model was called")
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(ai_interpreter, "OpenAI", object())
+    monkeypatch.setattr(ai_interpreter, "_get_openai_client", _no_client)
+    monkeypatch.setattr(ai_interpreter, "log_ai_call", lambda *_, **__: None)
+    ai_interpreter.clear_response_cache()
+
+    intent = ai_interpreter.interpret("grab the stick", _context())
+
+    assert (intent.action, intent.args) == ("take", {"item": "stick"})
+    assert intent.rationale == "fast path take"
@@ -0,0 +1,166 @@
+"""Contracts for the process-wide model HTTP pool."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from game.ai import http_pool
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool(monkeypatch):
+    for name in (
+        "CABIN_HTTP_MAX_CONNECTIONS",
+        "CABIN_HTTP_MAX_KEEPALIVE",
+        "CABIN_HTTP_KEEPALIVE_SECONDS",
+        "CABIN_HTTP2",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    asyncio.run(http_pool.aclose_http_clients())
+    yield
+    asyncio.run(http_pool.aclose_http_clients())
+
+
+def test_defaults_without_environment():
+    settings = http_pool.pool_settings()
+
+    assert settings.max_connections == http_pool.DEFAULT_MAX_CONNECTIONS
+    assert settings.max_keepalive_connections == (
+        http_pool.DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    )
+    assert settings.keepalive_expiry == http_pool.DEFAULT_KEEPALIVE_EXPIRY_SECONDS
+    assert settings.http2 is False
+
+
+def test_environment_overrides_and_keepalive_is_capped(monkeypatch):
+    monkeypatch.setenv("CABIN_HTTP_MAX_CONNECTIONS", "4")
+    monkeypatch.setenv("CABIN_HTTP_MAX_KEEPALIVE", "9")
+    monkeypatch.setenv("CABIN_HTTP_KEEPALIVE_SECONDS", "12.5")
+
+    settings = http_pool.pool_settings()
+
+    assert settings.max_connections == 4
+    assert settings.max_keepalive_connections == 4
+    assert settings.keepalive_expiry == 12.5
+
+
+@pytest.mark.parametrize("raw", ["0", "-3", "many"])
+def test_unusable_limits_fall_back_to_defaults(monkeypatch, raw):
+    monkeypatch.setenv("CABIN_HTTP_MAX_CONNECTIONS", raw)
+
+    assert http_pool.pool_settings().max_connections == (
+        http_pool.DEFAULT_MAX_CONNECTIONS
+    )
+
+
+def test_http2_without_h2_degrades_to_http1(monkeypatch):
+    monkeypatch.setenv("CABIN_HTTP2", "1")
+    monkeypatch.setattr(http_pool, "_http2_supported", lambda: False)
+
+    assert http_pool.pool_settings().http2 is False
+
+
+def test_blocking_client_is_shared():
+    first = http_pool.get_http_client()
+
+    assert http_pool.get_http_client() is first
+
+
+def test_async_client_is_shared_within_a_loop_and_rebuilt_across_loops():
+    async def _twice():
+        return http_pool.get_async_http_client(), http_pool.get_async_http_client()
+
+    first, again = asyncio.run(_twice())
+    later, _ = asyncio.run(_twice())
+
+    assert first is again
+    assert later is not first
+    # The first loop has closed, so its client is no longer held.
+    assert list(http_pool._async_http_clients.values()) == [later]
+
+
+def test_a_loop_keeps_its_client_while_another_loop_runs():
+    outer = asyncio.new_event_loop()
+    try:
+        held = outer.run_until_complete(_client_on_loop())
+        inner = asyncio.run(_client_on_loop())
+        assert outer.run_until_complete(_client_on_loop()) is held
+        assert inner is not held
+    finally:
+        outer.run_until_complete(held.aclose())
+        outer.close()
+
+
+async def _client_on_loop():
+    return http_pool.get_async_http_client()
+
+
+def _counted_client(monkeypatch, answer):
+    """A shared blocking client whose requests are answered locally."""
+    client = http_pool._CountedClient(transport=httpx.MockTransport(answer))
+    monkeypatch.setattr(http_pool, "_http_client", client)
+    return client
+
+
+def _ok(request):
+    # A stream rather than content, so the body is read later, as off a socket.
+    return httpx.Response(200, stream=httpx.ByteStream(b"{}"))
+
+
+def test_stats_count_requests_until_their_response_is_closed(monkeypatch):
+    monkeypatch.setenv("CABIN_HTTP_MAX_CONNECTIONS", "1")
+    client = _counted_client(monkeypatch, _ok)
+
+    first = client.send(client.build_request("GET", "https://example.test"), stream=True)
+    second = client.send(client.build_request("GET", "https://example.test"), stream=True)
+    stats = http_pool.pool_stats()
+    assert (stats["in_use"], stats["waiting"]) == (1, 1)
+
+    first.close()
+    second.close()
+    client.get("https://example.test")
+    assert http_pool.pool_stats()["in_use"] == 0
+
+
+def test_a_failed_request_is_not_counted(monkeypatch):
+    def refuse(request):
+        raise httpx.ConnectError("refused")
+
+    client = _counted_client(monkeypatch, refuse)
+    with pytest.raises(httpx.ConnectError):
+        client.get("https://example.test")
+    assert http_pool.pool_stats()["in_use"] == 0
+
+
+def test_async_requests_are_counted_through_a_streamed_body(monkeypatch):
+    async def scenario():
+        client = http_pool._CountedAsyncClient(transport=httpx.MockTransport(_ok))
+        monkeypatch.setitem(
+            http_pool._async_http_clients, asyncio.get_running_loop(), client
+        )
+        async with client.stream("GET", "https://example.test") as response:
+            during = http_pool.pool_stats()["in_use"]
+            await response.aread()
+        return during, http_pool.pool_stats()["in_use"]
+
+    assert asyncio.run(scenario()) == (1, 0)
+
+
+def test_stats_before_any_client_is_built():
+    stats = http_pool.pool_stats()
+    assert (stats["in_use"], stats["waiting"], stats["clients"]) == (0, 0, 0)
+
+
+def test_close_releases_both_clients():
+    async def _open_and_close():
+        async_client = http_pool.get_async_http_client()
+        await http_pool.aclose_http_clients()
+        return async_client
+
+    sync_client = http_pool.get_http_client()
+    async_client = asyncio.run(_open_and_close())
+
+    assert sync_client.is_closed
+    assert async_client.is_closed
+    assert http_pool.get_http_client() is not sync_client
@@ -22,6 +22,8 @@ from game.ai_interpreter import (
     _rule_based,
     _sanitize_diegetic_reply,
 )
+from game.ai.cache_keys import cache_key_fields
+from game.ai.prompt import build_user_message_content
 from game.config import Config
 
 
@@ -324,7 +326,7 @@ class TestInterpreterLogging:
         monkeypatch.setattr(ai_interpreter, "log_ai_call", lambda *_, **__: None)
 
         intent = interpret(
-            "pick up stone",
+            "carefully pick up the stone",
             {
                 "exits": [],
                 "room_items": ["stone"],
@@ -347,18 +349,45 @@ class TestInterpreterLogging:
     ("field", "value"),
     [
         ("room_items", ["matches", "rope"]),
+        ("exits", ["south"]),
+        ("inventory", ["key", "rope", "stone"]),
+        ("world_flags", {"has_power": True}),
         ("rooms_visited", 5),
-        ("been_here_before", True),
         ("active_quest", "Restore power to the cabin"),
+        ("been_here_before", True),
+        ("fear", 75),
+        ("health", 30),
     ],
 )
-def test_cache_key_changes_when_prompt_context_changes(field, value):
+@pytest.mark.parametrize("user_text", ["wait", "go north", "take stone"])
+def test_cache_key_changes_when_prompt_context_changes(field, value, user_text):
     """Prompt-affecting context changes should invalidate cached replies."""
     base_context = _base_context()
     changed_context = dict(base_context)
     changed_context[field] = value
 
-    assert _make_cache_key("wait", base_context) != _make_cache_key("wait", changed_context)
+    assert _make_cache_key(user_text, base_context) != _make_cache_key(
+        user_text, changed_context
+    )
+
+
+@pytest.mark.parametrize(("field", "value"), [("fear", 12), ("health", 85)])
+def test_cache_key_reads_fear_and_health_as_bands(field, value):
+    base_context = _base_context()
+    base_context.update(fear=5, health=95)
+    changed_context = dict(base_context)
+    changed_context[field] = value
+
+    assert _make_cache_key("wait", base_context) == _make_cache_key("wait", changed_context)
+
+
+def test_cache_key_covers_every_field_the_prompt_renders():
+    rendered = json.loads(build_user_message_content("wait", _base_context()))
+    keyed = set(cache_key_fields("wait", _base_context()))
+    unkeyed = set(rendered) - keyed - {"instructions", "user", "layer_rules"}
+
+    assert unkeyed == {"fear", "health"}
+    assert {"fear_band", "health_band"} <= keyed
 
 
 def _fixture_context(room_items):
@@ -803,7 +832,11 @@ def test_build_interpreter_messages_returns_system_and_user():
 
 
 class TestWrongLayerRules:
-    """The copy's knowledge rule must ride into the system prompt (#141)."""
+    """The copy's knowledge rule must ride into every wrong-layer turn (#141).
+
+    It travels in the user message as ``layer_rules``, so the system block
+    stays byte-identical across layers.
+    """
 
     def _wrong_layer_context(self, ending: str = "none"):
         context = _base_context()
@@ -816,27 +849,38 @@ class TestWrongLayerRules:
         }
         return context
 
+    @staticmethod
+    def _layer_rules(messages):
+        return json.loads(messages[1]["content"]).get("layer_rules", "")
+
     def test_real_layer_prompt_has_no_copy_rules(self):
         messages = build_interpreter_messages("look", _base_context())
-        assert "Knowledge rule" not in messages[0]["content"]
-        assert "false cabin" not in messages[0]["content"]
+        assert "layer_rules" not in json.loads(messages[1]["content"])
+        for message in messages:
+            assert "Knowledge rule" not in message["content"]
+            assert "false cabin" not in message["content"]
 
     def test_wrong_layer_prompt_carries_the_knowledge_rule(self):
         messages = build_interpreter_messages("talk to nika", self._wrong_layer_context())
-        prompt = messages[0]["content"]
-        assert "Knowledge rule" in prompt
-        assert "keep the pretence steady" in prompt
-        assert "never performs hesitation, hurt, or the" in prompt
-        assert "Only the authored beats reveal wrongness" in prompt
+        rules = self._layer_rules(messages)
+        assert "Knowledge rule" in rules
+        assert "keep the pretence steady" in rules
+        assert "never performs hesitation, hurt, or the" in rules
+        assert "Only the authored beats reveal wrongness" in rules
 
     def test_post_refusal_prompt_switches_to_indifference(self):
         messages = build_interpreter_messages(
             "look at nika", self._wrong_layer_context(ending="escaped")
         )
-        prompt = messages[0]["content"]
-        assert "pretence stopped" in prompt
-        assert "Knowledge rule" not in prompt
-        assert "Never describe what is under" in prompt
+        rules = self._layer_rules(messages)
+        assert "pretence stopped" in rules
+        assert "Knowledge rule" not in rules
+        assert "Never describe what is under" in rules
+
+    def test_layer_rules_never_reach_the_system_block(self):
+        real = build_interpreter_messages("look", _base_context())
+        wrong = build_interpreter_messages("look", self._wrong_layer_context())
+        assert real[0]["content"] == wrong[0]["content"]
 
     def test_rules_never_name_the_lyer(self):
         import re
@@ -847,7 +891,8 @@ class TestWrongLayerRules:
             )
             # Word-boundary match: "player" and "layer" are fine; the name
             # itself must never reach an external model provider.
-            assert not re.search(r"\blyer\b", messages[0]["content"], re.IGNORECASE)
+            for message in messages:
+                assert not re.search(r"\blyer\b", message["content"], re.IGNORECASE)
 
 
 def test_build_openai_chat_params_keeps_legacy_temperature_for_non_gpt5():
@@ -973,7 +1018,7 @@ class TestLowConfidenceGating:
         })
 
         intent = interpret(
-            "get the log",
+            "get hold of the log",
             {
                 "exits": [],
                 "room_items": ["log"],
@@ -996,7 +1041,7 @@ class TestLowConfidenceGating:
         })
 
         intent = interpret(
-            "get the log",
+            "get hold of the log",
             {
                 "exits": [],
                 "room_items": ["log"],
@@ -1019,7 +1064,7 @@ class TestLowConfidenceGating:
         })
 
         intent = interpret(
-            "pick up stone",
+            "carefully pick up the stone",
             {
                 "exits": [],
                 "room_items": ["stone"],
@@ -1042,7 +1087,7 @@ class TestLowConfidenceGating:
             "rationale": "test",
         })
 
-        intent = interpret("do nothing", {"exits": [], "room_items": [], "inventory": []})
+        intent = interpret("do nothing at all", {"exits": [], "room_items": [], "inventory": []})
 
         assert intent.action == "none"
         assert intent.reply == "Nothing happens."
@@ -1358,7 +1403,7 @@ def test_non_object_model_json_does_not_crash(monkeypatch):
     """A valid-but-non-object JSON response must not crash a turn."""
     clear_response_cache()
     _install_fake_model(monkeypatch, json.dumps([1, 2, 3]))
-    intent = interpret("look around", _base_context())
+    intent = interpret("look around slowly", _base_context())
     assert intent.action == "none"
 
 
@@ -1371,7 +1416,7 @@ def test_null_inventory_effects_do_not_crash(monkeypatch):
         "effects": {"fear": 1, "health": 0, "inventory_add": None, "inventory_remove": None},
     })
     _install_fake_model(monkeypatch, raw)
-    intent = interpret("wait", _base_context())
+    intent = interpret("wait a while", _base_context())
     assert intent.effects["inventory_add"] == []
     assert intent.effects["inventory_remove"] == []
 
@@ -1384,7 +1429,7 @@ def test_non_list_inventory_effects_do_not_crash(monkeypatch):
         "effects": {"fear": 0, "health": 0, "inventory_add": 5, "inventory_remove": True},
     })
     _install_fake_model(monkeypatch, raw)
-    intent = interpret("wait", _base_context())
+    intent = interpret("wait a while", _base_context())
     assert intent.effects["inventory_add"] == []
     assert intent.effects["inventory_remove"] == []
 
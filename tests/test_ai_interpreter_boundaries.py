@@ -11,9 +11,11 @@ def test_facade_client_cache_reuses_client_per_api_key(monkeypatch):
         created.append((kwargs, client))
         return client
 
+    pooled = object()
     monkeypatch.setattr(ai_interpreter, "OpenAI", fake_openai)
     monkeypatch.setattr(ai_interpreter, "_openai_client", None)
     monkeypatch.setattr(ai_interpreter, "_openai_client_key", None)
+    monkeypatch.setattr(ai_interpreter._http_pool, "get_http_client", lambda: pooled)
 
     first = ai_interpreter._get_openai_client("first-key")
     repeated = ai_interpreter._get_openai_client("first-key")
@@ -26,10 +28,12 @@ def test_facade_client_cache_reuses_client_per_api_key(monkeypatch):
             "api_key": "first-key",
             "timeout": ai_interpreter.OPENAI_TIMEOUT_SECONDS,
             "max_retries": 0,
+            "http_client": pooled,
         },
         {
             "api_key": "second-key",
             "timeout": ai_interpreter.OPENAI_TIMEOUT_SECONDS,
             "max_retries": 0,
+            "http_client": pooled,
         },
     ]
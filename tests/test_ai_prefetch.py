@@ -0,0 +1,155 @@
+"""Opt-in model warm-up while an overlay is on screen."""
+
+import asyncio
+import os
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from game.ai import http_pool, prefetch
+
+
+class _Response:
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return {"usage": {"prompt_tokens": 1100, "completion_tokens": 1}}
+
+
+class _Client:
+    def __init__(self):
+        self.posts = []
+        self.urls = []
+
+    async def post(self, url, **kwargs):
+        self.urls.append(url)
+        self.posts.append(kwargs["json"])
+        return _Response()
+
+
+@pytest.fixture
+def warm(monkeypatch):
+    client = _Client()
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setenv("CABIN_MODEL_PREFETCH", "1")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(http_pool, "get_async_http_client", lambda: client)
+    monkeypatch.setattr(prefetch, "monotonic", lambda: clock.now)
+    prefetch.reset_prefetch()
+    yield client, clock
+    prefetch.reset_prefetch()
+
+
+def _schedule():
+    async def run():
+        task = prefetch.schedule_warm_up()
+        if task is not None:
+            await task
+        return task
+
+    return asyncio.run(run())
+
+
+def test_off_by_default(monkeypatch):
+    monkeypatch.delenv("CABIN_MODEL_PREFETCH", raising=False)
+
+    assert _schedule() is None
+    assert prefetch.prefetch_stats()["enabled"] is False
+
+
+def test_warm_up_sends_the_static_system_prompt_on_a_small_budget(warm):
+    from game.ai.prompt import SYSTEM_PROMPT
+
+    client, _ = warm
+    _schedule()
+
+    (params,) = client.posts
+    assert params["messages"][0]["content"] == SYSTEM_PROMPT
+    budget = params.get("max_completion_tokens", params.get("max_tokens"))
+    assert budget == prefetch.WARM_UP_MAX_TOKENS > 1
+    # A reply cut off by the budget must not be refused as broken JSON.
+    assert "response_format" not in params
+    assert prefetch.prefetch_stats()["issued"] == 1
+
+
+def test_warm_up_calls_the_configured_host(warm):
+    from game.ai import transport
+
+    client, _ = warm
+    _schedule()
+    assert client.urls == [transport.OPENAI_CHAT_COMPLETIONS_URL]
+
+
+def test_the_base_url_can_be_overridden():
+    env = dict(os.environ, OPENAI_BASE_URL="https://models.example.test/v1/")
+    url = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from game.ai import prefetch; print(prefetch.OPENAI_CHAT_COMPLETIONS_URL)",
+        ],
+        env=env,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+    assert url == "https://models.example.test/v1/chat/completions"
+
+
+@pytest.mark.parametrize("model", ["gpt-5.6-terra", "gpt-4.1-mini"])
+def test_warm_up_budget_applies_to_every_model_family(warm, monkeypatch, model):
+    from game.config import get_config
+
+    monkeypatch.setattr(get_config(), "openai_model", model)
+    params = prefetch._warm_up_params()
+
+    assert params["model"] == model
+    limit = "max_completion_tokens" if model.startswith("gpt-5") else "max_tokens"
+    assert params[limit] == prefetch.WARM_UP_MAX_TOKENS
+
+
+def test_a_request_while_fresh_is_a_hit(warm):
+    _, clock = warm
+    _schedule()
+    clock.now += 30
+
+    prefetch.note_model_request()
+    prefetch.note_model_request()
+
+    stats = prefetch.prefetch_stats()
+    assert (stats["hits"], stats["wasted"]) == (1, 0)
+
+
+def test_a_warm_up_that_goes_stale_unused_is_waste(warm):
+    _, clock = warm
+    _schedule()
+    clock.now += prefetch.PREFETCH_FRESH_SECONDS + 1
+
+    stats = prefetch.prefetch_stats()
+    assert (stats["hits"], stats["wasted"]) == (0, 1)
+
+
+def test_no_warm_up_while_real_traffic_keeps_the_prefix_fresh(warm):
+    client, clock = warm
+    prefetch.note_model_request()
+    clock.now += 10
+
+    assert _schedule() is None
+    assert client.posts == []
+    assert prefetch.prefetch_stats()["skipped"] == 1
+
+
+def test_a_failed_warm_up_is_counted_and_never_raises(warm, monkeypatch):
+    async def _refused(url, **kwargs):
+        raise ConnectionError("refused")
+
+    client, _ = warm
+    monkeypatch.setattr(client, "post", _refused)
+    _schedule()
+
+    stats = prefetch.prefetch_stats()
+    assert (stats["issued"], stats["failed"], stats["wasted"]) == (1, 1, 0)
@@ -0,0 +1,48 @@
+"""Incremental extraction of the narration from a streamed model response."""
+
+import json
+
+import pytest
+
+from game.ai.reply_stream import ReplyStreamReader
+
+
+def _feed_in_pieces(text, size):
+    reader = ReplyStreamReader()
+    return "".join(reader.feed(text[i : i + size]) for i in range(0, len(text), size))
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 1000])
+def test_reply_is_recovered_across_any_chunking(size):
+    reply = 'She says "stay", and the stove ticks.\nSnow — ❄ 🌲 — \\ /'
+    raw = json.dumps(
+        {
+            "action": "none",
+            "args": {"reply": "not this one"},
+            "confidence": 0.8,
+            "reply": reply,
+            "effects": {"fear": 1},
+        }
+    )
+
+    assert _feed_in_pieces(raw, size) == reply
+
+
+def test_text_is_released_as_it_arrives():
+    reader = ReplyStreamReader()
+
+    assert reader.feed('{"action": "look", "reply": "The tr') == "The tr"
+    assert reader.feed('ees lean') == "ees lean"
+    assert reader.feed('.", "effects": {}}') == "."
+    assert reader.done
+
+
+def test_a_null_or_missing_reply_yields_nothing():
+    assert _feed_in_pieces('{"action": "look", "reply": null}', 4) == ""
+    assert _feed_in_pieces('{"action": "look"}', 4) == ""
+
+
+def test_a_value_that_looks_like_the_key_is_not_the_reply():
+    raw = '{"rationale": "reply", "action": "wait", "reply": "You wait."}'
+
+    assert _feed_in_pieces(raw, 5) == "You wait."
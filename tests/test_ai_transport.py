@@ -1,12 +1,13 @@
 """Retry and deadline contracts for the production model transport."""
 
+import asyncio
 import json
 from types import SimpleNamespace
 
 import pytest
 
 import game.ai_interpreter as ai_interpreter
-from game.ai import transport
+from game.ai import http_pool, transport
 
 
 VALID_RESPONSE = {
@@ -218,7 +219,9 @@ def test_direct_httpx_transport_posts_nonstreaming_json_without_sdk(monkeypatch)
         calls.append((url, kwargs))
         return _HTTPResponse(_http_payload(json.dumps(VALID_RESPONSE)))
 
-    monkeypatch.setattr(transport._httpx, "post", post)
+    monkeypatch.setattr(
+        http_pool, "get_http_client", lambda: SimpleNamespace(post=post)
+    )
 
     result = transport.request_model_json_httpx(
         "mobile-key",
@@ -247,7 +250,9 @@ def test_direct_httpx_transport_retries_transient_status_once(monkeypatch):
         calls.append((args, kwargs))
         return next(outcomes)
 
-    monkeypatch.setattr(transport._httpx, "post", post)
+    monkeypatch.setattr(
+        http_pool, "get_http_client", lambda: SimpleNamespace(post=post)
+    )
 
     assert transport.request_model_json_httpx(
         "mobile-key",
@@ -277,3 +282,319 @@ def test_interpreter_uses_opt_in_direct_httpx_without_openai_sdk(monkeypatch):
     )
 
     assert intent.reply == VALID_RESPONSE["reply"]
+
+
+class _AsyncStream:
+    def __init__(self, content):
+        self.chunks = _stream(content)
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+class _AsyncCompletions(_Completions):
+    async def create(self, **params):
+        return _Completions.create(self, **params)
+
+
+def _async_client(*outcomes):
+    completions = _AsyncCompletions(outcomes)
+    return (
+        SimpleNamespace(chat=SimpleNamespace(completions=completions)),
+        completions,
+    )
+
+
+def _request_async(client):
+    return asyncio.run(
+        transport.request_model_json_async(
+            client,
+            "gpt-5.6-terra",
+            [{"role": "user", "content": "listen"}],
+            reasoning_effort="none",
+            debug=lambda _: None,
+        )
+    )
+
+
+@pytest.fixture
+def _no_real_async_retry_delay(monkeypatch):
+    async def _instant(_):
+        return None
+
+    monkeypatch.setattr(transport.asyncio, "sleep", _instant)
+
+
+def test_async_transport_retries_once_like_the_blocking_one(
+    _no_real_async_retry_delay,
+):
+    client, completions = _async_client(
+        ConnectionResetError("stream reset"),
+        _AsyncStream(json.dumps(VALID_RESPONSE)),
+    )
+
+    assert _request_async(client) == VALID_RESPONSE
+    assert len(completions.calls) == 2
+    assert all(call["stream"] is True for call in completions.calls)
+
+
+def test_async_transport_does_not_retry_a_timeout(_no_real_async_retry_delay):
+    client, completions = _async_client(
+        TimeoutError("slow"),
+        _AsyncStream(json.dumps(VALID_RESPONSE)),
+    )
+
+    with pytest.raises(TimeoutError):
+        _request_async(client)
+    assert len(completions.calls) == 1
+
+
+def test_interpret_async_awaits_the_async_client(monkeypatch):
+    client, completions = _async_client(_AsyncStream(json.dumps(VALID_RESPONSE)))
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(ai_interpreter, "OpenAI", object())
+    monkeypatch.setattr(ai_interpreter, "_get_async_openai_client", lambda _: client)
+    monkeypatch.setattr(ai_interpreter, "log_ai_call", lambda *_, **__: None)
+    ai_interpreter.clear_response_cache()
+
+    intent = asyncio.run(
+        ai_interpreter.interpret_async(
+            "sing to the trees", {"room_id": "wilderness_start"}
+        )
+    )
+
+    assert intent.reply == VALID_RESPONSE["reply"]
+    assert len(completions.calls) == 1
+
+
+def test_interpret_async_hands_narration_to_the_caller(monkeypatch):
+    client, _ = _async_client(_AsyncStream(json.dumps(VALID_RESPONSE)))
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(ai_interpreter, "OpenAI", object())
+    monkeypatch.setattr(ai_interpreter, "_get_async_openai_client", lambda _: client)
+    monkeypatch.setattr(ai_interpreter, "log_ai_call", lambda *_, **__: None)
+    ai_interpreter.clear_response_cache()
+    narrated = []
+
+    async def on_narration(piece):
+        narrated.append(piece)
+
+    intent = asyncio.run(
+        ai_interpreter.interpret_async(
+            "sing to the trees",
+            {"room_id": "wilderness_start"},
+            on_narration=on_narration,
+        )
+    )
+
+    assert "".join(narrated) == intent.reply == VALID_RESPONSE["reply"]
+
+
+def test_interpret_async_failure_uses_the_same_fallback(
+    monkeypatch, _no_real_async_retry_delay
+):
+    client, completions = _async_client(
+        ConnectionError("first"),
+        ConnectionError("second"),
+    )
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(ai_interpreter, "OpenAI", object())
+    monkeypatch.setattr(ai_interpreter, "_get_async_openai_client", lambda _: client)
+    monkeypatch.setattr(ai_interpreter, "log_ai_call", lambda *_, **__: None)
+    ai_interpreter.clear_response_cache()
+
+    intent = asyncio.run(
+        ai_interpreter.interpret_async(
+            "sing to the trees", {"room_id": "wilderness_start"}
+        )
+    )
+
+    assert len(completions.calls) == 2
+    assert intent.rationale == "fallback-error"
+    assert intent.reply == "You sing one line. It comes back thin between the trunks."
+
+
+def test_streamed_usage_is_recorded_with_cached_prompt_tokens():
+    transport.reset_usage_stats()
+    usage = SimpleNamespace(
+        prompt_tokens=1200,
+        completion_tokens=60,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=1024),
+    )
+    stream = _stream(json.dumps(VALID_RESPONSE)) + [SimpleNamespace(choices=[], usage=usage)]
+    client, completions = _client(stream)
+
+    assert _request(client) == VALID_RESPONSE
+    call = completions.calls[0]
+    stream_options = call.get("stream_options") or call["extra_body"]["stream_options"]
+    assert stream_options == {"include_usage": True}
+    stats = transport.usage_stats()
+    assert stats["calls"] == 1
+    assert stats["prompt_tokens"] == 1200
+    assert stats["cached_prompt_tokens"] == 1024
+    assert stats["cached_ratio"] == round(1024 / 1200, 4)
+    transport.reset_usage_stats()
+
+
+def test_usage_without_cache_details_counts_nothing_cached():
+    transport.reset_usage_stats()
+    transport.record_usage({"prompt_tokens": 900, "completion_tokens": 40}, lambda _: None)
+
+    assert transport.usage_stats()["cached_prompt_tokens"] == 0
+    assert transport.usage_stats()["prompt_tokens"] == 900
+    transport.reset_usage_stats()
+
+
+def test_async_transport_streams_the_reply_as_it_arrives():
+    raw = json.dumps(VALID_RESPONSE)
+    stream = _AsyncStream(raw)
+    stream.chunks = [
+        SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=raw[i : i + 9]))])
+        for i in range(0, len(raw), 9)
+    ]
+    client, _ = _async_client(stream)
+    pieces = []
+
+    async def on_reply(piece):
+        pieces.append(piece)
+
+    result = asyncio.run(
+        transport.request_model_json_async(
+            client,
+            "gpt-5.6-terra",
+            [{"role": "user", "content": "listen"}],
+            reasoning_effort="none",
+            debug=lambda _: None,
+            on_reply=on_reply,
+        )
+    )
+
+    assert result == VALID_RESPONSE
+    assert len(pieces) > 1
+    assert "".join(pieces) == VALID_RESPONSE["reply"]
+
+
+class _BrokenAsyncStream(_AsyncStream):
+    """Delivers the first *cut* characters, then drops the connection."""
+
+    def __init__(self, content, cut):
+        super().__init__(content[:cut])
+        self.chunks = [
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=char))])
+            for char in content[:cut]
+        ]
+
+    async def _iterate(self):
+        for chunk in self.chunks:
+            yield chunk
+        raise ConnectionResetError("stream reset")
+
+
+def test_a_retry_takes_back_what_the_failed_attempt_streamed(
+    _no_real_async_retry_delay,
+):
+    raw = json.dumps(VALID_RESPONSE)
+    cut = raw.index(VALID_RESPONSE["reply"]) + 6
+    client, completions = _async_client(
+        _BrokenAsyncStream(raw, cut), _AsyncStream(raw)
+    )
+    pieces = []
+
+    async def on_reply(piece):
+        pieces.append(piece)
+
+    result = asyncio.run(
+        transport.request_model_json_async(
+            client,
+            "gpt-5.6-terra",
+            [{"role": "user", "content": "listen"}],
+            reasoning_effort="none",
+            debug=lambda _: None,
+            on_reply=on_reply,
+        )
+    )
+
+    assert result == VALID_RESPONSE
+    assert len(completions.calls) == 2
+    reset = pieces.index(None)
+    assert "".join(pieces[:reset]) == VALID_RESPONSE["reply"][:6]
+    assert "".join(pieces[reset + 1:]) == VALID_RESPONSE["reply"]
+
+
+def test_a_retry_before_anything_streamed_sends_no_reset(_no_real_async_retry_delay):
+    client, _ = _async_client(
+        ConnectionResetError("stream reset"),
+        _AsyncStream(json.dumps(VALID_RESPONSE)),
+    )
+    pieces = []
+
+    async def on_reply(piece):
+        pieces.append(piece)
+
+    asyncio.run(
+        transport.request_model_json_async(
+            client,
+            "gpt-5.6-terra",
+            [{"role": "user", "content": "listen"}],
+            reasoning_effort="none",
+            debug=lambda _: None,
+            on_reply=on_reply,
+        )
+    )
+
+    assert None not in pieces
+
+
+class _ClientGone(Exception):
+    pass
+
+
+def test_a_failing_listener_is_not_retried(_no_real_async_retry_delay):
+    client, completions = _async_client(
+        _AsyncStream(json.dumps(VALID_RESPONSE)),
+        _AsyncStream(json.dumps(VALID_RESPONSE)),
+    )
+
+    async def on_reply(piece):
+        raise ConnectionResetError("client gone")
+
+    with pytest.raises(transport.NarrationListenerError) as raised:
+        asyncio.run(
+            transport.request_model_json_async(
+                client,
+                "gpt-5.6-terra",
+                [{"role": "user", "content": "listen"}],
+                reasoning_effort="none",
+                debug=lambda _: None,
+                on_reply=on_reply,
+            )
+        )
+    assert isinstance(raised.value.__cause__, ConnectionResetError)
+    assert len(completions.calls) == 1
+
+
+def test_interpret_async_hands_a_listener_failure_back_instead_of_falling_back(
+    monkeypatch,
+):
+    client, _ = _async_client(_AsyncStream(json.dumps(VALID_RESPONSE)))
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(ai_interpreter, "OpenAI", object())
+    monkeypatch.setattr(ai_interpreter, "_get_async_openai_client", lambda _: client)
+    monkeypatch.setattr(ai_interpreter, "log_ai_call", lambda *_, **__: None)
+    ai_interpreter.clear_response_cache()
+
+    async def on_narration(piece):
+        raise _ClientGone()
+
+    with pytest.raises(_ClientGone):
+        asyncio.run(
+            ai_interpreter.interpret_async(
+                "sing to the trees",
+                {"room_id": "wilderness_start"},
+                on_narration=on_narration,
+            )
+        )
@@ -0,0 +1,26 @@
+"""Replay of the command corpus through both cache-key schemes."""
+
+from game.ai import cache_keys
+from tools.cache_key_stats import replay
+from tools.command_interpretation_eval import DEFAULT_CORPUS, load_corpus
+
+
+def test_normalised_keys_share_entries_without_serving_a_different_intent():
+    report = replay(load_corpus(DEFAULT_CORPUS))
+
+    assert report["normalised"]["divergent_hits"] == 0
+    assert report["normalised"]["reply_divergent_hits"] == 0
+    assert report["normalised"]["effects_divergent_hits"] == 0
+    assert report["normalised"]["hit_rate"] > report["full_context"]["hit_rate"]
+
+
+def test_a_key_missing_a_rendered_field_shows_as_reply_divergence(monkeypatch):
+    monkeypatch.setattr(
+        cache_keys,
+        "PROMPT_FIELDS",
+        tuple(f for f in cache_keys.PROMPT_FIELDS if f[0] != "rooms_visited"),
+    )
+    report = replay(load_corpus(DEFAULT_CORPUS))
+
+    assert report["normalised"]["reply_divergent_hits"] > 0
+    assert report["normalised"]["divergent_hits"] == 0
@@ -46,3 +46,11 @@ def test_current_interpreter_satisfies_primary_and_constraint_metrics():
         == report["constraints"]["expected_model_bound_calls"]
     )
     assert report["constraints"]["impossible_targets_accepted"] == 0
+
+
+def test_fast_path_saves_model_calls_without_changing_any_answer():
+    report = evaluate(load_corpus(DEFAULT_CORPUS))["fast_path"]
+
+    assert report["mismatch_case_ids"] == []
+    assert report["online_model_calls"] < report["online_model_calls_without_fast_path"]
+    assert report["model_calls_saved_rate"] > 0
@@ -120,3 +120,21 @@ def test_runtime_asset_move_preserves_authored_triggers(
     ]
 
     assert matching_ids == [expected_cutscene_id]
+
+
+def test_authored_text_is_read_once_per_process(monkeypatch):
+    CutsceneManager()
+    reads = []
+    real_read_text = cutscene_module.Path.read_text
+    monkeypatch.setattr(
+        cutscene_module.Path,
+        "read_text",
+        lambda self, *args, **kwargs: reads.append(self) or real_read_text(self, *args, **kwargs),
+    )
+
+    first, second = CutsceneManager(), CutsceneManager()
+
+    assert reads == []
+    assert [cs.text for cs in first.cutscenes] == [cs.text for cs in second.cutscenes]
+    first.cutscenes[0].has_played = True
+    assert second.get_played_ids() == []
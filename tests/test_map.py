@@ -4,12 +4,12 @@ import ast
 import inspect
 import textwrap
 
-from game.map import Map
+from game.map import Map, world_template
 
 
 def _display_map_room_ids() -> tuple[set[str], set[str]]:
-    """Return room IDs hard-coded into Map.display_map's layout references."""
-    source = textwrap.dedent(inspect.getsource(Map.display_map))
+    """Return room IDs hard-coded into the map screen's layout references."""
+    source = textwrap.dedent(inspect.getsource(Map._draw_map))
     tree = ast.parse(source)
     references: set[str] = set()
     rendered: set[str] = set()
@@ -127,6 +127,39 @@ class TestMapVisitTracking:
         assert "gives back a little heat" not in description
 
 
+class TestWorldTemplate:
+    """Sessions share the authored world and keep their own item placement."""
+
+    def test_maps_share_static_room_data(self):
+        first, second = Map(), Map()
+        a = first.locations["cabin_interior"].rooms["cabin_main"]
+        b = second.locations["cabin_interior"].rooms["cabin_main"]
+
+        assert a is not b
+        assert a.exits is b.exits
+        assert a.wrong_description is b.wrong_description
+        assert first.items["rope"] is second.items["rope"]
+
+    def test_item_placement_does_not_leak_between_sessions(self):
+        first, second = Map(), Map()
+
+        taken = first.current_room.remove_item("stick")
+        first.current_room.add_item(first.items["rope"])
+
+        assert taken is not None
+        assert second.current_room.has_item("stick")
+        assert not second.current_room.has_item("rope")
+        template_room = world_template().locations["wilderness"].rooms["wilderness_start"]
+        assert [item.name for item in template_room.items] == ["stick", "stone"]
+
+    def test_rebinding_a_room_attribute_stays_in_the_session(self):
+        first, second = Map(), Map()
+
+        first.current_room.exits = {}
+
+        assert second.current_room.exits == {"north": ("cabin_grounds", "cabin_clearing")}
+
+
 class TestMapDisplay:
     """Tests for the ASCII map display."""
 
@@ -0,0 +1,12 @@
+"""Smoke test for the rate limiter flood benchmark."""
+
+from tools.rate_limiter_benchmark import measure
+
+
+def test_benchmark_expires_the_flood_and_keeps_the_player():
+    report = measure(ips=500, seconds=5.0)
+
+    assert report["ips"] == 500
+    assert report["peak_buckets"] == 501
+    assert report["buckets_after_window"] == 1
+    assert report["p99_us"] > 0
@@ -0,0 +1,123 @@
+"""Tests for the room prose and map render cache (game.render_cache)."""
+
+import pytest
+
+from game.map import Map
+from game.player import Player
+from game.render_cache import (
+    MISSING,
+    RenderCache,
+    render_cache_stats,
+    reset_render_cache_stats,
+)
+from game.world_state import WorldState
+from tools.playtest_runner import _default_scenarios, load_scenario, run_scenario
+
+
+@pytest.fixture(autouse=True)
+def _fresh_counters():
+    reset_render_cache_stats()
+    yield
+    reset_render_cache_stats()
+
+
+class TestStateVersion:
+    def test_grows_on_assignment(self):
+        state = WorldState()
+        before = state.state_version
+        state.fire_lit = True
+        assert state.state_version > before
+
+    def test_grows_on_custom_flags(self):
+        state = WorldState()
+        before = state.state_version
+        state.set_flag("door_open", True)
+        middle = state.state_version
+        state["other_flag"] = 1
+        assert before < middle < state.state_version
+
+    def test_grows_on_wrongness(self):
+        state = WorldState()
+        before = state.state_version
+        state.wrongness.add("extra_door")
+        assert state.state_version > before
+
+    def test_two_states_never_share_a_version(self):
+        assert WorldState().state_version != WorldState().state_version
+
+    def test_is_left_out_of_the_saved_dict(self):
+        assert "_version" not in WorldState().to_dict()
+
+
+class TestRenderCache:
+    def test_counts_hits_and_misses(self):
+        cache = RenderCache("test-kind")
+        assert cache.get("a") is MISSING
+        cache.put("a", "prose")
+        assert cache.get("a") == "prose"
+        stats = render_cache_stats()["test-kind"]
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_evicts_the_least_recent(self):
+        cache = RenderCache("test-kind", maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is MISSING
+
+
+class TestMapDescriptions:
+    def test_a_repeat_look_is_served_from_the_cache(self):
+        game_map = Map()
+        player = Player()
+        room = game_map.locations["cabin_interior"].rooms["cabin_main"]
+        first = game_map.describe_room(room, player)
+        assert game_map.describe_room(room, player) == first
+        stats = render_cache_stats()["description"]
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    def test_a_flag_change_invalidates(self):
+        game_map = Map()
+        player = Player()
+        room = game_map.locations["cabin_interior"].rooms["cabin_main"]
+        cold = game_map.describe_room(room, player)
+        game_map.world_state.fire_lit = True
+        warm = game_map.describe_room(room, player)
+        assert warm != cold
+        assert "Firelight" in warm
+        assert warm == room.get_description(player, game_map.world_state)
+
+    def test_can_be_turned_off(self, monkeypatch):
+        monkeypatch.setenv("CABIN_RENDER_CACHE", "0")
+        game_map = Map()
+        room = game_map.locations["cabin_interior"].rooms["cabin_main"]
+        game_map.describe_room(room)
+        game_map.describe_room(room)
+        assert render_cache_stats().get("description", {}).get("hits", 0) == 0
+
+    def test_the_map_screen_is_shared_across_runs(self):
+        first, second = Map(), Map()
+        drawn = first.display_map(first.get_visited_rooms())
+        assert second.display_map(second.get_visited_rooms()) == drawn
+        assert render_cache_stats()["map"]["hits"] >= 1
+
+
+def test_every_playtest_renders_byte_identically_with_and_without_the_cache(
+    monkeypatch,
+):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    paths = _default_scenarios()
+    assert paths
+
+    monkeypatch.setenv("CABIN_RENDER_CACHE", "0")
+    uncached = [run_scenario(load_scenario(path)) for path in paths]
+    monkeypatch.setenv("CABIN_RENDER_CACHE", "1")
+    cached = [run_scenario(load_scenario(path)) for path in paths]
+
+    for path, fresh, memo in zip(paths, uncached, cached):
+        assert memo.transcript_text == fresh.transcript_text, path.name
+        assert memo.state == fresh.state, path.name
+    assert sum(stats["hits"] for stats in render_cache_stats().values()) > 0
@@ -1,11 +1,19 @@
 """Tests for SaveManager."""
 
 import pytest
+import hashlib
 import json
+import os
+import zlib
 from pathlib import Path
 from unittest.mock import MagicMock
 
-from game.persistence.save_manager import SaveManager
+from game.cutscene import CutsceneManager
+from game.game_state import GameState
+from game.map import Map
+from game.persistence.save_manager import MANIFEST_NAME, SaveManager
+from game.player import Player
+from game.quests import create_quest_manager
 
 
 class TestSaveManager:
@@ -140,3 +148,192 @@ class TestSaveManager:
         manager.save_game(mock_game_state)
         
         assert (save_dir / "autosave.json").exists()
+
+
+class TestSaveManifest:
+    """Listing reads the manifest, not the slots."""
+
+    @pytest.fixture
+    def save_dir(self, tmp_path):
+        return tmp_path / "saves"
+
+    @pytest.fixture
+    def manager(self, save_dir):
+        return SaveManager(save_dir=save_dir)
+
+    def _state(self, room="cabin", health=100):
+        state = MagicMock()
+        state.to_dict.return_value = {
+            "player": {"health": health, "fear": 10},
+            "map": {"current_room_id": room},
+        }
+        return state
+
+    def _manifest(self, save_dir):
+        return json.loads((save_dir / MANIFEST_NAME).read_text())["slots"]
+
+    def test_a_fresh_manifest_answers_without_reading_slots(self, manager, save_dir):
+        manager.save_game(self._state(), "slot")
+        manager.list_saves()
+        path = save_dir / "slot.json"
+        stat = path.stat()
+        # Same size and mtime, different content: only a read could tell.
+        content = path.read_text().replace("cabin", "shack")
+        path.write_text(content)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert [s.room_name for s in manager.list_saves()] == ["cabin"]
+
+    def test_a_changed_slot_is_read_again(self, manager, save_dir):
+        manager.save_game(self._state(), "slot")
+        manager.list_saves()
+        other = SaveManager(save_dir=save_dir / "elsewhere")
+        other.save_game(self._state(room="lake"), "slot")
+        (save_dir / "elsewhere" / "slot.json").replace(save_dir / "slot.json")
+
+        assert [s.room_name for s in manager.list_saves()] == ["lake"]
+        assert self._manifest(save_dir)["slot"]["room_name"] == "lake"
+
+    def test_a_missing_manifest_is_rebuilt(self, manager, save_dir):
+        manager.save_game(self._state(), "one")
+        manager.save_game(self._state(), "two")
+        (save_dir / MANIFEST_NAME).unlink(missing_ok=True)
+
+        assert {s.slot_name for s in manager.list_saves()} == {"one", "two"}
+        assert set(self._manifest(save_dir)) == {"one", "two"}
+
+    def test_listing_an_empty_directory_writes_nothing(self, manager, save_dir):
+        save_dir.mkdir(parents=True, exist_ok=True)
+
+        assert manager.list_saves() == []
+        assert not (save_dir / MANIFEST_NAME).exists()
+
+    def test_saves_and_deletes_keep_it_current(self, manager, save_dir):
+        manager.save_game(self._state(), "one")
+        manager.list_saves()
+        manager.save_game(self._state(health=40), "two")
+        manager.delete_save("one")
+
+        slots = self._manifest(save_dir)
+        assert set(slots) == {"two"}
+        assert slots["two"]["player_health"] == 40
+        content = (save_dir / "two.json").read_bytes()
+        assert slots["two"]["sha256"] == hashlib.sha256(content).hexdigest()
+
+    def test_unreadable_slots_are_skipped(self, manager, save_dir):
+        manager.save_game(self._state(), "good")
+        (save_dir / "bad.json").write_text("{not json")
+
+        assert [s.slot_name for s in manager.list_saves()] == ["good"]
+        assert self._manifest(save_dir)["bad"]["valid"] is False
+
+    def test_the_manifest_is_not_a_slot(self, manager, save_dir):
+        manager.save_game(self._state(), "slot")
+        manager.list_saves()
+        assert (save_dir / MANIFEST_NAME).exists()
+        assert [s.slot_name for s in manager.list_saves()] == ["slot"]
+
+
+class TestSaveFormat:
+    """Version 2 slots: a diff against a fresh game, written only on change."""
+
+    @pytest.fixture
+    def save_dir(self, tmp_path):
+        return tmp_path / "saves"
+
+    @pytest.fixture
+    def manager(self, save_dir):
+        return SaveManager(save_dir=save_dir)
+
+    @pytest.fixture
+    def state(self):
+        return GameState(
+            player=Player(),
+            map=Map(),
+            quest_manager=create_quest_manager(),
+            cutscene_manager=CutsceneManager(),
+        )
+
+    def _take_first_item(self, state):
+        room = next(
+            room
+            for location in state.map.locations.values()
+            for room in location.rooms.values()
+            if room.items
+        )
+        state.player.add_item(room.items.pop(0))
+        return room.id
+
+    def test_only_changed_rooms_and_flags_are_written(self, manager, state, save_dir):
+        room_id = self._take_first_item(state)
+        state.map.world_state.fire_lit = True
+        manager.save_game(state, "slot")
+
+        stored = json.loads((save_dir / "slot.json").read_bytes())["game_state"]
+        assert list(stored["map"]["room_items"]) == [room_id]
+        assert stored["world_state"] == {"fire_lit": True}
+
+    def test_a_diffed_save_loads_as_the_full_state(self, manager, state):
+        self._take_first_item(state)
+        state.map.world_state.fire_lit = True
+        manager.save_game(state, "slot")
+
+        assert manager.load_game("slot") == json.loads(json.dumps(state.to_dict()))
+
+    def test_version_1_saves_still_load(self, manager, state, save_dir):
+        save_dir.mkdir(parents=True)
+        full = state.to_dict()
+        (save_dir / "old.json").write_text(
+            json.dumps(
+                {"version": 1, "timestamp": "t", "slot_name": "old", "game_state": full},
+                indent=2,
+            )
+        )
+
+        assert manager.load_game("old") == json.loads(json.dumps(full))
+
+    def test_future_versions_are_refused(self, manager, save_dir):
+        save_dir.mkdir(parents=True)
+        (save_dir / "new.json").write_text(json.dumps({"version": 99, "game_state": {}}))
+        assert manager.load_game("new") is None
+
+    def test_compressed_slots_round_trip(self, save_dir, state):
+        manager = SaveManager(save_dir=save_dir, compress=True)
+        manager.save_game(state, "slot")
+
+        content = (save_dir / "slot.json").read_bytes()
+        assert json.loads(zlib.decompress(content))["version"] == 2
+        assert SaveManager(save_dir=save_dir).load_game("slot") == json.loads(
+            json.dumps(state.to_dict())
+        )
+        assert [s.slot_name for s in manager.list_saves()] == ["slot"]
+
+    def test_compression_follows_the_environment(self, save_dir, state, monkeypatch):
+        monkeypatch.setenv("CABIN_SAVE_COMPRESS", "1")
+        SaveManager(save_dir=save_dir).save_game(state, "slot")
+        assert (save_dir / "slot.json").read_bytes()[:1] == b"\x78"
+
+    def test_an_unchanged_state_is_not_rewritten(self, manager, state, save_dir):
+        touched = []
+        manager.on_save = touched.append
+        manager.save_game(state, "slot")
+        path = save_dir / "slot.json"
+        before = path.stat().st_mtime_ns
+        os.utime(path, ns=(before - 10**9, before - 10**9))
+        manager.list_saves()
+
+        manager.save_game(state, "slot")
+        assert path.stat().st_mtime_ns == before - 10**9
+        assert touched == [save_dir, save_dir]
+
+        state.player.fear = 30
+        manager.save_game(state, "slot")
+        assert path.stat().st_mtime_ns != before - 10**9
+
+    def test_a_slot_changed_behind_the_manifest_is_rewritten(self, manager, state, save_dir):
+        manager.save_game(state, "slot")
+        path = save_dir / "slot.json"
+        path.write_text("{not json")
+
+        manager.save_game(state, "slot")
+        assert manager.load_game("slot") is not None
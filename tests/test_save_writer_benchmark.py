@@ -0,0 +1,13 @@
+"""Smoke test for the save writer benchmark."""
+
+from tools.save_writer_benchmark import measure
+
+
+def test_benchmark_times_every_mode(tmp_path):
+    report = measure(saves=40, sessions=4, directory=tmp_path)
+
+    assert set(report) == {"saves", "sessions", "inline", "durable_each", "group"}
+    assert report["durable_each"]["batches"] == 40
+    assert report["group"]["failed"] == 0
+    assert report["group"]["batches"] <= 40
+    assert all(report[mode]["saves_per_second"] > 0 for mode in ("inline", "group"))
@@ -0,0 +1,19 @@
+"""Smoke test for the idle-session memory benchmark."""
+
+from game.player import Player
+from game.room import Room
+from game.world_state import WorldState
+from tools.session_memory_benchmark import measure
+
+
+def test_benchmark_reports_bytes_per_idle_session():
+    report = measure(sessions=5)
+
+    assert report["sessions"] == 5
+    assert report["bytes_per_session"] > 0
+    assert report["total_bytes"] >= report["bytes_per_session"] * 5
+
+
+def test_hot_session_state_carries_no_instance_dict():
+    for obj in (Player(), WorldState(), Room("Shed", "A shed.")):
+        assert not hasattr(obj, "__dict__")
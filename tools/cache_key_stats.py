@@ -0,0 +1,170 @@
+"""Replay the command corpus through the interpreter cache keys.
+
+Each corpus case is interpreted in its own context and again in variants of
+it that another player could plausibly be in: a few points of fear or health
+either way, more rooms explored, a quest underway, a longer wrongness log.
+Every interpretation is looked up under both key schemes, in order, as a
+shared cache would see them.
+
+The offline model stub answers every request with a reply and effects drawn
+from a digest of the prompt it was sent, with fear and health read as the
+bands the system prompt's tone rules use, so any other difference in what the
+model is shown changes what it says. A key that leaves out something the
+prompt renders then shows up as divergence, not only as a matching action.
+
+For each scheme the report gives the hit rate and three kinds of divergence:
+hits that would have served an action or argument (``divergent_hits``), a
+reply (``reply_divergent_hits``) or effects (``effects_divergent_hits``)
+different from the ones the uncached interpreter gives for that context. The
+full-context scheme is the one ``make_cache_key`` used before keys were
+normalised; it can only diverge if two inputs hash together, so it is the
+baseline for the hit rate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+
+from game.ai.cache import make_cache_key
+from game.ai.cache_keys import FEAR_BANDS, HEALTH_BANDS, band
+from tools.command_interpretation_eval import (
+    DEFAULT_CORPUS,
+    _model_response,
+    _run_case,
+    load_corpus,
+)
+
+
+def full_context_key(user_text: str, context: Dict[str, Any]) -> str:
+    """The key scheme before normalisation: every context field, verbatim."""
+    key_data = json.dumps(
+        {
+            "user_text": user_text.strip().lower(),
+            "room_name": context.get("room_name", ""),
+            "exits": sorted(context.get("exits", [])),
+            "room_items": sorted(context.get("room_items", [])),
+            "inventory": sorted(context.get("inventory", [])),
+            "world_flags": context.get("world_flags", {}),
+            "fear": context.get("fear", 0),
+            "health": context.get("health", 100),
+            "rooms_visited": context.get("rooms_visited", 1),
+            "been_here_before": context.get("been_here_before", False),
+            "active_quest": context.get("active_quest"),
+            "can_advance_to_dawn": context.get("can_advance_to_dawn", False),
+            "is_dawn_offer_active": context.get("is_dawn_offer_active", False),
+        },
+        sort_keys=True,
+    )
+    return hashlib.md5(key_data.encode()).hexdigest()
+
+
+SCHEMES: Dict[str, Callable[[str, Dict[str, Any]], str]] = {
+    "full_context": full_context_key,
+    "normalised": make_cache_key,
+}
+
+
+def prompt_sensitive_response(
+    case: Dict[str, Any],
+) -> Callable[[List[Dict[str, str]]], Dict[str, Any]]:
+    """The corpus response for *case*, its reply and effects keyed to the prompt."""
+
+    def respond(messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        shown = json.loads(messages[-1]["content"])
+        shown["fear"] = band(shown.get("fear", 0), FEAR_BANDS)
+        shown["health"] = band(shown.get("health", 100), HEALTH_BANDS)
+        digest = hashlib.sha256(
+            json.dumps(shown, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        response = _model_response(case)
+        response["reply"] = f"{response['reply']} ({digest[:8]})"
+        response["effects"] = {
+            **response["effects"],
+            "fear": int(digest[8], 16) % 5 - 2,
+        }
+        return response
+
+    return respond
+
+
+def context_variants(context: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Yield *context* and the nearby contexts other players might be in."""
+    yield context
+    yield {**context, "fear": min(100, context.get("fear", 0) + 2)}
+    yield {**context, "health": max(0, context.get("health", 100) - 3)}
+    yield {**context, "rooms_visited": context.get("rooms_visited", 1) + 4}
+    yield {**context, "active_quest": "Find out what happened to the northern camera"}
+    flags = deepcopy(context.get("world_flags", {}))
+    entries = flags.setdefault("wrongness", {}).setdefault("entries", [])
+    entries.append({"anomaly_id": "fox_tracks"})
+    yield {**context, "world_flags": flags}
+
+
+def replay(corpus: Dict[str, Any]) -> Dict[str, Any]:
+    lookups: List[tuple[str, Dict[str, Any], Dict[str, Any]]] = []
+    for case in corpus["cases"]:
+        for variant in context_variants(corpus["contexts"][case["context"]]):
+            result = _run_case(
+                case,
+                {case["context"]: deepcopy(variant)},
+                respond=prompt_sensitive_response(case),
+            )
+            lookups.append((case["input"], variant, result))
+
+    report: Dict[str, Any] = {"corpus_sha256": corpus["_sha256"], "lookups": len(lookups)}
+    for name, scheme in SCHEMES.items():
+        stored: Dict[str, Dict[str, Any]] = {}
+        hits = divergent = reply_divergent = effects_divergent = 0
+        for user_text, context, result in lookups:
+            key = scheme(user_text, context)
+            if key in stored:
+                hits += 1
+                served = stored[key]
+                divergent += served["actual"] != result["actual"]
+                reply_divergent += served["reply"] != result["reply"]
+                effects_divergent += served["effects"] != result["effects"]
+            else:
+                stored[key] = result
+        report[name] = {
+            "keys": len(stored),
+            "hits": hits,
+            "hit_rate": round(hits / len(lookups), 6) if lookups else 0.0,
+            "divergent_hits": divergent,
+            "divergence_rate": round(divergent / hits, 6) if hits else 0.0,
+            "reply_divergent_hits": reply_divergent,
+            "effects_divergent_hits": effects_divergent,
+        }
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help=(
+            "Exit non-zero if the normalised keys serve any divergent intent, "
+            "reply or effects."
+        ),
+    )
+    args = parser.parse_args(argv)
+
+    report = replay(load_corpus(args.corpus))
+    print(json.dumps(report, indent=2, sort_keys=True))
+    normalised = report["normalised"]
+    if args.check and any(
+        normalised[name]
+        for name in ("divergent_hits", "reply_divergent_hits", "effects_divergent_hits")
+    ):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,6 +9,10 @@ The corpus drives ``game.ai_interpreter.interpret`` in one of two modes:
 The primary metric is exact action-and-argument accuracy. Routing and accepted
 impossible inventory targets are constraints rather than alternate ways to
 earn primary-metric credit.
+
+The ``fast_path`` section replays every case online (``model`` mode) with and
+without the deterministic fast path, and reports the share of model calls it
+saves. A fast-path answer that differs from the expected intent is a failure.
 """
 
 from __future__ import annotations
@@ -20,7 +24,7 @@ import os
 from copy import deepcopy
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Any
+from typing import Any, Callable
 
 import game.ai_interpreter as ai_interpreter
 
@@ -30,17 +34,25 @@ DEFAULT_CORPUS = REPO_ROOT / "evals" / "command_interpretation_corpus.json"
 
 
 class _OfflineCompletionStub:
-    def __init__(self, response: dict[str, Any]) -> None:
+    """Streams *response*; a callable is given the request's messages first."""
+
+    def __init__(
+        self,
+        response: dict[str, Any] | Callable[[list[dict[str, str]]], dict[str, Any]],
+    ) -> None:
         self.response = response
         self.calls = 0
 
-    def create(self, **_: Any) -> list[SimpleNamespace]:
+    def create(self, **params: Any) -> list[SimpleNamespace]:
         self.calls += 1
+        response = self.response
+        if callable(response):
+            response = response(params["messages"])
         return [
             SimpleNamespace(
                 choices=[
                     SimpleNamespace(
-                        delta=SimpleNamespace(content=json.dumps(self.response))
+                        delta=SimpleNamespace(content=json.dumps(response))
                     )
                 ]
             )
@@ -73,9 +85,17 @@ def _model_response(case: dict[str, Any]) -> dict[str, Any]:
     return response
 
 
-def _run_case(case: dict[str, Any], contexts: dict[str, Any]) -> dict[str, Any]:
+def _run_case(
+    case: dict[str, Any],
+    contexts: dict[str, Any],
+    *,
+    mode: str | None = None,
+    fast_path: bool = True,
+    respond: Callable[[list[dict[str, str]]], dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    mode = mode or case["mode"]
     context = deepcopy(contexts[case["context"]])
-    completion = _OfflineCompletionStub(_model_response(case))
+    completion = _OfflineCompletionStub(respond or _model_response(case))
     fake_client = SimpleNamespace(
         chat=SimpleNamespace(completions=completion)
     )
@@ -84,18 +104,21 @@ def _run_case(case: dict[str, Any], contexts: dict[str, Any]) -> dict[str, Any]:
     old_openai = ai_interpreter.OpenAI
     old_client_factory = ai_interpreter._get_openai_client
     old_logger = ai_interpreter.log_ai_call
+    old_fast_path = ai_interpreter._fast_path
     ai_interpreter.clear_response_cache()
 
     try:
         ai_interpreter.log_ai_call = lambda *_, **__: None
-        if case["mode"] == "model":
+        if not fast_path:
+            ai_interpreter._fast_path = lambda *_: None
+        if mode == "model":
             os.environ["OPENAI_API_KEY"] = "offline-command-eval"
             ai_interpreter.OpenAI = object()
             ai_interpreter._get_openai_client = lambda _: fake_client
-        elif case["mode"] == "fallback":
+        elif mode == "fallback":
             os.environ.pop("OPENAI_API_KEY", None)
         else:
-            raise ValueError(f"Unknown evaluation mode: {case['mode']!r}")
+            raise ValueError(f"Unknown evaluation mode: {mode!r}")
 
         intent = ai_interpreter.interpret(case["input"], context)
     finally:
@@ -106,6 +129,7 @@ def _run_case(case: dict[str, Any], contexts: dict[str, Any]) -> dict[str, Any]:
         ai_interpreter.OpenAI = old_openai
         ai_interpreter._get_openai_client = old_client_factory
         ai_interpreter.log_ai_call = old_logger
+        ai_interpreter._fast_path = old_fast_path
         ai_interpreter.clear_response_cache()
 
     actual = {"action": intent.action, "args": intent.args}
@@ -128,6 +152,44 @@ def _run_case(case: dict[str, Any], contexts: dict[str, Any]) -> dict[str, Any]:
         "expected_model_call": case["expect_model_call"],
         "routing_correct": routing_correct,
         "impossible_target_accepted": impossible_accepted,
+        "rationale": intent.rationale,
+        "reply": intent.reply,
+        "effects": intent.effects,
+    }
+
+
+def fast_path_savings(corpus: dict[str, Any]) -> dict[str, Any]:
+    """Model calls the fast path saves when every case is typed online."""
+    with_fast_path = [
+        _run_case(case, corpus["contexts"], mode="model") for case in corpus["cases"]
+    ]
+    without_fast_path = [
+        _run_case(case, corpus["contexts"], mode="model", fast_path=False)
+        for case in corpus["cases"]
+    ]
+    hits = [
+        result for result in with_fast_path
+        if (result["rationale"] or "").startswith("fast path")
+    ]
+    calls = sum(result["model_call_count"] for result in with_fast_path)
+    calls_without = sum(result["model_call_count"] for result in without_fast_path)
+    total = len(with_fast_path)
+
+    return {
+        "hits": len(hits),
+        "hit_case_ids": [result["id"] for result in hits],
+        "mismatch_case_ids": [
+            result["id"] for result in hits if not result["action_args_correct"]
+        ],
+        "online_model_calls": calls,
+        "online_model_calls_without_fast_path": calls_without,
+        "online_model_call_rate": round(calls / total, 6) if total else 0.0,
+        "online_model_call_rate_without_fast_path": (
+            round(calls_without / total, 6) if total else 0.0
+        ),
+        "model_calls_saved_rate": (
+            round((calls_without - calls) / calls_without, 6) if calls_without else 0.0
+        ),
     }
 
 
@@ -167,6 +229,7 @@ def evaluate(corpus: dict[str, Any]) -> dict[str, Any]:
                 if result["impossible_target_accepted"]
             ],
         },
+        "fast_path": fast_path_savings(corpus),
         "cases": results,
     }
 
@@ -192,6 +255,7 @@ def main(argv: list[str] | None = None) -> int:
         and report["constraints"]["model_bound_calls"]
         == report["constraints"]["expected_model_bound_calls"]
         and report["constraints"]["impossible_targets_accepted"] == 0
+        and not report["fast_path"]["mismatch_case_ids"]
     ) else 1
 
 
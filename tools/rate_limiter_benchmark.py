@@ -0,0 +1,103 @@
+"""Time ``RateLimiter`` under a flood of distinct IPs.
+
+A scanner sweep is simulated on a virtual clock: ``--ips`` addresses each
+connect and send once, spread evenly over ``--seconds``, while one player
+keeps sending alongside them. The clock then runs on past the window so
+every scanner bucket expires through the timing wheel.
+
+The report gives per-call latency percentiles for the checks and registers,
+the slowest single call (the one a player would feel if expiry were done in
+one sweep), the peak bucket count, and how many buckets are left once the
+window has passed, which should be just the player's.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from server.rate_limiter import WINDOW_SECONDS, RateLimiter
+
+
+DEFAULT_IPS = 100_000
+DEFAULT_SECONDS = 30.0
+PLAYER_IP = "198.51.100.7"
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _micros(seconds: float) -> float:
+    return round(seconds * 1_000_000, 3)
+
+
+def measure(ips: int = DEFAULT_IPS, seconds: float = DEFAULT_SECONDS) -> Dict[str, Any]:
+    if ips < 1:
+        raise ValueError("ips must be at least 1")
+    clock = [0.0]
+    samples: List[float] = []
+    peak = 0
+    perf = time.perf_counter
+
+    with patch("server.rate_limiter.time.monotonic", lambda: clock[0]):
+        limiter = RateLimiter(max_messages_per_min=1_000_000, max_sessions=ips + 1)
+        step = seconds / ips
+        for n in range(ips):
+            clock[0] = n * step
+            ip = f"10.{n >> 16 & 255}.{n >> 8 & 255}.{n & 255}"
+            started = perf()
+            limiter.can_connect(ip)
+            limiter.register_connection(ip)
+            limiter.can_send_message(ip)
+            limiter.register_message(ip)
+            samples.append(perf() - started)
+            if n % 100 == 0:
+                started = perf()
+                limiter.can_send_message(PLAYER_IP)
+                limiter.register_message(PLAYER_IP)
+                samples.append(perf() - started)
+        peak = len(limiter._buckets)
+
+        # Run the clock past the window a tenth of a second at a time, the
+        # player still sending, so the wheel expires the flood as it ages.
+        expiry_samples: List[float] = []
+        end = seconds + WINDOW_SECONDS + 2
+        while clock[0] < end:
+            clock[0] += 0.1
+            started = perf()
+            limiter.can_send_message(PLAYER_IP)
+            limiter.register_message(PLAYER_IP)
+            expiry_samples.append(perf() - started)
+        remaining = len(limiter._buckets)
+
+    return {
+        "ips": ips,
+        "seconds": seconds,
+        "calls": len(samples),
+        "p50_us": _micros(_percentile(samples, 0.5)),
+        "p99_us": _micros(_percentile(samples, 0.99)),
+        "max_us": _micros(max(samples)),
+        "expiry_p99_us": _micros(_percentile(expiry_samples, 0.99)),
+        "expiry_max_us": _micros(max(expiry_samples)),
+        "peak_buckets": peak,
+        "buckets_after_window": remaining,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ips", type=int, default=DEFAULT_IPS)
+    parser.add_argument("--seconds", type=float, default=DEFAULT_SECONDS)
+    args = parser.parse_args(argv)
+
+    print(json.dumps(measure(args.ips, args.seconds), indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
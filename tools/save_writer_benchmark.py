@@ -0,0 +1,126 @@
+"""Compare inline save writes with the group-commit save writer.
+
+``--saves`` saves are made back to back, round-robin over ``--sessions``
+durable save directories, the way the event loop makes them when many
+players save at once. Each save changes the state, so none is skipped as
+unchanged. Three ways of writing are timed:
+
+- ``inline``: ``SaveManager`` writing the slot itself, as before the writer.
+  Nothing is flushed, so this is not durable.
+- ``durable_each``: every save waits for its own durable write before the
+  next, one batch per save: inline writing made durable.
+- ``group``: every save is queued and the writer batches them; the clock
+  stops once the last batch is durable.
+
+Each reports throughput over the whole run and the time a save keeps its
+caller (the turn), and the writer modes their batch counts and how many
+queued saves were overtaken by a later save of the same slot. Run it with
+``--dir`` on the volume that matters; temp directories are often tmpfs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from game.cutscene import CutsceneManager
+from game.game_state import GameState
+from game.map import Map
+from game.persistence import SaveManager
+from game.player import Player
+from game.quests import create_quest_manager
+from server.save_writer import SaveWriter
+
+
+DEFAULT_SAVES = 500
+DEFAULT_SESSIONS = 50
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _millis(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+def _run(root: Path, mode: str, saves: int, sessions: int) -> Dict[str, Any]:
+    writer = None if mode == "inline" else SaveWriter()
+    managers = []
+    for n in range(sessions):
+        manager = SaveManager(save_dir=root / mode / f"{n:032x}")
+        manager.writer = writer
+        managers.append(manager)
+    state = GameState(
+        player=Player(),
+        map=Map(),
+        quest_manager=create_quest_manager(),
+        cutscene_manager=CutsceneManager(),
+    )
+
+    perf = time.perf_counter
+    caller: List[float] = []
+    started = perf()
+    for n in range(saves):
+        state.player.fear = n % 101
+        manager = managers[n % sessions]
+        call_started = perf()
+        manager.save_game(state, "autosave")
+        if mode == "durable_each":
+            manager.pending_write.result()
+        caller.append(perf() - call_started)
+    if writer is not None:
+        writer.flush()
+    elapsed = perf() - started
+
+    report: Dict[str, Any] = {
+        "saves_per_second": round(saves / elapsed, 1),
+        "caller_p50_ms": _millis(_percentile(caller, 0.5)),
+        "caller_p99_ms": _millis(_percentile(caller, 0.99)),
+    }
+    if writer is not None:
+        stats = writer.stats()
+        report.update(
+            batches=stats["batches"],
+            mean_batch=round(stats["writes"] / max(stats["batches"], 1), 2),
+            largest_batch=stats["largest_batch"],
+            coalesced=stats["coalesced"],
+            failed=stats["failed"],
+        )
+    return report
+
+
+def measure(
+    saves: int = DEFAULT_SAVES,
+    sessions: int = DEFAULT_SESSIONS,
+    directory: Optional[Path] = None,
+) -> Dict[str, Any]:
+    if saves < 1 or sessions < 1:
+        raise ValueError("saves and sessions must be at least 1")
+    with tempfile.TemporaryDirectory(dir=directory) as scratch:
+        root = Path(scratch)
+        modes = {
+            mode: _run(root, mode, saves, sessions)
+            for mode in ("inline", "durable_each", "group")
+        }
+    return {"saves": saves, "sessions": sessions, **modes}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--saves", type=int, default=DEFAULT_SAVES)
+    parser.add_argument("--sessions", type=int, default=DEFAULT_SESSIONS)
+    parser.add_argument("--dir", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    print(json.dumps(measure(args.saves, args.sessions, args.dir), indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
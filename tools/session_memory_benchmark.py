@@ -0,0 +1,78 @@
+"""Measure the memory an idle HTTP session holds in ``SessionStore``.
+
+Sessions are created exactly as ``POST /session`` creates them, then left
+alone. The figure reported is traced Python allocation per session, after the
+shared world template and authored assets have been loaded once, so it is the
+cost the next session adds rather than the cost of the first.
+
+Use it to size machines: ``--budget-mb`` turns the per-session figure into the
+``RateLimiter.max_sessions`` that budget would hold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Any
+
+from server.session_store import SessionStore
+
+
+DEFAULT_SESSIONS = 500
+
+
+def measure(sessions: int = DEFAULT_SESSIONS) -> dict[str, Any]:
+    if sessions < 1:
+        raise ValueError("sessions must be at least 1")
+    store = SessionStore(idle_timeout=3600.0)
+
+    # Pay for the process-wide parts (world template, cutscene text, imports
+    # reached lazily on first session) before tracing starts.
+    store.release(store.create(ip="198.51.100.1").token)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        for _ in range(sessions):
+            store.create(ip="198.51.100.1")
+        gc.collect()
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        for token in list(store.tokens()):
+            store.release(token)
+
+    return {
+        "sessions": sessions,
+        "total_bytes": after - before,
+        "bytes_per_session": (after - before) // sessions,
+        "peak_bytes": peak - before,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=DEFAULT_SESSIONS)
+    parser.add_argument(
+        "--budget-mb",
+        type=float,
+        default=None,
+        help="Report how many idle sessions fit in this much session memory.",
+    )
+    args = parser.parse_args(argv)
+
+    report = measure(args.sessions)
+    if args.budget_mb is not None:
+        report["budget_mb"] = args.budget_mb
+        report["sessions_in_budget"] = int(
+            args.budget_mb * 1024 * 1024 // max(1, report["bytes_per_session"])
+        )
+    print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())